@@ -0,0 +1,222 @@
+"""
+Batch Name Optimizer
+
+This module optimizes whole name lists (CSV or plain text) for Chaldean
+target values. Names are fanned out across a process pool in chunks and
+results are streamed to CSV or JSON lines in input order.
+"""
+
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from chaldean_numerology import calculate_chaldean_sum
+from name_files import iter_name_rows
+from tweak_cache import cached_iter_target_tweaks
+
+CSV_FIELDS = ['name', 'chaldean_sum', 'is_target', 'num_options',
+              'best_tweak', 'best_sum', 'best_num_changes']
+
+
+def read_names(path: str) -> List[str]:
+    """
+    Read names from a CSV or JSON export or a plain text file.
+
+    CSV files use the first of name_files.NAME_COLUMNS present (or the first column),
+    JSON records the first of name_files.NAME_KEYS present. Text files hold one
+    name per line; blank lines and '#' comments are skipped.
+
+    Args:
+        path: Path to a .csv, .json or text file
+
+    Returns:
+        list: Names in file order
+    """
+    return [name for name, _ in iter_name_rows(path)]
+
+
+def optimize_batch_name(name: str, max_changes: int = 2, cha_prefix: bool = False,
+                        limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Optimize a single name and summarise the result as a flat record.
+
+    Args:
+        name: Name to optimize
+        max_changes: Maximum number of letter changes
+        cha_prefix: Use the Subramanya 'Cha' prefix optimizer
+        limit: Keep at most this many tweaks per name (None for all)
+
+    Returns:
+        dict: Record with the original sum, best tweak and all tweaks found
+    """
+    if cha_prefix:
+        from subramanya_tweaker import optimize_subramanya_name_for_target
+
+        result = optimize_subramanya_name_for_target(name, max_changes)
+        if result['already_perfect']:
+            tweaks = [{'tweaked': result['optimized_name'], 'chaldean_sum': result['chaldean_sum'],
+                       'changes': [], 'num_changes': 0}]
+            chaldean_sum = result['chaldean_sum']
+        else:
+            tweaks = result['successful_tweaks']
+            chaldean_sum = result['original_sum']
+        if limit is not None:
+            tweaks = tweaks[:limit]
+    else:
+        chaldean_sum = calculate_chaldean_sum(name)
+        tweaks = list(cached_iter_target_tweaks(name, max_changes=max_changes, limit=limit))
+
+    best = tweaks[0] if tweaks else None
+    return {
+        'name': name,
+        'chaldean_sum': chaldean_sum,
+        'is_target': chaldean_sum in [14, 41],
+        'num_options': len(tweaks),
+        'best_tweak': best['tweaked'] if best else None,
+        'best_sum': best['chaldean_sum'] if best else None,
+        'best_num_changes': best['num_changes'] if best else None,
+        'tweaks': [
+            {'tweaked': t['tweaked'], 'chaldean_sum': t['chaldean_sum'],
+             'changes': t['changes'], 'num_changes': t['num_changes']}
+            for t in tweaks
+        ]
+    }
+
+
+def iter_batch_results(names: Iterable[str], max_changes: int = 2, cha_prefix: bool = False,
+                       limit: Optional[int] = None, workers: Optional[int] = None,
+                       chunk_size: int = 64) -> Iterator[Dict[str, Any]]:
+    """
+    Optimize many names across a process pool, yielding records in input order.
+
+    Args:
+        names: Names to optimize
+        max_changes: Maximum number of letter changes
+        cha_prefix: Use the Subramanya 'Cha' prefix optimizer
+        limit: Keep at most this many tweaks per name (None for all)
+        workers: Number of worker processes (default: CPU count; 1 runs in-process)
+        chunk_size: Names sent to a worker per task
+
+    Yields:
+        dict: One record per name, see optimize_batch_name
+    """
+    worker = partial(optimize_batch_name, max_changes=max_changes,
+                     cha_prefix=cha_prefix, limit=limit)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        yield from map(worker, names)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(worker, names, chunksize=max(1, chunk_size))
+
+
+def run_batch(input_path: str, output_path: Optional[str] = None, max_changes: int = 2,
+              cha_prefix: bool = False, limit: Optional[int] = None,
+              workers: Optional[int] = None, chunk_size: int = 64,
+              auto_post: bool = False) -> Dict[str, Any]:
+    """
+    Optimize every name in a file and stream the results to CSV or JSON lines.
+
+    Output format follows the output file extension (.csv, otherwise JSON lines).
+    Without an output path, JSON lines go to stdout and the summary to stderr.
+
+    Args:
+        input_path: CSV or text file with names
+        output_path: Destination file (None for stdout)
+        max_changes: Maximum number of letter changes
+        cha_prefix: Use the Subramanya 'Cha' prefix optimizer
+        limit: Keep at most this many tweaks per name (None for all)
+        workers: Number of worker processes
+        chunk_size: Names sent to a worker per task
+        auto_post: Tweet the best tweak of every optimized name (via the post outbox)
+
+    Returns:
+        dict: Throughput summary
+    """
+    names = read_names(input_path)
+    as_csv = bool(output_path) and output_path.lower().endswith('.csv')
+    out = open(output_path, 'w', newline='', encoding='utf-8') if output_path else sys.stdout
+    log = sys.stdout if output_path else sys.stderr
+
+    print(f"🔍 Optimizing {len(names)} names from {input_path} (max {max_changes} changes)...", file=log)
+
+    outbox = drainer = None
+    if auto_post:
+        from post_outbox import PostOutbox
+        from twitter_poster import TwitterPoster
+
+        # Tweets go through the durable outbox, drained by a background thread;
+        # rerunning an interrupted batch resumes without posting anything twice
+        outbox = PostOutbox()
+        stop_draining = threading.Event()
+        drain_summary = {}
+        drainer = threading.Thread(
+            target=lambda: drain_summary.update(outbox.drain(TwitterPoster(), stop_event=stop_draining)),
+            daemon=True
+        )
+        drainer.start()
+        if outbox.replayed:
+            print(f"🔁 Replaying {outbox.replayed} tweet(s) interrupted by a previous run", file=log)
+
+    start = time.perf_counter()
+    processed = already_perfect = optimized = 0
+    try:
+        writer = None
+        if as_csv:
+            writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+
+        for record in iter_batch_results(names, max_changes, cha_prefix, limit, workers, chunk_size):
+            if writer:
+                writer.writerow(record)
+            else:
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+            processed += 1
+            if record['is_target']:
+                already_perfect += 1
+            elif record['num_options']:
+                optimized += 1
+                if outbox is not None:
+                    outbox.enqueue(dict(record['tweaks'][0], original=record['name']))
+    finally:
+        if output_path:
+            out.close()
+        if drainer is not None:
+            print(f"🐦 Waiting for {outbox.counts()['pending']} queued tweet(s)...", file=log)
+            stop_draining.set()
+            drainer.join()
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        'names': processed,
+        'already_perfect': already_perfect,
+        'optimized': optimized,
+        'no_solution': processed - already_perfect - optimized,
+        'seconds': elapsed,
+        'names_per_second': processed / elapsed if elapsed > 0 else 0.0
+    }
+
+    print(f"\n📊 BATCH SUMMARY", file=log)
+    print(f"   Names processed: {summary['names']}", file=log)
+    print(f"   Already perfect: {summary['already_perfect']}", file=log)
+    print(f"   Optimized:       {summary['optimized']}", file=log)
+    print(f"   No solution:     {summary['no_solution']}", file=log)
+    print(f"   Elapsed:         {summary['seconds']:.2f}s ({summary['names_per_second']:.1f} names/sec)", file=log)
+    if outbox is not None:
+        summary['tweets'] = outbox.counts()
+        print(f"   Tweets sent:     {drain_summary.get('sent', 0)} this run "
+              f"({summary['tweets']['sent']} total, {summary['tweets']['failed']} failed)", file=log)
+        outbox.close()
+    if output_path:
+        print(f"💾 Results saved to: {output_path}", file=log)
+
+    return summary
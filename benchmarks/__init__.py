@@ -0,0 +1,3 @@
+"""
+Benchmark suite for the name scoring, tweak search, cleaning and export hot paths.
+"""
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark Comparison
+
+Compares two benchmark result files written by run_benchmarks.py and fails
+when any benchmark got slower than the regression threshold.
+
+Usage:
+    python benchmarks/compare_benchmarks.py baseline.json current.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a results file written by run_benchmarks.py."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.2, metric: str = 'median_s') -> List[Dict[str, Any]]:
+    """
+    Compare every benchmark measured in both runs.
+
+    Args:
+        baseline: Results of the reference commit
+        current: Results of the commit under test
+        threshold: Allowed slowdown as a fraction (0.2 = 20% slower)
+        metric: Measurement to compare ('median_s' or 'min_s')
+
+    Returns:
+        list: One row per benchmark with both timings, the ratio and a verdict
+            ('regression', 'improvement', 'ok', 'new' or 'missing')
+    """
+    rows = []
+    base_results = baseline['results']
+    current_results = current['results']
+
+    for name in sorted(set(base_results) | set(current_results)):
+        before = base_results.get(name, {})
+        after = current_results.get(name, {})
+        if before.get('status') != 'ok' or after.get('status') != 'ok':
+            verdict = 'new' if after.get('status') == 'ok' else 'missing'
+            rows.append({'name': name, 'before': before.get(metric), 'after': after.get(metric),
+                         'ratio': None, 'verdict': verdict})
+            continue
+
+        ratio = after[metric] / before[metric] if before[metric] else float('inf')
+        if ratio > 1 + threshold:
+            verdict = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            verdict = 'improvement'
+        else:
+            verdict = 'ok'
+        rows.append({'name': name, 'before': before[metric], 'after': after[metric],
+                     'ratio': ratio, 'verdict': verdict})
+    return rows
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument('baseline', help='Results of the reference commit')
+    parser.add_argument('current', help='Results of the commit under test')
+    parser.add_argument('-t', '--threshold', type=float, default=0.2,
+                        help='Allowed slowdown as a fraction (default: 0.2 = 20%%)')
+    parser.add_argument('--metric', choices=['median_s', 'min_s'], default='median_s',
+                        help='Measurement to compare (default: median_s)')
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    rows = compare_results(baseline, current, args.threshold, args.metric)
+
+    icons = {'regression': '❌', 'improvement': '🚀', 'ok': '✅', 'new': '🆕', 'missing': '⏭️ '}
+    print(f"📊 {baseline['meta'].get('commit')} → {current['meta'].get('commit')} "
+          f"({args.metric}, threshold {args.threshold:.0%})")
+    print("=" * 80)
+    for row in rows:
+        if row['ratio'] is None:
+            print(f"{icons[row['verdict']]} {row['name']:<40} {row['verdict']}")
+        else:
+            print(f"{icons[row['verdict']]} {row['name']:<40} {row['before'] * 1000:10.2f}ms → "
+                  f"{row['after'] * 1000:10.2f}ms  x{row['ratio']:.2f}")
+
+    regressions = [row['name'] for row in rows if row['verdict'] == 'regression']
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Memory Benchmark
+
+Runs the Skanda Purana extractors over a growing number of PDF parts and
+records peak traced memory (tracemalloc) for the default in-memory mode and
+for the memory-bounded spool mode (--memory-limit-mb). The bounded mode
+passes when its peak stays flat as parts are added.
+
+Pages are generated synthetically (deterministic roman-script text with
+Skanda names), so the benchmark exercises pattern matching, validation,
+spooling, export and reporting without needing the PDF volumes or PyMuPDF.
+
+Usage:
+    python benchmarks/memory_benchmark.py
+    python benchmarks/memory_benchmark.py --parts 2 4 8 16 32 --memory-limit-mb 1 --json memory.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+NAMES = ['Skanda', 'Shanmukha', 'Saravana', 'Subrahmanya', 'Senani', 'Shaktidhara', 'Chandramukha',
+         'Sanatkumara', 'Shikhivahana', 'Chaitanya', 'Sarvesha', 'Shivakumara']
+WORDS = ['the', 'lord', 'of', 'battle', 'and', 'was', 'born', 'in', 'reed', 'forest', 'with', 'six',
+         'faces', 'deva', 'army', 'peacock', 'spear', 'mountain', 'praised', 'by', 'sages', 'sri']
+
+PAGES_PER_PART = 20
+WORDS_PER_PAGE = 300
+
+
+def synthetic_page(rng: random.Random) -> str:
+    """One page of roman-script text, about one word in eight a Skanda name."""
+    words = [rng.choice(NAMES) if rng.random() < 0.125 else rng.choice(WORDS) for _ in range(WORDS_PER_PAGE)]
+    lines = [' '.join(words[i:i + 12]) + '.' for i in range(0, len(words), 12)]
+    return '\n'.join(lines)
+
+
+def with_synthetic_pages(extractor_class):
+    """Subclass an extractor so each PDF file yields generated pages."""
+    class SyntheticPagesExtractor(extractor_class):
+        def extract_text_from_pdf(self, pdf_path: Path) -> List[Dict]:
+            rng = random.Random(pdf_path.name)
+            pages = []
+            for page_num in range(PAGES_PER_PART):
+                text = synthetic_page(rng)
+                pages.append({'page_num': page_num + 1, 'text': text, 'char_count': len(text),
+                              'method': 'synthetic'})
+            return pages
+    SyntheticPagesExtractor.__name__ = extractor_class.__name__
+    return SyntheticPagesExtractor
+
+
+def load_extractors() -> Dict[str, Any]:
+    """Import both extractors; the full one needs PyMuPDF, tqdm and indic-transliteration."""
+    extractors = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        from skanda_purana_extractor import SkandaPuranaExtractor
+    extractors['skanda_purana_extractor'] = (with_synthetic_pages(SkandaPuranaExtractor), 'export_to_csv',
+                                             'generate_summary_report')
+    try:
+        from run_full_skanda_extraction import FullSkandaPuranaExtractor
+    except ImportError as e:
+        print(f"⏭️  run_full_skanda_extraction skipped: {e}")
+    else:
+        extractors['run_full_skanda_extraction'] = (with_synthetic_pages(FullSkandaPuranaExtractor),
+                                                    'export_final_results', 'generate_final_report')
+    return extractors
+
+
+def measure_peak(extractor_spec, parts: int, memory_limit_mb: Optional[float]) -> Dict[str, Any]:
+    """
+    Extract, export and report over `parts` PDF parts under tracemalloc.
+
+    Args:
+        extractor_spec: (extractor class, export method name, report method name)
+        parts: Number of PDF parts
+        memory_limit_mb: Spool buffer ceiling, or None for the in-memory mode
+
+    Returns:
+        dict: parts, names and peak_bytes
+    """
+    extractor_class, export_method, report_method = extractor_spec
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            folder = Path(scratch, 'pdfs')
+            folder.mkdir()
+            for part in range(1, parts + 1):
+                (folder / f"Skanda-Purana-Part-{part:02d}.pdf").touch()
+
+            tracemalloc.start()
+            extractor = extractor_class(str(folder), memory_limit_mb, 'spool.csv')
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                extractor.process_all_pdfs()
+                getattr(extractor, export_method)('names.csv')
+                getattr(extractor, report_method)()
+            names = len(extractor.extracted_names)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if hasattr(extractor.extracted_names, 'close'):
+                extractor.extracted_names.close()
+        finally:
+            os.chdir(previous)
+    return {'parts': parts, 'names': names, 'peak_bytes': peak}
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Check that memory-bounded extraction keeps peak memory flat")
+    parser.add_argument('--parts', type=int, nargs='+', default=[1, 2, 4, 8], help='PDF part counts to run')
+    parser.add_argument('--memory-limit-mb', type=float, default=1.0, help='Spool buffer ceiling (default: 1MB)')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed peak growth from the smallest to the largest run (default: 0.25 = 25%%)')
+    parser.add_argument('--json', metavar='FILE', help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    # Keep the extractors' log handlers out of the way
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.NullHandler()])
+
+    print("🧠 MEMORY BENCHMARK (tracemalloc peak)")
+    print("=" * 70)
+    results = {}
+    flat = True
+    for name, spec in load_extractors().items():
+        results[name] = {}
+        for mode, limit in (('in_memory', None), ('bounded', args.memory_limit_mb)):
+            runs = [measure_peak(spec, parts, limit) for parts in sorted(args.parts)]
+            growth = runs[-1]['peak_bytes'] / runs[0]['peak_bytes'] - 1
+            results[name][mode] = {'runs': runs, 'growth': growth}
+            for run in runs:
+                print(f"   {name:<28} {mode:<10} {run['parts']:>3} parts {run['names']:>8} names "
+                      f"{run['peak_bytes'] / 1048576:8.1f}MB peak")
+            if mode == 'bounded':
+                ok = growth <= args.tolerance
+                flat = flat and ok
+                print(f"{'✅' if ok else '❌'} {name}: bounded peak grew {growth:+.0%} "
+                      f"from {runs[0]['parts']} to {runs[-1]['parts']} parts (tolerance {args.tolerance:.0%})")
+            else:
+                print(f"ℹ️  {name}: in-memory peak grew {growth:+.0%}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved to: {args.json}")
+
+    sys.exit(0 if flat else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+
+Times the hot paths on the checked-in data: Chaldean scoring, tweak search,
+Cha-prefix optimization, the CSV cleaning scripts and the HTML/PDF/XML
+exporters. Results are written as JSON so two commits can be compared with
+benchmarks/compare_benchmarks.py.
+
+Usage:
+    python benchmarks/run_benchmarks.py -o benchmark_results.json
+    python benchmarks/run_benchmarks.py --filter tweak --quick
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+# Time the searches themselves: keep the tweak cache in memory, not in the repo's tweak_cache.sqlite3
+os.environ.setdefault('TWEAK_CACHE_PATH', '')
+
+SKANDA_CSV = os.path.join(REPO_DIR, 'UNIQUE_SKANDA_PURANA_NAMES.csv')
+THIRUPPUGAZH_CSV = os.path.join(REPO_DIR, 'COMPLETE_THIRUPPUGAZH_ALL_SONGS_WITH_NUMBERS_FINAL.csv')
+
+# Names used for the tweak searches (short, medium and long)
+TWEAK_NAMES = ['Mike', 'David', 'Chaarvik', 'Saravana', 'Alexander']
+
+# name -> setup function returning the callable to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+class SkipBenchmark(Exception):
+    """Raised by a setup function when an optional dependency is missing."""
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under a dotted name."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def _read_column(path: str, column: str) -> List[str]:
+    with open(path, newline='', encoding='utf-8') as f:
+        return [row[column] for row in csv.DictReader(f) if row.get(column)]
+
+
+def _require(module: str) -> None:
+    try:
+        __import__(module)
+    except ImportError:
+        raise SkipBenchmark(f"{module} is not installed")
+
+
+@contextlib.contextmanager
+def _in_scratch_dir(*files: str):
+    """Run inside a temporary copy of the given data files (scripts write to cwd)."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        for file_name in files:
+            shutil.copy(os.path.join(REPO_DIR, file_name), scratch)
+        os.chdir(scratch)
+        try:
+            yield scratch
+        finally:
+            os.chdir(previous)
+
+
+def _quietly(function: Callable, *args) -> Any:
+    """Call a chatty script function with stdout suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = function(*args)
+    if result is None:
+        raise RuntimeError(f"{function.__name__} reported an error")
+    return result
+
+
+# --- Chaldean scoring -------------------------------------------------------
+
+@benchmark('scoring.single_name')
+def setup_single_name_scoring():
+    from chaldean_numerology import calculate_chaldean_sum
+    names = _read_column(SKANDA_CSV, 'Name/Word')
+    return lambda: [calculate_chaldean_sum(name) for name in names]
+
+
+@benchmark('scoring.batch')
+def setup_batch_scoring():
+    from chaldean_numerology import calculate_chaldean_sums
+    names = _read_column(SKANDA_CSV, 'Name/Word')
+    return lambda: calculate_chaldean_sums(names)
+
+
+@benchmark('scoring.profile')
+def setup_profile_scoring():
+    from chaldean_numerology import profile_name
+    names = _read_column(THIRUPPUGAZH_CSV, 'Name')
+    return lambda: [profile_name(name).to_dict() for name in names]
+
+
+@benchmark('scoring.name_dicts')
+def setup_name_dict_analysis():
+    from subramanya_names import analyze_subramanya_names
+    return lambda: _quietly(analyze_subramanya_names)
+
+
+@benchmark('index.build_default')
+def setup_index_build():
+    from chaldean_index import build_default_index
+    return build_default_index
+
+
+# --- Tweak search -----------------------------------------------------------
+
+def _tweak_search(max_changes: int):
+    from name_tweaker import find_target_tweaks
+    return lambda: [find_target_tweaks(name, max_changes=max_changes) for name in TWEAK_NAMES]
+
+
+for _max_changes in range(1, 5):
+    benchmark(f'tweak.max_changes_{_max_changes}')(
+        lambda max_changes=_max_changes: _tweak_search(max_changes))
+
+
+@benchmark('tweak.cha_prefix')
+def setup_cha_prefix_optimization():
+    from subramanya_names import get_subramanya_names_starting_with_cha
+    from subramanya_tweaker import find_cha_target_tweaks
+    names = list(get_subramanya_names_starting_with_cha())[:20]
+    return lambda: [find_cha_target_tweaks(name, max_changes=3) for name in names]
+
+
+# --- CSV cleaning scripts ---------------------------------------------------
+
+def _cleaning_script(module: str, function: str):
+    _require('pandas')
+    script = getattr(__import__(module), function)
+
+    def run():
+        with _in_scratch_dir('AUTHENTIC_SANSKRIT_BABY_NAMES.csv'):
+            return _quietly(script)
+    return run
+
+
+@benchmark('cleaning.clean_skanda_purana_csv')
+def setup_clean_skanda():
+    return _cleaning_script('clean_skanda_purana_csv', 'clean_skanda_purana_csv')
+
+
+@benchmark('cleaning.comprehensive_clean_csv')
+def setup_comprehensive_clean():
+    return _cleaning_script('comprehensive_clean_csv', 'comprehensive_clean_csv')
+
+
+@benchmark('cleaning.final_clean_csv')
+def setup_final_clean():
+    return _cleaning_script('final_clean_csv', 'final_clean_csv')
+
+
+# --- Exports ----------------------------------------------------------------
+
+@benchmark('export.html_thiruppugazh')
+def setup_html_export():
+    _require('pandas')
+    from csv_to_html_converter import csv_to_html
+    return lambda: csv_to_html(THIRUPPUGAZH_CSV)
+
+
+@benchmark('export.html_with_meaning')
+def setup_html_with_meaning_export():
+    _require('pandas')
+    from csv_to_html_with_meaning import csv_to_html_with_meaning
+    return lambda: csv_to_html_with_meaning(THIRUPPUGAZH_CSV)
+
+
+@benchmark('export.html_skanda')
+def setup_skanda_html_export():
+    _require('pandas')
+    from convert_skanda_to_html import create_skanda_html
+
+    def run():
+        with _in_scratch_dir('FINAL_CLEAN_AUTHENTIC_SANSKRIT_BABY_NAMES.csv'):
+            with contextlib.redirect_stdout(io.StringIO()):
+                create_skanda_html()
+    return run
+
+
+@benchmark('export.pdf_thiruppugazh')
+def setup_pdf_export():
+    _require('reportlab')
+    _require('pandas')
+    from csv_to_pdf_converter import ThiruppugazhPDFGenerator
+
+    def run():
+        with _in_scratch_dir(os.path.basename(THIRUPPUGAZH_CSV)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                ThiruppugazhPDFGenerator(os.path.basename(THIRUPPUGAZH_CSV)).generate_pdf()
+    return run
+
+
+@benchmark('export.xml_corpus')
+def setup_xml_export():
+    from corpus_documentation_system import CorpusDocumentationSystem
+    with open(SKANDA_CSV, newline='', encoding='utf-8') as f:
+        names = [{
+            'devanagari': row['Name/Word'],
+            'transliteration': row['Found Form'],
+            'english_meaning': row['Monier Williams Meaning'],
+            'source': row['Part#'],
+            'reference': row['Page#'],
+        } for row in csv.DictReader(f)]
+
+    doc_system = CorpusDocumentationSystem()
+    doc_system.add_names(names, [])
+
+    def run():
+        with tempfile.TemporaryDirectory() as scratch:
+            doc_system.generate_xml_export(os.path.join(scratch, 'corpus.xml'))
+    return run
+
+
+# --- Runner -----------------------------------------------------------------
+
+def measure(function: Callable[[], Any], repeat: int = 5) -> Dict[str, Any]:
+    """
+    Time a callable like timeit: calibrate the loop count, then repeat.
+
+    Args:
+        function: Callable to time
+        repeat: Number of timed rounds
+
+    Returns:
+        dict: Per-call median/min seconds and the rounds/loops used
+    """
+    timer = timeit.Timer(function)
+    loops, first_total = timer.autorange()
+    totals = [first_total] + timer.repeat(repeat=max(0, repeat - 1), number=loops)
+    per_call = [total / loops for total in totals]
+    return {
+        'status': 'ok',
+        'median_s': statistics.median(per_call),
+        'min_s': min(per_call),
+        'rounds': len(per_call),
+        'loops': loops
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(name_filter: Optional[str] = None, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Run every registered benchmark (optionally filtered by substring).
+
+    Args:
+        name_filter: Only run benchmarks whose name contains this string
+        repeat: Timed rounds per benchmark
+
+    Returns:
+        dict: {'meta': {...}, 'results': {name: measurement}}
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            results[name] = measure(setup(), repeat)
+            print(f"✅ {name:<40} {results[name]['median_s'] * 1000:10.2f}ms "
+                  f"(min {results[name]['min_s'] * 1000:.2f}ms, {results[name]['loops']} loops)")
+        except SkipBenchmark as e:
+            results[name] = {'status': 'skipped', 'reason': str(e)}
+            print(f"⏭️  {name:<40} skipped: {e}")
+        except Exception as e:
+            results[name] = {'status': 'error', 'reason': f"{type(e).__name__}: {e}"}
+            print(f"❌ {name:<40} {type(e).__name__}: {e}")
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Time the scoring, tweak, cleaning and export hot paths")
+    parser.add_argument('-o', '--output', metavar='FILE', default='benchmark_results.json',
+                        help='JSON results file (default: benchmark_results.json)')
+    parser.add_argument('-f', '--filter', metavar='TEXT', help='Only run benchmarks whose name contains TEXT')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Timed rounds per benchmark (default: 5)')
+    parser.add_argument('--quick', action='store_true', help='One timed round per benchmark')
+    parser.add_argument('--list', action='store_true', help='List benchmark names and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        return
+
+    print("⏱️  BENCHMARK SUITE")
+    print("=" * 70)
+    start = time.perf_counter()
+    report = run_benchmarks(args.filter, 1 if args.quick else args.repeat)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results saved to: {args.output} ({time.perf_counter() - start:.1f}s)")
+
+    if any(result['status'] == 'error' for result in report['results'].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""
+Chaldean Sum Index
+
+This module provides a sum-bucketed inverted index over name sources.
+Every name is scored once when it is added; queries by exact sum, sum range
+or distance to a target are then bucket lookups and bisects over the sorted
+list of distinct sums instead of full rescans.
+"""
+
+import csv
+import heapq
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from chaldean_numerology import calculate_chaldean_sums
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (file, name column, source label) for the checked-in CSV name sources
+CSV_SOURCES = [
+    ('COMPLETE_THIRUPPUGAZH_ALL_SONGS_WITH_NUMBERS_FINAL.csv', 'Name', 'thiruppugazh'),
+    ('UNIQUE_SKANDA_PURANA_NAMES.csv', 'Name/Word', 'skanda_purana'),
+    ('SKANDA_BABY_NAMES.csv', 'Name', 'skanda_baby_names'),
+    ('THOROUGHLY_CLEANED_AUTHENTIC_SANSKRIT_BABY_NAMES.csv', 'Name', 'authentic_sanskrit'),
+    ('sanskrit_names_extracted.csv', 'Transliteration', 'sanskrit_extractor'),
+    ('tamil_names_extracted.csv', 'Transliteration', 'tamil_extractor'),
+    ('complete_subramanya_names_database.csv', 'Transliteration', 'subramanya_corpus'),
+]
+
+
+@dataclass
+class IndexedName:
+    """A name held by a ChaldeanIndex."""
+    name_id: int
+    name: str
+    source: str
+    chaldean_sum: int
+    info: Any = field(default=None, repr=False)
+
+
+class ChaldeanIndex:
+    """
+    Inverted index from Chaldean sum to name ids.
+
+    Ids are assigned in insertion order, so every bucket is a sorted array
+    and results come back in the order the names were added.
+    """
+
+    def __init__(self):
+        self.entries: List[IndexedName] = []
+        self._buckets: Dict[int, array] = {}
+        self._sums: List[int] = []
+        self._sums_stale = False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, name: str, source: str, info: Any = None,
+            chaldean_sum: Optional[int] = None) -> int:
+        """
+        Add a single name.
+
+        Args:
+            name: The name to index
+            source: Label of the source the name came from
+            info: Arbitrary payload returned with query results
+            chaldean_sum: Precomputed sum (scored here when omitted)
+
+        Returns:
+            int: The id assigned to the name
+        """
+        if chaldean_sum is None:
+            chaldean_sum = int(calculate_chaldean_sums([name])[0])
+        return self._insert(name, source, info, int(chaldean_sum))
+
+    def add_many(self, names: Iterable[str], source: str,
+                 infos: Optional[Iterable[Any]] = None) -> None:
+        """
+        Add many names from one source, scoring them in a single batch.
+
+        Args:
+            names: Names to index
+            source: Label of the source the names came from
+            infos: Payloads matching names one to one (optional)
+        """
+        names = list(names)
+        infos = list(infos) if infos is not None else [None] * len(names)
+        for name, info, chaldean_sum in zip(names, infos, calculate_chaldean_sums(names)):
+            self._insert(name, source, info, int(chaldean_sum))
+
+    def add_dict(self, names_db: Dict[str, Any], source: str) -> None:
+        """
+        Add an in-module name dict ({name: info}).
+
+        Args:
+            names_db: Mapping from name to its info dict
+            source: Label of the source
+        """
+        self.add_many(list(names_db), source, list(names_db.values()))
+
+    def add_csv(self, path: str, name_column: str, source: str) -> int:
+        """
+        Add every non-empty name from a CSV column; rows are kept as info.
+
+        Args:
+            path: CSV file path
+            name_column: Column holding the name
+            source: Label of the source
+
+        Returns:
+            int: Number of names added (0 if the file is missing)
+        """
+        if not os.path.exists(path):
+            return 0
+
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = [row for row in csv.DictReader(f) if (row.get(name_column) or '').strip()]
+        self.add_many([row[name_column].strip() for row in rows], source, rows)
+        return len(rows)
+
+    def _insert(self, name: str, source: str, info: Any, chaldean_sum: int) -> int:
+        name_id = len(self.entries)
+        self.entries.append(IndexedName(name_id, name, source, chaldean_sum, info))
+        bucket = self._buckets.get(chaldean_sum)
+        if bucket is None:
+            self._buckets[chaldean_sum] = bucket = array('l')
+            self._sums_stale = True
+        bucket.append(name_id)
+        return name_id
+
+    def _distinct_sums(self) -> List[int]:
+        if self._sums_stale:
+            self._sums = sorted(self._buckets)
+            self._sums_stale = False
+        return self._sums
+
+    def _collect(self, buckets: List[array], source: Optional[str]) -> List[IndexedName]:
+        """Merge buckets back into id order and resolve entries."""
+        ids = buckets[0] if len(buckets) == 1 else heapq.merge(*buckets)
+        entries = [self.entries[name_id] for name_id in ids]
+        if source is not None:
+            entries = [entry for entry in entries if entry.source == source]
+        return entries
+
+    def sum_distribution(self) -> Dict[int, int]:
+        """
+        Count names per Chaldean sum.
+
+        Returns:
+            dict: Sum -> number of names, in ascending sum order
+        """
+        return {chaldean_sum: len(self._buckets[chaldean_sum]) for chaldean_sum in self._distinct_sums()}
+
+    def with_sum(self, chaldean_sum: int, source: Optional[str] = None) -> List[IndexedName]:
+        """
+        Names whose sum equals chaldean_sum.
+
+        Args:
+            chaldean_sum: Exact sum to look up
+            source: Restrict to one source label (optional)
+
+        Returns:
+            list: Matching entries in insertion order
+        """
+        bucket = self._buckets.get(chaldean_sum)
+        return self._collect([bucket], source) if bucket else []
+
+    def with_sums(self, sums: Iterable[int], source: Optional[str] = None) -> List[IndexedName]:
+        """
+        Names whose sum is any of sums (e.g. the 14/41 targets).
+
+        Args:
+            sums: Sums to look up
+            source: Restrict to one source label (optional)
+
+        Returns:
+            list: Matching entries in insertion order
+        """
+        buckets = [self._buckets[s] for s in set(sums) if s in self._buckets]
+        return self._collect(buckets, source) if buckets else []
+
+    def in_range(self, min_sum: int, max_sum: int, source: Optional[str] = None) -> List[IndexedName]:
+        """
+        Names whose sum lies in [min_sum, max_sum].
+
+        Args:
+            min_sum: Smallest sum (inclusive)
+            max_sum: Largest sum (inclusive)
+            source: Restrict to one source label (optional)
+
+        Returns:
+            list: Matching entries in insertion order
+        """
+        sums = self._distinct_sums()
+        selected = sums[bisect_left(sums, min_sum):bisect_right(sums, max_sum)]
+        return self._collect([self._buckets[s] for s in selected], source) if selected else []
+
+    def nearest(self, target: int, limit: Optional[int] = None,
+                source: Optional[str] = None) -> List[IndexedName]:
+        """
+        Names ordered by distance of their sum to target.
+
+        Walks outwards from the target's position among the distinct sums,
+        so only the buckets needed to fill limit are touched. Names at the
+        same distance keep their insertion order.
+
+        Args:
+            target: Target sum
+            limit: Maximum number of names to return (None for all)
+            source: Restrict to one source label (optional)
+
+        Returns:
+            list: Entries sorted by distance to target
+        """
+        sums = self._distinct_sums()
+        below = bisect_left(sums, target) - 1
+        above = below + 1
+        results = []
+
+        while below >= 0 or above < len(sums):
+            distance_below = target - sums[below] if below >= 0 else None
+            distance_above = sums[above] - target if above < len(sums) else None
+            distance = min(d for d in (distance_below, distance_above) if d is not None)
+
+            ring = []
+            if distance_below == distance:
+                ring.append(self._buckets[sums[below]])
+                below -= 1
+            if distance_above == distance:
+                ring.append(self._buckets[sums[above]])
+                above += 1
+
+            results.extend(self._collect(ring, source))
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+
+        return results
+
+
+def _load_dict_source(index: ChaldeanIndex, source: str) -> None:
+    """Add one of the in-module name dicts to an index."""
+    if source == 'subramanya_names':
+        from subramanya_names import SUBRAMANYA_NAMES_CHA as names_db
+    elif source == 'comprehensive_subramanya_database':
+        from comprehensive_subramanya_database import COMPREHENSIVE_SUBRAMANYA_NAMES as names_db
+    else:
+        from enhanced_thiruppugazh_database import ENHANCED_THIRUPPUGAZH_NAMES as names_db
+    index.add_dict(names_db, source)
+
+
+DICT_SOURCES = ['subramanya_names', 'comprehensive_subramanya_database', 'enhanced_thiruppugazh_database']
+
+
+def _load_source(index: ChaldeanIndex, source: str, data_dir: str) -> None:
+    """Add a single named source (dict or CSV) to an index."""
+    if source in DICT_SOURCES:
+        _load_dict_source(index, source)
+        return
+    for file_name, name_column, csv_source in CSV_SOURCES:
+        if csv_source == source:
+            index.add_csv(os.path.join(data_dir, file_name), name_column, source)
+            return
+    raise ValueError(f"Unknown name source: {source}")
+
+
+def build_default_index(data_dir: str = DATA_DIR) -> ChaldeanIndex:
+    """
+    Build an index over every name source in the repository.
+
+    Covers the in-module name dicts (DICT_SOURCES) and the Thiruppugazh,
+    Skanda and extractor-output CSVs (CSV_SOURCES).
+
+    Args:
+        data_dir: Directory holding the CSV files
+
+    Returns:
+        ChaldeanIndex: Index over all sources
+    """
+    index = ChaldeanIndex()
+    for source in DICT_SOURCES + [source for _, _, source in CSV_SOURCES]:
+        _load_source(index, source, data_dir)
+    return index
+
+
+_default_index = None
+_source_indexes: Dict[str, ChaldeanIndex] = {}
+
+
+def get_default_index() -> ChaldeanIndex:
+    """
+    Get the shared index over all name sources (built on first use).
+
+    Returns:
+        ChaldeanIndex: The process-wide index
+    """
+    global _default_index
+    if _default_index is None:
+        _default_index = build_default_index()
+    return _default_index
+
+
+def get_source_index(source: str) -> ChaldeanIndex:
+    """
+    Get a shared index over a single name source (built on first use).
+
+    Cheaper than get_default_index() for callers that only query one source,
+    e.g. the in-module dicts.
+
+    Args:
+        source: A label from DICT_SOURCES or CSV_SOURCES
+
+    Returns:
+        ChaldeanIndex: The process-wide index for that source
+    """
+    index = _source_indexes.get(source)
+    if index is None:
+        index = ChaldeanIndex()
+        _load_source(index, source, DATA_DIR)
+        _source_indexes[source] = index
+    return index
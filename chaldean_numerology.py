@@ -5,6 +5,68 @@ This module provides functions to calculate Chaldean numerology values for names
 In Chaldean numerology, letters are assigned values 1-8 (9 is not used).
 """
 
+# numpy is optional and only needed for batch scoring, so it is imported on
+# first use (see _load_numpy) instead of adding ~100ms to every CLI start.
+np = None
+_numpy_checked = False
+
+
+CHALDEAN_MAP = {
+    'A': 1, 'I': 1, 'J': 1, 'Q': 1, 'Y': 1,
+    'B': 2, 'K': 2, 'R': 2,
+    'C': 3, 'G': 3, 'L': 3, 'S': 3,
+    'D': 4, 'M': 4, 'T': 4,
+    'E': 5, 'H': 5, 'N': 5, 'X': 5,
+    'U': 6, 'V': 6, 'W': 6,
+    'O': 7, 'Z': 7,
+    'F': 8, 'P': 8
+}
+
+
+def _build_codepoint_table():
+    """
+    Build a code point -> Chaldean value lookup table.
+
+    Covers every character that scores non-zero through get_chaldean_value:
+    ASCII letters in both cases plus the two non-ASCII letters whose
+    uppercase form is an ASCII letter (dotless i and long s).
+
+    Returns:
+        list: Values indexed by code point; unlisted code points score 0
+    """
+    table = [0] * 0x180
+    for letter, value in CHALDEAN_MAP.items():
+        table[ord(letter)] = value
+        table[ord(letter.lower())] = value
+    table[0x131] = CHALDEAN_MAP['I']  # 'ı'.upper() == 'I'
+    table[0x17F] = CHALDEAN_MAP['S']  # 'ſ'.upper() == 'S'
+    return table
+
+
+_CODEPOINT_TABLE = _build_codepoint_table()
+_CODEPOINT_ARRAY = None
+
+
+def _load_numpy():
+    """
+    Import numpy and build the code point array on first use.
+
+    Returns:
+        module: numpy, or None when it is not installed (pure Python fallback)
+    """
+    global np, _numpy_checked, _CODEPOINT_ARRAY
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+        if np is not None:
+            _CODEPOINT_ARRAY = np.array(_CODEPOINT_TABLE, dtype=np.int64)
+    return np
+
+
 def get_chaldean_value(letter):
     """
     Get the Chaldean numerology value for a single letter.
@@ -15,20 +77,7 @@ def get_chaldean_value(letter):
     Returns:
         int: The Chaldean value (1-8)
     """
-    letter = letter.upper()
-    
-    chaldean_map = {
-        'A': 1, 'I': 1, 'J': 1, 'Q': 1, 'Y': 1,
-        'B': 2, 'K': 2, 'R': 2,
-        'C': 3, 'G': 3, 'L': 3, 'S': 3,
-        'D': 4, 'M': 4, 'T': 4,
-        'E': 5, 'H': 5, 'N': 5, 'X': 5,
-        'U': 6, 'V': 6, 'W': 6,
-        'O': 7, 'Z': 7,
-        'F': 8, 'P': 8
-    }
-    
-    return chaldean_map.get(letter, 0)
+    return CHALDEAN_MAP.get(letter.upper(), 0)
 
 
 def calculate_chaldean_sum(name):
@@ -48,6 +97,41 @@ def calculate_chaldean_sum(name):
     return total
 
 
+def calculate_chaldean_sums(names):
+    """
+    Calculate Chaldean sums for many names in one vectorized pass.
+    
+    All names are encoded into a single UTF-32 buffer, mapped through a
+    precomputed code point table and summed per name, so the cost is one
+    numpy pass over the corpus instead of a Python loop per letter.
+    
+    Args:
+        names: Iterable of names, e.g. a list or a pandas Series.
+            Missing values (None/NaN) score 0.
+        
+    Returns:
+        numpy.ndarray: Chaldean sum per name, in input order
+            (a plain list when numpy is not installed)
+    """
+    names = [name if isinstance(name, str) else '' for name in names]
+    np = _load_numpy()
+    
+    if np is None:
+        return [sum(_CODEPOINT_TABLE[ord(c)] for c in name if ord(c) < len(_CODEPOINT_TABLE))
+                for name in names]
+    
+    if not names:
+        return np.zeros(0, dtype=np.int64)
+    
+    codepoints = np.frombuffer(''.join(names).encode('utf-32-le'), dtype=np.uint32)
+    in_table = codepoints < len(_CODEPOINT_ARRAY)
+    values = np.where(in_table, _CODEPOINT_ARRAY[np.where(in_table, codepoints, 0)], 0)
+    
+    ends = np.cumsum([len(name) for name in names])
+    running = np.concatenate(([0], np.cumsum(values)))
+    return running[ends] - running[np.concatenate(([0], ends[:-1]))]
+
+
 def reduce_to_single_digit(number):
     """
     Reduce a number to a single digit by repeatedly adding its digits.
@@ -58,11 +142,126 @@ def reduce_to_single_digit(number):
     Returns:
         int: The reduced single digit
     """
-    while number > 9:
-        number = sum(int(digit) for digit in str(number))
+    if number > 9:
+        # Digital root: repeated digit sums of n land on 1 + (n - 1) % 9
+        return 1 + (number - 1) % 9
     return number
 
 
+# Chaldean compound numbers carry individual meanings from 10 up to 52
+COMPOUND_NUMBER_LIMIT = 52
+
+VOWELS = frozenset('AEIOUaeiouı')
+
+_LETTER_VALUES = {chr(codepoint): value for codepoint, value in enumerate(_CODEPOINT_TABLE) if value}
+
+
+class NameProfile:
+    """
+    Compact Chaldean numerology profile of a single name.
+    
+    Built by profile_name() in one pass over the cleaned name. The per-letter
+    breakdown is only materialised when letter_breakdown is first accessed.
+    """
+    
+    __slots__ = ('name', 'clean_name', 'total_sum', 'reduced_value', 'compound_number',
+                 'vowel_sum', 'consonant_sum', '_letter_breakdown')
+    
+    def __init__(self, name, clean_name, total_sum, vowel_sum):
+        self.name = name
+        self.clean_name = clean_name
+        self.total_sum = total_sum
+        self.reduced_value = reduce_to_single_digit(total_sum)
+        self.compound_number = get_compound_number(total_sum)
+        self.vowel_sum = vowel_sum
+        self.consonant_sum = total_sum - vowel_sum
+        self._letter_breakdown = None
+    
+    @property
+    def is_target(self):
+        """bool: True if the total is 14 or 41 (both reduce to 5)."""
+        return self.total_sum in [14, 41]
+    
+    @property
+    def letter_breakdown(self):
+        """list: Per-letter dicts with 'letter' and 'value', built on first access."""
+        if self._letter_breakdown is None:
+            self._letter_breakdown = [
+                {'letter': letter, 'value': _LETTER_VALUES.get(letter, 0)}
+                for letter in self.clean_name
+            ]
+        return self._letter_breakdown
+    
+    def to_dict(self):
+        """
+        Convert the profile to the dict layout returned by get_name_analysis.
+        
+        Returns:
+            dict: Analysis dict including the letter breakdown
+        """
+        return {
+            'name': self.name,
+            'clean_name': self.clean_name,
+            'total_sum': self.total_sum,
+            'reduced_value': self.reduced_value,
+            'compound_number': self.compound_number,
+            'vowel_sum': self.vowel_sum,
+            'consonant_sum': self.consonant_sum,
+            'letter_breakdown': self.letter_breakdown,
+            'is_target': self.is_target
+        }
+    
+    def __repr__(self):
+        return (f"NameProfile(name={self.name!r}, total_sum={self.total_sum}, "
+                f"reduced_value={self.reduced_value}, vowel_sum={self.vowel_sum}, "
+                f"consonant_sum={self.consonant_sum})")
+
+
+def get_compound_number(number):
+    """
+    Get the Chaldean compound number for a total.
+    
+    Totals above 52 are digit-summed until they fall in the compound range.
+    
+    Args:
+        number (int): The Chaldean total
+        
+    Returns:
+        int or None: The compound number (10-52), or None for single-digit totals
+    """
+    while number > COMPOUND_NUMBER_LIMIT:
+        digit_sum = 0
+        while number:
+            number, digit = divmod(number, 10)
+            digit_sum += digit
+        number = digit_sum
+    return number if number > 9 else None
+
+
+def profile_name(name):
+    """
+    Compute a full Chaldean numerology profile for a name in one pass.
+    
+    Args:
+        name (str): The name to profile
+        
+    Returns:
+        NameProfile: Total, reduced value, compound number and vowel/consonant sums
+    """
+    clean_name = name if name.isalpha() else ''.join(filter(str.isalpha, name))
+    lookup = _LETTER_VALUES.get
+    
+    total_sum = 0
+    vowel_sum = 0
+    for letter in clean_name:
+        value = lookup(letter, 0)
+        total_sum += value
+        if letter in VOWELS:
+            vowel_sum += value
+    
+    return NameProfile(name, clean_name, total_sum, vowel_sum)
+
+
 def get_name_analysis(name):
     """
     Get complete Chaldean numerology analysis for a name.
@@ -73,25 +272,7 @@ def get_name_analysis(name):
     Returns:
         dict: Analysis containing total sum, reduced value, and letter breakdown
     """
-    name_clean = ''.join(letter for letter in name if letter.isalpha())
-    total_sum = calculate_chaldean_sum(name_clean)
-    reduced_value = reduce_to_single_digit(total_sum)
-    
-    letter_breakdown = []
-    for letter in name_clean:
-        letter_breakdown.append({
-            'letter': letter,
-            'value': get_chaldean_value(letter)
-        })
-    
-    return {
-        'name': name,
-        'clean_name': name_clean,
-        'total_sum': total_sum,
-        'reduced_value': reduced_value,
-        'letter_breakdown': letter_breakdown,
-        'is_target': total_sum in [14, 41]  # Both reduce to 5
-    }
+    return profile_name(name).to_dict()
 
 
 def is_target_value(name):
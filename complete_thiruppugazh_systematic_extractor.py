@@ -7,6 +7,7 @@ as requested. This addresses the inadequate 20 names with systematic
 web extraction from all English translations.
 
 URL Pattern: https://kaumaram.com/thiru/nnt000X_u.html#english (X = 6 to 1340)
+Songs are fetched concurrently by song_fetcher.SongFetcher and handled in order.
 """
 
 import requests
@@ -19,7 +20,13 @@ from dataclasses import dataclass, asdict
 from bs4 import BeautifulSoup, NavigableString
 import random
 from datetime import datetime
-import pickle
+import argparse
+
+from instrumentation import INSTRUMENTATION as instr, add_profile_argument, profiling
+from run_metrics import add_metrics_arguments, metrics_reporting
+from name_matcher import get_name_matcher
+from song_fetcher import SongFetcher, add_fetcher_arguments
+from song_journal import SongJournal, archive_journal, replay_journal
 
 @dataclass
 class CompleteThiruppugazhName:
@@ -34,12 +41,13 @@ class CompleteThiruppugazhName:
     category: str
     confidence: float
     extraction_timestamp: str
+    pattern_family: str = ''
 
 class CompleteThiruppugazhSystematicExtractor:
     """Complete systematic extractor for all 1,340 songs."""
     
-    def __init__(self):
-        self.base_url = "https://kaumaram.com/thiru/"
+    def __init__(self, base_url: str = "https://kaumaram.com/thiru/"):
+        self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -50,91 +58,8 @@ class CompleteThiruppugazhSystematicExtractor:
             'Upgrade-Insecure-Requests': '1'
         })
         
-        # Comprehensive patterns for all Sa/Cha/Sha variations
-        self.comprehensive_patterns = [
-            # SARAVANA group (highest priority - birth place)
-            r'\b[Ss]aravana?(?:bhava?|bava?|perumal|n|m|r|k)?\b',
-            r'\b[Ss]haravan[a-z]*\b',
-            r'\b[Ss]arvan[a-z]*\b',
-            
-            # SHAKTI/SAKTI group (power/weapon)
-            r'\b[Ss]h?akti(?:vel|vEl|dhar[a-z]*|pan[a-z]*)?\b',
-            r'\b[Ss]h?akti[a-z]*\b',
-            
-            # SHANMUKHA/SANMUKHA group (six-faced)
-            r'\b[Ss]h?anmukh[a-z]*\b',
-            r'\b[Cc]h?anmukh[a-z]*\b',
-            r'\b[Ss]h?anmugan?\b',
-            r'\b[Cc]h?anmugan?\b',
-            
-            # SIVA/SHIVA group (father)
-            r'\b[Ss]h?iva[a-z]*\b',
-            r'\b[Ss]h?ivan?\b',
-            
-            # SUBRAHMANYA group (primary name)
-            r'\b[Ss]ubrahmany[a-z]*\b',
-            r'\b[Ss]ubramany[a-z]*\b',
-            r'\b[Ss]ubramaniam?\b',
-            
-            # SAMI/SWAMI group (lord/master)
-            r'\b[Ss]wami[a-z]*\b',
-            r'\b[Ss]ami[a-z]*\b',
-            r'\b[Cc]h?ami[a-z]*\b',
-            
-            # CHANDRA/CHANDRAN group (moon)
-            r'\b[Cc]h?andra[a-z]*\b',
-            r'\b[Ss]h?andra[a-z]*\b',
-            r'\b[Cc]h?andran?\b',
-            
-            # SARAN/CHARAN group (feet/refuge)
-            r'\b[Ss]h?aran[a-z]*\b',
-            r'\b[Cc]h?aran[a-z]*\b',
-            r'\b[Ss]h?aranagat[a-z]*\b',
-            
-            # SHAMBHU group (auspicious)
-            r'\b[Ss]h?ambhu[a-z]*\b',
-            r'\b[Cc]h?ambhu[a-z]*\b',
-            
-            # CHAITANYA group (consciousness)
-            r'\b[Cc]h?aitany[a-z]*\b',
-            r'\b[Ss]h?aitany[a-z]*\b',
-            
-            # CHAKRA group (discus/wheel)
-            r'\b[Cc]h?akra[a-z]*\b',
-            r'\b[Ss]h?akra[a-z]*\b',
-            
-            # SHANKARA group (benevolent)
-            r'\b[Ss]h?ankar[a-z]*\b',
-            r'\b[Cc]h?ankar[a-z]*\b',
-            
-            # SHAILA group (mountain)
-            r'\b[Ss]h?aila[a-z]*\b',
-            r'\b[Cc]h?aila[a-z]*\b',
-            
-            # SHANTI group (peace)
-            r'\b[Ss]h?anti[a-z]*\b',
-            r'\b[Cc]h?anti[a-z]*\b',
-            
-            # CHATURMUKHA group (four-faced)
-            r'\b[Cc]h?aturmukh[a-z]*\b',
-            r'\b[Ss]h?aturmukh[a-z]*\b',
-            
-            # Additional comprehensive patterns
-            r'\b[Ss]h?arad[a-z]*\b',  # Autumn/wisdom
-            r'\b[Cc]h?arit[a-z]*\b',  # Character/story
-            r'\b[Ss]h?ashi[a-z]*\b',  # Six/moon
-            r'\b[Cc]h?akrav[a-z]*\b', # Chakra variants
-            r'\b[Ss]h?arma[a-z]*\b',  # Joy/protection
-            r'\b[Cc]h?arma[a-z]*\b',  # Skin/shield
-            r'\b[Ss]h?astra[a-z]*\b', # Scripture/weapon
-            r'\b[Cc]h?atur[a-z]*\b',  # Four-related
-            r'\b[Ss]h?anatan[a-z]*\b', # Eternal
-            r'\b[Cc]h?etan[a-z]*\b',  # Consciousness
-            r'\b[Ss]h?akta[a-z]*\b',  # Powerful
-            r'\b[Cc]h?akta[a-z]*\b',  # Able/powerful
-            r'\b[Ss]h?aran[a-z]*\b',  # Refuge/protection
-            r'\b[Cc]h?iran[a-z]*\b'   # Eternal/long-lasting
-        ]
+        # Comprehensive patterns for all Sa/Cha/Sha variations ('complete' set of the shared matcher)
+        self.matcher = get_name_matcher()
         
         # Enhanced divine context indicators
         self.divine_context_indicators = [
@@ -152,29 +77,28 @@ class CompleteThiruppugazhSystematicExtractor:
         self.extracted_names = []
         self.failed_extractions = []
         self.processed_songs = 0
-        self.progress_file = "thiruppugazh_extraction_progress.pickle"
+        self.completed_songs = set()
+        
+        # Each finished song is appended to the journal; see song_journal.py
+        self.journal_path = "thiruppugazh_extraction_journal.jsonl"
+        self.journal = None
         
     def save_progress(self):
-        """Save current progress to file."""
-        progress_data = {
-            'extracted_names': self.extracted_names,
-            'failed_extractions': self.failed_extractions,
-            'processed_songs': self.processed_songs,
-            'timestamp': datetime.now().isoformat()
-        }
-        with open(self.progress_file, 'wb') as f:
-            pickle.dump(progress_data, f)
+        """Flush the checkpoint journal to disk (songs are appended as they finish)."""
+        if self.journal is not None:
+            self.journal.sync()
     
     def load_progress(self) -> bool:
-        """Load previous progress if exists."""
-        if os.path.exists(self.progress_file):
+        """Replay the checkpoint journal of a previous run, if there is one."""
+        if os.path.exists(self.journal_path):
             try:
-                with open(self.progress_file, 'rb') as f:
-                    progress_data = pickle.load(f)
+                state = replay_journal(self.journal_path)
                 
-                self.extracted_names = progress_data['extracted_names']
-                self.failed_extractions = progress_data['failed_extractions']
-                self.processed_songs = progress_data['processed_songs']
+                self.extracted_names = [CompleteThiruppugazhName(**record) for record in state.records]
+                self.failed_extractions = state.failed
+                self.completed_songs = set(state.songs) - set(state.errors)
+                # Songs journaled with an error are fetched and counted again
+                self.processed_songs = len(self.completed_songs)
                 
                 print(f"✅ Loaded previous progress: {len(self.extracted_names)} names from {self.processed_songs} songs")
                 return True
@@ -189,49 +113,73 @@ class CompleteThiruppugazhSystematicExtractor:
         
         try:
             # Respectful delay with randomization
-            time.sleep(random.uniform(0.4, 1.2))
-            
-            response = self.session.get(url, timeout=20)
-            response.raise_for_status()
+            with instr.span('throttle'):
+                time.sleep(random.uniform(0.4, 1.2))
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract song title
-            title_elem = soup.find('title')
-            song_title = title_elem.text.strip() if title_elem else f"Thiruppugazh Song {song_number}"
-            
-            # Get comprehensive text content
-            page_text = soup.get_text()
+            with instr.span('fetch'):
+                response = self.session.get(url, timeout=20)
+                response.raise_for_status()
+            instr.count('pages')
+        except Exception as e:
+            instr.count('errors')
+            self.failed_extractions.append((song_number, str(e)))
+            return []
+        
+        return self.extract_names_from_page(song_number, response.content)
+    
+    def extract_names_from_page(self, song_number: int, content: bytes) -> List[CompleteThiruppugazhName]:
+        """
+        Extract names from the HTML of a fetched song page.
+        
+        Args:
+            song_number: Song number
+            content: Page HTML
             
-            # Extract English content with multiple methods
-            english_sections = self._comprehensive_english_extraction(soup, page_text)
+        Returns:
+            List[CompleteThiruppugazhName]: Names found, deduplicated within the song
+        """
+        url = f"{self.base_url}nnt{song_number:04d}_u.html"
+        
+        try:
+            with instr.span('parse'):
+                soup = BeautifulSoup(content, 'html.parser')
+                
+                # Extract song title
+                title_elem = soup.find('title')
+                song_title = title_elem.text.strip() if title_elem else f"Thiruppugazh Song {song_number}"
+                
+                # Get comprehensive text content
+                page_text = soup.get_text()
+                
+                # Extract English content with multiple methods
+                english_sections = self._comprehensive_english_extraction(soup, page_text)
             
             extracted_names = []
             timestamp = datetime.now().isoformat()
             
             # Apply comprehensive pattern matching
-            for english_text in english_sections:
-                for pattern in self.comprehensive_patterns:
-                    matches = re.finditer(pattern, english_text, re.IGNORECASE)
-                    
-                    for match in matches:
-                        potential_name = match.group().strip()
+            with instr.span('pattern_match'):
+                for english_text in english_sections:
+                    for match in self.matcher.scan(english_text, 'complete'):
+                        potential_name = match.text
                         
                         # Skip very short matches
                         if len(potential_name) < 3:
                             continue
                         
                         # Get comprehensive context
-                        context_start = max(0, match.start() - 200)
-                        context_end = min(len(english_text), match.end() + 200)
+                        context_start = max(0, match.start - 200)
+                        context_end = min(len(english_text), match.end + 200)
                         context = english_text[context_start:context_end]
                         
                         # Enhanced validation and scoring
-                        confidence = self._comprehensive_confidence_scoring(potential_name, context)
+                        with instr.span('validate'):
+                            confidence = self._comprehensive_confidence_scoring(potential_name, context)
                         
                         if confidence >= 0.25:  # Lower threshold for comprehensive collection
-                            category = self._comprehensive_categorization(potential_name, context)
-                            meaning = self._comprehensive_meaning_extraction(potential_name, context)
+                            with instr.span('validate'):
+                                category = self._comprehensive_categorization(potential_name, context)
+                                meaning = self._comprehensive_meaning_extraction(potential_name, context)
                             
                             extracted_names.append(CompleteThiruppugazhName(
                                 name=self._standardize_name(potential_name),
@@ -243,14 +191,576 @@ class CompleteThiruppugazhSystematicExtractor:
                                 tamil_reference=f"Thiruppugazh Song {song_number}",
                                 category=category,
                                 confidence=confidence,
-                                extraction_timestamp=timestamp
+                                extraction_timestamp=timestamp,
+                                pattern_family='/'.join(match.families)
                             ))
-            
+                
             # Deduplicate within song
             unique_names = self._comprehensive_deduplication(extracted_names)
+            instr.count('names', len(unique_names))
             
             return unique_names
             
         except Exception as e:
+            instr.count('errors')
             self.failed_extractions.append((song_number, str(e)))
-            return []\n    \n    def _comprehensive_english_extraction(self, soup: BeautifulSoup, page_text: str) -> List[str]:\n        \"\"\"Comprehensive English content extraction.\"\"\"\n        english_sections = []\n        \n        # Method 1: All text elements\n        all_elements = soup.find_all(text=True)\n        english_blocks = []\n        current_block = []\n        \n        for element in all_elements:\n            text = element.strip()\n            if self._is_comprehensive_english(text):\n                current_block.append(text)\n            else:\n                if current_block:\n                    english_blocks.append(' '.join(current_block))\n                    current_block = []\n        \n        if current_block:\n            english_blocks.append(' '.join(current_block))\n        \n        english_sections.extend(english_blocks)\n        \n        # Method 2: Paragraph analysis\n        for element in soup.find_all(['p', 'div', 'span', 'td', 'th']):\n            text = element.get_text().strip()\n            if len(text) > 30 and self._is_comprehensive_english(text):\n                english_sections.append(text)\n        \n        # Method 3: Line-by-line analysis\n        lines = page_text.split('\\n')\n        in_english_section = False\n        english_buffer = []\n        \n        for line in lines:\n            line = line.strip()\n            if self._is_comprehensive_english(line) and len(line) > 10:\n                english_buffer.append(line)\n                in_english_section = True\n            elif in_english_section and line:\n                if english_buffer:\n                    english_sections.append(' '.join(english_buffer))\n                    english_buffer = []\n                in_english_section = False\n        \n        if english_buffer:\n            english_sections.append(' '.join(english_buffer))\n        \n        # Remove duplicates and filter\n        unique_sections = []\n        for section in english_sections:\n            if len(section) > 20 and section not in unique_sections:\n                unique_sections.append(section)\n        \n        return unique_sections\n    \n    def _is_comprehensive_english(self, text: str) -> bool:\n        \"\"\"Comprehensive English text detection.\"\"\"\n        if not text or len(text) < 3:\n            return False\n        \n        # Remove common punctuation and numbers\n        clean_text = re.sub(r'[0-9\\.,;:()\\[\\]{}\"\\-]+', '', text)\n        \n        if not clean_text:\n            return False\n        \n        # Count English alphabetic characters\n        english_chars = sum(1 for c in clean_text if c.isascii() and c.isalpha())\n        total_alpha_chars = sum(1 for c in clean_text if c.isalpha())\n        \n        if total_alpha_chars == 0:\n            return False\n        \n        english_ratio = english_chars / total_alpha_chars\n        \n        # Also check for common English words\n        common_english_words = {\n            'the', 'and', 'or', 'of', 'to', 'in', 'on', 'at', 'by', 'for',\n            'with', 'from', 'up', 'about', 'into', 'through', 'during',\n            'this', 'that', 'these', 'those', 'is', 'are', 'was', 'were',\n            'lord', 'god', 'murugan', 'who', 'when', 'where', 'why', 'how'\n        }\n        \n        words = re.findall(r'\\b\\w+\\b', text.lower())\n        english_word_count = sum(1 for word in words if word in common_english_words)\n        \n        has_english_words = english_word_count > 0\n        \n        return english_ratio > 0.6 or has_english_words\n    \n    def _comprehensive_confidence_scoring(self, name: str, context: str) -> float:\n        \"\"\"Comprehensive confidence scoring system.\"\"\"\n        confidence = 0.0\n        name_lower = name.lower()\n        context_lower = context.lower()\n        \n        # Base confidence for pattern match\n        confidence += 0.2\n        \n        # Premium divine names (highest confidence)\n        premium_names = {\n            'saravana': 0.5, 'saravanabhava': 0.6, 'shanmukha': 0.5,\n            'subrahmanya': 0.6, 'subramanya': 0.6, 'shaktivel': 0.5,\n            'sami': 0.4, 'swami': 0.4, 'siva': 0.3, 'shiva': 0.3\n        }\n        \n        for premium_name, bonus in premium_names.items():\n            if premium_name in name_lower:\n                confidence += bonus\n                break\n        \n        # Context validation\n        divine_context_score = 0\n        for indicator in self.divine_context_indicators:\n            if indicator in context_lower:\n                divine_context_score += 0.05\n        \n        confidence += min(0.3, divine_context_score)\n        \n        # Name characteristics\n        if len(name) >= 5:\n            confidence += 0.1\n        if len(name) >= 8:\n            confidence += 0.1\n        \n        # Capitalization (proper names)\n        if name[0].isupper():\n            confidence += 0.05\n        \n        # Sanskrit/Tamil name patterns\n        if any(ending in name_lower for ending in ['an', 'ar', 'am', 'al', 'ay', 'av']):\n            confidence += 0.1\n        \n        return min(1.0, confidence)\n    \n    def _comprehensive_categorization(self, name: str, context: str) -> str:\n        \"\"\"Comprehensive name categorization.\"\"\"\n        name_lower = name.lower()\n        context_lower = context.lower()\n        \n        # Primary divine names\n        primary_divine = ['saravana', 'shanmukha', 'subrahmanya', 'subramanya']\n        if any(dn in name_lower for dn in primary_divine):\n            return 'primary_divine_name'\n        \n        # Secondary divine names\n        secondary_divine = ['siva', 'shiva', 'sami', 'swami']\n        if any(dn in name_lower for dn in secondary_divine):\n            return 'secondary_divine_name'\n        \n        # Attributes and weapons\n        if any(word in context_lower for word in ['spear', 'vel', 'weapon', 'power', 'shakti']):\n            return 'divine_attribute'\n        \n        # Physical descriptions\n        if any(word in context_lower for word in ['face', 'mukha', 'form', 'appearance']):\n            return 'physical_description'\n        \n        # Places and abodes\n        if any(word in context_lower for word in ['mountain', 'hill', 'place', 'abode', 'temple']):\n            return 'sacred_place'\n        \n        # Devotional terms\n        if any(word in context_lower for word in ['worship', 'prayer', 'devotion', 'surrender']):\n            return 'devotional_term'\n        \n        # Default classification\n        return 'divine_epithet'\n    \n    def _comprehensive_meaning_extraction(self, name: str, context: str) -> str:\n        \"\"\"Comprehensive meaning extraction from context.\"\"\"\n        # Pattern 1: Direct explanation\n        explanation_patterns = [\n            rf'{re.escape(name)}\\s*(?:means?|refers?\\s+to|is|signifies?)\\s+([^.!?]+)',\n            rf'(?:means?|refers?\\s+to|is|signifies?)\\s+([^.!?]*{re.escape(name)}[^.!?]*)',\n            rf'({re.escape(name)}[^.!?]*(?:lord|god|divine|deity)[^.!?]*)',\n            rf'((?:lord|god|divine|deity)[^.!?]*{re.escape(name)}[^.!?]*)',\n        ]\n        \n        for pattern in explanation_patterns:\n            match = re.search(pattern, context, re.IGNORECASE)\n            if match:\n                explanation = match.group(1).strip()\n                if len(explanation) > 5:\n                    return explanation\n        \n        # Pattern 2: Surrounding descriptive text\n        sentences = re.split(r'[.!?]+', context)\n        for sentence in sentences:\n            if name.lower() in sentence.lower():\n                clean_sentence = sentence.strip()\n                if len(clean_sentence) > 20:\n                    return clean_sentence\n        \n        # Pattern 3: Context summary\n        words = context.split()\n        if len(words) > 10:\n            # Find the sentence containing the name\n            for i, word in enumerate(words):\n                if name.lower() in word.lower():\n                    start = max(0, i - 10)\n                    end = min(len(words), i + 10)\n                    return ' '.join(words[start:end])\n        \n        # Fallback: truncated context\n        return context[:150] + \"...\" if len(context) > 150 else context\n    \n    def _standardize_name(self, name: str) -> str:\n        \"\"\"Standardize name format.\"\"\"\n        # Remove extra whitespace\n        name = re.sub(r'\\s+', ' ', name.strip())\n        \n        # Proper capitalization\n        return name.title()\n    \n    def _clean_context(self, context: str) -> str:\n        \"\"\"Clean and format context text.\"\"\"\n        # Remove excessive whitespace\n        context = re.sub(r'\\s+', ' ', context)\n        \n        # Remove special characters that might cause issues\n        context = re.sub(r'[\\x00-\\x08\\x0b\\x0c\\x0e-\\x1f\\x7f-\\x84\\x86-\\x9f]', '', context)\n        \n        return context.strip()\n    \n    def _comprehensive_deduplication(self, names: List[CompleteThiruppugazhName]) -> List[CompleteThiruppugazhName]:\n        \"\"\"Comprehensive deduplication within song.\"\"\"\n        seen = {}\n        unique = []\n        \n        for name_obj in names:\n            # Create normalized key for comparison\n            key = re.sub(r'[^a-zA-Z]', '', name_obj.name.lower())\n            \n            if key not in seen or name_obj.confidence > seen[key].confidence:\n                seen[key] = name_obj\n        \n        return list(seen.values())\n    \n    def extract_complete_systematic(self, start_song: int = 6, end_song: int = 1340, \n                                   batch_size: int = 100, save_interval: int = 50) -> List[CompleteThiruppugazhName]:\n        \"\"\"Complete systematic extraction from all songs.\"\"\"\n        \n        print(f\"🕉️ COMPLETE THIRUPPUGAZH SYSTEMATIC EXTRACTION\")\n        print(f\"{'=' * 70}\")\n        print(f\"Songs to process: {start_song} to {end_song} ({end_song - start_song + 1} total)\")\n        print(f\"Batch size: {batch_size} | Save interval: {save_interval}\")\n        \n        # Load previous progress if available\n        resume = self.load_progress()\n        if resume:\n            current_song = self.processed_songs + start_song\n            print(f\"Resuming from song {current_song}\")\n        else:\n            current_song = start_song\n        \n        total_songs = end_song - start_song + 1\n        \n        for song_num in range(current_song, end_song + 1):\n            print(f\"📿 Song {song_num:4d}/{end_song} ({((song_num-start_song+1)/total_songs*100):5.1f}%) \", end='')\n            \n            names = self.extract_from_single_song_complete(song_num)\n            self.extracted_names.extend(names)\n            self.processed_songs += 1\n            \n            print(f\"-> {len(names)} names | Total: {len(self.extracted_names)}\")\n            \n            # Save progress at intervals\n            if self.processed_songs % save_interval == 0:\n                self.save_progress()\n                print(f\"   💾 Progress saved at song {song_num}\")\n            \n            # Batch reporting\n            if self.processed_songs % batch_size == 0:\n                unique_count = len(set(n.name.lower() for n in self.extracted_names))\n                print(f\"\\n📊 BATCH PROGRESS REPORT:\")\n                print(f\"   Songs processed: {self.processed_songs}/{total_songs}\")\n                print(f\"   Total names: {len(self.extracted_names)}\")\n                print(f\"   Unique names: {unique_count}\")\n                print(f\"   Failed extractions: {len(self.failed_extractions)}\")\n                print(f\"   Success rate: {((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100):5.1f}%\")\n                print()\n        \n        # Final save\n        self.save_progress()\n        \n        print(f\"\\n🏆 COMPLETE EXTRACTION FINISHED!\")\n        print(f\"   Total songs processed: {self.processed_songs}\")\n        print(f\"   Total names extracted: {len(self.extracted_names)}\")\n        print(f\"   Failed extractions: {len(self.failed_extractions)}\")\n        \n        return self.extracted_names\n    \n    def export_complete_database(self) -> str:\n        \"\"\"Export complete extraction database.\"\"\"\n        # Global deduplication\n        global_unique = {}\n        for name_obj in self.extracted_names:\n            key = re.sub(r'[^a-zA-Z]', '', name_obj.name.lower())\n            if key not in global_unique or name_obj.confidence > global_unique[key].confidence:\n                global_unique[key] = name_obj\n        \n        unique_names = list(global_unique.values())\n        \n        # Statistics\n        by_category = {}\n        high_confidence = 0\n        \n        for name in unique_names:\n            by_category[name.category] = by_category.get(name.category, 0) + 1\n            if name.confidence >= 0.7:\n                high_confidence += 1\n        \n        database = {\n            'metadata': {\n                'extraction_date': datetime.now().isoformat(),\n                'source': 'Complete kaumaram.com Thiruppugazh extraction (songs 6-1340)',\n                'total_songs_processed': self.processed_songs,\n                'total_names_extracted': len(self.extracted_names),\n                'unique_names': len(unique_names),\n                'high_confidence_names': high_confidence,\n                'failed_extractions': len(self.failed_extractions),\n                'success_rate': ((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100) if self.processed_songs > 0 else 0,\n                'methodology': 'Comprehensive systematic web extraction with pattern matching and confidence scoring',\n                'focus': 'All Sa/Cha/Sha starting names from complete Thiruppugazh corpus',\n                'achievement': 'MASSIVE improvement over initial inadequate 20 names'\n            },\n            'statistics': {\n                'by_category': by_category,\n                'extraction_summary': {\n                    'total_raw_extractions': len(self.extracted_names),\n                    'unique_names_after_deduplication': len(unique_names),\n                    'high_confidence_names': high_confidence,\n                    'processing_statistics': {\n                        'songs_processed': self.processed_songs,\n                        'failed_songs': len(self.failed_extractions),\n                        'success_rate_percentage': ((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100) if self.processed_songs > 0 else 0\n                    }\n                }\n            },\n            'names': [asdict(name) for name in sorted(unique_names, key=lambda x: x.confidence, reverse=True)],\n            'failed_extractions': self.failed_extractions\n        }\n        \n        return json.dumps(database, indent=2, ensure_ascii=False)\n    \n    def generate_final_comprehensive_report(self) -> str:\n        \"\"\"Generate final comprehensive report.\"\"\"\n        # Global deduplication for reporting\n        global_unique = {}\n        for name_obj in self.extracted_names:\n            key = re.sub(r'[^a-zA-Z]', '', name_obj.name.lower())\n            if key not in global_unique or name_obj.confidence > global_unique[key].confidence:\n                global_unique[key] = name_obj\n        \n        unique_names = list(global_unique.values())\n        high_confidence = [n for n in unique_names if n.confidence >= 0.7]\n        medium_confidence = [n for n in unique_names if 0.5 <= n.confidence < 0.7]\n        \n        by_category = {}\n        for name in unique_names:\n            by_category[name.category] = by_category.get(name.category, 0) + 1\n        \n        report = f\"\"\"\n🕉️ COMPLETE THIRUPPUGAZH SYSTEMATIC EXTRACTION - FINAL REPORT 🕉️\n{'=' * 80}\n\n📊 COMPREHENSIVE EXTRACTION STATISTICS:\n   • Total Songs Processed: {self.processed_songs} / 1,334 songs\n   • Success Rate: {((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100):5.1f}%\n   • Total Raw Extractions: {len(self.extracted_names)}\n   • Unique Names After Deduplication: {len(unique_names)}\n   • High Confidence Names (≥0.7): {len(high_confidence)}\n   • Medium Confidence Names (0.5-0.7): {len(medium_confidence)}\n   • Failed Extractions: {len(self.failed_extractions)}\n\n🎯 MASSIVE IMPROVEMENT ACHIEVED:\n   ✅ From inadequate 20 names to {len(unique_names)} comprehensive names\n   ✅ Systematic extraction from ALL 1,340 Thiruppugazh songs\n   ✅ Complete coverage of Sa/Cha/Sha starting names\n   ✅ Authentic source verification from kaumaram.com\n   ✅ No compromise on traditional authenticity\n\n📚 NAME CATEGORIES DISCOVERED:\n\"\"\"\n        \n        for category, count in sorted(by_category.items(), key=lambda x: x[1], reverse=True):\n            report += f\"   • {category.replace('_', ' ').title()}: {count}\n\"\n        \n        report += f\"\"\"\n\n📿 TOP HIGH-CONFIDENCE NAMES (Confidence ≥ 0.7):\n\"\"\"\n        \n        for i, name in enumerate(sorted(high_confidence, key=lambda x: x.confidence, reverse=True)[:25], 1):\n            report += f\"\"\"\n{i:2d}. {name.name} (Confidence: {name.confidence:.2f})\n    Song: {name.song_number} | Category: {name.category}\n    Context: {name.english_meaning[:100]}...\n\"\"\"\n        \n        if len(high_confidence) > 25:\n            report += f\"\\n... and {len(high_confidence) - 25} more high-confidence names\\n\"\n        \n        report += f\"\"\"\n\n🌟 METHODOLOGY SUCCESS:\n   ✅ Comprehensive pattern matching for all Sa/Cha/Sha variations\n   ✅ Advanced HTML parsing with BeautifulSoup\n   ✅ Multi-method English content extraction\n   ✅ Context-based confidence scoring system\n   ✅ Divine name validation using contextual analysis\n   ✅ Systematic processing of complete kaumaram.com corpus\n   ✅ Robust error handling and progress tracking\n\n🏆 ACHIEVEMENT FOR YOUR SON'S NAMING:\n   This represents the most comprehensive collection of authentic \n   Thiruppugazh names ever systematically extracted. From the initial\n   inadequate 20 names, we now have {len(unique_names)} verified names starting\n   with Sa/Cha/Sha from the complete 1,340 song corpus.\n   \n   Perfect for your son's naming with NO COMPROMISE on authenticity!\n\n🙏 COMPLETE SYSTEMATIC EXTRACTION AS REQUESTED:\n   \"if you go through all the skanda purana, astothakam, \n   shatanamavali, stotram, skanda purana\" + COMPLETE Thiruppugazh\n   \n   ALL SOURCES NOW COMPREHENSIVELY COVERED ✅\n\n{'=' * 80}\n\"\"\"\n        \n        return report\n\ndef main():\n    \"\"\"Main complete extraction function.\"\"\"\n    extractor = CompleteThiruppugazhSystematicExtractor()\n    \n    print(\"🕉️ COMPLETE THIRUPPUGAZH SYSTEMATIC EXTRACTION SYSTEM\")\n    print(\"=\" * 70)\n    print(\"This will extract from ALL 1,340 Thiruppugazh songs systematically\")\n    print(\"Estimated time: 3-4 hours for complete extraction\")\n    print(\"Progress will be saved every 50 songs for resumption\")\n    \n    # Option for test run or full extraction\n    mode = input(\"\\nSelect mode:\\n1. Full extraction (songs 6-1340)\\n2. Extended test (songs 6-100)\\n3. Resume previous extraction\\nChoice (1/2/3): \").strip()\n    \n    if mode == '2':\n        print(\"\\n🧪 EXTENDED TEST EXTRACTION (Songs 6-100)...\")\n        names = extractor.extract_complete_systematic(6, 100, batch_size=25, save_interval=25)\n    elif mode == '3':\n        print(\"\\n🔄 RESUMING PREVIOUS EXTRACTION...\")\n        if extractor.load_progress():\n            names = extractor.extract_complete_systematic(6, 1340, batch_size=100, save_interval=50)\n        else:\n            print(\"No previous progress found. Starting fresh...\")\n            names = extractor.extract_complete_systematic(6, 1340, batch_size=100, save_interval=50)\n    else:\n        print(\"\\n🚀 FULL SYSTEMATIC EXTRACTION (Songs 6-1340)...\")\n        names = extractor.extract_complete_systematic(6, 1340, batch_size=100, save_interval=50)\n    \n    if names:\n        print(\"\\n💾 GENERATING FINAL OUTPUTS...\")\n        \n        # Complete database export\n        json_output = extractor.export_complete_database()\n        with open('COMPLETE_THIRUPPUGAZH_SYSTEMATIC_DATABASE.json', 'w', encoding='utf-8') as f:\n            f.write(json_output)\n        print(\"   ✅ Complete Database: COMPLETE_THIRUPPUGAZH_SYSTEMATIC_DATABASE.json\")\n        \n        # Final comprehensive report\n        report = extractor.generate_final_comprehensive_report()\n        with open('COMPLETE_THIRUPPUGAZH_FINAL_REPORT.txt', 'w', encoding='utf-8') as f:\n            f.write(report)\n        print(\"   ✅ Final Report: COMPLETE_THIRUPPUGAZH_FINAL_REPORT.txt\")\n        \n        print(report)\n        \n    else:\n        print(\"❌ No names extracted. Please check the extraction process.\")\n\nif __name__ == \"__main__\":\n    main()
\ No newline at end of file
+            return []
+    
+    def _comprehensive_english_extraction(self, soup: BeautifulSoup, page_text: str) -> List[str]:
+        """Comprehensive English content extraction."""
+        english_sections = []
+        
+        # Method 1: All text elements
+        all_elements = soup.find_all(text=True)
+        english_blocks = []
+        current_block = []
+        
+        for element in all_elements:
+            text = element.strip()
+            if self._is_comprehensive_english(text):
+                current_block.append(text)
+            else:
+                if current_block:
+                    english_blocks.append(' '.join(current_block))
+                    current_block = []
+        
+        if current_block:
+            english_blocks.append(' '.join(current_block))
+        
+        english_sections.extend(english_blocks)
+        
+        # Method 2: Paragraph analysis
+        for element in soup.find_all(['p', 'div', 'span', 'td', 'th']):
+            text = element.get_text().strip()
+            if len(text) > 30 and self._is_comprehensive_english(text):
+                english_sections.append(text)
+        
+        # Method 3: Line-by-line analysis
+        lines = page_text.split('\n')
+        in_english_section = False
+        english_buffer = []
+        
+        for line in lines:
+            line = line.strip()
+            if self._is_comprehensive_english(line) and len(line) > 10:
+                english_buffer.append(line)
+                in_english_section = True
+            elif in_english_section and line:
+                if english_buffer:
+                    english_sections.append(' '.join(english_buffer))
+                    english_buffer = []
+                in_english_section = False
+        
+        if english_buffer:
+            english_sections.append(' '.join(english_buffer))
+        
+        # Remove duplicates and filter
+        unique_sections = []
+        for section in english_sections:
+            if len(section) > 20 and section not in unique_sections:
+                unique_sections.append(section)
+        
+        return unique_sections
+    
+    def _is_comprehensive_english(self, text: str) -> bool:
+        """Comprehensive English text detection."""
+        if not text or len(text) < 3:
+            return False
+        
+        # Remove common punctuation and numbers
+        clean_text = re.sub(r'[0-9\.,;:()\[\]{}"\-]+', '', text)
+        
+        if not clean_text:
+            return False
+        
+        # Count English alphabetic characters
+        english_chars = sum(1 for c in clean_text if c.isascii() and c.isalpha())
+        total_alpha_chars = sum(1 for c in clean_text if c.isalpha())
+        
+        if total_alpha_chars == 0:
+            return False
+        
+        english_ratio = english_chars / total_alpha_chars
+        
+        # Also check for common English words
+        common_english_words = {
+            'the', 'and', 'or', 'of', 'to', 'in', 'on', 'at', 'by', 'for',
+            'with', 'from', 'up', 'about', 'into', 'through', 'during',
+            'this', 'that', 'these', 'those', 'is', 'are', 'was', 'were',
+            'lord', 'god', 'murugan', 'who', 'when', 'where', 'why', 'how'
+        }
+        
+        words = re.findall(r'\b\w+\b', text.lower())
+        english_word_count = sum(1 for word in words if word in common_english_words)
+        
+        has_english_words = english_word_count > 0
+        
+        return english_ratio > 0.6 or has_english_words
+    
+    def _comprehensive_confidence_scoring(self, name: str, context: str) -> float:
+        """Comprehensive confidence scoring system."""
+        confidence = 0.0
+        name_lower = name.lower()
+        context_lower = context.lower()
+        
+        # Base confidence for pattern match
+        confidence += 0.2
+        
+        # Premium divine names (highest confidence)
+        premium_names = {
+            'saravana': 0.5, 'saravanabhava': 0.6, 'shanmukha': 0.5,
+            'subrahmanya': 0.6, 'subramanya': 0.6, 'shaktivel': 0.5,
+            'sami': 0.4, 'swami': 0.4, 'siva': 0.3, 'shiva': 0.3
+        }
+        
+        for premium_name, bonus in premium_names.items():
+            if premium_name in name_lower:
+                confidence += bonus
+                break
+        
+        # Context validation
+        divine_context_score = 0
+        for indicator in self.divine_context_indicators:
+            if indicator in context_lower:
+                divine_context_score += 0.05
+        
+        confidence += min(0.3, divine_context_score)
+        
+        # Name characteristics
+        if len(name) >= 5:
+            confidence += 0.1
+        if len(name) >= 8:
+            confidence += 0.1
+        
+        # Capitalization (proper names)
+        if name[0].isupper():
+            confidence += 0.05
+        
+        # Sanskrit/Tamil name patterns
+        if any(ending in name_lower for ending in ['an', 'ar', 'am', 'al', 'ay', 'av']):
+            confidence += 0.1
+        
+        return min(1.0, confidence)
+    
+    def _comprehensive_categorization(self, name: str, context: str) -> str:
+        """Comprehensive name categorization."""
+        name_lower = name.lower()
+        context_lower = context.lower()
+        
+        # Primary divine names
+        primary_divine = ['saravana', 'shanmukha', 'subrahmanya', 'subramanya']
+        if any(dn in name_lower for dn in primary_divine):
+            return 'primary_divine_name'
+        
+        # Secondary divine names
+        secondary_divine = ['siva', 'shiva', 'sami', 'swami']
+        if any(dn in name_lower for dn in secondary_divine):
+            return 'secondary_divine_name'
+        
+        # Attributes and weapons
+        if any(word in context_lower for word in ['spear', 'vel', 'weapon', 'power', 'shakti']):
+            return 'divine_attribute'
+        
+        # Physical descriptions
+        if any(word in context_lower for word in ['face', 'mukha', 'form', 'appearance']):
+            return 'physical_description'
+        
+        # Places and abodes
+        if any(word in context_lower for word in ['mountain', 'hill', 'place', 'abode', 'temple']):
+            return 'sacred_place'
+        
+        # Devotional terms
+        if any(word in context_lower for word in ['worship', 'prayer', 'devotion', 'surrender']):
+            return 'devotional_term'
+        
+        # Default classification
+        return 'divine_epithet'
+    
+    def _comprehensive_meaning_extraction(self, name: str, context: str) -> str:
+        """Comprehensive meaning extraction from context."""
+        # Pattern 1: Direct explanation
+        explanation_patterns = [
+            rf'{re.escape(name)}\s*(?:means?|refers?\s+to|is|signifies?)\s+([^.!?]+)',
+            rf'(?:means?|refers?\s+to|is|signifies?)\s+([^.!?]*{re.escape(name)}[^.!?]*)',
+            rf'({re.escape(name)}[^.!?]*(?:lord|god|divine|deity)[^.!?]*)',
+            rf'((?:lord|god|divine|deity)[^.!?]*{re.escape(name)}[^.!?]*)',
+        ]
+        
+        for pattern in explanation_patterns:
+            match = re.search(pattern, context, re.IGNORECASE)
+            if match:
+                explanation = match.group(1).strip()
+                if len(explanation) > 5:
+                    return explanation
+        
+        # Pattern 2: Surrounding descriptive text
+        sentences = re.split(r'[.!?]+', context)
+        for sentence in sentences:
+            if name.lower() in sentence.lower():
+                clean_sentence = sentence.strip()
+                if len(clean_sentence) > 20:
+                    return clean_sentence
+        
+        # Pattern 3: Context summary
+        words = context.split()
+        if len(words) > 10:
+            # Find the sentence containing the name
+            for i, word in enumerate(words):
+                if name.lower() in word.lower():
+                    start = max(0, i - 10)
+                    end = min(len(words), i + 10)
+                    return ' '.join(words[start:end])
+        
+        # Fallback: truncated context
+        return context[:150] + "..." if len(context) > 150 else context
+    
+    def _standardize_name(self, name: str) -> str:
+        """Standardize name format."""
+        # Remove extra whitespace
+        name = re.sub(r'\s+', ' ', name.strip())
+        
+        # Proper capitalization
+        return name.title()
+    
+    def _clean_context(self, context: str) -> str:
+        """Clean and format context text."""
+        # Remove excessive whitespace
+        context = re.sub(r'\s+', ' ', context)
+        
+        # Remove special characters that might cause issues
+        context = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x84\x86-\x9f]', '', context)
+        
+        return context.strip()
+    
+    def _comprehensive_deduplication(self, names: List[CompleteThiruppugazhName]) -> List[CompleteThiruppugazhName]:
+        """Comprehensive deduplication within song."""
+        seen = {}
+        unique = []
+        
+        for name_obj in names:
+            # Create normalized key for comparison
+            key = re.sub(r'[^a-zA-Z]', '', name_obj.name.lower())
+            
+            if key not in seen or name_obj.confidence > seen[key].confidence:
+                seen[key] = name_obj
+        
+        return list(seen.values())
+    
+    def extract_complete_systematic(self, start_song: int = 6, end_song: int = 1340, 
+                                   batch_size: int = 100, save_interval: int = 50,
+                                   fetcher: SongFetcher = None, resume: bool = True) -> List[CompleteThiruppugazhName]:
+        """
+        Complete systematic extraction from all songs.
+        
+        Pages are fetched concurrently (fetcher's per-host limits) and
+        handled in song order, so progress saves and resumption are unchanged.
+        With resume=False the previous journal is archived and every song is
+        fetched again.
+        """
+        
+        print(f"🕉️ COMPLETE THIRUPPUGAZH SYSTEMATIC EXTRACTION")
+        print(f"{'=' * 70}")
+        print(f"Songs to process: {start_song} to {end_song} ({end_song - start_song + 1} total)")
+        print(f"Batch size: {batch_size} | Save interval: {save_interval}")
+        
+        # Load previous progress if available
+        if resume:
+            resumed = self.load_progress()
+        else:
+            archived = archive_journal(self.journal_path)
+            if archived:
+                print(f"🗃️  Starting fresh; previous journal archived to {archived}")
+            self.extracted_names, self.failed_extractions = [], []
+            self.processed_songs, self.completed_songs = 0, set()
+            resumed = False
+        # Songs that failed last time are tried again
+        remaining = [n for n in range(start_song, end_song + 1) if n not in self.completed_songs]
+        retried = set(remaining)
+        self.failed_extractions = [f for f in self.failed_extractions if f[0] not in retried]
+        if resumed and remaining:
+            print(f"Resuming from song {remaining[0]} ({len(remaining)} songs left)")
+        
+        instr.set_target('songs', len(remaining))
+        
+        own_fetcher = fetcher is None
+        fetcher = fetcher or SongFetcher(headers=dict(self.session.headers))
+        songs = ((song_num, f"{self.base_url}nnt{song_num:04d}_u.html") for song_num in remaining)
+        
+        self.journal = SongJournal(self.journal_path, sync_every=save_interval)
+        try:
+            with instr.span('fetch'):
+                self._process_fetched_songs(fetcher.fetch_ordered(songs), start_song, end_song,
+                                            batch_size, save_interval)
+            
+            # Final save: one entry per song, in song order
+            self.journal.compact()
+        finally:
+            self.journal.close()
+            self.journal = None
+            if own_fetcher:
+                fetcher.close()
+        
+        instr.set_gauge('queue_depth', 0)
+        
+        print(f"\n🏆 COMPLETE EXTRACTION FINISHED!")
+        print(f"   Total songs processed: {self.processed_songs}")
+        print(f"   Total names extracted: {len(self.extracted_names)}")
+        print(f"   Failed extractions: {len(self.failed_extractions)}")
+        print(f"   Requests: {fetcher.requests} ({fetcher.retries} retries)")
+        
+        return self.extracted_names
+    
+    def _process_fetched_songs(self, results, start_song: int, end_song: int, batch_size: int, save_interval: int):
+        """Extract names from fetched pages in song order, journaling each song as it completes."""
+        total_songs = end_song - start_song + 1
+        
+        for result in results:
+            song_num = result.key
+            instr.set_gauge('queue_depth', end_song - song_num + 1)
+            print(f"📿 Song {song_num:4d}/{end_song} ({((song_num-start_song+1)/total_songs*100):5.1f}%) ", end='')
+            
+            if result.ok:
+                instr.count('pages')
+                names = self.extract_names_from_page(song_num, result.content)
+            else:
+                instr.count('errors')
+                self.failed_extractions.append((song_num, result.error))
+                names = []
+            
+            self.extracted_names.extend(names)
+            self.processed_songs += 1
+            self.completed_songs.add(song_num)
+            instr.count('songs')
+            
+            failed = self.failed_extractions[-1] if self.failed_extractions else None
+            self.journal.record_song(song_num, [asdict(n) for n in names],
+                                     failed[1] if failed and failed[0] == song_num else None)
+            
+            print(f"-> {len(names)} names | Total: {len(self.extracted_names)}")
+            
+            # Save progress at intervals
+            if self.processed_songs % save_interval == 0:
+                self.save_progress()
+                print(f"   💾 Progress saved at song {song_num}")
+            
+            # Batch reporting
+            if self.processed_songs % batch_size == 0:
+                unique_count = len(set(n.name.lower() for n in self.extracted_names))
+                print(f"\n📊 BATCH PROGRESS REPORT:")
+                print(f"   Songs processed: {self.processed_songs}/{total_songs}")
+                print(f"   Total names: {len(self.extracted_names)}")
+                print(f"   Unique names: {unique_count}")
+                print(f"   Failed extractions: {len(self.failed_extractions)}")
+                print(f"   Success rate: {((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100):5.1f}%")
+                print()
+    
+    def export_complete_database(self) -> str:
+        """Export complete extraction database."""
+        # Global deduplication
+        global_unique = {}
+        for name_obj in self.extracted_names:
+            key = re.sub(r'[^a-zA-Z]', '', name_obj.name.lower())
+            if key not in global_unique or name_obj.confidence > global_unique[key].confidence:
+                global_unique[key] = name_obj
+        
+        unique_names = list(global_unique.values())
+        
+        # Statistics
+        by_category = {}
+        high_confidence = 0
+        
+        for name in unique_names:
+            by_category[name.category] = by_category.get(name.category, 0) + 1
+            if name.confidence >= 0.7:
+                high_confidence += 1
+        
+        database = {
+            'metadata': {
+                'extraction_date': datetime.now().isoformat(),
+                'source': 'Complete kaumaram.com Thiruppugazh extraction (songs 6-1340)',
+                'total_songs_processed': self.processed_songs,
+                'total_names_extracted': len(self.extracted_names),
+                'unique_names': len(unique_names),
+                'high_confidence_names': high_confidence,
+                'failed_extractions': len(self.failed_extractions),
+                'success_rate': ((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100) if self.processed_songs > 0 else 0,
+                'methodology': 'Comprehensive systematic web extraction with pattern matching and confidence scoring',
+                'focus': 'All Sa/Cha/Sha starting names from complete Thiruppugazh corpus',
+                'achievement': 'MASSIVE improvement over initial inadequate 20 names'
+            },
+            'statistics': {
+                'by_category': by_category,
+                'extraction_summary': {
+                    'total_raw_extractions': len(self.extracted_names),
+                    'unique_names_after_deduplication': len(unique_names),
+                    'high_confidence_names': high_confidence,
+                    'processing_statistics': {
+                        'songs_processed': self.processed_songs,
+                        'failed_songs': len(self.failed_extractions),
+                        'success_rate_percentage': ((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100) if self.processed_songs > 0 else 0
+                    }
+                }
+            },
+            'names': [asdict(name) for name in sorted(unique_names, key=lambda x: x.confidence, reverse=True)],
+            'failed_extractions': self.failed_extractions
+        }
+        
+        return json.dumps(database, indent=2, ensure_ascii=False)
+    
+    def generate_final_comprehensive_report(self) -> str:
+        """Generate final comprehensive report."""
+        # Global deduplication for reporting
+        global_unique = {}
+        for name_obj in self.extracted_names:
+            key = re.sub(r'[^a-zA-Z]', '', name_obj.name.lower())
+            if key not in global_unique or name_obj.confidence > global_unique[key].confidence:
+                global_unique[key] = name_obj
+        
+        unique_names = list(global_unique.values())
+        high_confidence = [n for n in unique_names if n.confidence >= 0.7]
+        medium_confidence = [n for n in unique_names if 0.5 <= n.confidence < 0.7]
+        
+        by_category = {}
+        for name in unique_names:
+            by_category[name.category] = by_category.get(name.category, 0) + 1
+        
+        report = f"""
+🕉️ COMPLETE THIRUPPUGAZH SYSTEMATIC EXTRACTION - FINAL REPORT 🕉️
+{'=' * 80}
+
+📊 COMPREHENSIVE EXTRACTION STATISTICS:
+   • Total Songs Processed: {self.processed_songs} / 1,334 songs
+   • Success Rate: {((self.processed_songs - len(self.failed_extractions))/self.processed_songs*100):5.1f}%
+   • Total Raw Extractions: {len(self.extracted_names)}
+   • Unique Names After Deduplication: {len(unique_names)}
+   • High Confidence Names (≥0.7): {len(high_confidence)}
+   • Medium Confidence Names (0.5-0.7): {len(medium_confidence)}
+   • Failed Extractions: {len(self.failed_extractions)}
+
+🎯 MASSIVE IMPROVEMENT ACHIEVED:
+   ✅ From inadequate 20 names to {len(unique_names)} comprehensive names
+   ✅ Systematic extraction from ALL 1,340 Thiruppugazh songs
+   ✅ Complete coverage of Sa/Cha/Sha starting names
+   ✅ Authentic source verification from kaumaram.com
+   ✅ No compromise on traditional authenticity
+
+📚 NAME CATEGORIES DISCOVERED:
+"""
+        
+        for category, count in sorted(by_category.items(), key=lambda x: x[1], reverse=True):
+            report += f"   • {category.replace('_', ' ').title()}: {count}\n"
+        
+        report += f"""
+
+📿 TOP HIGH-CONFIDENCE NAMES (Confidence ≥ 0.7):
+"""
+        
+        for i, name in enumerate(sorted(high_confidence, key=lambda x: x.confidence, reverse=True)[:25], 1):
+            report += f"""
+{i:2d}. {name.name} (Confidence: {name.confidence:.2f})
+    Song: {name.song_number} | Category: {name.category}
+    Context: {name.english_meaning[:100]}...
+"""
+        
+        if len(high_confidence) > 25:
+            report += f"\n... and {len(high_confidence) - 25} more high-confidence names\n"
+        
+        report += f"""
+
+🌟 METHODOLOGY SUCCESS:
+   ✅ Comprehensive pattern matching for all Sa/Cha/Sha variations
+   ✅ Advanced HTML parsing with BeautifulSoup
+   ✅ Multi-method English content extraction
+   ✅ Context-based confidence scoring system
+   ✅ Divine name validation using contextual analysis
+   ✅ Systematic processing of complete kaumaram.com corpus
+   ✅ Robust error handling and progress tracking
+
+🏆 ACHIEVEMENT FOR YOUR SON'S NAMING:
+   This represents the most comprehensive collection of authentic 
+   Thiruppugazh names ever systematically extracted. From the initial
+   inadequate 20 names, we now have {len(unique_names)} verified names starting
+   with Sa/Cha/Sha from the complete 1,340 song corpus.
+   
+   Perfect for your son's naming with NO COMPROMISE on authenticity!
+
+🙏 COMPLETE SYSTEMATIC EXTRACTION AS REQUESTED:
+   "if you go through all the skanda purana, astothakam, 
+   shatanamavali, stotram, skanda purana" + COMPLETE Thiruppugazh
+   
+   ALL SOURCES NOW COMPREHENSIVELY COVERED ✅
+
+{'=' * 80}
+"""
+        
+        return report
+
+def main():
+    """Main complete extraction function."""
+    parser = argparse.ArgumentParser(description="Systematic name extraction from all Thiruppugazh songs")
+    add_profile_argument(parser, 'thiruppugazh_extraction')
+    add_metrics_arguments(parser)
+    add_fetcher_arguments(parser)
+    args = parser.parse_args()
+    
+    fetcher = SongFetcher(max_workers=args.workers, per_host_concurrency=args.per_host, per_host_rate=args.rate)
+    with profiling(args.profile), metrics_reporting(args.metrics, args.metrics_format, args.metrics_interval), fetcher:
+        run_extraction(fetcher, args.base_url)
+    
+    print()
+    print(instr.format_report("THIRUPPUGAZH EXTRACTION STAGE BREAKDOWN"))
+
+def run_extraction(fetcher: SongFetcher = None, base_url: str = "https://kaumaram.com/thiru/"):
+    """Interactive extraction run with final exports."""
+    extractor = CompleteThiruppugazhSystematicExtractor(base_url)
+    
+    print("🕉️ COMPLETE THIRUPPUGAZH SYSTEMATIC EXTRACTION SYSTEM")
+    print("=" * 70)
+    print("This will extract from ALL 1,340 Thiruppugazh songs systematically")
+    print("Estimated time: 5-10 minutes for complete extraction")
+    print("Every finished song is journaled for resumption")
+    
+    # Option for test run or full extraction
+    mode = input("\nSelect mode:\n1. Full extraction (songs 6-1340)\n2. Extended test (songs 6-100)\n3. Resume previous extraction\nChoice (1/2/3): ").strip()
+    
+    # Modes 1 and 2 start over (archiving any previous journal); mode 3 resumes
+    if mode == '2':
+        print("\n🧪 EXTENDED TEST EXTRACTION (Songs 6-100)...")
+        names = extractor.extract_complete_systematic(6, 100, batch_size=25, save_interval=25, fetcher=fetcher,
+                                                      resume=False)
+    elif mode == '3':
+        print("\n🔄 RESUMING PREVIOUS EXTRACTION...")
+        if extractor.load_progress():
+            names = extractor.extract_complete_systematic(6, 1340, batch_size=100, save_interval=50, fetcher=fetcher)
+        else:
+            print("No previous progress found. Starting fresh...")
+            names = extractor.extract_complete_systematic(6, 1340, batch_size=100, save_interval=50, fetcher=fetcher)
+    else:
+        print("\n🚀 FULL SYSTEMATIC EXTRACTION (Songs 6-1340)...")
+        names = extractor.extract_complete_systematic(6, 1340, batch_size=100, save_interval=50, fetcher=fetcher,
+                                                      resume=False)
+    
+    if names:
+        print("\n💾 GENERATING FINAL OUTPUTS...")
+        
+        # Complete database export
+        with instr.span('export'):
+            json_output = extractor.export_complete_database()
+            with open('COMPLETE_THIRUPPUGAZH_SYSTEMATIC_DATABASE.json', 'w', encoding='utf-8') as f:
+                f.write(json_output)
+        print("   ✅ Complete Database: COMPLETE_THIRUPPUGAZH_SYSTEMATIC_DATABASE.json")
+        
+        # Final comprehensive report
+        with instr.span('export'):
+            report = extractor.generate_final_comprehensive_report()
+            with open('COMPLETE_THIRUPPUGAZH_FINAL_REPORT.txt', 'w', encoding='utf-8') as f:
+                f.write(report)
+        print("   ✅ Final Report: COMPLETE_THIRUPPUGAZH_FINAL_REPORT.txt")
+        
+        print(report)
+        
+    else:
+        print("❌ No names extracted. Please check the extraction process.")
+
+if __name__ == "__main__":
+    main()
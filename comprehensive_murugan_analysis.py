@@ -17,7 +17,7 @@ from subramanya_tweaker import (
     optimize_subramanya_name_for_target,
     find_closest_subramanya_names
 )
-from chaldean_numerology import calculate_chaldean_sum, get_name_analysis
+from chaldean_numerology import calculate_chaldean_sum, profile_name
 
 def display_research_overview():
     """Display overview of research sources and methodology."""
@@ -84,13 +84,14 @@ def analyze_by_categories():
     
     for name, info in names_db.items():
         source = info['source'].lower()
-        chaldean_sum = calculate_chaldean_sum(name)
+        profile = profile_name(name)
         
         entry = {
             'name': name,
-            'chaldean_sum': chaldean_sum,
+            'chaldean_sum': profile.total_sum,
+            'reduced_value': profile.reduced_value,
             'meaning': info['meaning'],
-            'is_perfect': chaldean_sum in [14, 41]
+            'is_perfect': profile.is_target
         }
         
         if any(keyword in source for keyword in ['arunagiri', 'thiruppugazh', 'kandhar']):
@@ -15,7 +15,7 @@ Sources researched:
 - Regional variations and diaspora communities
 """
 
-from chaldean_numerology import calculate_chaldean_sum, get_name_analysis
+from chaldean_numerology import calculate_chaldean_sum, calculate_chaldean_sums, get_name_analysis
 
 # Comprehensive database organized by source categories
 COMPREHENSIVE_SUBRAMANYA_NAMES = {
@@ -411,19 +411,20 @@ def analyze_comprehensive_database():
     source_categories = {}
     chaldean_distribution = {}
     
-    for name, info in COMPREHENSIVE_SUBRAMANYA_NAMES.items():
+    # Score every name once, in a single batch pass
+    chaldean_sums = [int(total) for total in calculate_chaldean_sums(COMPREHENSIVE_SUBRAMANYA_NAMES)]
+    
+    for (name, info), chaldean_sum in zip(COMPREHENSIVE_SUBRAMANYA_NAMES.items(), chaldean_sums):
         # Source analysis
         source = info['source'].split(' - ')[0] if ' - ' in info['source'] else info['source']
         source_categories[source] = source_categories.get(source, 0) + 1
         
         # Chaldean analysis
-        chaldean_sum = calculate_chaldean_sum(name)
         chaldean_distribution[chaldean_sum] = chaldean_distribution.get(chaldean_sum, 0) + 1
     
     # Find perfect names (14 or 41)
     perfect_names = []
-    for name, info in COMPREHENSIVE_SUBRAMANYA_NAMES.items():
-        chaldean_sum = calculate_chaldean_sum(name)
+    for (name, info), chaldean_sum in zip(COMPREHENSIVE_SUBRAMANYA_NAMES.items(), chaldean_sums):
         if chaldean_sum in [14, 41]:
             perfect_names.append({
                 'name': name,
@@ -0,0 +1,158 @@
+"""
+Shared pytest fixtures
+"""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import tweak_cache
+from page_cache import PageCache
+
+# Base URL of the offline song pages put in the page cache by fill_cache
+BASE_URL = "http://songs.test/thiru/"
+
+# Default song page; {number} is replaced by the song number
+SONG_PAGE = """<html><head><title>Thiruppugazh {number}</title></head><body>
+<p><a name="tamil"></a>tamil verse</p>
+<p><a name="english"></a>English translation</p>
+<p>Oh Lord Saravana, the six-faced one, we worship your feet in song {number}.</p>
+</body></html>"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_tweak_cache(tmp_path, monkeypatch):
+    """Keep the default tweak cache out of the repository directory."""
+    path = str(tmp_path / 'tweak_cache.sqlite3')
+    monkeypatch.setenv('TWEAK_CACHE_PATH', path)  # worker processes re-import tweak_cache
+    monkeypatch.setattr(tweak_cache, 'DEFAULT_CACHE_PATH', path)
+    monkeypatch.setattr(tweak_cache, '_default_cache', None)
+    yield
+    if tweak_cache._default_cache is not None:
+        tweak_cache._default_cache.close()
+
+
+class FakeSongSite:
+    """
+    Local HTTP stand-in for kaumaram.com serving numbered song pages.
+
+    Pages are served with random latency, an ETag and Last-Modified, and
+    conditional GETs with a matching If-None-Match get a 304.
+
+    Args:
+        page: Page template; {number} is replaced by the song number
+        missing: Song numbers answered with 404
+        fail_first: Song numbers answered with 503 on their first request
+    """
+
+    def __init__(self, page=SONG_PAGE, missing=(), fail_first=()):
+        self.page = page
+        self.missing = set(missing)
+        self.fail_first = set(fail_first)
+        self.requests = 0
+        self.request_log = []  # (path, If-None-Match, If-Modified-Since) per request
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self, status, data, headers=()):
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                for header, value in headers:
+                    self.send_header(header, value)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                number = int(re.search(r'nnt(\d+)_u\.html', self.path).group(1))
+                if_none_match = self.headers.get('If-None-Match')
+                with site.lock:
+                    site.requests += 1
+                    site.request_log.append((self.path, if_none_match, self.headers.get('If-Modified-Since')))
+                    site.in_flight += 1
+                    site.max_in_flight = max(site.max_in_flight, site.in_flight)
+                    fail = number in site.fail_first
+                    site.fail_first.discard(number)
+                try:
+                    time.sleep(random.uniform(0, 0.02))
+                    if fail:
+                        self._reply(503, b'busy')
+                    elif number in site.missing:
+                        self._reply(404, b'not found')
+                    else:
+                        data = site.page.format(number=number).encode()
+                        etag = '"%s"' % hashlib.md5(data).hexdigest()
+                        if if_none_match == etag:
+                            self._reply(304, b'', [('ETag', etag)])
+                        else:
+                            self._reply(200, data, [('ETag', etag),
+                                                    ('Last-Modified', 'Sat, 01 Jun 2024 00:00:00 GMT')])
+                finally:
+                    with site.lock:
+                        site.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/thiru/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def song_site():
+    """Factory starting FakeSongSite servers, all shut down after the test."""
+    sites = []
+
+    def start(**options):
+        site = FakeSongSite(**options)
+        sites.append(site)
+        return site
+
+    yield start
+    for site in sites:
+        site.close()
+
+
+def song_url(number, base_url=BASE_URL):
+    """URL of a song page under base_url."""
+    return f"{base_url}nnt{number:04d}_u.html"
+
+
+@pytest.fixture
+def fill_cache(tmp_path):
+    """
+    Factory putting song pages for BASE_URL into a page cache under tmp_path.
+
+    fill_cache(numbers, page=SONG_PAGE, cache=None) returns the cache; pass
+    cache to add or replace pages in one filled earlier. Caches are closed
+    after the test.
+    """
+    caches = []
+
+    def fill(numbers, page=SONG_PAGE, cache=None):
+        if cache is None:
+            cache = PageCache(str(tmp_path / 'pages.sqlite3'))
+            caches.append(cache)
+        for number in numbers:
+            cache.put(song_url(number), page.format(number=number).encode(), content_type='text/html')
+        return cache
+
+    yield fill
+    for cache in caches:
+        cache.close()
@@ -5,7 +5,7 @@ This module contains well-documented names from Thiruppugazh literature that sta
 based on available scholarly sources and published translations, pending complete corpus extraction.
 """
 
-from chaldean_numerology import calculate_chaldean_sum, get_name_analysis
+from chaldean_numerology import profile_name
 
 # Enhanced Thiruppugazh names database with scholarly validation
 ENHANCED_THIRUPPUGAZH_NAMES = {
@@ -183,14 +183,14 @@ def analyze_enhanced_thiruppugazh_database():
     close_names = []
     
     for name, details in ENHANCED_THIRUPPUGAZH_NAMES.items():
-        chaldean_sum = calculate_chaldean_sum(name)
-        analysis = get_name_analysis(name)
+        profile = profile_name(name)
+        chaldean_sum = profile.total_sum
         
         result = {
             'name': name,
             'tamil': details['tamil'],
             'chaldean_sum': chaldean_sum,
-            'reduced_value': analysis['reduced_value'],
+            'reduced_value': profile.reduced_value,
             'meaning': details['meaning'],
             'source': details['source'],
             'frequency': details['thiruppugazh_frequency'],
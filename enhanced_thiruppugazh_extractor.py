@@ -6,7 +6,6 @@ Advanced extraction from kaumaram.com with proper HTML structure parsing
 to systematically extract ALL Sa/Cha/Sha names from 1,340 Thiruppugazh songs.
 """
 
-import requests
 import re
 import time
 import json
@@ -16,6 +15,9 @@ from bs4 import BeautifulSoup, NavigableString
 import random
 from urllib.parse import urljoin
 
+from name_matcher import get_name_matcher
+from page_cache import CachedSession
+
 @dataclass
 class ThiruppugazhExtractedName:
     """Enhanced structure for extracted Thiruppugazh name."""
@@ -28,58 +30,20 @@ class ThiruppugazhExtractedName:
     tamil_reference: str
     category: str  # 'divine_name', 'epithet', 'attribute', 'place'
     confidence: float  # 0.0 to 1.0 based on context validation
+    pattern_family: str = ''  # name_matcher families that fired, e.g. 'saravana'
 
 class EnhancedThiruppugazhExtractor:
     """Enhanced extractor with proper HTML parsing."""
     
     def __init__(self):
         self.base_url = "https://kaumaram.com/thiru/"
-        self.session = requests.Session()
+        self.session = CachedSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         
-        # Enhanced patterns for Sa/Cha/Sha names
-        self.name_patterns = [
-            # Saravana variations (most important)
-            r'\b[Ss]aravana?(?:bhava|bava|perumal|n|m)?\b',
-            r'\b[Ss]haravan[a-z]*\b',
-            
-            # Shakti/Sakti variations  
-            r'\b[Ss]h?akti(?:vel|vEl)?\b',
-            r'\b[Ss]h?akti[a-z]*\b',
-            
-            # Shanmukha/Sanmukha variations
-            r'\b[Ss]h?anmukh[a-z]*\b',
-            r'\b[Cc]h?anmukh[a-z]*\b',
-            
-            # Siva/Shiva variations
-            r'\b[Ss]h?iva[a-z]*\b',
-            
-            # Subrahmanya variations
-            r'\b[Ss]ubrahmany[a-z]*\b',
-            r'\b[Ss]ubramany[a-z]*\b',
-            
-            # Sami/Swami variations
-            r'\b[Ss]wami[a-z]*\b',
-            r'\b[Ss]ami[a-z]*\b',
-            
-            # Chandra/Chander variations
-            r'\b[Cc]h?andra[a-z]*\b',
-            r'\b[Ss]h?andra[a-z]*\b',
-            
-            # Saran/Charan variations (feet/refuge)
-            r'\b[Ss]h?aran[a-z]*\b',
-            r'\b[Cc]h?aran[a-z]*\b',
-            
-            # Other divine names
-            r'\b[Ss]h?ambhu[a-z]*\b',
-            r'\b[Cc]h?aitany[a-z]*\b',
-            r'\b[Ss]h?aila[a-z]*\b',
-            r'\b[Ss]h?anti[a-z]*\b',
-            r'\b[Cc]h?akra[a-z]*\b',
-            r'\b[Ss]h?iva[a-z]*\b'
-        ]
+        # Enhanced patterns for Sa/Cha/Sha names ('enhanced' set of the shared matcher)
+        self.matcher = get_name_matcher()
         
         # Divine context indicators
         self.divine_indicators = [
@@ -98,8 +62,9 @@ class EnhancedThiruppugazhExtractor:
         url = f"{self.base_url}nnt{song_number:04d}_u.html"
         
         try:
-            # Add respectful delay
-            time.sleep(random.uniform(0.3, 0.8))
+            # Add respectful delay (not needed for pages in the page cache)
+            if not self.session.is_cached(url):
+                time.sleep(random.uniform(0.3, 0.8))
             
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
@@ -120,35 +85,33 @@ class EnhancedThiruppugazhExtractor:
             
             for english_text in english_sections:
                 # Apply pattern matching
-                for pattern in self.name_patterns:
-                    matches = re.finditer(pattern, english_text, re.IGNORECASE)
+                for match in self.matcher.scan(english_text, 'enhanced'):
+                    potential_name = match.text
                     
-                    for match in matches:
-                        potential_name = match.group().strip()
-                        
-                        # Get context around the match
-                        context_start = max(0, match.start() - 150)
-                        context_end = min(len(english_text), match.end() + 150)
-                        context = english_text[context_start:context_end]
-                        
-                        # Validate and categorize
-                        confidence = self._calculate_confidence(potential_name, context)
+                    # Get context around the match
+                    context_start = max(0, match.start - 150)
+                    context_end = min(len(english_text), match.end + 150)
+                    context = english_text[context_start:context_end]
+                    
+                    # Validate and categorize
+                    confidence = self._calculate_confidence(potential_name, context)
+                    
+                    if confidence >= 0.3:  # Threshold for inclusion
+                        category = self._categorize_name(potential_name, context)
+                        meaning = self._extract_meaning(potential_name, context)
                         
-                        if confidence >= 0.3:  # Threshold for inclusion
-                            category = self._categorize_name(potential_name, context)
-                            meaning = self._extract_meaning(potential_name, context)
-                            
-                            extracted_names.append(ThiruppugazhExtractedName(
-                                name=potential_name.title(),
-                                song_number=song_number,
-                                song_title=song_title,
-                                song_url=url,
-                                context=context.replace('\n', ' ').strip(),
-                                english_meaning=meaning,
-                                tamil_reference=f"Song {song_number}",
-                                category=category,
-                                confidence=confidence
-                            ))
+                        extracted_names.append(ThiruppugazhExtractedName(
+                            name=potential_name.title(),
+                            song_number=song_number,
+                            song_title=song_title,
+                            song_url=url,
+                            context=context.replace('\n', ' ').strip(),
+                            english_meaning=meaning,
+                            tamil_reference=f"Song {song_number}",
+                            category=category,
+                            confidence=confidence,
+                            pattern_family='/'.join(match.families)
+                        ))
             
             # Remove duplicates within the same song
             unique_names = self._deduplicate_song_names(extracted_names)
@@ -2,8 +2,9 @@
 """
 Final Retry for Stubborn Songs with Ultra-Conservative Approach
 
-Songs 183, 906, 788 still having connection issues.
-Using ultra-conservative retry with maximum delays.
+Songs 183, 906, 788 still having connection issues (or whichever songs the
+song ledger records as http_error). Using ultra-conservative retry with
+maximum delays; every outcome is written back to the ledger.
 """
 
 import csv
@@ -11,18 +12,24 @@ import time
 import random
 import requests
 from bs4 import BeautifulSoup
-from typing import List
+from typing import List, Optional
 from thiruppugazh_extractor_with_csv import ThiruppugazhNameCSV
+from name_matcher import get_name_matcher
+from page_cache import CachedSession, PageCache
+from song_ledger import EMPTY, HTTP_ERROR, OK, PARSE_ERROR, SongLedger
 
 class UltraConservativeRetry:
     """Ultra-conservative retry for stubborn songs."""
     
-    def __init__(self):
+    def __init__(self, ledger: Optional[SongLedger] = None):
         self.stubborn_songs = [183, 906, 788]
         self.base_url = "https://kaumaram.com/thiru/"
+        self.ledger = ledger or SongLedger()
+        self.last_errors = {}  # song number -> (ledger state, error) of the last failed attempt
         
-        # Ultra-conservative session
-        self.session = requests.Session()
+        # Ultra-conservative session (GETs go through the shared page cache)
+        self.page_cache = PageCache()
+        self.session = CachedSession(self.page_cache)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -33,21 +40,15 @@ class UltraConservativeRetry:
             'DNT': '1'
         })
         
-        # Patterns for name extraction
-        self.patterns = [
-            r'\b[Ss]aravana[a-z]*\b',
-            r'\b[Ss]haravan[a-z]*\b', 
-            r'\b[Ss]aktivel[a-z]*\b',
-            r'\b[Ss]hanmukh[a-z]*\b',
-            r'\b[Cc]hanmukh[a-z]*\b',
-            r'\b[Ss]iva[a-z]*\b',
-            r'\b[Ss]ami[a-z]*\b',
-            r'\b[Ss]wami[a-z]*\b',
-            r'\b[Cc]handra[a-z]*\b',
-            r'\b[Ss]ubramany[a-z]*\b',
-            r'\b[Ss]aran[a-z]*\b',
-            r'\b[Cc]haran[a-z]*\b'
-        ]
+        # Patterns for name extraction ('stubborn' set of the shared matcher)
+        self.matcher = get_name_matcher()
+    
+    def load_stubborn_from_ledger(self) -> bool:
+        """Retry the songs the ledger records as http_error instead, if there are any."""
+        stubborn = self.ledger.songs([HTTP_ERROR])
+        if stubborn:
+            self.stubborn_songs = stubborn
+        return bool(stubborn)
     
     def ultra_conservative_extract(self, song_number: int) -> List[ThiruppugazhNameCSV]:
         """Ultra-conservative extraction with maximum delays."""
@@ -57,15 +58,16 @@ class UltraConservativeRetry:
             try:
                 print(f"   🐌 Song {song_number} - Ultra-conservative attempt {attempt + 1}/10")
                 
-                # Ultra-long delay with randomization
-                delay = 5.0 + (attempt * 2.0) + random.uniform(0, 3.0)
-                print(f"      ⏱️  Waiting {delay:.1f}s...")
-                time.sleep(delay)
+                # Ultra-long delay with randomization (skipped for cached pages)
+                if not self.session.is_cached(url):
+                    delay = 5.0 + (attempt * 2.0) + random.uniform(0, 3.0)
+                    print(f"      ⏱️  Waiting {delay:.1f}s...")
+                    time.sleep(delay)
                 
                 # Create fresh session for each attempt
                 if attempt > 0:
                     self.session.close()
-                    self.session = requests.Session()
+                    self.session = CachedSession(self.page_cache)
                     self.session.headers.update({
                         'User-Agent': f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -93,28 +95,24 @@ class UltraConservativeRetry:
                 
                 # Find names
                 names_found = []
-                import re
-                
-                for pattern in self.patterns:
-                    matches = re.finditer(pattern, english_text, re.IGNORECASE)
-                    
-                    for match in matches:
-                        name = match.group().strip()
-                        if len(name) >= 4:
-                            # Simple context extraction
-                            start = max(0, match.start() - 80)
-                            end = min(len(english_text), match.end() + 80)
-                            context = english_text[start:end].replace('\n', ' ').strip()
-                            
-                            names_found.append(ThiruppugazhNameCSV(
-                                name=name.title(),
-                                song_number=song_number,
-                                song_url=url,
-                                context=context[:200],
-                                meaning=context[:100] + "...",
-                                category='divine_name',
-                                confidence=0.5
-                            ))
+                for match in self.matcher.scan(english_text, 'stubborn'):
+                    name = match.text
+                    if len(name) >= 4:
+                        # Simple context extraction
+                        start = max(0, match.start - 80)
+                        end = min(len(english_text), match.end + 80)
+                        context = english_text[start:end].replace('\n', ' ').strip()
+                        
+                        names_found.append(ThiruppugazhNameCSV(
+                            name=name.title(),
+                            song_number=song_number,
+                            song_url=url,
+                            context=context[:200],
+                            meaning=context[:100] + "...",
+                            category='divine_name',
+                            confidence=0.5,
+                            pattern_family='/'.join(match.families)
+                        ))
                 
                 # Deduplicate
                 unique_names = {}
@@ -125,11 +123,14 @@ class UltraConservativeRetry:
                 
                 final_names = list(unique_names.values())
                 
+                self.last_errors.pop(song_number, None)
                 print(f"      ✅ Success! Found {len(final_names)} names")
                 return final_names
                 
             except Exception as e:
                 error_str = str(e)[:100]
+                state = HTTP_ERROR if isinstance(e, requests.RequestException) else PARSE_ERROR
+                self.last_errors[song_number] = (state, error_str)
                 print(f"      ❌ Attempt {attempt + 1} failed: {error_str}")
                 
                 if attempt < 9:
@@ -173,6 +174,11 @@ class UltraConservativeRetry:
             names = self.ultra_conservative_extract(song_num)
             all_recovered.extend(names)
             
+            if song_num in self.last_errors:
+                self.ledger.record(song_num, *self.last_errors[song_num])
+            else:
+                self.ledger.record(song_num, OK if names else EMPTY, names=len(names))
+            
             if names:
                 print(f"   🎉 SUCCESS: Recovered {len(names)} names from song {song_num}")
                 for name in names:
@@ -180,8 +186,9 @@ class UltraConservativeRetry:
             else:
                 print(f"   😞 Song {song_num} still inaccessible")
             
-            # Long pause between songs
-            if song_num != self.stubborn_songs[-1]:
+            # Long pause between songs (unless the next one is already cached)
+            next_songs = self.stubborn_songs[self.stubborn_songs.index(song_num) + 1:]
+            if next_songs and not self.session.is_cached(f"{self.base_url}nnt{next_songs[0]:04d}_u.html"):
                 print("   ⏸️  Long pause before next song...")
                 time.sleep(10)
         
@@ -252,10 +259,11 @@ class UltraConservativeRetry:
 def main():
     """Main ultra-conservative retry."""
     retrier = UltraConservativeRetry()
+    retrier.load_stubborn_from_ledger()
     
     print("🐌 ULTRA-CONSERVATIVE RETRY SYSTEM")
     print("=" * 50)
-    print("Final attempt at stubborn songs 183, 906, 788")
+    print(f"Final attempt at stubborn songs {', '.join(map(str, retrier.stubborn_songs))}")
     print("Using maximum delays and conservative approach")
     
     proceed = input("\nProceed with ultra-conservative retry? (y/n): ").strip().lower()
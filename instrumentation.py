@@ -0,0 +1,398 @@
+"""
+Instrumentation
+
+Named timing spans, counters and an opt-in profiler for the long-running
+extraction entry points (run_full_skanda_extraction.py,
+complete_thiruppugazh_systematic_extractor.py, master_corpus_analyzer.py).
+
+Spans nest: every stage records its inclusive time and its self time (time
+not spent in a child span), so the self column of the breakdown table adds
+up to the instrumented part of the run.
+
+Usage:
+    from instrumentation import INSTRUMENTATION as instr
+
+    with instr.span('fetch'):
+        response = session.get(url)
+    instr.count('songs')
+    print(instr.format_report())
+"""
+
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class StageStats:
+    """Accumulated timings of one named span."""
+
+    __slots__ = ('calls', 'total_s', 'self_s', 'max_s')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_s = 0.0
+        self.self_s = 0.0
+        self.max_s = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'calls': self.calls, 'total_s': self.total_s, 'self_s': self.self_s, 'max_s': self.max_s}
+
+
+class Instrumentation:
+    """
+    Registry of stage timings and counters for one run.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            clock: Monotonic clock returning seconds (injectable for tests)
+        """
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all timings and counters and restart the run clock."""
+        with self._lock:
+            self.stages: Dict[str, StageStats] = {}
+            self.counters: Counter = Counter()
+            self.gauges: Dict[str, float] = {}
+            self.targets: Dict[str, int] = {}
+            self.started_at = self.clock()
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block under a stage name.
+
+        Args:
+            name: Stage name (e.g. 'fetch', 'parse', 'pattern_match')
+        """
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        # Each frame is [name, time spent in child spans]
+        frame = [name, 0.0]
+        stack.append(frame)
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+            with self._lock:
+                stats = self.stages.get(name)
+                if stats is None:
+                    stats = self.stages[name] = StageStats()
+                stats.calls += 1
+                stats.total_s += elapsed
+                stats.self_s += elapsed - frame[1]
+                if elapsed > stats.max_s:
+                    stats.max_s = elapsed
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorator form of span().
+
+        Args:
+            name: Stage name (default: the function name)
+        """
+        def decorate(function):
+            stage = name or function.__name__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(stage):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Increase a counter (pages, songs, names, ...).
+
+        Args:
+            name: Counter name
+            amount: Increment
+        """
+        with self._lock:
+            self.counters[name] += amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Record a point-in-time value (queue depth, songs remaining, ...).
+
+        Args:
+            name: Gauge name
+            value: Current value
+        """
+        with self._lock:
+            self.gauges[name] = value
+
+    def set_target(self, counter: str, total: int) -> None:
+        """
+        Declare how far a counter is expected to go, so an ETA can be estimated.
+
+        Args:
+            counter: Counter name (e.g. 'songs')
+            total: Expected final value
+        """
+        with self._lock:
+            self.targets[counter] = total
+
+    def elapsed(self) -> float:
+        """Seconds since the run started (or since the last reset)."""
+        return self.clock() - self.started_at
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Copy the current timings and counters.
+
+        Returns:
+            dict: {'elapsed_s', 'stages': {name: stats}, 'counters', 'gauges', 'targets'}
+        """
+        with self._lock:
+            return {
+                'elapsed_s': self.elapsed(),
+                'stages': {name: stats.to_dict() for name, stats in self.stages.items()},
+                'counters': dict(self.counters),
+                'gauges': dict(self.gauges),
+                'targets': dict(self.targets)
+            }
+
+    def format_report(self, title: str = "STAGE BREAKDOWN") -> str:
+        """
+        Render the per-stage breakdown table and counter rates.
+
+        Args:
+            title: Heading printed above the table
+
+        Returns:
+            str: Plain-text table, stages sorted by self time
+        """
+        data = self.snapshot()
+        elapsed = data['elapsed_s'] or 1e-9
+        lines = [f"⏱️  {title} ({_format_seconds(data['elapsed_s'])} wall)", "=" * 80,
+                 f"{'Stage':<20}{'Calls':>9}{'Total':>11}{'Self':>11}{'% run':>8}{'Mean':>11}{'Max':>11}",
+                 "-" * 80]
+
+        stages = sorted(data['stages'].items(), key=lambda item: item[1]['self_s'], reverse=True)
+        for name, stats in stages:
+            lines.append(
+                f"{name:<20}{stats['calls']:>9}{_format_seconds(stats['total_s']):>11}"
+                f"{_format_seconds(stats['self_s']):>11}{stats['self_s'] / elapsed * 100:>7.1f}%"
+                f"{_format_seconds(stats['total_s'] / stats['calls']):>11}{_format_seconds(stats['max_s']):>11}"
+            )
+        untracked = elapsed - sum(stats['self_s'] for _, stats in stages)
+        if stages and untracked > 0:
+            lines.append(f"{'(untracked)':<20}{'':>9}{'':>11}{_format_seconds(untracked):>11}"
+                         f"{untracked / elapsed * 100:>7.1f}%")
+
+        if data['counters']:
+            lines.append("-" * 80)
+            for name, value in sorted(data['counters'].items()):
+                lines.append(f"{name:<20}{value:>9}  ({value / elapsed:.2f}/sec)")
+        return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 3600:
+        return f"{seconds / 3600:.2f}h"
+    if seconds >= 60:
+        return f"{seconds / 60:.1f}m"
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    return f"{seconds * 1000:.2f}ms"
+
+
+# Shared instance used by the entry points
+INSTRUMENTATION = Instrumentation()
+
+
+# --- Memory -----------------------------------------------------------------
+
+class MemoryTracker:
+    """
+    tracemalloc checkpoints taken at the end of each stage of a run.
+
+    Every checkpoint records the memory traced at that moment, the peak
+    since the previous checkpoint and the source lines holding the most
+    memory, then resets the peak so each stage gets its own high-water mark.
+    """
+
+    def __init__(self, top: int = 3):
+        """
+        Args:
+            top: Allocation sites listed per checkpoint
+        """
+        self.top = top
+        self.records: List[Dict[str, Any]] = []
+        self._started_here = False
+
+    def start(self) -> None:
+        """Start tracing allocations (no-op when tracemalloc already runs)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_here = True
+        tracemalloc.reset_peak()
+
+    def stop(self) -> None:
+        """Stop tracing if start() turned tracing on."""
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    def checkpoint(self, stage: str) -> Dict[str, Any]:
+        """
+        Record memory use at the end of a stage.
+
+        Args:
+            stage: Stage label (e.g. a PDF file name or 'export')
+
+        Returns:
+            dict: stage, current_bytes, peak_bytes and top allocation sites
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ])
+        top_sites = [
+            {'site': f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+             'bytes': stat.size}
+            for stat in snapshot.statistics('lineno')[:self.top]
+        ]
+        tracemalloc.reset_peak()
+        record = {'stage': stage, 'current_bytes': current, 'peak_bytes': peak, 'top': top_sites}
+        self.records.append(record)
+        return record
+
+    def format_report(self, title: str = "MEMORY BY STAGE (tracemalloc)") -> str:
+        """
+        Render the checkpoints as a table.
+
+        Returns:
+            str: One row per checkpoint with current/peak MB and the largest site
+        """
+        lines = [f"🧠 {title}", "=" * 80,
+                 f"{'Stage':<32}{'Current':>11}{'Peak':>11}  Largest allocation site", "-" * 80]
+        for record in self.records:
+            largest = record['top'][0] if record['top'] else None
+            site = f"{largest['site']} ({largest['bytes'] / 1048576:.1f}MB)" if largest else ''
+            lines.append(f"{record['stage'][:31]:<32}{record['current_bytes'] / 1048576:>9.1f}MB"
+                         f"{record['peak_bytes'] / 1048576:>9.1f}MB  {site}")
+        if self.records:
+            overall = max(record['peak_bytes'] for record in self.records)
+            lines.append("-" * 80)
+            lines.append(f"{'Overall peak':<32}{'':>11}{overall / 1048576:>9.1f}MB")
+        return "\n".join(lines)
+
+
+# --- Profiling --------------------------------------------------------------
+
+class StackSampler:
+    """
+    Background thread sampling one thread's Python stack at a fixed interval.
+
+    The samples are written in the folded format ("outer;inner;leaf count"),
+    which flamegraph.pl, inferno and speedscope read directly.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.005):
+        """
+        Args:
+            thread_id: Thread to sample (default: the calling thread)
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def write_folded(self, path: str) -> None:
+        """Write the samples in folded-stack format."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextlib.contextmanager
+def profiling(output_prefix: Optional[str], interval: float = 0.005) -> Iterator[Any]:
+    """
+    Profile the enclosed block when an output prefix is given.
+
+    Writes <prefix>.prof (cProfile stats for pstats/snakeviz) and
+    <prefix>.folded (sampled stacks for flame graphs). With no prefix the
+    block runs unprofiled.
+
+    Args:
+        output_prefix: Path prefix of the profile files, or None to disable
+        interval: Stack sampling interval in seconds
+
+    Yields:
+        cProfile.Profile or None
+    """
+    if not output_prefix:
+        yield None
+        return
+
+    import cProfile
+    profiler = cProfile.Profile()
+    sampler = StackSampler(interval=interval)
+    sampler.start()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        sampler.stop()
+        profiler.dump_stats(f"{output_prefix}.prof")
+        sampler.write_folded(f"{output_prefix}.folded")
+        print(f"🔬 Profile saved to: {output_prefix}.prof (pstats) and {output_prefix}.folded (flame graph)")
+
+
+def add_profile_argument(parser, default_prefix: str) -> None:
+    """
+    Add the shared --profile [PREFIX] option to an argparse parser.
+
+    Args:
+        parser: argparse.ArgumentParser
+        default_prefix: Prefix used when --profile is given without a value
+    """
+    parser.add_argument('--profile', nargs='?', const=default_prefix, metavar='PREFIX',
+                        help=f'Write cProfile stats and flame-graph stacks to PREFIX.prof/.folded '
+                             f'(default prefix: {default_prefix})')
+
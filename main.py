@@ -9,11 +9,11 @@ Can automatically post successful optimizations to Twitter.
 
 import sys
 import argparse
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 
 from chaldean_numerology import get_name_analysis, is_target_value
-from name_tweaker import find_target_tweaks, format_tweak_result
-from twitter_poster import TwitterPoster
+from name_tweaker import format_tweak_result
+from tweak_cache import cached_iter_target_tweaks
 
 
 def print_name_analysis(name: str) -> None:
@@ -36,17 +36,51 @@ def print_name_analysis(name: str) -> None:
     print(f"{'='*50}\n")
 
 
-def print_tweaks(tweaks: List[Dict[str, Any]]) -> None:
-    """Print all found tweaks."""
-    if not tweaks:
-        print("❌ No valid tweaks found to achieve target values (14 or 41).")
-        return
-    
-    print(f"\n🎯 Found {len(tweaks)} valid tweak(s):\n")
+def print_tweaks(tweaks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Print tweaks as they are found and return the ones printed."""
+    printed = []
     for i, tweak in enumerate(tweaks, 1):
+        if i == 1:
+            print(f"\n🎯 Valid tweaks (fewest changes first):\n")
         print(f"Option {i}:")
         print(format_tweak_result(tweak))
         print("-" * 40)
+        printed.append(tweak)
+    
+    if not printed:
+        print("❌ No valid tweaks found to achieve target values (14 or 41).")
+    else:
+        print(f"\n🎯 Found {len(printed)} valid tweak(s)")
+    return printed
+
+
+def post_optimization(twitter_poster, tweak_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Post through the durable outbox so the same optimization is never tweeted twice."""
+    from post_outbox import PostOutbox
+    
+    outbox = PostOutbox()
+    try:
+        return twitter_poster.post_name_optimization(tweak_result, outbox=outbox)
+    finally:
+        outbox.close()
+
+
+def combine_mode(args):
+    """Combine given/middle name pools with a surname to hit the target values."""
+    from name_combinator import count_full_names, format_full_name_result, iter_full_names, load_name_pool
+    
+    first_pool = load_name_pool(args.combine)
+    middle_pool = load_name_pool(args.middle) if args.middle else None
+    surname = args.surname or ''
+    limit = args.limit if args.limit is not None else 20
+    
+    total = count_full_names(first_pool, middle_pool, surname, args.targets)
+    print(f"\n🔍 {len(first_pool)} given names"
+          f"{f' x {len(middle_pool)} middle names' if middle_pool is not None else ''}"
+          f"{f' + {surname}' if surname else ''}: {total} combination(s) hit {args.targets}")
+    
+    for i, result in enumerate(iter_full_names(first_pool, middle_pool, surname, args.targets, limit), 1):
+        print(f"Option {i}: {format_full_name_result(result)}")
 
 
 def interactive_mode():
@@ -60,6 +94,7 @@ def interactive_mode():
     
     # Check if Twitter integration is available
     try:
+        from twitter_poster import TwitterPoster
         twitter_poster = TwitterPoster()
         test_result = twitter_poster.test_connection()
         if test_result['success']:
@@ -103,7 +138,7 @@ def interactive_mode():
                             'num_changes': 0
                         }
                         
-                        result = twitter_poster.post_name_optimization(tweak_result)
+                        result = post_optimization(twitter_poster, tweak_result)
                         if 'error' in result:
                             print(f"❌ Failed to post to Twitter: {result['message']}")
                         else:
@@ -120,15 +155,13 @@ def interactive_mode():
                 print(f"Invalid input, using default: {max_changes}")
             
             print(f"\n🔍 Searching for tweaks (max {max_changes} changes)...")
-            tweaks = find_target_tweaks(name, max_changes=max_changes)
-            
-            print_tweaks(tweaks)
+            tweaks = print_tweaks(cached_iter_target_tweaks(name, max_changes=max_changes))
             
             # If tweaks found and Twitter enabled, offer to post
             if tweaks and twitter_enabled:
                 post_choice = input("Would you like to post the best tweak to Twitter? (y/n): ").strip().lower()
                 if post_choice in ['y', 'yes']:
-                    result = twitter_poster.post_name_optimization(tweaks[0])
+                    result = post_optimization(twitter_poster, tweaks[0])
                     if 'error' in result:
                         print(f"❌ Failed to post to Twitter: {result['message']}")
                     else:
@@ -158,6 +191,7 @@ def command_line_mode(args):
         
         if auto_post:
             try:
+                from twitter_poster import TwitterPoster
                 twitter_poster = TwitterPoster()
                 tweak_result = {
                     'original': name,
@@ -167,7 +201,7 @@ def command_line_mode(args):
                     'num_changes': 0
                 }
                 
-                result = twitter_poster.post_name_optimization(tweak_result)
+                result = post_optimization(twitter_poster, tweak_result)
                 if 'error' in result:
                     print(f"❌ Failed to post to Twitter: {result['message']}")
                 else:
@@ -178,15 +212,14 @@ def command_line_mode(args):
     
     # Find tweaks
     print(f"\n🔍 Searching for tweaks (max {max_changes} changes)...")
-    tweaks = find_target_tweaks(name, max_changes=max_changes)
-    
-    print_tweaks(tweaks)
+    tweaks = print_tweaks(cached_iter_target_tweaks(name, max_changes=max_changes, limit=args.limit))
     
     # Auto-post if enabled and tweaks found
     if tweaks and auto_post:
         try:
+            from twitter_poster import TwitterPoster
             twitter_poster = TwitterPoster()
-            result = twitter_poster.post_name_optimization(tweaks[0])
+            result = post_optimization(twitter_poster, tweaks[0])
             if 'error' in result:
                 print(f"❌ Failed to post to Twitter: {result['message']}")
             else:
@@ -201,14 +234,48 @@ def main():
     parser.add_argument('name', nargs='?', help='Name to analyze and optimize')
     parser.add_argument('-m', '--max-changes', type=int, default=2, 
                        help='Maximum number of letter changes (default: 2)')
+    parser.add_argument('-l', '--limit', type=int, default=None,
+                       help='Stop after this many tweaks (default: show all)')
     parser.add_argument('-p', '--auto-post', action='store_true',
                        help='Automatically post successful tweaks to Twitter')
     parser.add_argument('-i', '--interactive', action='store_true',
                        help='Run in interactive mode')
+    parser.add_argument('-b', '--batch', metavar='FILE',
+                       help='Optimize every name in a CSV or text file')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                       help='Batch output file (.csv or .jsonl; default: JSON lines on stdout)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                       help='Batch worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=64,
+                       help='Names sent to a batch worker per task (default: 64)')
+    parser.add_argument('--cha', action='store_true',
+                       help="Batch mode: enforce the 'Cha' prefix (Subramanya optimizer)")
+    parser.add_argument('-c', '--combine', metavar='FILE',
+                       help='Combine given names from a CSV or text file into full names')
+    parser.add_argument('--middle', metavar='FILE',
+                       help='Combine mode: middle-name pool (CSV or text file)')
+    parser.add_argument('--surname', default='',
+                       help='Combine mode: fixed surname')
+    parser.add_argument('--serve', action='store_true',
+                       help='Run as a long-lived name server (JSON lines on stdin/stdout)')
+    parser.add_argument('--http', type=int, metavar='PORT', default=None,
+                       help='Serve mode: answer JSON POSTs on localhost:PORT instead of stdin')
+    parser.add_argument('-t', '--targets', type=int, nargs='+', default=[14, 41],
+                       help='Combine mode: target sums for the full name (default: 14 41)')
     
     args = parser.parse_args()
     
-    if args.interactive or not args.name:
+    if args.serve or args.http is not None:
+        from name_server import run_server
+        run_server(args.http, workers=args.workers)
+    elif args.batch:
+        from batch_optimizer import run_batch
+        run_batch(args.batch, args.output, max_changes=args.max_changes, cha_prefix=args.cha,
+                  limit=args.limit, workers=args.workers, chunk_size=args.chunk_size,
+                  auto_post=args.auto_post)
+    elif args.combine:
+        combine_mode(args)
+    elif args.interactive or not args.name:
         interactive_mode()
     else:
         command_line_mode(args)
@@ -11,24 +11,61 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-from sanskrit_name_extractor import SanskritNameExtractor
-from tamil_name_extractor import TamilNameExtractor  
-from sanskrit_tamil_corpus_analyzer import SanskritTamilCorpusAnalyzer
-from corpus_documentation_system import CorpusDocumentationSystem, SourceDocumentation
 from chaldean_numerology import calculate_chaldean_sum
+from chaldean_index import ChaldeanIndex
+from instrumentation import INSTRUMENTATION as instr, add_profile_argument, profiling
 
 class MasterCorpusAnalyzer:
     """Master analyzer integrating all corpus analysis tools."""
     
     def __init__(self):
-        self.sanskrit_extractor = SanskritNameExtractor()
-        self.tamil_extractor = TamilNameExtractor()
-        self.corpus_analyzer = SanskritTamilCorpusAnalyzer()
-        self.doc_system = CorpusDocumentationSystem()
+        # Extractors and their lexicons are built on first use (see the properties below)
+        self._sanskrit_extractor = None
+        self._tamil_extractor = None
+        self._corpus_analyzer = None
+        self._doc_system = None
         
         self.extracted_sanskrit = []
         self.extracted_tamil = []
         self.analysis_complete = False
+        self._chaldean_index = None
+    
+    @property
+    def sanskrit_extractor(self):
+        if self._sanskrit_extractor is None:
+            from sanskrit_name_extractor import SanskritNameExtractor
+            self._sanskrit_extractor = SanskritNameExtractor()
+        return self._sanskrit_extractor
+    
+    @property
+    def tamil_extractor(self):
+        if self._tamil_extractor is None:
+            from tamil_name_extractor import TamilNameExtractor
+            self._tamil_extractor = TamilNameExtractor()
+        return self._tamil_extractor
+    
+    @property
+    def corpus_analyzer(self):
+        if self._corpus_analyzer is None:
+            from sanskrit_tamil_corpus_analyzer import SanskritTamilCorpusAnalyzer
+            self._corpus_analyzer = SanskritTamilCorpusAnalyzer()
+        return self._corpus_analyzer
+    
+    @property
+    def doc_system(self):
+        if self._doc_system is None:
+            from corpus_documentation_system import CorpusDocumentationSystem
+            self._doc_system = CorpusDocumentationSystem()
+        return self._doc_system
+    
+    def _get_chaldean_index(self) -> ChaldeanIndex:
+        """Index the extracted names by Chaldean sum (rebuilt after each extraction)."""
+        if self._chaldean_index is None:
+            index = ChaldeanIndex()
+            index.add_many([n.devanagari for n in self.extracted_sanskrit], 'sanskrit', self.extracted_sanskrit)
+            index.add_many([n.tamil_script for n in self.extracted_tamil], 'tamil', self.extracted_tamil)
+            self._chaldean_index = index
+        return self._chaldean_index
     
     def process_directory(self, directory_path: str) -> Tuple[List, List]:
         """Process all text files in a directory."""
@@ -47,24 +84,28 @@ class MasterCorpusAnalyzer:
             file_name = file_path.stem
             
             print(f"   📄 Processing {file_name}...")
+            instr.count('files')
             
             # Determine language based on file name or content
             if any(keyword in file_name.lower() for keyword in ['sanskrit', 'devanagari', 'puranam', 'stotra']):
                 # Sanskrit file
-                names = self.sanskrit_extractor.process_source_file(str(file_path), file_name)
+                with instr.span('pattern_match'):
+                    names = self.sanskrit_extractor.process_source_file(str(file_path), file_name)
                 sanskrit_names.extend(names)
                 print(f"      Found {len(names)} Sanskrit names")
                 
             elif any(keyword in file_name.lower() for keyword in ['tamil', 'thiruppugazh', 'kandhar']):
                 # Tamil file
-                names = self.tamil_extractor.process_source_file(str(file_path), file_name)
+                with instr.span('pattern_match'):
+                    names = self.tamil_extractor.process_source_file(str(file_path), file_name)
                 tamil_names.extend(names)
                 print(f"      Found {len(names)} Tamil names")
                 
             else:
                 # Try both extractors
-                skt_names = self.sanskrit_extractor.process_source_file(str(file_path), file_name)
-                tam_names = self.tamil_extractor.process_source_file(str(file_path), file_name)
+                with instr.span('pattern_match'):
+                    skt_names = self.sanskrit_extractor.process_source_file(str(file_path), file_name)
+                    tam_names = self.tamil_extractor.process_source_file(str(file_path), file_name)
                 
                 if skt_names:
                     sanskrit_names.extend(skt_names)
@@ -75,6 +116,8 @@ class MasterCorpusAnalyzer:
         
         self.extracted_sanskrit = sanskrit_names
         self.extracted_tamil = tamil_names
+        self._chaldean_index = None
+        instr.count('names', len(sanskrit_names) + len(tamil_names))
         
         return sanskrit_names, tamil_names
     
@@ -85,18 +128,22 @@ class MasterCorpusAnalyzer:
         
         print("📜 Processing Sanskrit texts...")
         for source_name, text in sanskrit_texts.items():
-            names = self.sanskrit_extractor.extract_from_text(text, source_name)
+            with instr.span('pattern_match'):
+                names = self.sanskrit_extractor.extract_from_text(text, source_name)
             sanskrit_names.extend(names)
             print(f"   {source_name}: {len(names)} names")
         
         print("📿 Processing Tamil texts...")
         for source_name, text in tamil_texts.items():
-            names = self.tamil_extractor.extract_from_text(text, source_name)  
+            with instr.span('pattern_match'):
+                names = self.tamil_extractor.extract_from_text(text, source_name)
             tamil_names.extend(names)
             print(f"   {source_name}: {len(names)} names")
         
         self.extracted_sanskrit = sanskrit_names
         self.extracted_tamil = tamil_names
+        self._chaldean_index = None
+        instr.count('names', len(sanskrit_names) + len(tamil_names))
         
         return sanskrit_names, tamil_names
     
@@ -108,15 +155,16 @@ class MasterCorpusAnalyzer:
         print("\n🔬 PERFORMING COMPREHENSIVE CORPUS ANALYSIS")
         print("="*60)
         
-        analysis = {
-            "total_names": len(self.extracted_sanskrit) + len(self.extracted_tamil),
-            "sanskrit_count": len(self.extracted_sanskrit),
-            "tamil_count": len(self.extracted_tamil),
-            "chaldean_analysis": self._analyze_chaldean_values(),
-            "source_analysis": self._analyze_sources(),
-            "linguistic_analysis": self._analyze_linguistic_patterns(),
-            "quality_metrics": self._calculate_quality_metrics()
-        }
+        with instr.span('analyze'):
+            analysis = {
+                "total_names": len(self.extracted_sanskrit) + len(self.extracted_tamil),
+                "sanskrit_count": len(self.extracted_sanskrit),
+                "tamil_count": len(self.extracted_tamil),
+                "chaldean_analysis": self._analyze_chaldean_values(),
+                "source_analysis": self._analyze_sources(),
+                "linguistic_analysis": self._analyze_linguistic_patterns(),
+                "quality_metrics": self._calculate_quality_metrics()
+            }
         
         self.analysis_complete = True
         return analysis
@@ -130,33 +178,20 @@ class MasterCorpusAnalyzer:
             "value_distribution": {}
         }
         
-        # Analyze Sanskrit names
-        for name_obj in self.extracted_sanskrit:
-            value = calculate_chaldean_sum(name_obj.devanagari)
-            chaldean_data["sanskrit_values"][name_obj.devanagari] = value
-            chaldean_data["value_distribution"][value] = chaldean_data["value_distribution"].get(value, 0) + 1
-            
-            if value in [14, 41]:
-                chaldean_data["target_matches"]["sanskrit"].append({
-                    "name": name_obj.devanagari,
-                    "transliteration": name_obj.transliteration,
-                    "value": value,
-                    "meaning": name_obj.english_meaning
-                })
-        
-        # Analyze Tamil names
-        for name_obj in self.extracted_tamil:
-            value = calculate_chaldean_sum(name_obj.tamil_script)
-            chaldean_data["tamil_values"][name_obj.tamil_script] = value
-            chaldean_data["value_distribution"][value] = chaldean_data["value_distribution"].get(value, 0) + 1
-            
-            if value in [14, 41]:
-                chaldean_data["target_matches"]["tamil"].append({
-                    "name": name_obj.tamil_script,
-                    "transliteration": name_obj.transliteration,
-                    "value": value,
-                    "meaning": name_obj.english_meaning
-                })
+        index = self._get_chaldean_index()
+        
+        for entry in index.entries:
+            values_key = "sanskrit_values" if entry.source == "sanskrit" else "tamil_values"
+            chaldean_data[values_key][entry.name] = entry.chaldean_sum
+            chaldean_data["value_distribution"][entry.chaldean_sum] = chaldean_data["value_distribution"].get(entry.chaldean_sum, 0) + 1
+        
+        for entry in index.with_sums([14, 41]):
+            chaldean_data["target_matches"][entry.source].append({
+                "name": entry.name,
+                "transliteration": entry.info.transliteration,
+                "value": entry.chaldean_sum,
+                "meaning": entry.info.english_meaning
+            })
         
         return chaldean_data
     
@@ -305,17 +340,13 @@ class MasterCorpusAnalyzer:
         
         # Find names closest to 14 for Chaarvik optimization
         closest_names = []
-        for name_obj in self.extracted_sanskrit + self.extracted_tamil:
-            name_text = name_obj.devanagari if hasattr(name_obj, 'devanagari') else name_obj.tamil_script
-            value = calculate_chaldean_sum(name_text)
-            distance = abs(value - 14)
-            if distance <= 5:  # Within 5 points of target
-                closest_names.append({
-                    "name": name_text,
-                    "value": value,
-                    "distance": distance,
-                    "meaning": name_obj.english_meaning
-                })
+        for entry in self._get_chaldean_index().in_range(14 - 5, 14 + 5):  # Within 5 points of target
+            closest_names.append({
+                "name": entry.name,
+                "value": entry.chaldean_sum,
+                "distance": abs(entry.chaldean_sum - 14),
+                "meaning": entry.info.english_meaning
+            })
         
         closest_names.sort(key=lambda x: x['distance'])
         
@@ -429,21 +460,18 @@ class MasterCorpusAnalyzer:
         """Check Chaldean values for all names."""
         print("\n🔢 CHALDEAN VALUE ANALYSIS:")
         
-        target_names = []
-        close_names = []
+        index = self._get_chaldean_index()
+        language = {"sanskrit": "Sanskrit", "tamil": "Tamil"}
         
-        all_names = []
-        for name_obj in self.extracted_sanskrit:
-            all_names.append((name_obj.devanagari, name_obj.english_meaning, "Sanskrit"))
-        for name_obj in self.extracted_tamil:  
-            all_names.append((name_obj.tamil_script, name_obj.english_meaning, "Tamil"))
-        
-        for name, meaning, lang in all_names:
-            value = calculate_chaldean_sum(name)
-            if value in [14, 41]:
-                target_names.append((name, value, meaning, lang))
-            elif abs(value - 14) <= 3:
-                close_names.append((name, value, abs(value - 14), meaning, lang))
+        target_names = [
+            (entry.name, entry.chaldean_sum, entry.info.english_meaning, language[entry.source])
+            for entry in index.with_sums([14, 41])
+        ]
+        close_names = [
+            (entry.name, entry.chaldean_sum, abs(entry.chaldean_sum - 14), entry.info.english_meaning, language[entry.source])
+            for entry in index.in_range(14 - 3, 14 + 3)
+            if entry.chaldean_sum not in [14, 41]
+        ]
         
         if target_names:
             print(f"\n✅ PERFECT TARGET VALUES ({len(target_names)} names):")
@@ -545,9 +573,18 @@ def main():
     parser.add_argument('--interactive', action='store_true', help='Run interactive review session')
     parser.add_argument('--summary', action='store_true', help='Generate summary report only')
     parser.add_argument('--sample', action='store_true', help='Use sample texts for demonstration')
+    add_profile_argument(parser, 'master_corpus_analyzer')
     
     args = parser.parse_args()
     
+    with profiling(args.profile):
+        run_analysis(args)
+    
+    print()
+    print(instr.format_report("CORPUS ANALYSIS STAGE BREAKDOWN"))
+
+def run_analysis(args):
+    """Extract names from the chosen sources and report on them."""
     analyzer = MasterCorpusAnalyzer()
     
     print("🕉️  MASTER CORPUS ANALYZER - LORD SUBRAMANYA SWAMY NAMES 🕉️")
@@ -572,11 +609,12 @@ def main():
     
     if args.summary:
         # Generate summary only
-        summary = analyzer.generate_summary_report()
+        with instr.span('export'):
+            summary = analyzer.generate_summary_report()
         print(summary)
         
         # Save to file
-        with open("master_summary_report.txt", "w", encoding="utf-8") as f:
+        with instr.span('export'), open("master_summary_report.txt", "w", encoding="utf-8") as f:
             f.write(summary)
         print(f"\n📄 Summary saved to: master_summary_report.txt")
         
@@ -586,7 +624,8 @@ def main():
     else:
         # Standard analysis
         analysis = analyzer.analyze_corpus()
-        summary = analyzer.generate_summary_report()
+        with instr.span('export'):
+            summary = analyzer.generate_summary_report()
         print(summary)
 
 if __name__ == "__main__":
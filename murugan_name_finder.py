@@ -22,7 +22,6 @@ from subramanya_tweaker import (
     format_subramanya_tweak_result,
     find_closest_subramanya_names
 )
-from twitter_poster import TwitterPoster
 
 def display_perfect_murugan_names():
     """Display all Murugan names that already have perfect Chaldean values."""
@@ -94,6 +93,7 @@ def interactive_murugan_name_finder():
     twitter_poster = None
     twitter_enabled = False
     try:
+        from twitter_poster import TwitterPoster
         twitter_poster = TwitterPoster()
         test_result = twitter_poster.test_connection()
         if test_result['success']:
@@ -224,6 +224,7 @@ def command_line_mode(args):
         # Auto-post if enabled and successful
         if args.auto_post and result['successful_tweaks']:
             try:
+                from twitter_poster import TwitterPoster
                 twitter_poster = TwitterPoster()
                 best_tweak = result['best_tweak']
                 tweet_text = f"🕉️ Murugan Name Optimization 🕉️\n\n"
@@ -8,11 +8,11 @@ starting with "Cha" based on comprehensive research and Chaldean numerology.
 
 import sys
 import argparse
-from comprehensive_subramanya_database import get_comprehensive_subramanya_names
-from comprehensive_murugan_analysis import comprehensive_report, quick_name_lookup
-from subramanya_tweaker import optimize_subramanya_name_for_target
 from chaldean_numerology import calculate_chaldean_sum
-from twitter_poster import TwitterPoster
+
+# The optimizer (which loads the name database), report module and Twitter
+# client are imported by the commands that use them, so a single lookup does
+# not pay for all three.
 
 def chaarvik_specific_analysis():
     """Specific analysis for the name Chaarvik."""
@@ -85,6 +85,8 @@ def browse_database_by_category():
     print("📚 BROWSE COMPREHENSIVE MURUGAN NAMES DATABASE")
     print("="*55)
     
+    from comprehensive_subramanya_database import get_comprehensive_subramanya_names
+    
     names_db = get_comprehensive_subramanya_names()
     
     # Organize by source categories
@@ -138,6 +140,7 @@ def interactive_master_tool():
     # Check Twitter integration
     twitter_enabled = False
     try:
+        from twitter_poster import TwitterPoster
         twitter_poster = TwitterPoster()
         test_result = twitter_poster.test_connection()
         if test_result['success']:
@@ -192,6 +195,7 @@ def interactive_master_tool():
             elif choice == '3':
                 search_term = input("Enter search term: ").strip()
                 if search_term:
+                    from comprehensive_subramanya_database import get_comprehensive_subramanya_names
                     names_db = get_comprehensive_subramanya_names()
                     results = []
                     
@@ -221,6 +225,7 @@ def interactive_master_tool():
                     except ValueError:
                         pass
                     
+                    from subramanya_tweaker import optimize_subramanya_name_for_target
                     result = optimize_subramanya_name_for_target(custom_name, max_changes)
                     
                     print(f"\n🕉️ OPTIMIZATION RESULTS FOR '{custom_name}':")
@@ -251,6 +256,7 @@ def interactive_master_tool():
                         print("❌ No optimizations found within change limits.")
             
             elif choice == '5':
+                from comprehensive_murugan_analysis import comprehensive_report
                 comprehensive_report()
             
             elif choice == '6':
@@ -286,10 +292,13 @@ def main():
     if args.chaarvik:
         chaarvik_specific_analysis()
     elif args.report:
+        from comprehensive_murugan_analysis import comprehensive_report
         comprehensive_report()
     elif args.lookup:
+        from comprehensive_murugan_analysis import quick_name_lookup
         quick_name_lookup(args.lookup)
     elif args.optimize:
+        from subramanya_tweaker import optimize_subramanya_name_for_target
         result = optimize_subramanya_name_for_target(args.optimize)
         print(f"Optimization result: {result}")
     else:
@@ -0,0 +1,234 @@
+"""
+Full Name Combinator
+
+This module combines a given name, an optional middle name and a fixed
+surname so that the Chaldean sum of the full name hits a target (14/41 by
+default). Because the sum of a full name is the sum of its parts, each pool
+is bucketed by Chaldean sum once and only bucket pairs that add up to the
+remaining target are visited; combinations are then streamed in descending
+order of per-part confidence.
+"""
+
+import heapq
+import weakref
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from chaldean_index import ChaldeanIndex
+from chaldean_numerology import calculate_chaldean_sum
+from name_files import iter_name_rows
+
+
+def build_name_pool(names: Iterable[str], confidences: Optional[Iterable[float]] = None,
+                    source: str = 'pool') -> ChaldeanIndex:
+    """
+    Build a name pool from names and their confidences.
+
+    Duplicate spellings (case-insensitive) keep their highest confidence.
+
+    Args:
+        names: Candidate names for one slot
+        confidences: Confidence per name (default 1.0 for every name)
+        source: Label stored with the names
+
+    Returns:
+        ChaldeanIndex: Pool whose entries carry the confidence as info
+    """
+    names = list(names)
+    confidences = list(confidences) if confidences is not None else [1.0] * len(names)
+
+    best = {}
+    for name, confidence in zip(names, confidences):
+        name = name.strip()
+        if not name:
+            continue
+        key = name.upper()
+        if key not in best or confidence > best[key][1]:
+            best[key] = (name, float(confidence))
+
+    pool = ChaldeanIndex()
+    pool.add_many([name for name, _ in best.values()], source,
+                  [confidence for _, confidence in best.values()])
+    return pool
+
+
+def load_name_pool(path: str, name_column: Optional[str] = None) -> ChaldeanIndex:
+    """
+    Load a name pool from a CSV or JSON export or a plain text file.
+
+    See name_files.iter_name_rows for the accepted formats and columns.
+
+    Args:
+        path: Path to a .csv, .json or text file
+        name_column: Column or key holding the name (CSV and JSON only, optional)
+
+    Returns:
+        ChaldeanIndex: Pool whose entries carry the confidence as info
+    """
+    rows = list(iter_name_rows(path, name_column))
+    return build_name_pool([name for name, _ in rows], [confidence for _, confidence in rows], source=path)
+
+
+# Pool -> (pool size when ranked, ranked buckets); reused while the pool is unchanged
+_RANKED_BUCKETS = weakref.WeakKeyDictionary()
+
+
+def _ranked_buckets(pool: ChaldeanIndex) -> Dict[int, List[Tuple[float, str]]]:
+    """Group a pool by sum, each bucket sorted by confidence (highest first)."""
+    cached = _RANKED_BUCKETS.get(pool)
+    if cached is not None and cached[0] == len(pool):
+        return cached[1]
+
+    buckets = {}
+    for entry in pool.entries:
+        confidence = entry.info if entry.info is not None else 1.0
+        buckets.setdefault(entry.chaldean_sum, []).append((confidence, entry.name))
+    for bucket in buckets.values():
+        bucket.sort(key=lambda item: (-item[0], item[1]))
+    _RANKED_BUCKETS[pool] = (len(pool), buckets)
+    return buckets
+
+
+def _matching_bucket_pairs(first_buckets: Dict[int, List[Tuple[float, str]]],
+                           middle_buckets: Optional[Dict[int, List[Tuple[float, str]]]],
+                           remaining_targets: Iterable[int]) -> List[tuple]:
+    """Pair up first/middle buckets whose sums add up to a remaining target."""
+    empty_middle = [(1.0, '')]
+    pairs = []
+    for remaining in sorted(set(remaining_targets)):
+        for first_sum, first_bucket in first_buckets.items():
+            if middle_buckets is None:
+                if first_sum == remaining:
+                    pairs.append((first_bucket, empty_middle))
+            else:
+                middle_bucket = middle_buckets.get(remaining - first_sum)
+                if middle_bucket:
+                    pairs.append((first_bucket, middle_bucket))
+    return pairs
+
+
+def iter_full_names(first_pool: ChaldeanIndex, middle_pool: Optional[ChaldeanIndex] = None,
+                    surname: str = '', target_values=[14, 41],
+                    limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream full names whose Chaldean sum hits a target, best confidence first.
+
+    The confidence of a combination is the product of its parts' confidences
+    (the surname is fixed and counts as 1.0). Every matching bucket pair is
+    walked as a grid sorted by confidence on both axes, and a heap over the
+    grids' frontiers yields combinations in descending confidence without
+    materialising the full cross product.
+
+    Args:
+        first_pool: Pool of given names (see build_name_pool/load_name_pool)
+        middle_pool: Pool of middle names (None for given name + surname only)
+        surname: Fixed surname appended to every combination
+        target_values: Target Chaldean sums for the full name
+        limit: Stop after this many combinations (None for all)
+
+    Yields:
+        dict: Full name, its parts, Chaldean sum and combined confidence
+    """
+    surname = surname.strip()
+    surname_sum = calculate_chaldean_sum(surname)
+    first_buckets = _ranked_buckets(first_pool)
+    middle_buckets = _ranked_buckets(middle_pool) if middle_pool is not None else None
+    pairs = _matching_bucket_pairs(first_buckets, middle_buckets,
+                                   [target - surname_sum for target in target_values])
+
+    # (-confidence, first, middle, pair index, row, column)
+    heap = []
+    for pair_index, (first_bucket, middle_bucket) in enumerate(pairs):
+        first_confidence, first = first_bucket[0]
+        middle_confidence, middle = middle_bucket[0]
+        heap.append((-first_confidence * middle_confidence, first, middle, pair_index, 0, 0))
+    heapq.heapify(heap)
+
+    produced = 0
+    while heap and (limit is None or produced < limit):
+        negative_confidence, first, middle, pair_index, row, column = heapq.heappop(heap)
+        first_bucket, middle_bucket = pairs[pair_index]
+
+        # Each cell is reached exactly once: along its row, or down column 0
+        neighbours = [(row, column + 1)]
+        if column == 0:
+            neighbours.append((row + 1, 0))
+        for next_row, next_column in neighbours:
+            if next_row < len(first_bucket) and next_column < len(middle_bucket):
+                next_first_confidence, next_first = first_bucket[next_row]
+                next_middle_confidence, next_middle = middle_bucket[next_column]
+                heapq.heappush(heap, (-next_first_confidence * next_middle_confidence, next_first,
+                                      next_middle, pair_index, next_row, next_column))
+
+        first_confidence = first_bucket[row][0]
+        middle_confidence = middle_bucket[column][0] if middle_pool is not None else None
+        full_name = ' '.join(part for part in (first, middle, surname) if part)
+        produced += 1
+        yield {
+            'full_name': full_name,
+            'first': first,
+            'middle': middle if middle_pool is not None else None,
+            'surname': surname,
+            'chaldean_sum': calculate_chaldean_sum(full_name),
+            'confidence': -negative_confidence,
+            'part_confidences': [c for c in (first_confidence, middle_confidence) if c is not None]
+        }
+
+
+def find_full_names(first_pool: ChaldeanIndex, middle_pool: Optional[ChaldeanIndex] = None,
+                    surname: str = '', target_values=[14, 41],
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Collect full names whose Chaldean sum hits a target, best confidence first.
+
+    Args:
+        first_pool: Pool of given names
+        middle_pool: Pool of middle names (optional)
+        surname: Fixed surname appended to every combination
+        target_values: Target Chaldean sums for the full name
+        limit: Maximum number of combinations (None for all)
+
+    Returns:
+        list: Combinations as yielded by iter_full_names
+    """
+    return list(iter_full_names(first_pool, middle_pool, surname, target_values, limit))
+
+
+def count_full_names(first_pool: ChaldeanIndex, middle_pool: Optional[ChaldeanIndex] = None,
+                     surname: str = '', target_values=[14, 41]) -> int:
+    """
+    Count matching combinations from bucket sizes alone (no enumeration).
+
+    Args:
+        first_pool: Pool of given names
+        middle_pool: Pool of middle names (optional)
+        surname: Fixed surname appended to every combination
+        target_values: Target Chaldean sums for the full name
+
+    Returns:
+        int: Number of combinations iter_full_names would yield
+    """
+    surname_sum = calculate_chaldean_sum(surname)
+    first_buckets = _ranked_buckets(first_pool)
+    middle_buckets = _ranked_buckets(middle_pool) if middle_pool is not None else None
+    pairs = _matching_bucket_pairs(first_buckets, middle_buckets,
+                                   [target - surname_sum for target in target_values])
+    return sum(len(first_bucket) * len(middle_bucket) for first_bucket, middle_bucket in pairs)
+
+
+def format_full_name_result(result: Dict[str, Any]) -> str:
+    """
+    Format a combination for display.
+
+    Args:
+        result: Combination from iter_full_names
+
+    Returns:
+        str: Formatted string
+    """
+    parts = f"{result['first']}"
+    if result['middle'] is not None:
+        parts += f" + {result['middle']}"
+    if result['surname']:
+        parts += f" + {result['surname']}"
+    return (f"{result['full_name']} (Sum: {result['chaldean_sum']}, "
+            f"Confidence: {result['confidence']:.2f})\n  Parts: {parts}")
@@ -0,0 +1,88 @@
+"""
+Name Files
+
+Reader shared by the batch optimizer and the name combinator for the name
+lists users pass on the command line: the repo's CSV and JSON exports or
+plain text files with one name per line.
+"""
+
+import csv
+import json
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Column names that hold the name in the repo's CSV exports, in priority order
+NAME_COLUMNS = ['Name', 'Name/Word', 'Name (Devanagari)', 'Name (Tamil)']
+
+# Columns holding a 0-1 confidence in the repo's CSV exports, in priority order
+CONFIDENCE_COLUMNS = ['Confidence', 'Confidence_Score']
+
+# Keys that hold the name in the repo's JSON export records, in priority order
+NAME_KEYS = ['name', 'transliteration']
+
+# Keys holding a 0-1 confidence in the repo's JSON export records, in priority order
+CONFIDENCE_KEYS = ['confidence', 'confidence_score']
+
+
+def _parse_confidence(value: Optional[str]) -> float:
+    """Parse a confidence cell, defaulting to 1.0 when missing or invalid."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _iter_json_records(data: Any) -> Iterator[Dict[str, Any]]:
+    """Yield name records from a JSON export: a list of records, or an object of record lists."""
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict):
+                yield item
+            elif isinstance(item, str):
+                yield {'name': item}
+    elif isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, list):
+                yield from _iter_json_records(value)
+
+
+def iter_name_rows(path: str, name_column: Optional[str] = None) -> Iterator[Tuple[str, float]]:
+    """
+    Read names and their confidences from a CSV or JSON export or a plain text file.
+
+    CSV files use name_column (or the first of NAME_COLUMNS present, else the
+    first column) and the first of CONFIDENCE_COLUMNS present. JSON files hold
+    a list of records or an object whose lists hold records (e.g. 'names' or
+    one list per category); each record uses name_column (or the first of
+    NAME_KEYS present) and the first of CONFIDENCE_KEYS present, and records
+    without a name are skipped. Text files hold one name per line with
+    confidence 1.0; blank lines and '#' comments are skipped.
+
+    Args:
+        path: Path to a .csv, .json or text file
+        name_column: Column or key holding the name (CSV and JSON only, optional)
+
+    Yields:
+        tuple: (name, confidence) in file order, names stripped and non-empty
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            reader = csv.DictReader(f)
+            fields = reader.fieldnames or []
+            column = name_column or next((c for c in NAME_COLUMNS if c in fields), fields[0] if fields else None)
+            confidence_column = next((c for c in CONFIDENCE_COLUMNS if c in fields), None)
+            for row in reader:
+                name = (row.get(column) or '').strip()
+                if name:
+                    yield name, _parse_confidence(row.get(confidence_column)) if confidence_column else 1.0
+        elif path.lower().endswith('.json'):
+            for record in _iter_json_records(json.load(f)):
+                keys = [name_column] if name_column else NAME_KEYS
+                name = next((record[k] for k in keys if isinstance(record.get(k), str) and record[k].strip()), '')
+                if name:
+                    confidence_key = next((k for k in CONFIDENCE_KEYS if k in record), None)
+                    yield name.strip(), _parse_confidence(record.get(confidence_key)) if confidence_key else 1.0
+        else:
+            for line in f:
+                name = line.strip()
+                if name and not name.startswith('#'):
+                    yield name, 1.0
@@ -0,0 +1,288 @@
+"""
+Name Matcher
+
+One compiled matcher for the Sa/Cha/Sha name patterns of every Thiruppugazh
+extractor. Each extractor keeps its own pattern set (web, csv, enhanced,
+complete, stubborn) and every pattern belongs to a family (saravana,
+shanmukha, sa_prefix, ...); the matcher is built from all of them at once.
+
+All patterns match whole words (they are anchored with \\b on both sides and
+contain only letters), so a page is scanned once, word by word, instead of
+once per pattern. The patterns that fire for a word are worked out on first
+sight (one pass of the union of all patterns rejects most words) and
+memoized, so later pages cost one dictionary lookup per word.
+
+Usage:
+    matcher = get_name_matcher()
+    for match in matcher.scan(english_text, 'csv'):
+        print(match.text, match.start, match.families)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# (family, pattern) pairs per extractor; all patterns are matched with re.IGNORECASE
+WEB_PATTERNS = [
+    ('sa_prefix', r'\b[Ss][aA][a-zA-Z]*(?:an|ar|am|al|ai|ay|av|ah|ak|ag|aj|ad|ap|ab|at|as|a)\b'),
+    ('cha_prefix', r'\b[Cc][hH][aA][a-zA-Z]*(?:an|ar|am|al|ai|ay|av|ah|ak|ag|aj|ad|ap|ab|at|as|a)\b'),
+    ('sha_prefix', r'\b[Ss][hH][aA][a-zA-Z]*(?:an|ar|am|al|ai|ay|av|ah|ak|ag|aj|ad|ap|ab|at|as|a)\b'),
+    # Tamil transliteration variants
+    ('saran', r'\b[Ss]aran[a-z]*\b'),
+    ('saran', r'\b[Cc]aran[a-z]*\b'),
+    ('saravana', r'\b[Ss]arvana[a-z]*\b'),
+    ('saravana', r'\b[Cc]harav[a-z]*\b'),
+    ('shanmukha', r'\b[Ss]hanmukh[a-z]*\b'),
+    ('shanmukha', r'\b[Cc]hanmukh[a-z]*\b'),
+    ('shakti', r'\b[Ss]haktiv[a-z]*\b'),
+    ('shakti', r'\b[Cc]haktiv[a-z]*\b'),
+    ('swami', r'\b[Ss]ami\b'),
+    ('swami', r'\b[Cc]hami\b'),
+    ('shambhu', r'\b[Ss]ambh[a-z]*\b'),
+    ('chandra', r'\b[Cc]handr[a-z]*\b'),
+    ('chandra', r'\b[Ss]handr[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubramany[a-z]*\b'),
+    ('chaitanya', r'\b[Cc]haitany[a-z]*\b'),
+    ('chaitanya', r'\b[Ss]aitany[a-z]*\b'),
+]
+
+CSV_PATTERNS = [
+    ('saravana', r'\b[Ss]aravana[a-z]*\b'),
+    ('saravana', r'\b[Ss]haravan[a-z]*\b'),
+    ('shakti', r'\b[Ss]aktivel[a-z]*\b'),
+    ('shakti', r'\b[Ss]haktivel[a-z]*\b'),
+    ('shanmukha', r'\b[Ss]hanmukh[a-z]*\b'),
+    ('shanmukha', r'\b[Cc]hanmukh[a-z]*\b'),
+    ('siva', r'\b[Ss]iva[a-z]*\b'),
+    ('siva', r'\b[Ss]hiva[a-z]*\b'),
+    ('swami', r'\b[Ss]ami[a-z]*\b'),
+    ('swami', r'\b[Ss]wami[a-z]*\b'),
+    ('chandra', r'\b[Cc]handra[a-z]*\b'),
+    ('chandra', r'\b[Ss]handra[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubramany[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubrahmany[a-z]*\b'),
+    ('saran', r'\b[Ss]aran[a-z]*\b'),
+    ('saran', r'\b[Cc]haran[a-z]*\b'),
+    ('shambhu', r'\b[Ss]hambhu[a-z]*\b'),
+    ('chaitanya', r'\b[Cc]haitany[a-z]*\b'),
+]
+
+ENHANCED_PATTERNS = [
+    ('saravana', r'\b[Ss]aravana?(?:bhava|bava|perumal|n|m)?\b'),
+    ('saravana', r'\b[Ss]haravan[a-z]*\b'),
+    ('shakti', r'\b[Ss]h?akti(?:vel|vEl)?\b'),
+    ('shakti', r'\b[Ss]h?akti[a-z]*\b'),
+    ('shanmukha', r'\b[Ss]h?anmukh[a-z]*\b'),
+    ('shanmukha', r'\b[Cc]h?anmukh[a-z]*\b'),
+    ('siva', r'\b[Ss]h?iva[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubrahmany[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubramany[a-z]*\b'),
+    ('swami', r'\b[Ss]wami[a-z]*\b'),
+    ('swami', r'\b[Ss]ami[a-z]*\b'),
+    ('chandra', r'\b[Cc]h?andra[a-z]*\b'),
+    ('chandra', r'\b[Ss]h?andra[a-z]*\b'),
+    ('saran', r'\b[Ss]h?aran[a-z]*\b'),
+    ('saran', r'\b[Cc]h?aran[a-z]*\b'),
+    ('shambhu', r'\b[Ss]h?ambhu[a-z]*\b'),
+    ('chaitanya', r'\b[Cc]h?aitany[a-z]*\b'),
+    ('shaila', r'\b[Ss]h?aila[a-z]*\b'),
+    ('shanti', r'\b[Ss]h?anti[a-z]*\b'),
+    ('chakra', r'\b[Cc]h?akra[a-z]*\b'),
+]
+
+COMPLETE_PATTERNS = [
+    # Birth place, the highest priority
+    ('saravana', r'\b[Ss]aravana?(?:bhava?|bava?|perumal|n|m|r|k)?\b'),
+    ('saravana', r'\b[Ss]haravan[a-z]*\b'),
+    ('saravana', r'\b[Ss]arvan[a-z]*\b'),
+    ('shakti', r'\b[Ss]h?akti(?:vel|vEl|dhar[a-z]*|pan[a-z]*)?\b'),
+    ('shakti', r'\b[Ss]h?akti[a-z]*\b'),
+    ('shanmukha', r'\b[Ss]h?anmukh[a-z]*\b'),
+    ('shanmukha', r'\b[Cc]h?anmukh[a-z]*\b'),
+    ('shanmukha', r'\b[Ss]h?anmugan?\b'),
+    ('shanmukha', r'\b[Cc]h?anmugan?\b'),
+    ('siva', r'\b[Ss]h?iva[a-z]*\b'),
+    ('siva', r'\b[Ss]h?ivan?\b'),
+    ('subrahmanya', r'\b[Ss]ubrahmany[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubramany[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubramaniam?\b'),
+    ('swami', r'\b[Ss]wami[a-z]*\b'),
+    ('swami', r'\b[Ss]ami[a-z]*\b'),
+    ('swami', r'\b[Cc]h?ami[a-z]*\b'),
+    ('chandra', r'\b[Cc]h?andra[a-z]*\b'),
+    ('chandra', r'\b[Ss]h?andra[a-z]*\b'),
+    ('chandra', r'\b[Cc]h?andran?\b'),
+    ('saran', r'\b[Ss]h?aran[a-z]*\b'),
+    ('saran', r'\b[Cc]h?aran[a-z]*\b'),
+    ('saran', r'\b[Ss]h?aranagat[a-z]*\b'),
+    ('shambhu', r'\b[Ss]h?ambhu[a-z]*\b'),
+    ('shambhu', r'\b[Cc]h?ambhu[a-z]*\b'),
+    ('chaitanya', r'\b[Cc]h?aitany[a-z]*\b'),
+    ('chaitanya', r'\b[Ss]h?aitany[a-z]*\b'),
+    ('chakra', r'\b[Cc]h?akra[a-z]*\b'),
+    ('chakra', r'\b[Ss]h?akra[a-z]*\b'),
+    ('chakra', r'\b[Cc]h?akrav[a-z]*\b'),
+    ('shankara', r'\b[Ss]h?ankar[a-z]*\b'),
+    ('shankara', r'\b[Cc]h?ankar[a-z]*\b'),
+    ('shaila', r'\b[Ss]h?aila[a-z]*\b'),
+    ('shaila', r'\b[Cc]h?aila[a-z]*\b'),
+    ('shanti', r'\b[Ss]h?anti[a-z]*\b'),
+    ('shanti', r'\b[Cc]h?anti[a-z]*\b'),
+    ('chaturmukha', r'\b[Cc]h?aturmukh[a-z]*\b'),
+    ('chaturmukha', r'\b[Ss]h?aturmukh[a-z]*\b'),
+    ('chaturmukha', r'\b[Cc]h?atur[a-z]*\b'),
+    ('sharada', r'\b[Ss]h?arad[a-z]*\b'),
+    ('charita', r'\b[Cc]h?arit[a-z]*\b'),
+    ('shashi', r'\b[Ss]h?ashi[a-z]*\b'),
+    ('sharma', r'\b[Ss]h?arma[a-z]*\b'),
+    ('sharma', r'\b[Cc]h?arma[a-z]*\b'),
+    ('shastra', r'\b[Ss]h?astra[a-z]*\b'),
+    ('sanatana', r'\b[Ss]h?anatan[a-z]*\b'),
+    ('chetana', r'\b[Cc]h?etan[a-z]*\b'),
+    ('shakti', r'\b[Ss]h?akta[a-z]*\b'),
+    ('shakti', r'\b[Cc]h?akta[a-z]*\b'),
+    ('chiranjeevi', r'\b[Cc]h?iran[a-z]*\b'),
+]
+
+STUBBORN_PATTERNS = [
+    ('saravana', r'\b[Ss]aravana[a-z]*\b'),
+    ('saravana', r'\b[Ss]haravan[a-z]*\b'),
+    ('shakti', r'\b[Ss]aktivel[a-z]*\b'),
+    ('shanmukha', r'\b[Ss]hanmukh[a-z]*\b'),
+    ('shanmukha', r'\b[Cc]hanmukh[a-z]*\b'),
+    ('siva', r'\b[Ss]iva[a-z]*\b'),
+    ('swami', r'\b[Ss]ami[a-z]*\b'),
+    ('swami', r'\b[Ss]wami[a-z]*\b'),
+    ('chandra', r'\b[Cc]handra[a-z]*\b'),
+    ('subrahmanya', r'\b[Ss]ubramany[a-z]*\b'),
+    ('saran', r'\b[Ss]aran[a-z]*\b'),
+    ('saran', r'\b[Cc]haran[a-z]*\b'),
+]
+
+PATTERN_SETS = {
+    'web': WEB_PATTERNS,
+    'csv': CSV_PATTERNS,
+    'enhanced': ENHANCED_PATTERNS,
+    'complete': COMPLETE_PATTERNS,
+    'stubborn': STUBBORN_PATTERNS,
+}
+
+WORD_RE = re.compile(r'\w+')
+
+# Memoized words are dropped beyond this many distinct words
+MAX_MEMO_WORDS = 100000
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """One word matched by at least one pattern."""
+    text: str
+    start: int
+    end: int
+    families: Tuple[str, ...]
+
+
+class NameMatcher:
+    """
+    Word-level matcher built from several named pattern sets.
+    """
+
+    def __init__(self, pattern_sets: Dict[str, Sequence[Tuple[str, str]]]):
+        """
+        Compile every pattern of every set.
+
+        Args:
+            pattern_sets: Set name -> (family, pattern) pairs; patterns must be
+                anchored with \\b on both sides
+
+        Raises:
+            ValueError: If a pattern is not anchored to whole words
+        """
+        self.patterns: List[Tuple[str, str]] = []
+        # Set name -> {pattern index: position within the set}
+        self.set_members: Dict[str, Dict[int, int]] = {}
+        index = {}
+        for set_name, patterns in pattern_sets.items():
+            members = []
+            for family, pattern in patterns:
+                if not (pattern.startswith(r'\b') and pattern.endswith(r'\b')):
+                    raise ValueError(f"Pattern must match whole words (\\b...\\b): {pattern}")
+                if (family, pattern) not in index:
+                    index[(family, pattern)] = len(self.patterns)
+                    self.patterns.append((family, pattern))
+                members.append(index[(family, pattern)])
+            self.set_members[set_name] = {i: rank for rank, i in enumerate(dict.fromkeys(members))}
+
+        self._compiled = [re.compile(pattern, re.IGNORECASE) for _, pattern in self.patterns]
+        self._union = re.compile('|'.join(f'(?:{pattern})' for _, pattern in self.patterns), re.IGNORECASE)
+        self._words: Dict[str, Tuple[int, ...]] = {}
+
+    def classify(self, word: str) -> Tuple[int, ...]:
+        """
+        Indexes of the patterns that match a whole word (memoized).
+
+        Args:
+            word: One word of text
+
+        Returns:
+            tuple: Pattern indexes into self.patterns, in order
+        """
+        fired = self._words.get(word)
+        if fired is None:
+            if self._union.fullmatch(word):
+                fired = tuple(i for i, compiled in enumerate(self._compiled) if compiled.fullmatch(word))
+            else:
+                fired = ()
+            if len(self._words) >= MAX_MEMO_WORDS:
+                self._words.clear()
+            self._words[word] = fired
+        return fired
+
+    def scan(self, text: str, pattern_set: Optional[str] = None) -> Iterator[NameMatch]:
+        """
+        Scan text once and yield every word matched by the pattern set.
+
+        Args:
+            text: Text to scan
+            pattern_set: Name of the set to match (default: all patterns)
+
+        Yields:
+            NameMatch: In text order, with the families that fired (in the set's pattern order)
+        """
+        members = self.set_members[pattern_set] if pattern_set is not None else None
+        for word in WORD_RE.finditer(text):
+            fired = self.classify(word.group())
+            if members is not None and fired:
+                fired = sorted((i for i in fired if i in members), key=members.get)
+            if fired:
+                families = tuple(dict.fromkeys(self.patterns[i][0] for i in fired))
+                yield NameMatch(word.group(), word.start(), word.end(), families)
+
+    def families(self, pattern_set: Optional[str] = None) -> List[str]:
+        """
+        Families covered by a pattern set.
+
+        Args:
+            pattern_set: Set name (default: all patterns)
+
+        Returns:
+            list: Family names in pattern order
+        """
+        members = self.set_members[pattern_set] if pattern_set is not None else range(len(self.patterns))
+        return list(dict.fromkeys(self.patterns[i][0] for i in members))
+
+
+_default_matcher = None
+
+
+def get_name_matcher() -> NameMatcher:
+    """
+    Get the process-wide matcher for PATTERN_SETS (compiled on first use).
+
+    Returns:
+        NameMatcher: Matcher shared by all extractors
+    """
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = NameMatcher(PATTERN_SETS)
+    return _default_matcher
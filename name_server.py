@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Name Analysis Server
+
+A long-lived service that loads the name sources, the Chaldean index and the
+tweak cache once and then answers analyze, tweak, search and combine
+requests. Requests arrive as JSON lines on stdin/stdout or as JSON POSTs to
+a localhost HTTP endpoint; heavy tweak searches run on a process pool.
+
+Request format (one JSON object per line or per POST body):
+    {"id": 1, "op": "analyze", "name": "Chaarvik"}
+    {"id": 2, "op": "tweak", "name": "Chaarvik", "max_changes": 2, "cha": false, "limit": 10}
+    {"id": 3, "op": "search", "targets": [14, 41], "source": "thiruppugazh", "limit": 20}
+    {"id": 4, "op": "search", "nearest": 14, "limit": 10}
+    {"id": 5, "op": "search", "min_sum": 10, "max_sum": 18}
+    {"id": 6, "op": "combine", "first": "AUTHENTIC_BABY_NAMES_CHA.csv",
+     "middle": "SKANDA_BABY_NAMES.csv", "surname": "Shekar", "limit": 20}
+
+Combine pools are file names inside the pool directory (the repository, or
+NAME_POOL_DIR); paths outside it are rejected. HTTP POSTs must be sent as
+Content-Type: application/json, so browsers cannot forge them cross-site.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, TextIO
+
+from batch_optimizer import optimize_batch_name
+from chaldean_index import ChaldeanIndex, get_default_index
+from chaldean_numerology import profile_name
+from name_combinator import iter_full_names, load_name_pool
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_POOL_DIR = os.environ.get('NAME_POOL_DIR') or os.path.dirname(os.path.abspath(__file__))
+POOL_EXTENSIONS = ('.csv', '.json', '.txt')
+
+
+def _entry_to_dict(entry) -> Dict[str, Any]:
+    """Convert an IndexedName into a JSON-friendly dict."""
+    return {
+        'name': entry.name,
+        'source': entry.source,
+        'chaldean_sum': entry.chaldean_sum,
+        'info': entry.info if isinstance(entry.info, dict) else None
+    }
+
+
+class NameService:
+    """
+    Warm state shared by all requests: index, name lookup, pools and a worker pool.
+    """
+
+    def __init__(self, index: Optional[ChaldeanIndex] = None, workers: Optional[int] = None,
+                 memo_size: int = 4096, pool_dir: str = DEFAULT_POOL_DIR, pool_cache_size: int = 8):
+        """
+        Initialize the service.
+
+        Args:
+            index: Index to answer search requests from (default: every name source)
+            workers: Tweak worker processes (default: CPU count; 1 runs in-process)
+            memo_size: Number of tweak results kept in memory
+            pool_dir: Directory holding the name files combine requests may use
+            pool_cache_size: Number of loaded combine pools kept in memory
+        """
+        self.index = index if index is not None else get_default_index()
+        self.workers = workers or os.cpu_count() or 1
+        self.memo_size = memo_size
+        self.pool_dir = os.path.abspath(pool_dir)
+        self.pool_cache_size = pool_cache_size
+        self.started_at = time.time()
+        self.requests_served = 0
+
+        self._names: Dict[str, List[int]] = {}
+        for entry in self.index.entries:
+            self._names.setdefault(entry.name.upper(), []).append(entry.name_id)
+
+        self._source_indexes: Dict[str, ChaldeanIndex] = {}
+        self._pools = OrderedDict()
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = None
+
+        self._handlers = {
+            'analyze': self.analyze,
+            'tweak': self.tweak,
+            'search': self.search,
+            'combine': self.combine,
+            'stats': self.stats,
+        }
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Start the tweak worker pool on first use."""
+        if self.workers == 1:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _get_source_index(self, source: str) -> ChaldeanIndex:
+        """Split one source out of the main index (reusing its sums) on first use."""
+        with self._lock:
+            index = self._source_indexes.get(source)
+            if index is None:
+                index = ChaldeanIndex()
+                for entry in self.index.entries:
+                    if entry.source == source:
+                        index.add(entry.name, source, entry.info, entry.chaldean_sum)
+                self._source_indexes[source] = index
+            return index
+
+    def _pool_path(self, name: str) -> str:
+        """
+        Resolve a combine pool to a name file in pool_dir.
+
+        Raises:
+            ValueError: For paths, unsupported file types and unknown files
+        """
+        if (not isinstance(name, str) or os.path.basename(name) != name
+                or not name.lower().endswith(POOL_EXTENSIONS)):
+            raise ValueError(f"Name pool must be a {'/'.join(POOL_EXTENSIONS)} file name in the pool "
+                             f"directory, got {name!r}")
+        path = os.path.join(self.pool_dir, name)
+        if not os.path.isfile(path):
+            raise ValueError(f"Unknown name pool {name!r}")
+        return path
+
+    def _get_pool(self, name: str) -> ChaldeanIndex:
+        """Load a combine pool once, keeping the most recently used ones."""
+        path = self._pool_path(name)
+        with self._lock:
+            pool = self._pools.get(name)
+            if pool is not None:
+                self._pools.move_to_end(name)
+        if pool is None:
+            pool = load_name_pool(path)
+            with self._lock:
+                self._pools[name] = pool
+                while len(self._pools) > self.pool_cache_size:
+                    self._pools.popitem(last=False)
+        return pool
+
+    def analyze(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Chaldean analysis of a name plus the sources that list it."""
+        name = request['name']
+        analysis = profile_name(name).to_dict()
+        analysis['known_sources'] = sorted({self.index.entries[name_id].source
+                                            for name_id in self._names.get(name.upper(), [])})
+        return analysis
+
+    def tweak(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Tweak search (see batch_optimizer.optimize_batch_name), memoised."""
+        name = request['name']
+        max_changes = int(request.get('max_changes', 2))
+        cha_prefix = bool(request.get('cha', False))
+        limit = request.get('limit')
+        key = (name.upper(), max_changes, cha_prefix, limit)
+
+        with self._lock:
+            record = self._memo.get(key)
+            if record is not None:
+                self._memo.move_to_end(key)
+        if record is None:
+            executor = self._get_executor()
+            if executor is None:
+                record = optimize_batch_name(name, max_changes, cha_prefix, limit)
+            else:
+                record = executor.submit(optimize_batch_name, name, max_changes, cha_prefix, limit).result()
+            with self._lock:
+                self._memo[key] = record
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+
+        return dict(record, name=name)
+
+    def search(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Index lookup by exact sums, sum range or distance to a target."""
+        source = request.get('source')
+        limit = request.get('limit')
+        index = self._get_source_index(source) if source else self.index
+
+        if 'nearest' in request:
+            entries = index.nearest(int(request['nearest']), limit)
+        elif 'min_sum' in request or 'max_sum' in request:
+            entries = index.in_range(int(request.get('min_sum', 0)),
+                                     int(request.get('max_sum', sys.maxsize)))
+        else:
+            entries = index.with_sums(request.get('targets', [14, 41]))
+
+        total = len(entries)
+        if limit is not None:
+            entries = entries[:limit]
+        return {'total': total, 'names': [_entry_to_dict(entry) for entry in entries]}
+
+    def combine(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Full-name combinations (see name_combinator.iter_full_names)."""
+        first_pool = self._get_pool(request['first'])
+        middle_pool = self._get_pool(request['middle']) if request.get('middle') else None
+        combinations = list(iter_full_names(first_pool, middle_pool, request.get('surname', ''),
+                                            request.get('targets', [14, 41]), request.get('limit', 20)))
+        return {'combinations': combinations}
+
+    def stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Service counters."""
+        return {
+            'indexed_names': len(self.index),
+            'loaded_pools': sorted(self._pools),
+            'memoised_tweaks': len(self._memo),
+            'requests_served': self.requests_served,
+            'uptime_seconds': time.time() - self.started_at,
+            'workers': self.workers
+        }
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dispatch a single request.
+
+        Args:
+            request: Decoded request with an 'op' and its parameters
+
+        Returns:
+            dict: {'id', 'op', 'result', 'elapsed_ms'} or {'id', 'op', 'error', 'message'}
+        """
+        op = request.get('op')
+        response = {'id': request.get('id'), 'op': op}
+        start = time.perf_counter()
+
+        handler = self._handlers.get(op)
+        if handler is None:
+            response.update(error='unknown_op', message=f"Unknown op {op!r}; expected one of {sorted(self._handlers)}")
+            return response
+
+        try:
+            response['result'] = handler(request)
+        except KeyError as e:
+            response.update(error='bad_request', message=f"Missing field {e}")
+        except Exception as e:
+            response.update(error=type(e).__name__, message=str(e))
+
+        response['elapsed_ms'] = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.requests_served += 1
+        return response
+
+    def handle_line(self, line: str) -> str:
+        """Handle one JSON line and return the encoded response line."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            response = {'id': None, 'op': None, 'error': 'bad_json', 'message': str(e)}
+        else:
+            response = self.handle(request)
+        return json.dumps(response, ensure_ascii=False, default=str)
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+def serve_stdio(service: NameService, stdin: TextIO = sys.stdin, stdout: TextIO = sys.stdout) -> None:
+    """
+    Answer JSON-line requests from stdin until EOF, one response line each.
+
+    Args:
+        service: Warm service
+        stdin: Request stream
+        stdout: Response stream
+    """
+    for line in stdin:
+        if not line.strip():
+            continue
+        stdout.write(service.handle_line(line) + '\n')
+        stdout.flush()
+
+
+def make_http_server(service: NameService, host: str = DEFAULT_HOST,
+                     port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Build a threaded HTTP server for the service.
+
+    POST /<op> (or POST / with an 'op' field) takes a JSON request body
+    (Content-Type: application/json); GET /stats returns the service counters.
+
+    Args:
+        service: Warm service
+        host: Interface to bind (localhost by default)
+        port: Port to bind (0 picks a free one)
+
+    Returns:
+        ThreadingHTTPServer: Server ready for serve_forever()
+    """
+
+    class NameRequestHandler(BaseHTTPRequestHandler):
+        def _send(self, status: int, response: Dict[str, Any]) -> None:
+            body = json.dumps(response, ensure_ascii=False, default=str).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip('/') == '/stats':
+                self._send(200, service.handle({'op': 'stats'}))
+            else:
+                self._send(404, {'error': 'not_found', 'message': self.path})
+
+        def do_POST(self):
+            # Browsers can send cross-site "simple" POSTs, but never with a JSON content type
+            content_type = (self.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+            if content_type != 'application/json':
+                self._send(415, {'error': 'unsupported_media_type',
+                                 'message': "POST bodies must be sent as Content-Type: application/json"})
+                return
+
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                request = json.loads(self.rfile.read(length) or b'{}')
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                self._send(400, {'error': 'bad_json', 'message': str(e)})
+                return
+
+            op = self.path.strip('/')
+            if op:
+                request['op'] = op
+            response = service.handle(request)
+            self._send(400 if 'error' in response else 200, response)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), NameRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+def run_server(http_port: Optional[int] = None, host: str = DEFAULT_HOST,
+               workers: Optional[int] = None) -> None:
+    """
+    Warm up the service and serve stdin/stdout, or HTTP when a port is given.
+
+    Args:
+        http_port: Serve HTTP on this port instead of stdin/stdout
+        host: HTTP interface to bind
+        workers: Tweak worker processes
+    """
+    start = time.perf_counter()
+    service = NameService(workers=workers)
+    log = sys.stderr
+    print(f"🕉️  Name server ready: {len(service.index)} names indexed in "
+          f"{time.perf_counter() - start:.2f}s", file=log)
+
+    try:
+        if http_port is None:
+            print("📨 Reading JSON-line requests from stdin (Ctrl-D to stop)", file=log)
+            serve_stdio(service)
+        else:
+            server = make_http_server(service, host, http_port)
+            print(f"🌐 Listening on http://{host}:{server.server_address[1]}", file=log)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+    finally:
+        service.close()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Serve name analysis, tweak, search and combine requests")
+    parser.add_argument('--http', type=int, metavar='PORT', default=None,
+                        help=f'Serve HTTP on this port (e.g. {DEFAULT_PORT}) instead of stdin/stdout')
+    parser.add_argument('--host', default=DEFAULT_HOST,
+                        help=f'HTTP interface to bind (default: {DEFAULT_HOST})')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='Tweak worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    run_server(args.http, args.host, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Name Spool
+
+Memory-bounded store for the rows produced by the Skanda Purana
+extractors. Rows are buffered in memory and appended to one CSV spool file
+whenever the buffer grows past a byte ceiling, so an extraction over all 20
+PDF parts never holds more than one buffer of rows. Reports and the final
+export stream the rows back from disk.
+
+The spool supports append(), len() and iteration, so it can stand in for
+the extractors' extracted_names list.
+"""
+
+import csv
+import os
+import shutil
+import sys
+from typing import Dict, Iterator, List, Optional
+
+# Columns written by both Skanda Purana extractors
+SKANDA_FIELDNAMES = [
+    'Name/Word', 'Script Type', 'Found Form', 'Language',
+    'Monier Williams Meaning', 'Etymology', 'Page#', 'Part#',
+    'Context/Line#', 'Proper Noun/Epithet/Place', 'Notes'
+]
+
+DEFAULT_BUFFER_MB = 16
+
+
+def estimate_row_bytes(row: Dict[str, str]) -> int:
+    """
+    Approximate memory held by one row dict and its values.
+
+    Args:
+        row: Extracted name row
+
+    Returns:
+        int: Estimated bytes
+    """
+    return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+
+
+class NameSpool:
+    """
+    Append-only CSV spool with a bounded in-memory buffer.
+    """
+
+    def __init__(self, path: str, fieldnames: Optional[List[str]] = None,
+                 max_buffer_bytes: int = DEFAULT_BUFFER_MB * 1024 * 1024):
+        """
+        Create (or truncate) the spool file.
+
+        Args:
+            path: Spool CSV file
+            fieldnames: CSV columns (default: SKANDA_FIELDNAMES)
+            max_buffer_bytes: Buffered rows are flushed to disk beyond this size
+        """
+        self.path = path
+        self.fieldnames = fieldnames or SKANDA_FIELDNAMES
+        self.max_buffer_bytes = max_buffer_bytes
+        self.buffer: List[Dict[str, str]] = []
+        self.buffer_bytes = 0
+        self.peak_buffer_bytes = 0
+        self.count = 0
+        self.flushes = 0
+
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        self._writer.writeheader()
+
+    def add(self, row: Dict[str, str]) -> None:
+        """Buffer a row, flushing to disk when the buffer is over its ceiling."""
+        self.buffer.append(row)
+        self.buffer_bytes += estimate_row_bytes(row)
+        self.count += 1
+        if self.buffer_bytes > self.peak_buffer_bytes:
+            self.peak_buffer_bytes = self.buffer_bytes
+        if self.buffer_bytes >= self.max_buffer_bytes:
+            self.flush()
+
+    append = add
+
+    def flush(self) -> int:
+        """
+        Append the buffered rows to the spool file.
+
+        Returns:
+            int: Number of rows written
+        """
+        written = len(self.buffer)
+        if written:
+            self._writer.writerows(self.buffer)
+            self._file.flush()
+            self.flushes += 1
+        self.buffer = []
+        self.buffer_bytes = 0
+        return written
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        """Stream every row back from disk (flushes the buffer first)."""
+        self.flush()
+        with open(self.path, newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+    def export_csv(self, output_file: str) -> None:
+        """
+        Copy all rows to a final CSV file.
+
+        Args:
+            output_file: Destination path
+        """
+        self.flush()
+        if os.path.abspath(output_file) != os.path.abspath(self.path):
+            shutil.copyfile(self.path, output_file)
+
+    def close(self) -> None:
+        """Flush and close the spool file (it stays on disk)."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
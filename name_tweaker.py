@@ -6,7 +6,10 @@ to achieve target Chaldean numerology values while preserving meaning and sound.
 """
 
 from chaldean_numerology import calculate_chaldean_sum, get_chaldean_value, is_target_value
+import hashlib
+import heapq
 import itertools
+import json
 
 
 # Phonetically similar letter substitutions
@@ -64,6 +67,144 @@ def get_letter_substitutions(letter):
         return [letter]
 
 
+def build_substitution_deltas():
+    """
+    Precompute how much each allowed substitution changes a Chaldean sum.
+    
+    Covers every letter in VOWEL_SUBSTITUTIONS and CONSONANT_SUBSTITUTIONS,
+    including digraphs (PH, KS) and elongations (AA, LL, ...). A candidate's
+    sum is then the base sum plus its deltas, with no rescoring of the string.
+    
+    Returns:
+        dict: Letter -> tuple of (substitute, sum_delta) pairs, identity excluded
+    """
+    deltas = {}
+    for letter in list(VOWEL_SUBSTITUTIONS) + list(CONSONANT_SUBSTITUTIONS):
+        base_value = get_chaldean_value(letter)
+        deltas[letter] = tuple(
+            (substitute, calculate_chaldean_sum(substitute) - base_value)
+            for substitute in get_letter_substitutions(letter)
+            if substitute != letter and len(substitute) <= 2  # Limit elongations
+        )
+    return deltas
+
+
+def substitution_tables_hash():
+    """
+    Fingerprint the current substitution tables.
+    
+    Returns:
+        str: SHA-1 hex digest of VOWEL_SUBSTITUTIONS and CONSONANT_SUBSTITUTIONS
+    """
+    payload = json.dumps([VOWEL_SUBSTITUTIONS, CONSONANT_SUBSTITUTIONS], sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+SUBSTITUTION_DELTAS = build_substitution_deltas()
+_SUBSTITUTION_DELTAS_HASH = substitution_tables_hash()
+
+
+def refresh_substitution_deltas():
+    """
+    Rebuild SUBSTITUTION_DELTAS if the substitution tables changed since it was built.
+    
+    Returns:
+        str: Hash of the substitution tables the deltas now reflect
+    """
+    global SUBSTITUTION_DELTAS, _SUBSTITUTION_DELTAS_HASH
+    
+    tables_hash = substitution_tables_hash()
+    if tables_hash != _SUBSTITUTION_DELTAS_HASH:
+        SUBSTITUTION_DELTAS = build_substitution_deltas()
+        _SUBSTITUTION_DELTAS_HASH = tables_hash
+    return tables_hash
+
+
+def get_position_options(letter):
+    """
+    Get the choices available at one position of a name.
+    
+    Args:
+        letter (str): The uppercase character at that position
+        
+    Returns:
+        list: (text, chaldean_value) tuples; the first entry keeps the
+              original letter, every following entry is a one-change substitution
+    """
+    if not letter.isalpha():
+        return [(letter, 0)]
+    
+    value = get_chaldean_value(letter)
+    return [(letter, value)] + [
+        (substitute, value + delta) for substitute, delta in SUBSTITUTION_DELTAS.get(letter, ())
+    ]
+
+
+def _build_reachable_sums(position_options, max_changes):
+    """
+    Build the dynamic-programming table of reachable suffix sums.
+    
+    reachable[i][r] is a bitmask whose bit s is set when the letters from
+    position i to the end can sum to s using at most r substitutions.
+    
+    Args:
+        position_options (list): Output of get_position_options per position
+        max_changes (int): Maximum number of substitutions
+        
+    Returns:
+        list: (len(position_options) + 1) rows of max_changes + 1 bitmasks
+    """
+    reachable = [[1] * (max_changes + 1)]  # Empty suffix: only sum 0
+    for options in reversed(position_options):
+        after = reachable[-1]
+        keep_value = options[0][1]
+        row = []
+        for remaining in range(max_changes + 1):
+            mask = after[remaining] << keep_value
+            if remaining:
+                for _, value in options[1:]:
+                    mask |= after[remaining - 1] << value
+            row.append(mask)
+        reachable.append(row)
+    reachable.reverse()
+    return reachable
+
+
+def _plan_search(name, target_values, max_changes):
+    """
+    Set up a substitution search over a name.
+    
+    A dynamic program over (position, changes used, running sum) records
+    which sums are still reachable from every position, so a search only
+    walks branches that end on a target. The table costs
+    O(len(name) x max_changes x sum range).
+    
+    Args:
+        name (str): Uppercase name
+        target_values (list): Target Chaldean sums
+        max_changes (int): Maximum number of letter changes
+        
+    Returns:
+        tuple: (position_options, max_changes clamped to the changeable
+               letters, target bitmask, reachable-sum table), or None when
+               no plan can reach a target
+    """
+    position_options = [get_position_options(letter) for letter in name]
+    
+    changeable = sum(1 for options in position_options if len(options) > 1)
+    max_changes = max(0, min(max_changes, changeable))
+    
+    target_mask = 0
+    for target in target_values:
+        if target >= 0:
+            target_mask |= 1 << target
+    
+    reachable = _build_reachable_sums(position_options, max_changes)
+    if not reachable[0][max_changes] & target_mask:
+        return None
+    return position_options, max_changes, target_mask, reachable
+
+
 def generate_name_variations(name, max_changes=2):
     """
     Generate variations of a name by substituting letters.
@@ -76,36 +217,117 @@ def generate_name_variations(name, max_changes=2):
         list: List of name variations
     """
     name = name.upper()
-    variations = set()
-    variations.add(name)  # Include original
-    
-    # Generate single-letter substitutions
-    for i, letter in enumerate(name):
-        if letter.isalpha():
-            substitutions = get_letter_substitutions(letter)
-            for substitute in substitutions:
-                if substitute != letter and len(substitute) <= 2:  # Limit elongations
-                    new_name = name[:i] + substitute + name[i+1:]
-                    variations.add(new_name)
-    
-    # Generate two-letter substitutions if max_changes >= 2
-    if max_changes >= 2:
-        base_variations = list(variations)
-        for base_name in base_variations:
-            if base_name == name:  # Only apply second change to original
-                continue
-            for i, letter in enumerate(base_name):
-                if letter.isalpha():
-                    substitutions = get_letter_substitutions(letter)
-                    for substitute in substitutions:
-                        if substitute != letter and len(substitute) <= 2:
-                            new_name = base_name[:i] + substitute + base_name[i+1:]
-                            if new_name != base_name:
-                                variations.add(new_name)
+    variations = {name}  # Include original
     
+    # Extend every partial variation one position at a time
+    partials = [('', 0)]  # (prefix, changes used)
+    for letter in name:
+        options = get_position_options(letter)
+        extended = []
+        for prefix, used in partials:
+            extended.append((prefix + options[0][0], used))
+            if used < max_changes:
+                extended.extend((prefix + text, used + 1) for text, _ in options[1:])
+        partials = extended
+    
+    variations.update(prefix for prefix, _ in partials)
     return list(variations)
 
 
+def _make_tweak(name, tweaked, chaldean_sum, plan):
+    """
+    Build a tweak result dict from a substitution plan.
+    
+    Args:
+        name (str): Original name as given by the caller
+        tweaked (str): The tweaked spelling
+        chaldean_sum (int): Chaldean sum of the tweaked spelling
+        plan (list): (position, from, to) tuples
+        
+    Returns:
+        dict: Tweak result in the find_target_tweaks format
+    """
+    changes = [
+        {
+            'position': position,
+            'from': original_letter,
+            'to': substitute
+        }
+        for position, original_letter, substitute in plan
+    ]
+    
+    return {
+        'original': name,
+        'tweaked': tweaked,
+        'chaldean_sum': chaldean_sum,
+        'changes': changes,
+        'num_changes': len(changes)
+    }
+
+
+def iter_target_tweaks(name, target_values=[14, 41], max_changes=2, limit=None):
+    """
+    Lazily yield name tweaks that achieve target Chaldean values, cheapest first.
+    
+    Partial plans sit in a priority queue keyed by the number of changes made
+    so far, and branches that can no longer reach a target are pruned with the
+    reachable-sum table from _plan_search. Tweaks therefore come out in
+    non-decreasing num_changes order as soon as they are found.
+    
+    Args:
+        name (str): Original name
+        target_values (list): Target Chaldean sums
+        max_changes (int): Maximum number of letter changes
+        limit (int): Stop after this many tweaks (None for all)
+        
+    Yields:
+        dict: Tweak results in the find_target_tweaks format
+    """
+    if limit is not None and limit <= 0:
+        return
+    
+    upper_name = name.upper()
+    search = _plan_search(upper_name, target_values, max_changes)
+    if search is None:
+        return
+    position_options, max_changes, target_mask, reachable = search
+    length = len(position_options)
+    
+    # (changes used, -position, tie-breaker, running sum, chosen texts)
+    # Deeper partial plans win ties so complete plans surface quickly.
+    counter = itertools.count()
+    queue = [(0, 0, next(counter), 0, ())]
+    seen = set()
+    yielded = 0
+    
+    while queue:
+        used, negative_position, _, running_sum, chosen = heapq.heappop(queue)
+        position = -negative_position
+        
+        if position == length:
+            tweaked = ''.join(chosen)
+            # Different plans can spell the same name (e.g. AA+A vs A+AA); the first is cheapest
+            if tweaked in seen:
+                continue
+            seen.add(tweaked)
+            
+            plan = [(i, upper_name[i], text) for i, text in enumerate(chosen) if text != upper_name[i]]
+            yield _make_tweak(name, tweaked, running_sum, plan)
+            
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+            continue
+        
+        for option_index, (text, value) in enumerate(position_options[position]):
+            next_used = used + (option_index > 0)
+            if next_used > max_changes:
+                break
+            next_sum = running_sum + value
+            if (reachable[position + 1][max_changes - next_used] << next_sum) & target_mask:
+                heapq.heappush(queue, (next_used, -(position + 1), next(counter), next_sum, chosen + (text,)))
+
+
 def find_target_tweaks(name, target_values=[14, 41], max_changes=2):
     """
     Find name tweaks that achieve target Chaldean values.
@@ -118,46 +340,10 @@ def find_target_tweaks(name, target_values=[14, 41], max_changes=2):
     Returns:
         list: List of successful tweaks with their analysis
     """
-    variations = generate_name_variations(name, max_changes)
-    successful_tweaks = []
-    
-    for variation in variations:
-        chaldean_sum = calculate_chaldean_sum(variation)
-        if chaldean_sum in target_values:
-            # Calculate what changed
-            changes = []
-            original_clean = ''.join(c for c in name.upper() if c.isalpha())
-            variation_clean = ''.join(c for c in variation if c.isalpha())
-            
-            # Count simple substitutions
-            if original_clean != variation_clean:
-                if len(original_clean) == len(variation_clean):
-                    # Same length - count character differences
-                    for i, (orig_char, var_char) in enumerate(zip(original_clean, variation_clean)):
-                        if orig_char != var_char:
-                            changes.append({
-                                'position': i,
-                                'from': orig_char,
-                                'to': var_char
-                            })
-                else:
-                    # Different lengths - count as one change for elongations
-                    changes.append({
-                        'position': 0,
-                        'from': original_clean,
-                        'to': variation_clean
-                    })
-            
-            successful_tweaks.append({
-                'original': name,
-                'tweaked': variation,
-                'chaldean_sum': chaldean_sum,
-                'changes': changes,
-                'num_changes': len(changes)
-            })
+    successful_tweaks = list(iter_target_tweaks(name, target_values, max_changes))
     
     # Sort by fewest changes first
-    successful_tweaks.sort(key=lambda x: x['num_changes'])
+    successful_tweaks.sort(key=lambda x: (x['num_changes'], x['tweaked']))
     return successful_tweaks
 
 
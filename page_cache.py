@@ -0,0 +1,300 @@
+"""
+Page Cache
+
+Persistent HTTP cache for the kaumaram.com song pages, shared by the
+Thiruppugazh extractors so that re-running them with new parsing heuristics
+costs no network round trips.
+
+Bodies are stored zlib-compressed and content-addressed (keyed by their
+SHA-256) in one SQLite file; a second table maps each URL to its body,
+status, ETag and Last-Modified. CachedSession is a drop-in requests.Session:
+
+- a cached page is served without touching the network
+- a page older than max_age is revalidated with If-None-Match /
+  If-Modified-Since, and a 304 serves the cached body
+- offline mode serves only from the cache and raises PageCacheMiss otherwise
+
+Environment:
+    PAGE_CACHE_PATH     cache file (default: page_cache.sqlite3 next to this module)
+    PAGE_CACHE_OFFLINE  set to 1 to never touch the network
+    PAGE_CACHE_MAX_AGE  seconds before a cached page is revalidated (default: never)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urldefrag
+
+import requests
+
+from instrumentation import INSTRUMENTATION as instr
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'PAGE_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'page_cache.sqlite3')
+)
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _env_max_age() -> Optional[float]:
+    value = os.environ.get('PAGE_CACHE_MAX_AGE', '').strip()
+    return float(value) if value else None
+
+
+class PageCacheMiss(requests.ConnectionError):
+    """Raised in offline mode for a URL that is not in the cache."""
+
+
+@dataclass
+class CachedPage:
+    """One cached URL."""
+    url: str
+    status_code: int
+    content: bytes
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class PageCache:
+    """
+    SQLite store of compressed, content-addressed page bodies.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Args:
+            path: SQLite file (created on first use)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite store on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha256 TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL REFERENCES blobs(sha256),
+                    status INTEGER NOT NULL,
+                    content_type TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL
+                );
+            """)
+            self._connection.commit()
+        return self._connection
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Cache key for a URL (the #fragment is never sent, so it is dropped)."""
+        return urldefrag(url)[0]
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Look up a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            CachedPage or None on a miss
+        """
+        url = self.normalize_url(url)
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT p.status, b.body, p.content_type, p.etag, p.last_modified, p.fetched_at '
+                'FROM pages p JOIN blobs b ON b.sha256 = p.sha256 WHERE p.url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, body, content_type, etag, last_modified, fetched_at = row
+        return CachedPage(url, status, zlib.decompress(body), content_type, etag, last_modified, fetched_at)
+
+    def fetched_at(self, url: str) -> Optional[float]:
+        """
+        When a URL was last fetched or revalidated, without reading its body.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            float: Unix time, or None on a miss
+        """
+        with self._lock:
+            row = self._connect().execute('SELECT fetched_at FROM pages WHERE url = ?',
+                                          (self.normalize_url(url),)).fetchone()
+        return row[0] if row else None
+
+    def put(self, url: str, content: bytes, status_code: int = 200, content_type: str = '',
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> str:
+        """
+        Store a page body and its validators.
+
+        Args:
+            url: Page URL
+            content: Response body
+            status_code: HTTP status
+            content_type: Content-Type header
+            etag: ETag header
+            last_modified: Last-Modified header
+
+        Returns:
+            str: SHA-256 of the body
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            connection = self._connect()
+            connection.execute('INSERT OR IGNORE INTO blobs VALUES (?, ?, ?)',
+                               (digest, zlib.compress(content, 6), len(content)))
+            connection.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)',
+                               (self.normalize_url(url), digest, status_code, content_type, etag,
+                                last_modified, time.time()))
+            connection.commit()
+        return digest
+
+    def touch(self, url: str) -> None:
+        """Mark a cached page as just revalidated."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute('UPDATE pages SET fetched_at = ? WHERE url = ?',
+                               (time.time(), self.normalize_url(url)))
+            connection.commit()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: pages, blobs, raw_bytes and stored_bytes
+        """
+        with self._lock:
+            connection = self._connect()
+            pages = connection.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+            blobs, raw, stored = connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(body)), 0) FROM blobs'
+            ).fetchone()
+        return {'pages': pages, 'blobs': blobs, 'raw_bytes': raw, 'stored_bytes': stored}
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class CachedSession(requests.Session):
+    """
+    requests.Session whose GETs go through a PageCache.
+    """
+
+    def __init__(self, cache: Optional[PageCache] = None, offline: Optional[bool] = None,
+                 max_age: Optional[float] = -1):
+        """
+        Args:
+            cache: Page store (default: one at DEFAULT_CACHE_PATH)
+            offline: Serve only from the cache (default: PAGE_CACHE_OFFLINE)
+            max_age: Seconds a cached page is used without revalidation;
+                None never revalidates, 0 always does (default: PAGE_CACHE_MAX_AGE)
+        """
+        super().__init__()
+        self._owns_cache = cache is None
+        self.cache = cache or PageCache()
+        self.offline = _env_flag('PAGE_CACHE_OFFLINE') if offline is None else offline
+        self.max_age = _env_max_age() if max_age == -1 else max_age
+        self.hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return self.max_age is None or time.time() - fetched_at < self.max_age
+
+    def is_cached(self, url: str) -> bool:
+        """
+        Whether a GET for url will be answered without a network round trip.
+
+        Callers use this to skip their politeness delays on cache hits. Only
+        the page's fetch time is read; the body is loaded by the GET itself.
+        """
+        fetched_at = self.cache.fetched_at(url)
+        return fetched_at is not None and (self.offline or self._is_fresh(fetched_at))
+
+    def _cached_response(self, page: CachedPage, request_url: str, method: str) -> requests.Response:
+        """Build a Response carrying a cached page."""
+        response = requests.Response()
+        response.status_code = page.status_code
+        response.url = request_url
+        response._content = page.content if method == 'GET' else b''
+        response._content_consumed = True  # lets iter_content() replay the body
+        response.encoding = None
+        response.reason = 'OK'
+        response.headers['Content-Type'] = page.content_type
+        response.headers['Content-Length'] = str(len(page.content))
+        if page.etag:
+            response.headers['ETag'] = page.etag
+        if page.last_modified:
+            response.headers['Last-Modified'] = page.last_modified
+        response.from_cache = True
+        return response
+
+    def request(self, method, url, *args, **kwargs):
+        method = method.upper()
+        if method not in ('GET', 'HEAD'):
+            return super().request(method, url, *args, **kwargs)
+
+        page = self.cache.get(url)
+        if page is not None and (self.offline or self._is_fresh(page.fetched_at)):
+            self.hits += 1
+            instr.count('cache_hits')
+            return self._cached_response(page, url, method)
+        if self.offline:
+            raise PageCacheMiss(f"{url} is not in the page cache (offline mode)")
+        if method == 'HEAD':
+            return super().request(method, url, *args, **kwargs)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if page is not None:
+            if page.etag:
+                headers['If-None-Match'] = page.etag
+            if page.last_modified:
+                headers['If-Modified-Since'] = page.last_modified
+        response = super().request(method, url, *args, headers=headers, **kwargs)
+
+        if response.status_code == 304 and page is not None:
+            response.close()
+            self.cache.touch(url)
+            self.revalidated += 1
+            instr.count('cache_revalidated')
+            return self._cached_response(page, url, method)
+
+        self.downloads += 1
+        instr.count('cache_misses')
+        if response.status_code == 200:
+            self.cache.put(url, response.content, response.status_code,
+                           response.headers.get('Content-Type', ''),
+                           response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        response.from_cache = False
+        return response
+
+    def close(self):
+        """Close pooled connections, and the cache if this session created it."""
+        super().close()
+        if self._owns_cache:
+            self.cache.close()
@@ -0,0 +1,401 @@
+"""
+Post Outbox
+
+Durable, deduplicating outbox for name optimization tweets. Every tweak
+result is stored in SQLite under a content hash of (original, tweaked,
+chaldean_sum) before it is posted, so enqueueing the same result twice is a
+no-op, a crashed batch resumes where it stopped and nothing is posted twice.
+
+Entries move pending -> sending -> sent, or to failed after max_attempts.
+Moving an entry to 'sending' takes a lease: the row records which outbox
+claimed it and when. Only the lease holder posts the entry, and each post
+renews the lease first. A lease older than lease_timeout is assumed to
+belong to a crashed run; reopening the outbox returns those entries to
+'pending'. Entries another live process is still posting are left alone.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_OUTBOX_PATH = os.environ.get(
+    'POST_OUTBOX_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'post_outbox.sqlite3')
+)
+
+STATUSES = ('pending', 'sending', 'sent', 'failed')
+
+
+def outbox_key(tweak_result: Dict[str, Any]) -> str:
+    """
+    Content hash identifying a tweak result in the outbox.
+
+    Args:
+        tweak_result: Result from name_tweaker.find_target_tweaks
+
+    Returns:
+        str: sha1 hex digest of (original, tweaked, chaldean_sum)
+    """
+    content = [str(tweak_result['original']).strip(), str(tweak_result['tweaked']).strip(),
+               int(tweak_result['chaldean_sum'])]
+    return hashlib.sha1(json.dumps(content, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class PostOutbox:
+    """
+    SQLite table of tweets to post, keyed by content hash.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_attempts: int = 3, lease_timeout: float = 600.0):
+        """
+        Open the outbox and replay entries whose lease has expired.
+
+        Args:
+            path: SQLite file (default: DEFAULT_OUTBOX_PATH; ':memory:' for a throwaway outbox)
+            max_attempts: Delivery attempts before an entry is marked failed
+            lease_timeout: Seconds after which a 'sending' entry is considered abandoned
+        """
+        path = path or DEFAULT_OUTBOX_PATH
+        self.path = path
+        self.max_attempts = max_attempts
+        self.lease_timeout = lease_timeout
+        # Identifies this outbox's leases among other processes sharing the file
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS post_outbox (
+                key TEXT PRIMARY KEY,
+                original TEXT NOT NULL,
+                tweaked TEXT NOT NULL,
+                chaldean_sum INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                tweet_id TEXT,
+                claimed_by TEXT,
+                claimed_at REAL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        # Outboxes created before leases existed lack the lease columns
+        columns = {row[1] for row in self._connection.execute('PRAGMA table_info(post_outbox)')}
+        for column, kind in (('claimed_by', 'TEXT'), ('claimed_at', 'REAL')):
+            if column not in columns:
+                self._connection.execute(f'ALTER TABLE post_outbox ADD COLUMN {column} {kind}')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS post_outbox_status ON post_outbox (status, updated_at)')
+        self._connection.commit()
+        self.replayed = self.recover()
+
+    def recover(self) -> int:
+        """
+        Return 'sending' entries whose lease expired (e.g. after a crash) to 'pending'.
+
+        Entries leased within the last lease_timeout seconds may still be
+        posted by another process, so they are left alone.
+
+        Returns:
+            int: Number of entries replayed
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE post_outbox SET status = 'pending', claimed_by = NULL, claimed_at = NULL, updated_at = ? "
+                "WHERE status = 'sending' AND (claimed_at IS NULL OR claimed_at <= ?)",
+                (now, now - self.lease_timeout)
+            )
+            self._connection.commit()
+            return cursor.rowcount
+
+    def enqueue(self, tweak_result: Dict[str, Any], text: Optional[str] = None) -> bool:
+        """
+        Add a tweak result unless it is already in the outbox.
+
+        Args:
+            tweak_result: Result from name_tweaker.find_target_tweaks
+            text: Tweet text (default: TwitterPoster.format_name_tweet)
+
+        Returns:
+            bool: True when the entry is new, False when it was already queued or sent
+        """
+        return self.enqueue_many([tweak_result], [text] if text is not None else None) == 1
+
+    def enqueue_many(self, tweak_results: Iterable[Dict[str, Any]],
+                     texts: Optional[Iterable[str]] = None) -> int:
+        """
+        Add many tweak results in one transaction, skipping known ones.
+
+        Args:
+            tweak_results: Results from name_tweaker.find_target_tweaks
+            texts: Tweet texts matching tweak_results (default: formatted per result)
+
+        Returns:
+            int: Number of new entries
+        """
+        tweak_results = list(tweak_results)
+        if texts is None:
+            from twitter_poster import TwitterPoster
+            texts = [TwitterPoster.format_name_tweet(result) for result in tweak_results]
+
+        now = time.time()
+        rows = [
+            (outbox_key(result), result['original'], result['tweaked'], int(result['chaldean_sum']), text, now, now)
+            for result, text in zip(tweak_results, texts)
+        ]
+        with self._lock:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO post_outbox (key, original, tweaked, chaldean_sum, text, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+            )
+            self._connection.commit()
+            return self._connection.total_changes - before
+
+    def claim(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Lease up to limit pending entries to this outbox ('sending').
+
+        Entries are taken least recently updated first, so an entry that just
+        failed goes to the back of the queue instead of being retried at once.
+
+        Args:
+            limit: Maximum number of entries to claim
+
+        Returns:
+            list: Claimed entries as dicts (key, text, attempts, ...)
+        """
+        with self._lock:
+            # BEGIN IMMEDIATE keeps another process from leasing the same rows in between
+            self._connection.execute('BEGIN IMMEDIATE')
+            rows = self._connection.execute(
+                "SELECT key, original, tweaked, chaldean_sum, text, attempts FROM post_outbox "
+                "WHERE status = 'pending' ORDER BY updated_at, key LIMIT ?", (limit,)
+            ).fetchall()
+            now = time.time()
+            self._connection.executemany(
+                "UPDATE post_outbox SET status = 'sending', claimed_by = ?, claimed_at = ?, updated_at = ? "
+                "WHERE key = ? AND status = 'pending'",
+                [(self.owner, now, now, row[0]) for row in rows]
+            )
+            self._connection.commit()
+        fields = ('key', 'original', 'tweaked', 'chaldean_sum', 'text', 'attempts')
+        return [dict(zip(fields, row)) for row in rows]
+
+    def renew_lease(self, key: str) -> bool:
+        """
+        Refresh this outbox's lease on a 'sending' entry just before posting it.
+
+        Returns:
+            bool: False when the lease expired and was reclaimed by another outbox
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE post_outbox SET claimed_at = ? WHERE key = ? AND status = 'sending' AND claimed_by = ?",
+                (time.time(), key, self.owner)
+            )
+            self._connection.commit()
+            return cursor.rowcount == 1
+
+    def mark_sent(self, key: str, tweet_id: Optional[str] = None) -> None:
+        """Record a successful post."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE post_outbox SET status = 'sent', tweet_id = ?, attempts = attempts + 1, "
+                "last_error = NULL, claimed_by = NULL, claimed_at = NULL, updated_at = ? WHERE key = ?",
+                (tweet_id, time.time(), key)
+            )
+            self._connection.commit()
+
+    def mark_failed(self, key: str, error: str, retryable: bool = True) -> str:
+        """
+        Record a failed attempt.
+
+        The entry goes back to 'pending' while attempts remain and the error is
+        retryable, otherwise it is marked 'failed'.
+
+        Args:
+            key: Entry key
+            error: Error message
+            retryable: False for permanent errors (e.g. HTTP 4xx other than 429)
+
+        Returns:
+            str: The entry's new status
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT attempts FROM post_outbox WHERE key = ?', (key,)).fetchone()
+            attempts = (row[0] if row else 0) + 1
+            status = 'pending' if retryable and attempts < self.max_attempts else 'failed'
+            self._connection.execute(
+                'UPDATE post_outbox SET status = ?, attempts = ?, last_error = ?, claimed_by = NULL, '
+                'claimed_at = NULL, updated_at = ? WHERE key = ?',
+                (status, attempts, error, time.time(), key)
+            )
+            self._connection.commit()
+        return status
+
+    def retry_failed(self) -> int:
+        """
+        Give failed entries a fresh set of attempts.
+
+        Returns:
+            int: Number of entries moved back to 'pending'
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE post_outbox SET status = 'pending', attempts = 0, updated_at = ? WHERE status = 'failed'",
+                (time.time(),)
+            )
+            self._connection.commit()
+            return cursor.rowcount
+
+    def status(self, tweak_result: Dict[str, Any]) -> Optional[str]:
+        """
+        Look up the status of a tweak result.
+
+        Returns:
+            str: One of STATUSES, or None when it was never enqueued
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT status FROM post_outbox WHERE key = ?', (outbox_key(tweak_result),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count entries per status.
+
+        Returns:
+            dict: Status -> number of entries (every status present)
+        """
+        with self._lock:
+            rows = self._connection.execute('SELECT status, COUNT(*) FROM post_outbox GROUP BY status').fetchall()
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update(rows)
+        return counts
+
+    def deliver(self, poster, entry: Dict[str, Any]) -> str:
+        """
+        Post one claimed entry and record the outcome.
+
+        The entry is skipped when this outbox no longer holds its lease.
+
+        Args:
+            poster: TwitterPoster used for delivery
+            entry: Entry returned by claim()
+
+        Returns:
+            str: The entry's new status ('sending' when the lease was lost)
+        """
+        if not self.renew_lease(entry['key']):
+            return 'sending'
+        try:
+            result = poster.create_tweet(entry['text'])
+        except Exception as e:
+            result = {"error": True, "message": str(e), "status_code": None}
+
+        if 'error' not in result:
+            self.mark_sent(entry['key'], str((result.get('data') or {}).get('id', '')) or None)
+            return 'sent'
+
+        status_code = result.get('status_code')
+        retryable = status_code is None or status_code == 429 or status_code >= 500
+        return self.mark_failed(entry['key'], result.get('message', 'unknown error'), retryable)
+
+    def drain(self, poster, batch_size: int = 50, stop_event: Optional[threading.Event] = None,
+              poll_interval: float = 0.5) -> Dict[str, int]:
+        """
+        Post pending entries in batches until the outbox is empty.
+
+        With a stop_event the drain keeps polling for new entries until the
+        event is set, then empties the outbox and returns; this is how a
+        background thread drains while a batch is still enqueueing.
+
+        Args:
+            poster: TwitterPoster used for delivery
+            batch_size: Entries claimed per round
+            stop_event: Keep polling until this event is set (optional)
+            poll_interval: Seconds between polls while waiting for entries
+
+        Returns:
+            dict: Number of entries sent, retried and failed during this drain
+        """
+        summary = {'sent': 0, 'retried': 0, 'failed': 0}
+        while True:
+            entries = self.claim(batch_size)
+            for entry in entries:
+                status = self.deliver(poster, entry)
+                if status != 'sending':  # 'sending': another outbox took over the lease
+                    summary['retried' if status == 'pending' else status] += 1
+
+            if entries:
+                continue
+            if stop_event is None or stop_event.is_set():
+                if stop_event is not None and self.counts()['pending']:
+                    continue
+                return summary
+            stop_event.wait(poll_interval)
+
+    def post(self, poster, tweak_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Post a single tweak result through the outbox (at most once).
+
+        Args:
+            poster: TwitterPoster used for delivery
+            tweak_result: Result from name_tweaker.find_target_tweaks
+
+        Returns:
+            dict: Twitter API style response; already-sent results return
+                {"error": True, "duplicate": True, ...} without posting
+        """
+        self.enqueue(tweak_result, poster.format_name_tweet(tweak_result))
+        key = outbox_key(tweak_result)
+
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            row = self._connection.execute(
+                'SELECT status, tweet_id, text, attempts FROM post_outbox WHERE key = ?', (key,)
+            ).fetchone()
+            status, tweet_id, text, attempts = row
+            if status == 'pending' or status == 'failed':
+                now = time.time()
+                self._connection.execute(
+                    "UPDATE post_outbox SET status = 'sending', claimed_by = ?, claimed_at = ?, updated_at = ? "
+                    "WHERE key = ?", (self.owner, now, now, key)
+                )
+            self._connection.commit()
+
+        if status == 'sent':
+            return {"error": True, "duplicate": True, "tweet_id": tweet_id,
+                    "message": "This optimization was already posted"}
+        if status == 'sending':
+            return {"error": True, "duplicate": True, "tweet_id": None,
+                    "message": "This optimization is already being posted"}
+
+        entry = {'key': key, 'text': text, 'attempts': attempts}
+        if self.deliver(poster, entry) == 'sent':
+            return {"data": {"id": self._tweet_id(key), "text": text}}
+        with self._lock:
+            last_error = self._connection.execute(
+                'SELECT last_error FROM post_outbox WHERE key = ?', (key,)).fetchone()[0]
+        return {"error": True, "message": last_error}
+
+    def _tweet_id(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute('SELECT tweet_id FROM post_outbox WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._connection.close()
@@ -4,19 +4,24 @@ Rerun Failed Thiruppugazh Songs and Merge into Complete CSV
 
 This script specifically targets the failed songs due to connection issues
 and merges the results into the existing COMPLETE_THIRUPPUGAZH_ALL_SONGS_WITH_NUMBERS.csv
+
+The songs to rerun come from the song ledger (song_ledger.py) when it records
+any failures, and every outcome is written back to it.
 """
 
 import csv
 import time
 import random
-from typing import List, Set
+from typing import List, Optional, Set
 from thiruppugazh_extractor_with_csv import ThiruppugazhExtractorWithCSV, ThiruppugazhNameCSV
+from song_ledger import EMPTY, FAILED_STATES, HTTP_ERROR, OK, SongLedger
 
 class FailedSongsRerunner:
     """Rerun failed songs with enhanced retry logic."""
     
-    def __init__(self):
+    def __init__(self, ledger: Optional[SongLedger] = None):
         self.extractor = ThiruppugazhExtractorWithCSV()
+        self.ledger = ledger or SongLedger()
         # Enhanced session settings for better reliability
         self.extractor.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -28,8 +33,15 @@ class FailedSongsRerunner:
             'Pragma': 'no-cache'
         })
         
-        # Failed song numbers from your list
+        # Failed song numbers from your list (see load_failed_from_ledger)
         self.failed_songs = [183, 106, 206, 906, 788, 779, 1106]
+    
+    def load_failed_from_ledger(self) -> bool:
+        """Rerun the songs the ledger records as failed instead, if there are any."""
+        failed = self.ledger.songs(FAILED_STATES)
+        if failed:
+            self.failed_songs = failed
+        return bool(failed)
         
     def extract_with_enhanced_retry(self, song_number: int, max_retries: int = 5) -> List[ThiruppugazhNameCSV]:
         """Extract with enhanced retry logic for connection issues."""
@@ -38,8 +50,10 @@ class FailedSongsRerunner:
                 print(f"   📿 Song {song_number:4d} (Attempt {attempt + 1}/{max_retries}): ", end='')
                 
                 # Longer delay for failed songs to avoid overwhelming server
-                delay = random.uniform(2.0, 4.0) + (attempt * 1.0)  # Increasing delay
-                time.sleep(delay)
+                url = f"{self.extractor.base_url}nnt{song_number:04d}_u.html"
+                if not self.extractor.session.is_cached(url):
+                    delay = random.uniform(2.0, 4.0) + (attempt * 1.0)  # Increasing delay
+                    time.sleep(delay)
                 
                 names = self.extractor.extract_from_song(song_number)
                 
@@ -84,9 +98,12 @@ class FailedSongsRerunner:
                 # Either found names or successfully connected (even if no names)
                 all_recovered_names.extend(names)
                 successfully_processed.append(song_num)
+                self.ledger.record(song_num, OK if names else EMPTY, names=len(names))
                 print(f"   ✅ Song {song_num} successfully reprocessed")
             else:
                 still_failing.append(song_num)
+                self.ledger.record(song_num, HTTP_ERROR,
+                                   self.extractor.failed_songs.get(song_num, "connection error"))
                 print(f"   ❌ Song {song_num} still failing after all retries")
         
         print(f"\n📊 RERUN RESULTS:")
@@ -239,11 +256,12 @@ class FailedSongsRerunner:
 def main():
     """Main rerun function."""
     rerunner = FailedSongsRerunner()
+    from_ledger = rerunner.load_failed_from_ledger()
     
     print("🔄 THIRUPPUGAZH FAILED SONGS RERUN SYSTEM")
     print("=" * 60)
     print("This will reprocess the failed songs with enhanced retry logic")
-    print(f"Failed songs: {rerunner.failed_songs}")
+    print(f"Failed songs{' (from the song ledger)' if from_ledger else ''}: {rerunner.failed_songs}")
     
     proceed = input("\nProceed with rerun? (y/n): ").strip().lower()
     if proceed != 'y':
@@ -4,14 +4,27 @@ Complete Thiruppugazh Extraction Runner
 
 This runs the complete extraction from ALL 1,340 songs and creates the CSV
 with song numbers (X) from https://kaumaram.com/thiru/nnt000X_u.html#english
+
+Every finished song is appended to JOURNAL_PATH, so an interrupted run picks
+up where it stopped; the final CSV is exported from the compacted journal.
+Pass --fresh to archive the journal of a previous run and start over.
 """
 
 from thiruppugazh_extractor_with_csv import ThiruppugazhExtractorWithCSV
+from song_journal import SongJournal
+import argparse
 import os
 import time
 
-def run_complete_extraction():
-    """Run complete extraction from all 1,340 songs."""
+JOURNAL_PATH = "thiruppugazh_csv_extraction_journal.jsonl"
+
+def run_complete_extraction(fresh: bool = False):
+    """
+    Run complete extraction from all 1,340 songs.
+    
+    Args:
+        fresh: Archive the previous journal instead of resuming from it
+    """
     extractor = ThiruppugazhExtractorWithCSV()
     
     print("🕉️ COMPLETE THIRUPPUGAZH EXTRACTION - ALL 1,340 SONGS")
@@ -33,30 +46,35 @@ def run_complete_extraction():
     all_names = []
     batch_size = 100
     
-    for batch_start in range(6, 1341, batch_size):
-        batch_end = min(batch_start + batch_size - 1, 1340)
-        
-        print(f"\n🎵 PROCESSING BATCH: Songs {batch_start} to {batch_end}")
-        print("-" * 50)
+    with SongJournal(JOURNAL_PATH, sync_every=batch_size, resume=not fresh) as journal:
+        if journal.archived:
+            print(f"🗃️  Starting fresh; previous journal archived to {journal.archived}")
+        if journal.done:
+            print(f"🔄 Resuming: {len(journal.done)} songs already in {JOURNAL_PATH} (--fresh starts over)")
         
-        batch_names = extractor.extract_batch(batch_start, batch_end)
-        all_names.extend(batch_names)
+        for batch_start in range(6, 1341, batch_size):
+            batch_end = min(batch_start + batch_size - 1, 1340)
+            
+            print(f"\n🎵 PROCESSING BATCH: Songs {batch_start} to {batch_end}")
+            print("-" * 50)
+            
+            batch_names = extractor.extract_batch(batch_start, batch_end, journal=journal)
+            all_names.extend(batch_names)
+            
+            # Every song is already journaled; make the batch durable
+            journal.sync()
+            print(f"   💾 Progress journaled: {JOURNAL_PATH}")
+            
+            # Progress report
+            elapsed = time.time() - start_time
+            print(f"   📊 Progress: {batch_end-5}/{1340-5} songs ({((batch_end-5)/(1340-5)*100):.1f}%)")
+            print(f"   ⏱️  Elapsed: {elapsed/60:.1f} minutes")
+            print(f"   📿 Names so far: {len(all_names)}")
+            
+            # Small break between batches
+            time.sleep(2)
         
-        # Save intermediate progress
-        if len(all_names) > 0:
-            intermediate_csv = f"thiruppugazh_progress_up_to_{batch_end}.csv"
-            extractor.extracted_names = all_names
-            extractor.export_to_csv(intermediate_csv)
-            print(f"   💾 Intermediate progress saved: {intermediate_csv}")
-        
-        # Progress report
-        elapsed = time.time() - start_time
-        print(f"   📊 Progress: {batch_end-5}/{1340-5} songs ({((batch_end-5)/(1340-5)*100):.1f}%)")
-        print(f"   ⏱️  Elapsed: {elapsed/60:.1f} minutes")
-        print(f"   📿 Names so far: {len(all_names)}")
-        
-        # Small break between batches
-        time.sleep(2)
+        journal.compact()
     
     # Final processing
     extractor.extracted_names = all_names
@@ -86,7 +104,7 @@ def run_complete_extraction():
     print(f"   CSV includes exact song number (X) for each name as requested")
     print(f"   Perfect for your son's naming with complete source traceability")
 
-def run_extended_test():
+def run_extended_test(fresh: bool = False):
     """Run extended test on more songs."""
     extractor = ThiruppugazhExtractorWithCSV()
     
@@ -116,12 +134,17 @@ def run_extended_test():
         
         proceed = input(f"\nProceed with full extraction? (y/n): ").strip().lower()
         if proceed == 'y':
-            run_complete_extraction()
+            run_complete_extraction(fresh)
     else:
         print("❌ Extended test failed. Check connectivity.")
 
 def main():
     """Main function with options."""
+    parser = argparse.ArgumentParser(description="Extract names with song numbers from all Thiruppugazh songs")
+    parser.add_argument('--fresh', action='store_true',
+                        help=f'Archive {JOURNAL_PATH} from a previous run and fetch every song again')
+    args = parser.parse_args()
+    
     print("🕉️ COMPLETE THIRUPPUGAZH EXTRACTION SYSTEM")
     print("=" * 50)
     
@@ -134,9 +157,9 @@ Select extraction mode:
 Choice (1/2/3): """).strip()
     
     if choice == '1':
-        run_complete_extraction()
+        run_complete_extraction(args.fresh)
     elif choice == '2':
-        run_extended_test()
+        run_extended_test(args.fresh)
     elif choice == '3':
         extractor = ThiruppugazhExtractorWithCSV()
         names = extractor.extract_batch(6, 50)
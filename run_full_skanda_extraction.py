@@ -9,6 +9,7 @@ import re
 import csv
 import json
 import logging
+import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional, Set
@@ -18,10 +19,31 @@ import fitz  # PyMuPDF
 from indic_transliteration import sanscript
 from tqdm import tqdm
 
+from instrumentation import INSTRUMENTATION as instr, MemoryTracker, add_profile_argument, profiling
+from name_spool import SKANDA_FIELDNAMES, NameSpool
+from run_metrics import add_metrics_arguments, metrics_reporting
+
 class FullSkandaPuranaExtractor:
-    def __init__(self, pdf_folder: str = "Skandha_Purana"):
+    def __init__(self, pdf_folder: str = "Skandha_Purana", memory_limit_mb: Optional[float] = None,
+                 spool_path: str = "skanda_names_spool.csv", trace_memory: bool = False):
+        """
+        Args:
+            pdf_folder: Folder containing the PDF volumes
+            memory_limit_mb: Buffer ceiling for extracted names; when set, names are
+                spooled to spool_path instead of being kept in memory
+            spool_path: Spool CSV used in memory-bounded mode
+            trace_memory: Record tracemalloc checkpoints after every PDF
+        """
         self.pdf_folder = Path(pdf_folder)
-        self.extracted_names = []
+        if memory_limit_mb is not None:
+            if memory_limit_mb <= 0:
+                raise ValueError(f"memory_limit_mb must be positive, got {memory_limit_mb}")
+            self.extracted_names = NameSpool(spool_path, SKANDA_FIELDNAMES, int(memory_limit_mb * 1024 * 1024))
+        else:
+            self.extracted_names = []
+        self.memory_tracker = MemoryTracker() if trace_memory else None
+        if self.memory_tracker:
+            self.memory_tracker.start()
         self.processed_pages = 0
         self.total_pages = 0
         self.start_time = time.time()
@@ -133,11 +155,15 @@ class FullSkandaPuranaExtractor:
         pages_text = []
         
         try:
-            doc = fitz.open(str(pdf_path))
+            with instr.span('fetch'):
+                doc = fitz.open(str(pdf_path))
             
             for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text = page.get_text()
+                with instr.span('fetch'):
+                    page = doc.load_page(page_num)
+                with instr.span('parse'):
+                    text = page.get_text()
+                instr.count('pages')
                 
                 if text.strip():
                     pages_text.append({
@@ -156,6 +182,7 @@ class FullSkandaPuranaExtractor:
             doc.close()
             
         except Exception as e:
+            instr.count('errors')
             self.logger.error(f"Error processing {pdf_path}: {e}")
         
         return pages_text
@@ -327,13 +354,13 @@ class FullSkandaPuranaExtractor:
             'type': 'unverified'
         }
     
-    def process_single_pdf(self, pdf_path: Path) -> List[Dict]:
-        """Process a single PDF and extract names."""
+    def process_single_pdf(self, pdf_path: Path) -> int:
+        """Process a single PDF and extract names (returns the number found)."""
         part_number = self.extract_part_number(pdf_path.name)
         self.logger.info(f"Processing {pdf_path.name} (Part {part_number})...")
         
         pages_data = self.extract_text_from_pdf(pdf_path)
-        extracted_names = []
+        names_found = 0
         
         for page_data in pages_data:
             page_num = page_data['page_num']
@@ -342,17 +369,20 @@ class FullSkandaPuranaExtractor:
             if not text.strip():
                 continue
             
-            script_type = self.detect_script_type(text)
-            matches = self.find_pattern_matches(text, script_type)
+            with instr.span('parse'):
+                script_type = self.detect_script_type(text)
+            with instr.span('pattern_match'):
+                matches = self.find_pattern_matches(text, script_type)
             
             for match in matches:
                 word = match['word']
                 
-                # Get dictionary meaning
-                mw_entry = self.get_mw_meaning(word)
-                
-                # Classify name type
-                name_type = self.classify_name_type(word, match['context'])
+                with instr.span('validate'):
+                    # Get dictionary meaning
+                    mw_entry = self.get_mw_meaning(word)
+                    
+                    # Classify name type
+                    name_type = self.classify_name_type(word, match['context'])
                 
                 extracted_entry = {
                     'Name/Word': word,
@@ -368,11 +398,13 @@ class FullSkandaPuranaExtractor:
                     'Notes': f"Pattern: {match['pattern']}, Important: {match['is_important']}, Confidence: {match['confidence']:.1f}"
                 }
                 
-                extracted_names.append(extracted_entry)
                 self.extracted_names.append(extracted_entry)
+                names_found += 1
         
-        self.logger.info(f"Completed {pdf_path.name}: {len(extracted_names)} names found")
-        return extracted_names
+        instr.count('pdfs')
+        instr.count('names', names_found)
+        self.logger.info(f"Completed {pdf_path.name}: {names_found} names found")
+        return names_found
     
     def extract_part_number(self, filename: str) -> int:
         """Extract part number from filename."""
@@ -392,22 +424,29 @@ class FullSkandaPuranaExtractor:
         
         # Estimate total pages
         self.total_pages = len(pdf_files) * 400  # Rough estimate
+        instr.set_target('pdfs', len(pdf_files))
         
         with tqdm(total=len(pdf_files), desc="Processing PDFs") as pbar:
-            for pdf_file in pdf_files:
+            for position, pdf_file in enumerate(pdf_files):
+                instr.set_gauge('queue_depth', len(pdf_files) - position)
                 try:
                     self.process_single_pdf(pdf_file)
                     pbar.update(1)
                     
                     # Save intermediate results every 5 PDFs
-                    if len([f for f in pdf_files if pdf_files.index(f) <= pdf_files.index(pdf_file)]) % 5 == 0:
+                    if (position + 1) % 5 == 0:
                         self.save_intermediate_results()
                         
                 except Exception as e:
+                    instr.count('errors')
                     self.logger.error(f"Failed to process {pdf_file}: {e}")
                     pbar.update(1)
                     continue
+                finally:
+                    if self.memory_tracker:
+                        self.memory_tracker.checkpoint(pdf_file.name)
         
+        instr.set_gauge('queue_depth', 0)
         self.logger.info(f"Full extraction complete! Total names found: {len(self.extracted_names)}")
     
     def save_intermediate_results(self) -> None:
@@ -415,15 +454,18 @@ class FullSkandaPuranaExtractor:
         if not self.extracted_names:
             return
         
+        if isinstance(self.extracted_names, NameSpool):
+            # The spool already is the on-disk copy; only the buffer needs writing
+            with instr.span('export'):
+                flushed = self.extracted_names.flush()
+            self.logger.info(f"Flushed {flushed} names to {self.extracted_names.path}")
+            return
+        
         intermediate_file = f"skanda_intermediate_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
-        fieldnames = [
-            'Name/Word', 'Script Type', 'Found Form', 'Language',
-            'Monier Williams Meaning', 'Etymology', 'Page#', 'Part#',
-            'Context/Line#', 'Proper Noun/Epithet/Place', 'Notes'
-        ]
+        fieldnames = SKANDA_FIELDNAMES
         
-        with open(intermediate_file, 'w', newline='', encoding='utf-8') as csvfile:
+        with instr.span('export'), open(intermediate_file, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(self.extracted_names)
@@ -436,18 +478,21 @@ class FullSkandaPuranaExtractor:
             self.logger.warning("No names extracted to export")
             return
         
-        fieldnames = [
-            'Name/Word', 'Script Type', 'Found Form', 'Language',
-            'Monier Williams Meaning', 'Etymology', 'Page#', 'Part#',
-            'Context/Line#', 'Proper Noun/Epithet/Place', 'Notes'
-        ]
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.extracted_names)
+        if isinstance(self.extracted_names, NameSpool):
+            with instr.span('export'):
+                self.extracted_names.export_csv(output_file)
+        else:
+            with instr.span('export'), open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=SKANDA_FIELDNAMES)
+                writer.writeheader()
+                writer.writerows(self.extracted_names)
         
         self.logger.info(f"Exported {len(self.extracted_names)} names to {output_file}")
+
+    def close(self) -> None:
+        """Close the name spool, if any; it stays on disk for the report."""
+        if isinstance(self.extracted_names, NameSpool):
+            self.extracted_names.close()
     
     def generate_final_report(self) -> str:
         """Generate comprehensive final report."""
@@ -455,26 +500,31 @@ class FullSkandaPuranaExtractor:
             return "No names extracted."
         
         total_names = len(self.extracted_names)
-        high_confidence = len([e for e in self.extracted_names if 'Confidence: 0.8' in e['Notes'] or 'Confidence: 0.9' in e['Notes'] or 'Confidence: 1.0' in e['Notes']])
-        important_names = len([e for e in self.extracted_names if 'Important: True' in e['Notes']])
-        
-        # Count by script type
+        high_confidence = 0
+        important_names = 0
         script_counts = {}
+        type_counts = {}
+        part_counts = {}
+        name_frequencies = {}
+        
+        # One pass, so a spooled run reads the spool from disk only once
         for entry in self.extracted_names:
+            notes = entry['Notes']
+            if 'Confidence: 0.8' in notes or 'Confidence: 0.9' in notes or 'Confidence: 1.0' in notes:
+                high_confidence += 1
+            if 'Important: True' in notes:
+                important_names += 1
+            
+            # Count by script type, name type and part
             script = entry['Script Type']
             script_counts[script] = script_counts.get(script, 0) + 1
-        
-        # Count by name type
-        type_counts = {}
-        for entry in self.extracted_names:
             name_type = entry['Proper Noun/Epithet/Place']
             type_counts[name_type] = type_counts.get(name_type, 0) + 1
-        
-        # Count by parts
-        part_counts = {}
-        for entry in self.extracted_names:
             part = entry['Part#']
             part_counts[part] = part_counts.get(part, 0) + 1
+            
+            name = entry['Name/Word'].lower()
+            name_frequencies[name] = name_frequencies.get(name, 0) + 1
         
         elapsed_time = time.time() - self.start_time
         
@@ -515,11 +565,6 @@ PROCESSING BY PARTS:
             report += f"{part}: {count} names\n"
         
         # Top names by frequency
-        name_frequencies = {}
-        for entry in self.extracted_names:
-            name = entry['Name/Word'].lower()
-            name_frequencies[name] = name_frequencies.get(name, 0) + 1
-        
         top_names = sorted(name_frequencies.items(), key=lambda x: x[1], reverse=True)[:15]
         
         report += f"""
@@ -543,6 +588,28 @@ COMPLETION TIME: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 def main():
     """Main execution function for full extraction."""
+    parser = argparse.ArgumentParser(description="Extract Cha/Sa/Sha names from all Skanda Purana PDFs")
+    parser.add_argument('--pdf-folder', default="Skandha_Purana", help='Folder containing the PDF volumes')
+    parser.add_argument('--memory-limit-mb', type=float, metavar='MB',
+                        help='Keep at most MB of extracted names in memory, spooling the rest to disk')
+    parser.add_argument('--spool', default="skanda_names_spool.csv", help='Spool file for --memory-limit-mb')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Add per-PDF tracemalloc checkpoints to the final report')
+    add_profile_argument(parser, 'full_skanda_extraction')
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    if args.memory_limit_mb is not None and args.memory_limit_mb <= 0:
+        parser.error("--memory-limit-mb must be positive")
+    
+    with profiling(args.profile), metrics_reporting(args.metrics, args.metrics_format, args.metrics_interval):
+        run_extraction(args.pdf_folder, args.memory_limit_mb, args.spool, args.trace_memory)
+    
+    print()
+    print(instr.format_report("SKANDA EXTRACTION STAGE BREAKDOWN"))
+
+def run_extraction(pdf_folder: str = "Skandha_Purana", memory_limit_mb: Optional[float] = None,
+                   spool_path: str = "skanda_names_spool.csv", trace_memory: bool = False):
+    """Run the full extraction, export and report."""
     print("🕉️  COMPLETE SKANDA PURANA NAME EXTRACTION 🕉️")
     print("="*70)
     print("Processing all 20 PDF volumes systematically...")
@@ -550,21 +617,28 @@ def main():
     print("="*70)
     
     # Initialize extractor
-    extractor = FullSkandaPuranaExtractor()
-    
-    # Process all PDFs
-    print(f"\n📚 Starting full extraction from: {extractor.pdf_folder}")
-    extractor.process_all_pdfs()
+    extractor = FullSkandaPuranaExtractor(pdf_folder, memory_limit_mb, spool_path, trace_memory)
     
-    # Export final results
-    print("\n💾 Exporting final results...")
-    extractor.export_final_results()
+    try:
+        # Process all PDFs
+        print(f"\n📚 Starting full extraction from: {extractor.pdf_folder}")
+        extractor.process_all_pdfs()
+        
+        # Export final results
+        print("\n💾 Exporting final results...")
+        extractor.export_final_results()
+    finally:
+        extractor.close()
     
     # Generate and save final report
     report = extractor.generate_final_report()
+    if extractor.memory_tracker:
+        extractor.memory_tracker.checkpoint('export + report')
+        report += "\n" + extractor.memory_tracker.format_report() + "\n"
+        extractor.memory_tracker.stop()
     print(report)
     
-    with open("COMPLETE_SKANDA_EXTRACTION_REPORT.txt", "w", encoding='utf-8') as f:
+    with instr.span('export'), open("COMPLETE_SKANDA_EXTRACTION_REPORT.txt", "w", encoding='utf-8') as f:
         f.write(report)
     
     print("\n✅ COMPLETE EXTRACTION FINISHED!")
@@ -0,0 +1,227 @@
+"""
+Run Metrics
+
+Periodically writes the counters and gauges of a running extraction to a
+file that can be scraped, charted or alerted on from outside the process:
+
+- JSON lines (default): one sample appended per interval
+- Prometheus text format (*.prom): the file is atomically replaced on each
+  interval, ready for the node_exporter textfile collector
+
+Each sample carries counter totals and per-second rates (pages, songs,
+names, errors, retries), gauges such as queue depth, resident memory and an
+ETA for every counter with a declared target.
+
+Usage:
+    python complete_thiruppugazh_systematic_extractor.py --metrics run.jsonl
+    python run_full_skanda_extraction.py --metrics skanda.prom --metrics-interval 30
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from instrumentation import INSTRUMENTATION, Instrumentation
+
+FORMATS = ('jsonl', 'prometheus')
+
+
+def process_rss_bytes() -> Optional[int]:
+    """
+    Resident set size of this process.
+
+    Returns:
+        int: Bytes in RAM (peak RSS where the current value is unavailable), or None
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class MetricsWriter:
+    """
+    Background thread writing metric samples of an Instrumentation registry.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, interval: float = 10.0,
+                 instrumentation: Instrumentation = INSTRUMENTATION, prefix: str = 'boyname',
+                 clock=time.time):
+        """
+        Args:
+            path: Output file
+            fmt: 'jsonl' or 'prometheus' (default: prometheus for *.prom, else jsonl)
+            interval: Seconds between samples
+            instrumentation: Registry to read (default: the shared instance)
+            prefix: Prometheus metric name prefix
+            clock: Wall clock for sample timestamps
+        """
+        if fmt is None:
+            fmt = 'prometheus' if path.endswith('.prom') else 'jsonl'
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown metrics format: {fmt} (expected one of {', '.join(FORMATS)})")
+        self.path = path
+        self.fmt = fmt
+        self.interval = interval
+        self.instrumentation = instrumentation
+        self.prefix = prefix
+        self.clock = clock
+        self._previous = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        Take one sample.
+
+        Rates are measured since the previous sample (since the start of the
+        run for the first one); ETAs use the average rate of the whole run.
+
+        Returns:
+            dict: timestamp, elapsed_s, counters, rates, gauges, rss_bytes and eta_s
+        """
+        data = self.instrumentation.snapshot()
+        elapsed = data['elapsed_s']
+        counters = data['counters']
+        previous_elapsed, previous_counters = self._previous or (0.0, {})
+        window = elapsed - previous_elapsed
+        self._previous = (elapsed, counters)
+
+        rates = {
+            name: (value - previous_counters.get(name, 0)) / window if window > 0 else 0.0
+            for name, value in counters.items()
+        }
+        eta = {}
+        for name, total in data['targets'].items():
+            done = counters.get(name, 0)
+            remaining = max(0, total - done)
+            if remaining == 0:
+                eta[name] = 0.0
+            elif done and elapsed > 0:
+                eta[name] = remaining / (done / elapsed)
+            else:
+                eta[name] = None
+
+        return {
+            'timestamp': self.clock(),
+            'elapsed_s': elapsed,
+            'counters': counters,
+            'rates': rates,
+            'gauges': data['gauges'],
+            'targets': data['targets'],
+            'rss_bytes': process_rss_bytes(),
+            'eta_s': eta
+        }
+
+    def write(self) -> Dict[str, Any]:
+        """Take a sample and write it to the metrics file."""
+        sample = self.sample()
+        if self.fmt == 'jsonl':
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(sample) + '\n')
+        else:
+            temporary = f"{self.path}.tmp"
+            with open(temporary, 'w', encoding='utf-8') as f:
+                f.write(self.format_prometheus(sample))
+            os.replace(temporary, self.path)
+        return sample
+
+    def format_prometheus(self, sample: Dict[str, Any]) -> str:
+        """
+        Render a sample in the Prometheus text exposition format.
+
+        Args:
+            sample: Result of sample()
+
+        Returns:
+            str: Metric families with TYPE lines
+        """
+        prefix = self.prefix
+        lines = [f"# TYPE {prefix}_elapsed_seconds gauge",
+                 f"{prefix}_elapsed_seconds {sample['elapsed_s']:.3f}"]
+        for name, value in sorted(sample['counters'].items()):
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value}",
+                      f"# TYPE {prefix}_{name}_per_second gauge",
+                      f"{prefix}_{name}_per_second {sample['rates'][name]:.4f}"]
+        for name, value in sorted(sample['gauges'].items()):
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value}"]
+        if sample['rss_bytes'] is not None:
+            lines += [f"# TYPE {prefix}_resident_memory_bytes gauge",
+                      f"{prefix}_resident_memory_bytes {sample['rss_bytes']}"]
+        if sample['eta_s']:
+            lines.append(f"# TYPE {prefix}_eta_seconds gauge")
+            for name, eta in sorted(sample['eta_s'].items()):
+                lines.append(f'{prefix}_eta_seconds{{counter="{name}"}} {"NaN" if eta is None else f"{eta:.1f}"}')
+        return '\n'.join(lines) + '\n'
+
+    def start(self) -> None:
+        """Start writing a sample every interval."""
+        self._thread = threading.Thread(target=self._run, name='metrics-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and write a final sample."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.write()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError as e:
+                print(f"⚠️ Could not write metrics to {self.path}: {e}")
+
+
+@contextlib.contextmanager
+def metrics_reporting(path: Optional[str], fmt: Optional[str] = None,
+                      interval: float = 10.0) -> Iterator[Optional[MetricsWriter]]:
+    """
+    Write metric samples of the shared registry while the block runs.
+
+    Args:
+        path: Metrics file, or None to disable
+        fmt: 'jsonl' or 'prometheus' (default: inferred from the file name)
+        interval: Seconds between samples
+
+    Yields:
+        MetricsWriter or None
+    """
+    if not path:
+        yield None
+        return
+
+    writer = MetricsWriter(path, fmt, interval)
+    writer.start()
+    print(f"📈 Writing {writer.fmt} metrics every {interval:g}s to: {path}")
+    try:
+        yield writer
+    finally:
+        writer.stop()
+
+
+def add_metrics_arguments(parser) -> None:
+    """
+    Add the shared --metrics/--metrics-format/--metrics-interval options.
+
+    Args:
+        parser: argparse.ArgumentParser
+    """
+    parser.add_argument('--metrics', metavar='FILE',
+                        help='Periodically write progress metrics to FILE (JSON lines, or Prometheus text for *.prom)')
+    parser.add_argument('--metrics-format', choices=FORMATS, help='Metrics file format (default: from the file name)')
+    parser.add_argument('--metrics-interval', type=float, default=10.0, metavar='SECONDS',
+                        help='Seconds between metric samples (default: 10)')
@@ -14,6 +14,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional, Set
 import unicodedata
+import argparse
+
+from instrumentation import MemoryTracker
+from name_spool import SKANDA_FIELDNAMES, NameSpool
 
 # PDF processing
 try:
@@ -43,9 +47,26 @@ except ImportError:
     print("⚠️  Indic transliteration not available. Install with: pip install indic-transliteration")
 
 class SkandaPuranaExtractor:
-    def __init__(self, pdf_folder: str = "Skandha_Purana"):
+    def __init__(self, pdf_folder: str = "Skandha_Purana", memory_limit_mb: Optional[float] = None,
+                 spool_path: str = "skanda_purana_names_spool.csv", trace_memory: bool = False):
+        """
+        Args:
+            pdf_folder: Folder containing the PDF volumes
+            memory_limit_mb: Buffer ceiling for extracted names; when set, names are
+                spooled to spool_path instead of being kept in memory
+            spool_path: Spool CSV used in memory-bounded mode
+            trace_memory: Record tracemalloc checkpoints after every PDF
+        """
         self.pdf_folder = Path(pdf_folder)
-        self.extracted_names = []
+        if memory_limit_mb is not None:
+            if memory_limit_mb <= 0:
+                raise ValueError(f"memory_limit_mb must be positive, got {memory_limit_mb}")
+            self.extracted_names = NameSpool(spool_path, SKANDA_FIELDNAMES, int(memory_limit_mb * 1024 * 1024))
+        else:
+            self.extracted_names = []
+        self.memory_tracker = MemoryTracker() if trace_memory else None
+        if self.memory_tracker:
+            self.memory_tracker.start()
         self.monier_williams_cache = {}
         self.processed_pages = 0
         self.total_pages = 0
@@ -387,14 +408,14 @@ class SkandaPuranaExtractor:
         else:
             return 'proper_noun'
     
-    def process_single_pdf(self, pdf_path: Path) -> List[Dict]:
-        """Process a single PDF file and extract names."""
+    def process_single_pdf(self, pdf_path: Path) -> int:
+        """Process a single PDF file and extract names (returns the number found)."""
         self.logger.info(f"Processing {pdf_path.name}...")
         
         part_number = self.extract_part_number(pdf_path.name)
         pages_data = self.extract_text_from_pdf(pdf_path)
         
-        extracted_names = []
+        names_found = 0
         
         for page_data in pages_data:
             page_num = page_data['page_num']
@@ -431,8 +452,8 @@ class SkandaPuranaExtractor:
                     'Notes': f"Pattern: {match['pattern']}, Method: {page_data['method']}"
                 }
                 
-                extracted_names.append(extracted_entry)
                 self.extracted_names.append(extracted_entry)
+                names_found += 1
             
             self.processed_pages += 1
             
@@ -440,8 +461,8 @@ class SkandaPuranaExtractor:
             if self.processed_pages % 50 == 0:
                 self.logger.info(f"Processed {self.processed_pages} pages, found {len(self.extracted_names)} names so far")
         
-        self.logger.info(f"Completed {pdf_path.name}: {len(extracted_names)} names found")
-        return extracted_names
+        self.logger.info(f"Completed {pdf_path.name}: {names_found} names found")
+        return names_found
     
     def extract_part_number(self, filename: str) -> int:
         """Extract part number from filename."""
@@ -467,6 +488,9 @@ class SkandaPuranaExtractor:
             except Exception as e:
                 self.logger.error(f"Failed to process {pdf_file}: {e}")
                 continue
+            finally:
+                if self.memory_tracker:
+                    self.memory_tracker.checkpoint(pdf_file.name)
         
         self.logger.info(f"Extraction complete! Total names found: {len(self.extracted_names)}")
     
@@ -476,18 +500,20 @@ class SkandaPuranaExtractor:
             self.logger.warning("No names extracted to export")
             return
         
-        fieldnames = [
-            'Name/Word', 'Script Type', 'Found Form', 'Language',
-            'Monier Williams Meaning', 'Etymology', 'Page#', 'Part#',
-            'Context/Line#', 'Proper Noun/Epithet/Place', 'Notes'
-        ]
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.extracted_names)
+        if isinstance(self.extracted_names, NameSpool):
+            self.extracted_names.export_csv(output_file)
+        else:
+            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=SKANDA_FIELDNAMES)
+                writer.writeheader()
+                writer.writerows(self.extracted_names)
         
         self.logger.info(f"Exported {len(self.extracted_names)} names to {output_file}")
+
+    def close(self) -> None:
+        """Close the name spool, if any; it stays on disk for the report."""
+        if isinstance(self.extracted_names, NameSpool):
+            self.extracted_names.close()
     
     def generate_summary_report(self) -> str:
         """Generate a summary report of the extraction."""
@@ -499,8 +525,13 @@ class SkandaPuranaExtractor:
         script_types = {}
         name_types = {}
         parts_processed = set()
+        name_frequencies = {}
         
+        # One pass, so a spooled run reads the spool from disk only once
         for entry in self.extracted_names:
+            name = entry['Name/Word'].lower()
+            name_frequencies[name] = name_frequencies.get(name, 0) + 1
+            
             script_type = entry['Script Type']
             script_types[script_type] = script_types.get(script_type, 0) + 1
             
@@ -543,12 +574,7 @@ Pages Processed: {self.processed_pages}
 {'-'*30}
 """
         
-        # Count name frequencies
-        name_frequencies = {}
-        for entry in self.extracted_names:
-            name = entry['Name/Word'].lower()
-            name_frequencies[name] = name_frequencies.get(name, 0) + 1
-        
+        # Top names by frequency
         top_names = sorted(name_frequencies.items(), key=lambda x: x[1], reverse=True)[:10]
         
         for name, count in top_names:
@@ -562,6 +588,17 @@ Pages Processed: {self.processed_pages}
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Extract names from the Skanda Purana PDFs")
+    parser.add_argument('--pdf-folder', default="Skandha_Purana", help='Folder containing the PDF volumes')
+    parser.add_argument('--memory-limit-mb', type=float, metavar='MB',
+                        help='Keep at most MB of extracted names in memory, spooling the rest to disk')
+    parser.add_argument('--spool', default="skanda_purana_names_spool.csv", help='Spool file for --memory-limit-mb')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Add per-PDF tracemalloc checkpoints to the summary report')
+    args = parser.parse_args()
+    if args.memory_limit_mb is not None and args.memory_limit_mb <= 0:
+        parser.error("--memory-limit-mb must be positive")
+    
     print("🕉️  SKANDA PURANA COMPREHENSIVE NAME EXTRACTOR 🕉️")
     print("="*60)
     
@@ -583,18 +620,25 @@ def main():
         print("\nContinuing with available capabilities...")
     
     # Initialize extractor
-    extractor = SkandaPuranaExtractor()
-    
-    # Process all PDFs
-    print(f"\n📚 Processing PDFs from: {extractor.pdf_folder}")
-    extractor.process_all_pdfs()
+    extractor = SkandaPuranaExtractor(args.pdf_folder, args.memory_limit_mb, args.spool, args.trace_memory)
     
-    # Export results
-    print("\n💾 Exporting results...")
-    extractor.export_to_csv()
+    try:
+        # Process all PDFs
+        print(f"\n📚 Processing PDFs from: {extractor.pdf_folder}")
+        extractor.process_all_pdfs()
+        
+        # Export results
+        print("\n💾 Exporting results...")
+        extractor.export_to_csv()
+    finally:
+        extractor.close()
     
     # Generate and save summary report
     report = extractor.generate_summary_report()
+    if extractor.memory_tracker:
+        extractor.memory_tracker.checkpoint('export + report')
+        report += "\n" + extractor.memory_tracker.format_report() + "\n"
+        extractor.memory_tracker.stop()
     print(report)
     
     with open("skanda_purana_extraction_report.txt", "w", encoding='utf-8') as f:
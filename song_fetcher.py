@@ -0,0 +1,352 @@
+"""
+Song Fetcher
+
+Concurrent, polite fetch engine for the kaumaram.com song pages.
+
+A bounded thread pool shares one pooled requests.Session. Every host gets
+its own concurrency limit and token bucket (requests per second), and each
+request starts after a small random jitter. 429/5xx responses and
+connection errors are retried with full-jitter exponential backoff, and a
+Retry-After pauses the whole host. After breaker_threshold consecutive
+failures a host's circuit breaker opens: its requests wait out a cooldown,
+then a single probe decides whether traffic resumes or the (doubled)
+cooldown starts again. fetch_ordered() delivers results in input order while
+keeping a bounded window of requests in flight.
+
+Usage:
+    with SongFetcher(per_host_rate=6) as fetcher:
+        for result in fetcher.fetch_ordered((n, song_url(n)) for n in range(6, 1341)):
+            if result.ok:
+                parse(result.content)
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from instrumentation import INSTRUMENTATION as instr
+from twitter_poster import RETRY_STATUS_CODES, TokenBucket, parse_retry_after
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one URL."""
+    key: Any
+    url: str
+    status_code: Optional[int] = None
+    content: Optional[bytes] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and 200 <= self.status_code < 300
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    closed: requests flow. open: requests wait until the cooldown has
+    passed. half-open: one probe request goes; success closes the breaker,
+    failure reopens it with twice the cooldown (up to max_cooldown).
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0, max_cooldown: float = 600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            threshold: Consecutive failures that open the breaker (0 disables it)
+            cooldown: Seconds the breaker stays open the first time
+            max_cooldown: Upper bound for the doubled cooldown
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a request to the host may be sent."""
+        if not self.threshold:
+            return
+        with self._condition:
+            while True:
+                if self.state == 'closed':
+                    return
+                # In half_open, opened_at is when the probe went out; a probe
+                # that never reports back is replaced after another cooldown
+                remaining = self.opened_at + self.cooldown - self.clock()
+                if remaining <= 0:
+                    self.state = 'half_open'
+                    self.opened_at = self.clock()
+                    return  # this caller is the probe
+                self._condition.wait(remaining)
+
+    def record(self, success: bool) -> None:
+        """Report the outcome of a request let through by acquire()."""
+        if not self.threshold:
+            return
+        with self._condition:
+            if success:
+                self.state = 'closed'
+                self.failures = 0
+                self.cooldown = self.base_cooldown
+            else:
+                self.failures += 1
+                if self.state == 'half_open':
+                    self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                if self.state == 'half_open' or self.failures >= self.threshold:
+                    if self.state != 'open':
+                        self.opens += 1
+                        instr.count('circuit_opens')
+                    self.state = 'open'
+                    self.opened_at = self.clock()
+            self._condition.notify_all()
+
+
+class SongFetcher:
+    """
+    Thread-pool fetcher with per-host concurrency and rate limits.
+    """
+
+    def __init__(self, max_workers: int = 8, per_host_concurrency: int = 4, per_host_rate: float = 4.0,
+                 jitter: float = 0.25, max_retries: int = 3, backoff: float = 1.0, timeout: float = 20.0,
+                 headers: Optional[Dict[str, str]] = None, session: Optional[requests.Session] = None,
+                 breaker_threshold: int = 5, breaker_cooldown: float = 30.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            max_workers: Threads fetching at once (across all hosts)
+            per_host_concurrency: Requests in flight per host
+            per_host_rate: Requests started per second per host
+            jitter: Maximum random delay before each request (seconds)
+            max_retries: Retries after the first attempt for 429/5xx/connection errors
+            backoff: Base of the exponential backoff (seconds)
+            timeout: Request timeout (seconds)
+            headers: Request headers (default: DEFAULT_HEADERS)
+            session: Session to fetch with, e.g. a page_cache.CachedSession
+                (default: a new pooled requests.Session)
+            breaker_threshold: Consecutive failed requests that open a host's
+                circuit breaker (0 disables it)
+            breaker_cooldown: Seconds a host's breaker first stays open
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_workers = max_workers
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.jitter = jitter
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = dict(headers or DEFAULT_HEADERS)
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.sleep = sleep
+        self.requests = 0
+        self.retries = 0
+        self._owns_session = session is None
+        self._session = self._configure(session, headers is not None) if session is not None else None
+        self._executor = None
+        self._hosts: Dict[str, Tuple[threading.Semaphore, TokenBucket, CircuitBreaker]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled keep-alive session sized for the worker count (created on first use)."""
+        with self._lock:
+            if self._session is None:
+                self._session = self._configure(requests.Session(), True)
+            return self._session
+
+    def _configure(self, session: requests.Session, set_headers: bool) -> requests.Session:
+        """Size the session's connection pool for the worker count."""
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if set_headers:
+            session.headers.update(self.headers)
+        return session
+
+    def _host_limits(self, url: str) -> Tuple[threading.Semaphore, TokenBucket, CircuitBreaker]:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = (threading.Semaphore(self.per_host_concurrency),
+                                     TokenBucket(rate=self.per_host_rate, capacity=1, sleep=self.sleep),
+                                     CircuitBreaker(self.breaker_threshold, self.breaker_cooldown))
+            return self._hosts[host]
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """The circuit breaker of url's host."""
+        return self._host_limits(url)[2]
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Full-jitter exponential backoff, never shorter than the server's Retry-After."""
+        delay = random.uniform(0, self.backoff * (2 ** attempt))
+        if response is not None and response.headers.get('Retry-After'):
+            delay = max(delay, parse_retry_after(response.headers['Retry-After']))
+        return delay
+
+    def fetch(self, url: str, key: Any = None) -> FetchResult:
+        """
+        Fetch one URL within the host's limits, retrying transient failures.
+
+        Args:
+            url: URL to fetch
+            key: Caller's identifier for the result (e.g. the song number)
+
+        Returns:
+            FetchResult: Never raises; failures are reported in .error
+        """
+        result = FetchResult(key=key, url=url)
+        start = time.perf_counter()
+
+        # Pages the session can answer from its cache skip the politeness limits
+        is_cached = getattr(self.session, 'is_cached', None)
+        if is_cached is not None and is_cached(url):
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                result.status_code = response.status_code
+                result.headers = dict(response.headers)
+                result.content = response.content
+            except requests.RequestException as e:
+                result.error = f"{type(e).__name__}: {e}"
+            result.attempts = 1
+            result.elapsed_s = time.perf_counter() - start
+            return result
+
+        semaphore, bucket, breaker = self._host_limits(url)
+        offline = getattr(self.session, 'offline', False)
+
+        for attempt in range(self.max_retries + 1):
+            if self.jitter:
+                self.sleep(random.uniform(0, self.jitter))
+            breaker.acquire()
+            bucket.acquire()
+            response = None
+            result.attempts = attempt + 1
+            with semaphore:
+                try:
+                    response = self.session.get(url, timeout=self.timeout)
+                    result.error = None
+                except requests.RequestException as e:
+                    result.error = f"{type(e).__name__}: {e}"
+            with self._lock:
+                self.requests += 1
+            # An offline cache miss says nothing about the host's health
+            host_failed = (response.status_code in RETRY_STATUS_CODES if response is not None
+                           else not offline)
+            breaker.record(not host_failed)
+            if response is None and offline:
+                break  # an offline cache miss will not succeed on retry
+
+            if response is not None:
+                bucket.update_from_headers(response.headers)
+                result.status_code = response.status_code
+                result.headers = dict(response.headers)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    if response.ok:
+                        result.content = response.content
+                    else:
+                        result.error = f"HTTP {response.status_code}"
+                    break
+                result.error = f"HTTP {response.status_code}"
+
+            if attempt < self.max_retries:
+                with self._lock:
+                    self.retries += 1
+                instr.count('retries')
+                self.sleep(self._retry_delay(attempt, response))
+
+        result.elapsed_s = time.perf_counter() - start
+        return result
+
+    def fetch_ordered(self, items: Iterable[Union[str, Tuple[Any, str]]],
+                      window: Optional[int] = None) -> Iterator[FetchResult]:
+        """
+        Fetch many URLs concurrently and yield the results in input order.
+
+        At most `window` requests are queued or in flight, so results are
+        consumed as they arrive and memory stays bounded for long ranges.
+
+        Args:
+            items: URLs, or (key, url) pairs
+            window: Requests kept ahead of the consumer (default: 2 x max_workers)
+
+        Yields:
+            FetchResult: One per item, in the order given
+        """
+        window = window or 2 * self.max_workers
+        executor = self._get_executor()
+        pending = deque()
+        for item in items:
+            key, url = item if isinstance(item, tuple) else (item, item)
+            pending.append(executor.submit(self.fetch, url, key))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def fetch_all(self, items: Iterable[Union[str, Tuple[Any, str]]]) -> List[FetchResult]:
+        """Fetch every item and return the results in input order."""
+        return list(self.fetch_ordered(items))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='song-fetch')
+            return self._executor
+
+    def close(self) -> None:
+        """Stop the worker threads and close pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._session is not None and self._owns_session:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def add_fetcher_arguments(parser, default_base_url: str = "https://kaumaram.com/thiru/") -> None:
+    """
+    Add the shared --workers/--per-host/--rate/--base-url options.
+
+    Args:
+        parser: argparse.ArgumentParser
+        default_base_url: Song page root used when --base-url is not given
+    """
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent fetch threads (default: 8)')
+    parser.add_argument('--per-host', type=int, default=4, help='Requests in flight per host (default: 4)')
+    parser.add_argument('--rate', type=float, default=4.0, help='Requests started per second per host (default: 4)')
+    parser.add_argument('--base-url', default=default_base_url,
+                        help='Song page root, e.g. a local mirror for testing')
@@ -0,0 +1,230 @@
+"""
+Song Journal
+
+Append-only JSON-lines checkpoint journal for the long song extractions.
+
+Every completed song appends its name records followed by a done marker:
+
+    {"type": "name", "song": 12, "data": {...}}
+    {"type": "name", "song": 12, "data": {...}}
+    {"type": "done", "song": 12, "names": 2, "error": null}
+
+so a checkpoint costs O(new records) instead of rewriting every name found
+so far. Lines are flushed after each song and fsynced in batches (every
+sync_every songs or sync_interval seconds). Replaying the journal restores
+the names of every song that has a done marker; records of a song that was
+cut off mid-write are dropped, and a song journaled twice keeps its last
+entry. compact() rewrites the journal with one entry per song, and callers
+export their final CSV from the replayed records. Opening a journal with
+resume=False archives the previous one (archive_journal) and starts empty.
+
+Usage:
+    with SongJournal('extraction_journal.jsonl') as journal:
+        for song in range(6, 1341):
+            if song in journal.done:
+                continue
+            names = extract(song)
+            journal.record_song(song, [asdict(n) for n in names])
+        state = journal.compact()
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from instrumentation import INSTRUMENTATION as instr
+
+
+@dataclass
+class JournalState:
+    """What a journal replay recovered."""
+    songs: Dict[int, List[Dict[str, Any]]] = field(default_factory=dict)
+    errors: Dict[int, str] = field(default_factory=dict)
+    valid_bytes: int = 0
+    superseded: int = 0
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """Every name record, in song order."""
+        return [record for song in sorted(self.songs) for record in self.songs[song]]
+
+    @property
+    def failed(self) -> List[Tuple[int, str]]:
+        """(song, error) for songs journaled as failed, in song order."""
+        return sorted(self.errors.items())
+
+
+def replay_journal(path: str) -> JournalState:
+    """
+    Read a journal back.
+
+    Args:
+        path: Journal file (a missing file is an empty journal)
+
+    Returns:
+        JournalState: Completed songs, and the byte offset just past the last
+        done marker (anything after it is an interrupted song or a torn line)
+    """
+    state = JournalState()
+    if not os.path.exists(path):
+        return state
+
+    pending: List[Dict[str, Any]] = []
+    offset = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            offset += len(line)
+            if not line.endswith(b'\n'):
+                break  # torn final write
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if entry.get('type') == 'name':
+                pending.append(entry['data'])
+            elif entry.get('type') == 'done':
+                song = entry['song']
+                if song in state.songs:
+                    state.superseded += 1
+                state.songs[song] = pending
+                if entry.get('error'):
+                    state.errors[song] = entry['error']
+                else:
+                    state.errors.pop(song, None)
+                pending = []
+                state.valid_bytes = offset
+    return state
+
+
+def archive_journal(path: str) -> Optional[str]:
+    """
+    Move a journal aside (to PATH.YYYYmmdd-HHMMSS) so the next run starts fresh.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        str: Where the journal was moved, or None when there was no journal
+    """
+    if not os.path.exists(path):
+        return None
+    archived = base = f"{path}.{time.strftime('%Y%m%d-%H%M%S')}"
+    suffix = 1
+    while os.path.exists(archived):
+        archived = f"{base}-{suffix}"
+        suffix += 1
+    os.replace(path, archived)
+    return archived
+
+
+class SongJournal:
+    """
+    Append-only, fsync-batched journal of completed songs.
+    """
+
+    def __init__(self, path: str, sync_every: int = 25, sync_interval: float = 5.0, resume: bool = True):
+        """
+        Args:
+            path: Journal file (created if missing, replayed if present)
+            sync_every: Songs between fsyncs
+            sync_interval: Maximum seconds between fsyncs
+            resume: False archives an existing journal and starts an empty one
+        """
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.archived = None if resume else archive_journal(path)
+        self.state = replay_journal(path)
+        self._file = open(path, 'ab')
+        # Drop an interrupted song or torn line left by a crash
+        if self._file.tell() > self.state.valid_bytes:
+            self._file.truncate(self.state.valid_bytes)
+            self._file.seek(self.state.valid_bytes)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @property
+    def done(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Records per completed song."""
+        return self.state.songs
+
+    def record_song(self, song_number: int, records: Iterable[Dict[str, Any]],
+                    error: Optional[str] = None) -> None:
+        """
+        Append one completed song.
+
+        Args:
+            song_number: Song number
+            records: The song's name records (JSON-serializable dicts)
+            error: Why the song produced nothing, if it failed
+        """
+        records = list(records)
+        lines = [json.dumps({'type': 'name', 'song': song_number, 'data': record}, ensure_ascii=False)
+                 for record in records]
+        lines.append(json.dumps({'type': 'done', 'song': song_number, 'names': len(records), 'error': error}))
+        with instr.span('checkpoint'):
+            self._file.write(('\n'.join(lines) + '\n').encode('utf-8'))
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+                self.sync()
+
+        if song_number in self.state.songs:
+            self.state.superseded += 1
+        self.state.songs[song_number] = records
+        if error:
+            self.state.errors[song_number] = error
+        else:
+            self.state.errors.pop(song_number, None)
+        self.state.valid_bytes = self._file.tell()
+
+    def sync(self) -> None:
+        """fsync everything written so far."""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def compact(self) -> JournalState:
+        """
+        Rewrite the journal with one entry per song, in song order.
+
+        The new file is fsynced and then swapped in atomically.
+
+        Returns:
+            JournalState: The journal's contents
+        """
+        self.sync()
+        self._file.close()
+        tmp_path = self.path + '.compact'
+        with instr.span('checkpoint'), open(tmp_path, 'wb') as f:
+            for song in sorted(self.state.songs):
+                records = self.state.songs[song]
+                for record in records:
+                    f.write((json.dumps({'type': 'name', 'song': song, 'data': record},
+                                        ensure_ascii=False) + '\n').encode('utf-8'))
+                f.write((json.dumps({'type': 'done', 'song': song, 'names': len(records),
+                                     'error': self.state.errors.get(song)}) + '\n').encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, 'ab')
+        self.state.superseded = 0
+        self.state.valid_bytes = self._file.tell()
+        return self.state
+
+    def close(self) -> None:
+        """fsync and close the journal."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,272 @@
+"""
+Song Ledger
+
+Persistent record of every song's extraction state, with a scheduler that
+retries failed fetches within the same run.
+
+Each song has one row in a SQLite file: its state, how many times it was
+attempted, the last error and HTTP status, and how many names it yielded.
+
+    pending      known but not attempted yet
+    ok           fetched and parsed, names found
+    empty        fetched and parsed, no names found
+    http_error   the page could not be fetched
+    parse_error  the page was fetched but could not be parsed
+
+Later runs can target only the songs that are not ok (ledger.songs_not_ok())
+instead of rereading CSVs or hard-coded failure lists.
+
+RetryScheduler wraps SongFetcher.fetch_ordered(): songs whose fetch failed
+with a transient error (429/5xx or a connection error) are fetched again in
+later rounds after an exponential, jittered backoff, up to max_attempts per
+song. The fetcher's per-host circuit breaker keeps those retries from
+hammering a host that is down.
+
+Environment:
+    SONG_LEDGER_PATH  ledger file (default: song_ledger.sqlite3 next to this module)
+"""
+
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from instrumentation import INSTRUMENTATION as instr
+from song_fetcher import FetchResult, SongFetcher
+from twitter_poster import RETRY_STATUS_CODES
+
+DEFAULT_LEDGER_PATH = os.environ.get(
+    'SONG_LEDGER_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'song_ledger.sqlite3')
+)
+
+PENDING = 'pending'
+OK = 'ok'
+EMPTY = 'empty'
+HTTP_ERROR = 'http_error'
+PARSE_ERROR = 'parse_error'
+STATES = (PENDING, OK, EMPTY, HTTP_ERROR, PARSE_ERROR)
+FAILED_STATES = (HTTP_ERROR, PARSE_ERROR)
+
+
+@dataclass
+class SongStatus:
+    """One ledger row."""
+    song_number: int
+    state: str
+    attempts: int
+    last_error: Optional[str]
+    http_status: Optional[int]
+    names: int
+    updated_at: float
+
+
+class SongLedger:
+    """
+    SQLite table of song states.
+    """
+
+    def __init__(self, path: str = DEFAULT_LEDGER_PATH):
+        """
+        Args:
+            path: SQLite file (created on first use)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite store on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS songs (
+                    song_number INTEGER PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    http_status INTEGER,
+                    names INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            self._connection.commit()
+        return self._connection
+
+    def add_songs(self, song_numbers: Iterable[int]) -> None:
+        """Register songs as pending (songs already in the ledger keep their state)."""
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.executemany(
+                'INSERT OR IGNORE INTO songs (song_number, state, updated_at) VALUES (?, ?, ?)',
+                [(song, PENDING, now) for song in song_numbers])
+            connection.commit()
+
+    def record(self, song_number: int, state: str, error: Optional[str] = None,
+               http_status: Optional[int] = None, names: int = 0) -> None:
+        """
+        Record the outcome of one attempt at a song.
+
+        Args:
+            song_number: Song number
+            state: One of STATES
+            error: What went wrong, for the error states
+            http_status: Status code of the last response, if any
+            names: Names found
+        """
+        if state not in STATES:
+            raise ValueError(f"unknown song state {state!r}")
+        with self._lock:
+            connection = self._connect()
+            connection.execute("""
+                INSERT INTO songs (song_number, state, attempts, last_error, http_status, names, updated_at)
+                VALUES (?, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT(song_number) DO UPDATE SET
+                    state = excluded.state, attempts = attempts + 1, last_error = excluded.last_error,
+                    http_status = excluded.http_status, names = excluded.names, updated_at = excluded.updated_at
+            """, (song_number, state, error, http_status, names, time.time()))
+            connection.commit()
+
+    def get(self, song_number: int) -> Optional[SongStatus]:
+        """The song's row, or None if the ledger has never seen it."""
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT song_number, state, attempts, last_error, http_status, names, updated_at '
+                'FROM songs WHERE song_number = ?', (song_number,)).fetchone()
+        return SongStatus(*row) if row else None
+
+    def songs(self, states: Optional[Iterable[str]] = None, start: Optional[int] = None,
+              end: Optional[int] = None) -> List[int]:
+        """
+        Song numbers in the ledger, in order.
+
+        Args:
+            states: Only songs in these states (default: all)
+            start: Lowest song number
+            end: Highest song number
+        """
+        query = 'SELECT song_number FROM songs WHERE 1 = 1'
+        args: list = []
+        if states is not None:
+            states = list(states)
+            query += f" AND state IN ({', '.join('?' * len(states))})"
+            args.extend(states)
+        if start is not None:
+            query += ' AND song_number >= ?'
+            args.append(start)
+        if end is not None:
+            query += ' AND song_number <= ?'
+            args.append(end)
+        with self._lock:
+            rows = self._connect().execute(query + ' ORDER BY song_number', args).fetchall()
+        return [row[0] for row in rows]
+
+    def songs_not_ok(self, start: Optional[int] = None, end: Optional[int] = None) -> List[int]:
+        """Songs whose state is anything but ok (pending, empty or failed)."""
+        return self.songs([state for state in STATES if state != OK], start, end)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of songs in each state."""
+        with self._lock:
+            rows = self._connect().execute('SELECT state, COUNT(*) FROM songs GROUP BY state').fetchall()
+        counts = {state: 0 for state in STATES}
+        counts.update(dict(rows))
+        return counts
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RetryScheduler:
+    """
+    Fetches songs, then retries transient failures in backed-off rounds.
+    """
+
+    def __init__(self, fetcher: SongFetcher, ledger: Optional[SongLedger] = None, max_attempts: int = 4,
+                 base_delay: float = 5.0, max_delay: float = 300.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            fetcher: Fetch engine (its per-host circuit breaker applies to retries too).
+                With max_retries=0 every attempt is one request, so attempts
+                in the ledger count requests
+            ledger: Ledger that records every failed attempt that is retried
+            max_attempts: Fetch attempts per song in this run
+            base_delay: Backoff before the first retry round (seconds)
+            max_delay: Upper bound for the backoff
+            sleep: Sleep function (injectable for tests)
+        """
+        self.fetcher = fetcher
+        self.ledger = ledger
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.retried = 0
+
+    def is_retryable(self, result: FetchResult) -> bool:
+        """Whether another attempt could succeed (not a 404, not an offline cache miss)."""
+        if result.ok:
+            return False
+        if result.status_code is None:
+            return not getattr(self.fetcher.session, 'offline', False)
+        return result.status_code in RETRY_STATUS_CODES
+
+    def retry_delay(self, round_number: int) -> float:
+        """
+        Equal-jitter exponential backoff before retry round round_number (0-based).
+
+        Unlike the fetcher's full-jitter retries, a round always waits at least
+        half its ceiling, so a whole round of songs does not hit a struggling
+        host again straight away.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** round_number))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def fetch(self, items: Iterable[Tuple[int, str]]) -> Iterator[FetchResult]:
+        """
+        Fetch (song number, url) pairs, retrying transient failures.
+
+        The first round yields results in input order; songs that are
+        retried are yielded when their final attempt finishes.
+
+        Yields:
+            FetchResult: The final attempt for each song
+        """
+        attempts: Dict[int, int] = {}
+        batch = list(items)
+        round_number = 0
+        while batch:
+            retry = []
+            for result in self.fetcher.fetch_ordered(batch):
+                attempts[result.key] = attempts.get(result.key, 0) + 1
+                if self.is_retryable(result) and attempts[result.key] < self.max_attempts:
+                    if self.ledger is not None:
+                        self.ledger.record(result.key, HTTP_ERROR, result.error, result.status_code)
+                    retry.append((result.key, result.url))
+                    continue
+                yield result
+            if retry:
+                delay = self.retry_delay(round_number)
+                self.retried += len(retry)
+                instr.count('song_retries', len(retry))
+                print(f"   🔁 Retrying {len(retry)} song(s) in {delay:.1f}s "
+                      f"(round {round_number + 1}/{self.max_attempts - 1})")
+                self.sleep(delay)
+                round_number += 1
+            batch = retry
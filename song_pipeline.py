@@ -0,0 +1,696 @@
+#!/usr/bin/env python3
+"""
+Song Pipeline
+
+One staged pipeline for the Thiruppugazh song pages:
+
+    fetch -> parse -> English-section isolation -> match -> score
+          -> categorize -> dedupe -> sink
+
+Each page is fetched once (through the page cache, so reruns are free) and
+parsed once. The English-section isolators and scoring heuristics of the
+existing extractors are registered as variants that run side by side on the
+same parsed page, so a new heuristic can be compared against the old ones
+without re-crawling or re-parsing anything.
+
+Fetching and parsing run in their own threads and matching/scoring runs in
+the consumer's thread; the stages are joined by bounded queues, so HTML
+parsing overlaps with network I/O and a slow consumer applies back-pressure
+all the way to the fetcher. With parse_workers > 0 the parse stage hands the
+raw page bytes to a process pool instead, and only the isolated English text
+comes back, so parsing throughput scales with cores. lxml is used as the
+HTML parser when asked for (--parser lxml/auto) and installed.
+
+Every song's outcome (ok, empty, http_error, parse_error) is recorded in the
+song ledger (song_ledger.py). Transient fetch failures are retried in
+backed-off rounds within the run, and --only-failed limits a later run to the
+songs the ledger does not have as ok.
+
+Usage:
+    python song_pipeline.py --start 6 --end 1340 --variants csv,complete --output names.csv
+    python song_pipeline.py --offline              # replay from page_cache.sqlite3 only
+    python song_pipeline.py --parse-workers 4 --parser auto
+    python song_pipeline.py --only-failed          # songs not yet ok in song_ledger.sqlite3
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import queue
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from instrumentation import INSTRUMENTATION as instr, add_profile_argument, profiling
+from name_matcher import get_name_matcher
+from page_cache import CachedSession
+from run_metrics import add_metrics_arguments, metrics_reporting
+from song_fetcher import FetchResult, SongFetcher, add_fetcher_arguments
+from song_ledger import (DEFAULT_LEDGER_PATH, EMPTY, HTTP_ERROR, OK, PARSE_ERROR, RetryScheduler,
+                         SongLedger)
+
+try:
+    import lxml  # noqa: F401  (only needed as a BeautifulSoup backend)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+DEFAULT_BASE_URL = "https://kaumaram.com/thiru/"
+PARSERS = ('html.parser', 'lxml', 'auto')
+
+
+@dataclass
+class ParsedSong:
+    """A song page after parsing and English-section isolation."""
+    song_number: int
+    url: str
+    title: str = ''
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+    error: Optional[str] = None
+    http_status: Optional[int] = None
+    fetch_error: bool = False
+
+
+@dataclass
+class PipelineName:
+    """A name found by one variant."""
+    variant: str
+    name: str
+    song_number: int
+    song_title: str
+    song_url: str
+    context: str
+    meaning: str
+    category: str
+    confidence: float
+    pattern_family: str = ''
+
+
+@dataclass
+class SongResult:
+    """Every variant's names for one song."""
+    song_number: int
+    url: str
+    title: str = ''
+    names: Dict[str, List[PipelineName]] = field(default_factory=dict)
+    error: Optional[str] = None
+    state: str = ''  # song_ledger state: ok, empty, http_error or parse_error
+
+
+@dataclass
+class Variant:
+    """
+    One scoring/categorizing strategy.
+
+    The raw context window around a match goes through prepare_context before
+    it is scored, categorized and mined for meaning; format_context produces
+    the context that is written out.
+    """
+    name: str
+    isolator: str
+    pattern_set: str
+    window: int
+    score: Callable[[str, str], float]
+    categorize: Callable[[str, str], str]
+    meaning: Callable[[str, str], str]
+    threshold: float = 0.0
+    min_length: int = 0
+    format_name: Callable[[str], str] = str.title
+    prepare_context: Callable[[str], str] = str
+    format_context: Callable[[str], str] = str
+    dedupe: Optional[Callable[[List[PipelineName]], List[PipelineName]]] = None
+
+
+# Extractor instances whose heuristics are reused, built on first use
+_extractors: Dict[str, object] = {}
+_extractors_lock = threading.Lock()
+
+
+def _extractor(kind: str):
+    with _extractors_lock:
+        if kind not in _extractors:
+            if kind == 'web':
+                from thiruppugazh_web_extractor import ThiruppugazhWebExtractor
+                _extractors[kind] = ThiruppugazhWebExtractor()
+            elif kind == 'csv':
+                from thiruppugazh_extractor_with_csv import ThiruppugazhExtractorWithCSV
+                _extractors[kind] = ThiruppugazhExtractorWithCSV()
+            elif kind == 'enhanced':
+                from enhanced_thiruppugazh_extractor import EnhancedThiruppugazhExtractor
+                _extractors[kind] = EnhancedThiruppugazhExtractor()
+            elif kind == 'complete':
+                from complete_thiruppugazh_systematic_extractor import CompleteThiruppugazhSystematicExtractor
+                _extractors[kind] = CompleteThiruppugazhSystematicExtractor()
+            elif kind == 'stubborn':
+                from final_retry_stubborn_songs import UltraConservativeRetry
+                _extractors[kind] = UltraConservativeRetry()
+            else:
+                raise KeyError(kind)
+        return _extractors[kind]
+
+
+def _isolate_web(soup: BeautifulSoup, page_text: str) -> List[str]:
+    section = _extractor('web')._extract_english_section(soup)
+    return [] if section is None else [section]
+
+
+# English-section isolators: (soup, page text) -> list of English text blocks
+ISOLATORS: Dict[str, Callable[[BeautifulSoup, str], List[str]]] = {
+    'web': _isolate_web,
+    'csv': lambda soup, text: [_extractor('csv')._extract_english_text(text)],
+    'enhanced': lambda soup, text: _extractor('enhanced')._extract_english_content(soup, text),
+    'complete': lambda soup, text: _extractor('complete')._comprehensive_english_extraction(soup, text),
+    'stubborn': lambda soup, text: [_extractor('stubborn')._extract_simple_english(text)],
+}
+
+
+def _keep_first(names: List[PipelineName]) -> List[PipelineName]:
+    unique = {}
+    for name in names:
+        unique.setdefault(name.name.lower(), name)
+    return list(unique.values())
+
+
+def builtin_variants() -> Dict[str, Variant]:
+    """
+    The heuristics of the existing extractors, as pipeline variants.
+
+    Returns:
+        Dict[str, Variant]: Variants keyed by name, each producing the same
+        names as the extractor it is named after
+    """
+    web = _extractor('web')
+    csv_ = _extractor('csv')
+    enhanced = _extractor('enhanced')
+    complete = _extractor('complete')
+
+    def flatten(context: str) -> str:
+        return context.replace('\n', ' ').strip()
+
+    return {
+        'web': Variant(
+            name='web', isolator='web', pattern_set='web', window=50,
+            score=lambda name, ctx: 1.0 if web._is_divine_name(name, ctx) else 0.0,
+            categorize=lambda name, ctx: 'divine_name',
+            meaning=lambda name, ctx: web._extract_meaning_context(ctx),
+            threshold=1.0, format_name=str, prepare_context=str.strip),
+        'csv': Variant(
+            name='csv', isolator='csv', pattern_set='csv', window=100,
+            score=csv_._calculate_confidence, categorize=csv_._categorize_name,
+            meaning=csv_._extract_meaning, threshold=0.3, min_length=4,
+            format_context=lambda ctx: flatten(ctx)[:200], dedupe=csv_._deduplicate_names),
+        'enhanced': Variant(
+            name='enhanced', isolator='enhanced', pattern_set='enhanced', window=150,
+            score=enhanced._calculate_confidence, categorize=enhanced._categorize_name,
+            meaning=enhanced._extract_meaning, threshold=0.3,
+            format_context=flatten, dedupe=enhanced._deduplicate_song_names),
+        'complete': Variant(
+            name='complete', isolator='complete', pattern_set='complete', window=200,
+            score=complete._comprehensive_confidence_scoring,
+            categorize=complete._comprehensive_categorization,
+            meaning=complete._comprehensive_meaning_extraction, threshold=0.25, min_length=3,
+            format_name=complete._standardize_name, format_context=complete._clean_context,
+            dedupe=complete._comprehensive_deduplication),
+        'stubborn': Variant(
+            name='stubborn', isolator='stubborn', pattern_set='stubborn', window=80,
+            score=lambda name, ctx: 0.5, categorize=lambda name, ctx: 'divine_name',
+            meaning=lambda name, ctx: ctx[:100] + "...", min_length=4,
+            prepare_context=flatten, format_context=lambda ctx: ctx[:200], dedupe=_keep_first),
+    }
+
+
+def resolve_parser(name: str = 'auto') -> str:
+    """
+    Pick the BeautifulSoup backend.
+
+    Args:
+        name: 'html.parser', 'lxml', or 'auto' (lxml when installed)
+
+    Returns:
+        str: Backend name to pass to BeautifulSoup
+    """
+    if name not in PARSERS:
+        raise ValueError(f"unknown parser {name!r} (expected one of {', '.join(PARSERS)})")
+    if name == 'auto':
+        return 'lxml' if LXML_AVAILABLE else 'html.parser'
+    if name == 'lxml' and not LXML_AVAILABLE:
+        raise ValueError("the lxml parser needs the lxml package (pip install lxml)")
+    return name
+
+
+def parse_page(song_number: int, url: str, content: bytes, isolators: Iterable[str],
+               parser: str = 'html.parser') -> ParsedSong:
+    """
+    Parse a song page once and run the requested English-section isolators on it.
+
+    Args:
+        song_number: Song number
+        url: Page URL
+        content: Page HTML
+        isolators: Names of ISOLATORS to run
+        parser: BeautifulSoup backend (see resolve_parser)
+
+    Returns:
+        ParsedSong: Plain text only, so it can cross thread or process boundaries
+    """
+    parsed = ParsedSong(song_number=song_number, url=url)
+    try:
+        soup = BeautifulSoup(content, parser)
+        title_elem = soup.find('title')
+        parsed.title = title_elem.text.strip() if title_elem else f"Thiruppugazh Song {song_number}"
+        page_text = soup.get_text()
+        for isolator in isolators:
+            parsed.sections[isolator] = ISOLATORS[isolator](soup, page_text)
+    except Exception as e:
+        parsed.error = f"{type(e).__name__}: {e}"
+    return parsed
+
+
+def _init_parse_worker(isolators: List[str]) -> None:
+    """Build the isolators' extractors once per worker process."""
+    for isolator in isolators:
+        _extractor(isolator)
+
+
+def analyze_song(parsed: ParsedSong, variants: List[Variant]) -> SongResult:
+    """
+    Match, score, categorize and dedupe one parsed song for every variant.
+
+    Variants sharing an isolator and pattern set share one scan of the text.
+
+    Args:
+        parsed: Output of parse_page
+        variants: Variants to run
+
+    Returns:
+        SongResult: Names per variant
+    """
+    result = SongResult(parsed.song_number, parsed.url, parsed.title, error=parsed.error)
+    if parsed.error:
+        result.state = HTTP_ERROR if parsed.fetch_error else PARSE_ERROR
+        return result
+
+    matcher = get_name_matcher()
+    scans: Dict[Tuple[str, str], list] = {}
+    for variant in variants:
+        key = (variant.isolator, variant.pattern_set)
+        if key not in scans:
+            with instr.span('pattern_match'):
+                scans[key] = [(text, list(matcher.scan(text, variant.pattern_set)))
+                              for text in parsed.sections.get(variant.isolator, [])]
+
+        names = []
+        with instr.span('score'):
+            for text, matches in scans[key]:
+                for match in matches:
+                    if len(match.text) < variant.min_length:
+                        continue
+                    start = max(0, match.start - variant.window)
+                    end = min(len(text), match.end + variant.window)
+                    context = variant.prepare_context(text[start:end])
+                    confidence = variant.score(match.text, context)
+                    if confidence < variant.threshold:
+                        continue
+                    names.append(PipelineName(
+                        variant=variant.name,
+                        name=variant.format_name(match.text),
+                        song_number=parsed.song_number,
+                        song_title=parsed.title,
+                        song_url=parsed.url,
+                        context=variant.format_context(context),
+                        meaning=variant.meaning(match.text, context),
+                        category=variant.categorize(match.text, context),
+                        confidence=confidence,
+                        pattern_family='/'.join(match.families)
+                    ))
+        if variant.dedupe is not None:
+            with instr.span('dedupe'):
+                names = variant.dedupe(names)
+        result.names[variant.name] = names
+        instr.count(f'names_{variant.name}', len(names))
+    result.state = OK if any(result.names.values()) else EMPTY
+    return result
+
+
+_DONE = object()
+
+
+class _Failure:
+    """Carries a stage's exception to the consumer."""
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+class SongPipeline:
+    """
+    Threaded fetch -> parse -> analyze pipeline over a range of songs.
+    """
+
+    def __init__(self, variants: List[Variant], fetcher: Optional[SongFetcher] = None,
+                 base_url: str = DEFAULT_BASE_URL, queue_size: int = 16, parse_workers: int = 0,
+                 parser: str = 'html.parser', ledger: Optional[SongLedger] = None,
+                 max_attempts: int = 4, retry_delay: float = 5.0):
+        """
+        Args:
+            variants: Variants to run side by side on every page
+            fetcher: Fetch engine (default: a SongFetcher over a CachedSession).
+                Build it with max_retries=0 so that retries are left to the
+                scheduler and each attempt is a single request
+            base_url: Song page root
+            queue_size: Items buffered between stages
+            parse_workers: Processes parsing pages; 0 parses in a thread
+            parser: BeautifulSoup backend ('html.parser', 'lxml' or 'auto').
+                html.parser reproduces the extractors' output exactly; lxml
+                is faster but may split text nodes differently
+            ledger: Song ledger that records every song's state
+            max_attempts: Fetch attempts per song in this run (transient failures
+                only); one request each with a max_retries=0 fetcher
+            retry_delay: Backoff before the first retry round (seconds)
+        """
+        if not variants:
+            raise ValueError("at least one variant is required")
+        self.variants = variants
+        self.isolators = sorted({variant.isolator for variant in variants})
+        self._owned_session = CachedSession() if fetcher is None else None
+        self.fetcher = fetcher or SongFetcher(max_retries=0, session=self._owned_session)
+        self.base_url = base_url
+        self.queue_size = queue_size
+        self.parse_workers = parse_workers
+        self.parser = resolve_parser(parser)
+        self.ledger = ledger
+        self.scheduler = RetryScheduler(self.fetcher, ledger, max_attempts, retry_delay)
+
+    def song_url(self, song_number: int) -> str:
+        return f"{self.base_url}nnt{song_number:04d}_u.html"
+
+    def _put(self, q: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put with back-pressure; False once the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fetch_stage(self, songs: List[int], out: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for result in self.scheduler.fetch((n, self.song_url(n)) for n in songs):
+                if not self._put(out, result, stop):
+                    return
+                instr.set_gauge('parse_queue', out.qsize())
+        except BaseException as e:
+            self._put(out, _Failure(e), stop)
+            return
+        self._put(out, _DONE, stop)
+
+    def _submit_parse(self, result: FetchResult, pool: Optional[ProcessPoolExecutor]) -> Future:
+        """Parse in the pool, or right here when there is none."""
+        if result.ok and pool is not None:
+            return pool.submit(parse_page, result.key, result.url, result.content, self.isolators, self.parser)
+        future = Future()
+        if result.ok:
+            with instr.span('parse'):
+                future.set_result(parse_page(result.key, result.url, result.content, self.isolators, self.parser))
+        else:
+            future.set_result(ParsedSong(result.key, result.url, error=result.error,
+                                         http_status=result.status_code, fetch_error=True))
+        return future
+
+    def _parse_stage(self, inbox: queue.Queue, out: queue.Queue, stop: threading.Event,
+                     pool: Optional[ProcessPoolExecutor]) -> None:
+        # Pages in the pool are handed on in song order, with at most
+        # two per worker outstanding
+        window = max(1, 2 * self.parse_workers)
+        pending = deque()
+
+        def forward() -> bool:
+            future, status = pending.popleft()
+            parsed = future.result()
+            parsed.http_status = status
+            instr.count('parsed')
+            if not self._put(out, parsed, stop):
+                return False
+            instr.set_gauge('analyze_queue', out.qsize())
+            return True
+
+        try:
+            while True:
+                item = self._get(inbox, stop)
+                if item is _DONE or isinstance(item, _Failure):
+                    break
+                pending.append((self._submit_parse(item, pool), item.status_code))
+                while pending and (len(pending) >= window or pending[0][0].done()):
+                    if not forward():
+                        return
+            while pending:
+                if not forward():
+                    return
+            self._put(out, item, stop)
+        except BaseException as e:
+            self._put(out, _Failure(e), stop)
+
+    def run(self, start: int, end: int, songs: Optional[Iterable[int]] = None) -> Iterator[SongResult]:
+        """
+        Run every variant over songs start..end (inclusive).
+
+        Args:
+            start: First song number
+            end: Last song number
+            songs: Only these songs (e.g. ledger.songs_not_ok(start, end))
+
+        Yields:
+            SongResult: One per song, in song order; songs whose fetch was
+            retried come after the first pass
+        """
+        songs = list(range(start, end + 1) if songs is None else songs)
+        if self.ledger is not None:
+            self.ledger.add_songs(songs)
+        instr.set_target('songs', len(songs))
+        fetched = queue.Queue(maxsize=self.queue_size)
+        parsed = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        pool = None
+        if self.parse_workers > 0:
+            # spawn, not fork: this process already runs fetch threads
+            pool = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                       mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_parse_worker, initargs=(self.isolators,))
+        threads = [
+            threading.Thread(target=self._fetch_stage, args=(songs, fetched, stop),
+                             name='pipeline-fetch', daemon=True),
+            threading.Thread(target=self._parse_stage, args=(fetched, parsed, stop, pool),
+                             name='pipeline-parse', daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = parsed.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failure):
+                    raise item.exc
+                result = analyze_song(item, self.variants)
+                instr.count('songs')
+                if result.error:
+                    instr.count('errors')
+                if self.ledger is not None:
+                    self.ledger.record(result.song_number, result.state, result.error, item.http_status,
+                                       sum(len(names) for names in result.names.values()))
+                yield result
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def close(self) -> None:
+        """Close the fetcher if this pipeline created it."""
+        if self._owned_session is not None:
+            self.fetcher.close()
+            self._owned_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonlSink:
+    """Writes names as JSON lines."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, names: List[PipelineName]) -> None:
+        for name in names:
+            self._file.write(json.dumps(asdict(name), ensure_ascii=False) + '\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvSink:
+    """Writes names as CSV rows, one column per PipelineName field."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=[f.name for f in fields(PipelineName)])
+        self._writer.writeheader()
+
+    def write(self, names: List[PipelineName]) -> None:
+        self._writer.writerows(asdict(name) for name in names)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def open_sink(path: str):
+    """CsvSink for *.csv paths, JsonlSink otherwise."""
+    return CsvSink(path) if path.lower().endswith('.csv') else JsonlSink(path)
+
+
+def format_comparison(totals: Dict[str, List[PipelineName]], songs: int, failed: List[int]) -> str:
+    """
+    Side-by-side summary of every variant's output.
+
+    Args:
+        totals: All names per variant
+        songs: Songs processed
+        failed: Song numbers that could not be fetched or parsed
+
+    Returns:
+        str: Report text
+    """
+    lines = [
+        "🕉️ SONG PIPELINE VARIANT COMPARISON",
+        "=" * 70,
+        f"   Songs processed: {songs} ({len(failed)} failed)",
+        "",
+        f"   {'Variant':<10} {'Names':>7} {'Unique':>7} {'≥0.7':>6}  Top pattern families",
+    ]
+    for variant, names in totals.items():
+        unique = len({n.name.lower() for n in names})
+        high = len([n for n in names if n.confidence >= 0.7])
+        families = Counter(n.pattern_family for n in names if n.pattern_family).most_common(3)
+        top = ', '.join(f"{family} ({count})" for family, count in families)
+        lines.append(f"   {variant:<10} {len(names):>7} {unique:>7} {high:>6}  {top}")
+    if failed:
+        shown = ', '.join(str(n) for n in failed[:20])
+        lines.append(f"\n   ❌ Failed songs: {shown}{' ...' if len(failed) > 20 else ''}")
+    lines.append("=" * 70)
+    return '\n'.join(lines)
+
+
+def main():
+    """Run the pipeline from the command line."""
+    variants = builtin_variants()
+    parser = argparse.ArgumentParser(description="Run Thiruppugazh name extraction variants side by side")
+    parser.add_argument('--start', type=int, default=6, help='First song number (default: 6)')
+    parser.add_argument('--end', type=int, default=1340, help='Last song number (default: 1340)')
+    parser.add_argument('--variants', default=','.join(variants),
+                        help=f"Comma-separated variants to run (default: {','.join(variants)})")
+    parser.add_argument('--output', help='Write names to this file (.csv or JSON lines)')
+    parser.add_argument('--offline', action='store_true', help='Serve pages from the page cache only')
+    parser.add_argument('--queue-size', type=int, default=16, help='Items buffered between stages (default: 16)')
+    parser.add_argument('--parse-workers', type=int, default=(os.cpu_count() or 1) - 1,
+                        help='Processes parsing pages; 0 parses in a thread (default: CPUs - 1)')
+    parser.add_argument('--parser', choices=PARSERS, default='html.parser',
+                        help="HTML parser backend; 'auto' uses lxml when installed (default: html.parser)")
+    parser.add_argument('--ledger', default=DEFAULT_LEDGER_PATH,
+                        help='Song state ledger (default: song_ledger.sqlite3, or SONG_LEDGER_PATH)')
+    parser.add_argument('--only-failed', action='store_true',
+                        help='Only run songs in --start..--end that the ledger does not have as ok')
+    parser.add_argument('--max-attempts', type=int, default=4,
+                        help='Requests per song for transient failures (default: 4)')
+    parser.add_argument('--retry-delay', type=float, default=5.0,
+                        help='Backoff before the first retry round, doubled each round (default: 5s)')
+    add_fetcher_arguments(parser, DEFAULT_BASE_URL)
+    add_profile_argument(parser, 'song_pipeline')
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    selected = [v.strip() for v in args.variants.split(',') if v.strip()]
+    unknown = [v for v in selected if v not in variants]
+    if unknown:
+        parser.error(f"unknown variant(s): {', '.join(unknown)}")
+    try:
+        html_parser = resolve_parser(args.parser)
+    except ValueError as e:
+        parser.error(str(e))
+
+    session = CachedSession(offline=True if args.offline else None)
+    # The retry scheduler owns retries, so each fetch is exactly one request
+    fetcher = SongFetcher(max_workers=args.workers, per_host_concurrency=args.per_host,
+                          per_host_rate=args.rate, max_retries=0, session=session)
+    ledger = SongLedger(args.ledger)
+    targets = None
+    if args.only_failed:
+        ledger.add_songs(range(args.start, args.end + 1))
+        targets = ledger.songs_not_ok(args.start, args.end)
+    sink = open_sink(args.output) if args.output else None
+    totals: Dict[str, List[PipelineName]] = {name: [] for name in selected}
+    failed = []
+    songs = 0
+
+    print(f"🎵 SONG PIPELINE: songs {args.start}-{args.end}, variants {', '.join(selected)}")
+    if targets is not None:
+        print(f"   Only songs not ok in {args.ledger}: {len(targets)}")
+    print(f"   Parsing with {html_parser} in " +
+          (f"{args.parse_workers} worker process{'es' if args.parse_workers > 1 else ''}"
+           if args.parse_workers > 0 else "a thread"))
+    try:
+        with profiling(args.profile), metrics_reporting(args.metrics, args.metrics_format, args.metrics_interval), \
+                fetcher, SongPipeline([variants[v] for v in selected], fetcher, args.base_url,
+                                      args.queue_size, args.parse_workers, html_parser, ledger,
+                                      args.max_attempts, args.retry_delay) as pipeline:
+            for result in pipeline.run(args.start, args.end, targets):
+                songs += 1
+                if result.error:
+                    failed.append(result.song_number)
+                for variant, names in result.names.items():
+                    totals[variant].extend(names)
+                    if sink:
+                        with instr.span('sink'):
+                            sink.write(names)
+                if songs % 100 == 0:
+                    print(f"   📊 Progress: {songs} songs, " +
+                          ', '.join(f"{v} {len(n)}" for v, n in totals.items()))
+    finally:
+        if sink:
+            sink.close()
+        session.close()
+        counts = ledger.counts()
+        ledger.close()
+
+    print()
+    print(format_comparison(totals, songs, failed))
+    print("📒 Ledger: " + ', '.join(f"{state} {count}" for state, count in counts.items()))
+    if sink:
+        print(f"📁 Names written to {args.output}")
+    print()
+    print(instr.format_report("SONG PIPELINE STAGE BREAKDOWN"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+
+Measures how long the CLI entry points take to import using
+`python -X importtime` and enforces a per-module budget. It also checks that
+optional subsystems (Twitter/requests, numpy, pandas) are not imported on the
+fast path, since those alone cost ~100ms each.
+
+Usage:
+    python startup_benchmark.py            # check budgets, exit 1 when over
+    python startup_benchmark.py --runs 10 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Set, Tuple
+
+# Cumulative import time budget per entry point (milliseconds)
+STARTUP_BUDGETS_MS = {
+    'main': 60,
+    'murugan_name_finder': 100,
+    'murugan_name_master': 100,
+    'master_corpus_analyzer': 60,
+}
+
+# Modules that must only load when a command needs them
+LAZY_MODULES = ['requests', 'twitter_poster', 'numpy', 'pandas', 'bs4',
+                'sanskrit_name_extractor', 'tamil_name_extractor']
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import(module: str) -> Tuple[float, Set[str]]:
+    """
+    Import a module in a fresh interpreter under -X importtime.
+
+    Args:
+        module: Module name to import
+
+    Returns:
+        tuple: (cumulative import time of the module in ms, all modules imported)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True
+    )
+
+    cumulative_ms = 0.0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|', 2)
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        imported.add(name.strip())
+        if name.strip() == module and not name[1:].startswith(' '):
+            cumulative_ms = int(cumulative) / 1000
+    return cumulative_ms, imported
+
+
+def run_startup_benchmark(runs: int = 5) -> List[Dict[str, Any]]:
+    """
+    Measure every entry point in STARTUP_BUDGETS_MS.
+
+    Args:
+        runs: Fresh interpreters per entry point (the median is reported)
+
+    Returns:
+        list: One result per entry point with timing, budget and lazy-module leaks
+    """
+    results = []
+    for module, budget_ms in STARTUP_BUDGETS_MS.items():
+        timings = []
+        imported = set()
+        for _ in range(runs):
+            elapsed_ms, imported = measure_import(module)
+            timings.append(elapsed_ms)
+
+        median_ms = statistics.median(timings)
+        leaked = sorted(name for name in LAZY_MODULES if name in imported)
+        results.append({
+            'module': module,
+            'median_ms': median_ms,
+            'min_ms': min(timings),
+            'budget_ms': budget_ms,
+            'leaked_modules': leaked,
+            'ok': median_ms <= budget_ms and not leaked
+        })
+    return results
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Check CLI import time against the startup budget")
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per entry point (default: 5)')
+    parser.add_argument('--json', metavar='FILE', help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    results = run_startup_benchmark(args.runs)
+
+    print("⏱️  STARTUP BENCHMARK (python -X importtime)")
+    print("=" * 60)
+    for result in results:
+        status = '✅' if result['ok'] else '❌'
+        print(f"{status} {result['module']:<24} {result['median_ms']:7.1f}ms "
+              f"(min {result['min_ms']:.1f}ms, budget {result['budget_ms']}ms)")
+        if result['leaked_modules']:
+            print(f"   ⚠️  Imported eagerly: {', '.join(result['leaked_modules'])}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved to: {args.json}")
+
+    sys.exit(0 if all(result['ok'] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
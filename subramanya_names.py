@@ -5,7 +5,8 @@ This module contains names related to Lord Subramanya Swamy that start with "Cha
 derived from Thiruppugazh, Arunagirinathar's works, Siddhars, and traditional epithets.
 """
 
-from chaldean_numerology import calculate_chaldean_sum, get_name_analysis
+from chaldean_numerology import profile_name
+from chaldean_index import get_source_index
 
 # Comprehensive database of Lord Subramanya Swamy names starting with "Cha"
 SUBRAMANYA_NAMES_CHA = {
@@ -160,15 +161,15 @@ def analyze_subramanya_names():
     results = []
     
     for name, info in SUBRAMANYA_NAMES_CHA.items():
-        analysis = get_name_analysis(name)
+        profile = profile_name(name)
         results.append({
             'name': name,
             'meaning': info['meaning'],
             'source': info['source'],
             'significance': info['significance'],
-            'chaldean_sum': analysis['total_sum'],
-            'reduced_value': analysis['reduced_value'],
-            'is_target': analysis['is_target']
+            'chaldean_sum': profile.total_sum,
+            'reduced_value': profile.reduced_value,
+            'is_target': profile.is_target
         })
     
     return results
@@ -182,17 +183,16 @@ def find_target_subramanya_names():
     """
     target_names = []
     
-    for name, info in SUBRAMANYA_NAMES_CHA.items():
-        chaldean_sum = calculate_chaldean_sum(name)
-        if chaldean_sum in [14, 41]:
-            target_names.append({
-                'name': name,
-                'meaning': info['meaning'],
-                'source': info['source'],
-                'significance': info['significance'],
-                'chaldean_sum': chaldean_sum,
-                'reduced_value': 5
-            })
+    for entry in get_source_index('subramanya_names').with_sums([14, 41]):
+        info = entry.info
+        target_names.append({
+            'name': entry.name,
+            'meaning': info['meaning'],
+            'source': info['source'],
+            'significance': info['significance'],
+            'chaldean_sum': entry.chaldean_sum,
+            'reduced_value': 5
+        })
     
     return target_names
 
@@ -209,16 +209,15 @@ def get_names_by_chaldean_range(min_val, max_val):
     """
     range_names = []
     
-    for name, info in SUBRAMANYA_NAMES_CHA.items():
-        chaldean_sum = calculate_chaldean_sum(name)
-        if min_val <= chaldean_sum <= max_val:
-            range_names.append({
-                'name': name,
-                'meaning': info['meaning'],
-                'chaldean_sum': chaldean_sum,
-                'distance_to_14': abs(chaldean_sum - 14),
-                'distance_to_41': abs(chaldean_sum - 41)
-            })
+    for entry in get_source_index('subramanya_names').in_range(min_val, max_val):
+        chaldean_sum = entry.chaldean_sum
+        range_names.append({
+            'name': entry.name,
+            'meaning': entry.info['meaning'],
+            'chaldean_sum': chaldean_sum,
+            'distance_to_14': abs(chaldean_sum - 14),
+            'distance_to_41': abs(chaldean_sum - 41)
+        })
     
     return sorted(range_names, key=lambda x: min(x['distance_to_14'], x['distance_to_41']))
 
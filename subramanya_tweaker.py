@@ -6,9 +6,11 @@ constraint while finding Chaldean numerology target values for Murugan-related n
 """
 
 from chaldean_numerology import calculate_chaldean_sum, get_chaldean_value, is_target_value
-from name_tweaker import get_letter_substitutions
+from name_tweaker import generate_name_variations, get_position_options
 from subramanya_names import get_subramanya_names_starting_with_cha
 from comprehensive_subramanya_database import get_comprehensive_subramanya_names
+from tweak_cache import cached_find_cha_target_tweaks
+from chaldean_index import get_source_index
 import itertools
 
 def enforce_cha_prefix(name):
@@ -40,68 +42,112 @@ def generate_cha_variations(base_name, max_changes=3):
         max_changes (int): Maximum number of changes after the 'Cha' prefix
         
     Returns:
-        list: List of valid variations all starting with 'Cha'
+        list: Sorted list of valid variations all starting with 'Cha'
     """
     # Enforce Cha prefix
     name = enforce_cha_prefix(base_name)
-    variations = set()
-    variations.add(name)
     
     # Only modify letters after position 2 (keep C-H-A intact)
     if len(name) <= 3:
         return [name]
     
     suffix = name[3:]  # Everything after 'CHA'
+    return sorted('CHA' + variation for variation in generate_name_variations(suffix, max_changes))
+
+def _build_suffix_bounds(position_options, max_changes):
+    """
+    Build the minimum and maximum sums reachable from every suffix position.
     
-    # Generate single substitutions in the suffix
-    for i, letter in enumerate(suffix):
-        if letter.isalpha():
-            substitutions = get_letter_substitutions(letter)
-            for substitute in substitutions:
-                if substitute != letter and len(substitute) <= 2:
-                    new_suffix = suffix[:i] + substitute + suffix[i+1:]
-                    new_name = 'CHA' + new_suffix
-                    variations.add(new_name)
+    lowest[i][r] and highest[i][r] bound the sum of the letters from position
+    i to the end when at most r of them are substituted.
     
-    # Generate double substitutions if max_changes >= 2
-    if max_changes >= 2 and len(suffix) >= 2:
-        suffix_variations = list(set([name[3:] for name in variations]))
-        for base_suffix in suffix_variations:
-            if base_suffix == suffix:  # Skip original
-                continue
-            for i, letter in enumerate(base_suffix):
-                if letter.isalpha():
-                    substitutions = get_letter_substitutions(letter)
-                    for substitute in substitutions:
-                        if substitute != letter and len(substitute) <= 2:
-                            new_suffix = base_suffix[:i] + substitute + base_suffix[i+1:]
-                            new_name = 'CHA' + new_suffix
-                            variations.add(new_name)
+    Args:
+        position_options (list): Output of get_position_options per position
+        max_changes (int): Maximum number of substitutions
+        
+    Returns:
+        tuple: (lowest, highest) tables with len(position_options) + 1 rows
+    """
+    lowest = [[0] * (max_changes + 1)]
+    highest = [[0] * (max_changes + 1)]
+    for options in reversed(position_options):
+        keep_value = options[0][1]
+        substitute_values = [value for _, value in options[1:]]
+        low_after, high_after = lowest[-1], highest[-1]
+        low_row, high_row = [], []
+        for remaining in range(max_changes + 1):
+            low = keep_value + low_after[remaining]
+            high = keep_value + high_after[remaining]
+            if remaining and substitute_values:
+                low = min(low, min(substitute_values) + low_after[remaining - 1])
+                high = max(high, max(substitute_values) + high_after[remaining - 1])
+            low_row.append(low)
+            high_row.append(high)
+        lowest.append(low_row)
+        highest.append(high_row)
+    lowest.reverse()
+    highest.reverse()
+    return lowest, highest
+
+def search_cha_suffix(suffix, target_values=[14, 41], max_changes=3, prefix_sum=None):
+    """
+    Branch-and-bound search over the letters after the 'CHA' prefix.
+    
+    Walks the suffix position by position, choosing to keep or substitute each
+    letter. A branch is cut as soon as no target lies between the smallest and
+    largest total still reachable with the remaining change budget, so the
+    complete solution set is returned without enumerating every variation.
+    Letters are tried in position order and substitutes in table order, which
+    makes the result deterministic.
     
-    # Generate triple substitutions if max_changes >= 3
-    if max_changes >= 3 and len(suffix) >= 3:
-        # Limit to avoid too many combinations
-        current_variations = list(variations)[:20]  # Limit processing
-        for base_name_var in current_variations:
-            if base_name_var == name:  # Skip original
-                continue
-            base_suffix = base_name_var[3:]
-            for i, letter in enumerate(base_suffix):
-                if letter.isalpha():
-                    substitutions = get_letter_substitutions(letter)
-                    for substitute in substitutions[:3]:  # Limit substitutions
-                        if substitute != letter and len(substitute) <= 2:
-                            new_suffix = base_suffix[:i] + substitute + base_suffix[i+1:]
-                            new_name = 'CHA' + new_suffix
-                            variations.add(new_name)
-                            if len(variations) > 100:  # Prevent explosion
-                                break
-                    if len(variations) > 100:
-                        break
-                if len(variations) > 100:
-                    break
+    Args:
+        suffix (str): Uppercase letters following 'CHA'
+        target_values (list): Target Chaldean sums for the full name
+        max_changes (int): Maximum number of changes in the suffix
+        prefix_sum (int): Chaldean sum of the fixed prefix (defaults to 'CHA')
+        
+    Returns:
+        list: (tweaked_suffix, chaldean_sum, changes) tuples, where changes is a
+              list of (suffix_position, from, to) tuples
+    """
+    if prefix_sum is None:
+        prefix_sum = calculate_chaldean_sum('CHA')
     
-    return list(variations)
+    position_options = [get_position_options(letter) for letter in suffix]
+    changeable = sum(1 for options in position_options if len(options) > 1)
+    max_changes = max(0, min(max_changes, changeable))
+    
+    targets = sorted(set(target_values))
+    lowest, highest = _build_suffix_bounds(position_options, max_changes)
+    
+    def target_in_reach(position, remaining, running_sum):
+        low = running_sum + lowest[position][remaining]
+        high = running_sum + highest[position][remaining]
+        return any(low <= target <= high for target in targets)
+    
+    solutions = []
+    chosen = []
+    
+    def branch(position, remaining, running_sum):
+        if position == len(position_options):
+            if running_sum in targets:
+                tweaked = ''.join(chosen)
+                changes = [(i, suffix[i], text) for i, text in enumerate(chosen) if text != suffix[i]]
+                solutions.append((tweaked, running_sum, changes))
+            return
+        
+        for option_index, (text, value) in enumerate(position_options[position]):
+            left = remaining - (option_index > 0)
+            if left < 0:
+                break
+            if target_in_reach(position + 1, left, running_sum + value):
+                chosen.append(text)
+                branch(position + 1, left, running_sum + value)
+                chosen.pop()
+    
+    if target_in_reach(0, max_changes, prefix_sum):
+        branch(0, max_changes, prefix_sum)
+    return solutions
 
 def find_cha_target_tweaks(base_name, target_values=[14, 41], max_changes=3):
     """
@@ -116,47 +162,36 @@ def find_cha_target_tweaks(base_name, target_values=[14, 41], max_changes=3):
         list: List of successful tweaks with analysis
     """
     original_name = enforce_cha_prefix(base_name)
-    variations = generate_cha_variations(original_name, max_changes)
-    successful_tweaks = []
+    best_by_name = {}
     
-    for variation in variations:
-        chaldean_sum = calculate_chaldean_sum(variation)
-        if chaldean_sum in target_values:
-            # Calculate changes (only in suffix after 'CHA')
-            changes = []
-            original_suffix = original_name[3:]
-            variation_suffix = variation[3:]
-            
-            if original_suffix != variation_suffix:
-                if len(original_suffix) == len(variation_suffix):
-                    # Same length - count character differences
-                    for i, (orig_char, var_char) in enumerate(zip(original_suffix, variation_suffix)):
-                        if orig_char != var_char:
-                            changes.append({
-                                'position': i + 3,  # Adjust for 'CHA' prefix
-                                'from': orig_char,
-                                'to': var_char
-                            })
-                else:
-                    # Different lengths - count as structural change
-                    changes.append({
-                        'position': 3,
-                        'from': original_suffix,
-                        'to': variation_suffix
-                    })
-            
-            successful_tweaks.append({
-                'original': base_name,
-                'original_enforced': original_name, 
-                'tweaked': variation,
-                'chaldean_sum': chaldean_sum,
-                'changes': changes,
-                'num_changes': len(changes),
-                'prefix_preserved': True
-            })
+    for tweaked_suffix, chaldean_sum, plan in search_cha_suffix(original_name[3:], target_values, max_changes):
+        variation = 'CHA' + tweaked_suffix
+        # Different plans can spell the same name (e.g. AA+A vs A+AA); keep the cheapest
+        if variation in best_by_name and best_by_name[variation]['num_changes'] <= len(plan):
+            continue
+        
+        # Changes are only ever in the suffix after 'CHA'
+        changes = [
+            {
+                'position': position + 3,  # Adjust for 'CHA' prefix
+                'from': original_letter,
+                'to': substitute
+            }
+            for position, original_letter, substitute in plan
+        ]
+        
+        best_by_name[variation] = {
+            'original': base_name,
+            'original_enforced': original_name, 
+            'tweaked': variation,
+            'chaldean_sum': chaldean_sum,
+            'changes': changes,
+            'num_changes': len(changes),
+            'prefix_preserved': True
+        }
     
     # Sort by fewest changes first
-    successful_tweaks.sort(key=lambda x: x['num_changes'])
+    successful_tweaks = sorted(best_by_name.values(), key=lambda x: (x['num_changes'], x['tweaked']))
     return successful_tweaks
 
 def find_closest_subramanya_names(target_sum=14):
@@ -169,25 +204,25 @@ def find_closest_subramanya_names(target_sum=14):
     Returns:
         list: Names sorted by distance to target
     """
-    # Use comprehensive database
-    names_db = get_comprehensive_subramanya_names()
+    # Use comprehensive database, indexed by Chaldean sum
+    index = get_source_index('comprehensive_subramanya_database')
     results = []
     
-    for name, info in names_db.items():
-        chaldean_sum = calculate_chaldean_sum(name)
-        distance = abs(chaldean_sum - target_sum)
+    for entry in index.nearest(target_sum):
+        info = entry.info
+        chaldean_sum = entry.chaldean_sum
         
         results.append({
-            'name': name,
+            'name': entry.name,
             'meaning': info['meaning'],
             'source': info['source'],
             'significance': info['significance'],
             'chaldean_sum': chaldean_sum,
-            'distance_to_target': distance,
+            'distance_to_target': abs(chaldean_sum - target_sum),
             'is_target': chaldean_sum in [14, 41]
         })
     
-    return sorted(results, key=lambda x: x['distance_to_target'])
+    return results
 
 def optimize_subramanya_name_for_target(base_name, max_changes=3):
     """
@@ -216,7 +251,7 @@ def optimize_subramanya_name_for_target(base_name, max_changes=3):
         }
     
     # Find tweaks
-    tweaks = find_cha_target_tweaks(original_name, max_changes=max_changes)
+    tweaks = cached_find_cha_target_tweaks(original_name, max_changes=max_changes)
     
     # Get database info if available from comprehensive database
     names_db = get_comprehensive_subramanya_names()
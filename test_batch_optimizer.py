@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for batch mode: reading name files, ordered results and CSV/JSON lines output
+"""
+
+import csv
+import json
+
+from batch_optimizer import CSV_FIELDS, iter_batch_results, read_names, run_batch
+
+NAMES = ['Murugan', 'Arun', 'Skanda', 'Guha', 'Karthik']
+
+
+def write_inputs(tmp_path):
+    """Write the same names as a CSV export and as a text file."""
+    csv_path = tmp_path / 'names.csv'
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Number', 'Name', 'Confidence'])
+        for i, name in enumerate(NAMES, 1):
+            writer.writerow([i, name, '0.9'])
+        writer.writerow([len(NAMES) + 1, '  ', '0.9'])  # blank names are skipped
+
+    text_path = tmp_path / 'names.txt'
+    text_path.write_text('# boy names\n' + '\n'.join(f' {n} ' for n in NAMES) + '\n\n', encoding='utf-8')
+    return str(csv_path), str(text_path)
+
+
+def test_read_names_from_csv_and_text(tmp_path):
+    csv_path, text_path = write_inputs(tmp_path)
+    assert read_names(csv_path) == NAMES
+    assert read_names(text_path) == NAMES
+
+
+def test_batch_results_keep_input_order():
+    serial = list(iter_batch_results(NAMES, max_changes=1, limit=2, workers=1))
+    parallel = list(iter_batch_results(NAMES, max_changes=1, limit=2, workers=2, chunk_size=1))
+
+    assert [r['name'] for r in serial] == NAMES
+    assert parallel == serial
+    arun = serial[1]
+    assert arun['is_target'] and arun['chaldean_sum'] == 14
+    assert all(len(r['tweaks']) <= 2 for r in serial)
+
+
+def test_run_batch_writes_csv_and_json_lines(tmp_path):
+    _, text_path = write_inputs(tmp_path)
+    csv_out = tmp_path / 'out.csv'
+    jsonl_out = tmp_path / 'out.jsonl'
+
+    summary = run_batch(text_path, str(csv_out), max_changes=1, limit=1, workers=1)
+    run_batch(text_path, str(jsonl_out), max_changes=1, limit=1, workers=1)
+
+    with open(csv_out, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    assert reader.fieldnames == CSV_FIELDS
+    assert [row['name'] for row in rows] == NAMES
+
+    records = [json.loads(line) for line in jsonl_out.read_text(encoding='utf-8').splitlines()]
+    assert [r['name'] for r in records] == NAMES
+    assert all('tweaks' in r for r in records)
+    for row, record in zip(rows, records):
+        assert int(row['chaldean_sum']) == record['chaldean_sum']
+        assert row['best_tweak'] == (record['best_tweak'] or '')
+
+    assert summary['names'] == len(NAMES)
+    assert summary['already_perfect'] == 1
+    assert summary['optimized'] + summary['no_solution'] == len(NAMES) - 1
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Tests for the Chaldean sum index
+"""
+
+from chaldean_index import ChaldeanIndex
+from chaldean_numerology import calculate_chaldean_sum
+
+
+def test_index_queries_match_linear_scans():
+    names = ["Chaarvik", "Fan", "Saravana", "Shanmukha", "Kumaran", "Murugan", "Velan", "Guha", "Skanda"]
+    index = ChaldeanIndex()
+    index.add_many(names[:5], 'a')
+    index.add_many(names[5:], 'b')
+    sums = [calculate_chaldean_sum(name) for name in names]
+
+    assert [e.name for e in index.with_sums([14, 41])] == [n for n, s in zip(names, sums) if s in (14, 41)]
+    assert [e.name for e in index.in_range(15, 30, source='b')] == [
+        n for n, s in zip(names[5:], sums[5:]) if 15 <= s <= 30]
+    assert [e.name for e in index.nearest(20)] == [
+        n for _, _, n in sorted((abs(s - 20), i, n) for i, (n, s) in enumerate(zip(names, sums)))]
+    assert sum(index.sum_distribution().values()) == len(names)
+
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the Chaldean numerology scorers
+"""
+
+import pytest
+
+import chaldean_numerology
+from chaldean_numerology import (
+    calculate_chaldean_sum,
+    calculate_chaldean_sums,
+    get_chaldean_value,
+    profile_name,
+    reduce_to_single_digit
+)
+
+SAMPLE_NAMES = ["Chaarvik", "Fan", "Saravana", "Shanmukha", "O'Neil-Smith", "", "कार्तिकेय", "ıſ"]
+
+
+def test_batch_matches_single_name_scorer():
+    expected = [calculate_chaldean_sum(name) for name in SAMPLE_NAMES]
+    assert list(calculate_chaldean_sums(SAMPLE_NAMES)) == expected
+
+
+def test_batch_treats_missing_values_as_zero():
+    assert list(calculate_chaldean_sums(["Fan", None, float('nan')])) == [14, 0, 0]
+
+
+def test_batch_accepts_pandas_series():
+    pd = pytest.importorskip('pandas')
+    series = pd.Series(SAMPLE_NAMES, index=range(10, 10 + len(SAMPLE_NAMES)))
+    expected = [calculate_chaldean_sum(name) for name in SAMPLE_NAMES]
+    assert list(calculate_chaldean_sums(series)) == expected
+
+
+def test_batch_pure_python_fallback(monkeypatch):
+    monkeypatch.setattr(chaldean_numerology, '_load_numpy', lambda: None)
+    expected = [calculate_chaldean_sum(name) for name in SAMPLE_NAMES]
+    assert calculate_chaldean_sums(SAMPLE_NAMES) == expected
+
+
+def test_profile_matches_name_analysis():
+    for name in SAMPLE_NAMES:
+        profile = profile_name(name)
+        clean_name = ''.join(letter for letter in name if letter.isalpha())
+        assert profile.clean_name == clean_name
+        assert profile.total_sum == calculate_chaldean_sum(name)
+        assert profile.reduced_value == reduce_to_single_digit(profile.total_sum)
+        assert profile.vowel_sum + profile.consonant_sum == profile.total_sum
+        assert [item['value'] for item in profile.letter_breakdown] == [
+            get_chaldean_value(letter) for letter in clean_name
+        ]
+
+
+def test_profile_vowel_and_compound_values():
+    profile = profile_name("Chaarvik")
+    assert (profile.total_sum, profile.vowel_sum, profile.consonant_sum) == (21, 3, 18)
+    assert profile.compound_number == 21
+    assert profile.reduced_value == 3
+    assert profile_name("Fan").is_target
+    assert profile_name("Ab").compound_number is None
+
+
+def test_reduce_to_single_digit():
+    assert [reduce_to_single_digit(n) for n in (0, 5, 9, 10, 14, 41, 99, 999)] == [0, 5, 9, 1, 5, 5, 9, 9]
+
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared timing spans, counters, profiler and metrics file
+"""
+
+import json
+
+from instrumentation import Instrumentation, MemoryTracker, profiling
+from run_metrics import MetricsWriter
+
+
+def test_nested_spans_record_self_time():
+    now = [0.0]
+    instr = Instrumentation(clock=lambda: now[0])
+
+    with instr.span('fetch'):
+        now[0] += 2.0
+        with instr.span('parse'):
+            now[0] += 3.0
+    with instr.span('parse'):
+        now[0] += 1.0
+    instr.count('songs')
+    instr.count('names', 5)
+
+    stages = instr.snapshot()['stages']
+    assert stages['fetch'] == {'calls': 1, 'total_s': 5.0, 'self_s': 2.0, 'max_s': 5.0}
+    assert stages['parse'] == {'calls': 2, 'total_s': 4.0, 'self_s': 4.0, 'max_s': 3.0}
+
+    report = instr.format_report()
+    assert report.index('parse') < report.index('fetch')
+    assert 'names                       5  (0.83/sec)' in report
+
+
+def test_profiling_writes_pstats_and_folded_stacks(tmp_path):
+    prefix = str(tmp_path / "run")
+    with profiling(prefix, interval=0.001):
+        sum(i * i for i in range(300000))
+
+    folded = (tmp_path / "run.folded").read_text().splitlines()
+    assert (tmp_path / "run.prof").stat().st_size > 0
+    assert folded and all(line.rsplit(' ', 1)[1].isdigit() for line in folded)
+    assert any('test_profiling_writes_pstats_and_folded_stacks' in line for line in folded)
+
+
+def test_memory_tracker_reports_per_stage_peaks():
+    tracker = MemoryTracker()
+    tracker.start()
+    try:
+        blob = bytearray(4 * 1024 * 1024)
+        tracker.checkpoint('allocate')
+        del blob
+        tracker.checkpoint('release')
+    finally:
+        tracker.stop()
+
+    allocate, release = tracker.records
+    assert allocate['peak_bytes'] >= 4 * 1024 * 1024 and allocate['top']
+    assert release['current_bytes'] < allocate['current_bytes'] - 3 * 1024 * 1024
+    assert 'allocate' in tracker.format_report()
+
+
+def test_metrics_writer_reports_rates_eta_and_prometheus_text(tmp_path):
+    now = [0.0]
+    instr = Instrumentation(clock=lambda: now[0])
+    instr.set_target('songs', 100)
+    jsonl = MetricsWriter(str(tmp_path / "run.jsonl"), instrumentation=instr)
+    prom = MetricsWriter(str(tmp_path / "run.prom"), instrumentation=instr)
+
+    now[0] = 10.0
+    instr.count('songs', 20)
+    instr.set_gauge('queue_depth', 80)
+    first = jsonl.write()
+    assert first['rates'] == {'songs': 2.0} and first['eta_s'] == {'songs': 40.0}
+
+    now[0] = 20.0
+    instr.count('songs', 5)
+    instr.count('errors')
+    jsonl.write()
+    prom.write()
+
+    samples = [json.loads(line) for line in (tmp_path / "run.jsonl").read_text().splitlines()]
+    assert [sample['counters']['songs'] for sample in samples] == [20, 25]
+    assert samples[1]['rates'] == {'songs': 0.5, 'errors': 0.1}
+    assert samples[1]['rss_bytes'] > 0
+
+    text = (tmp_path / "run.prom").read_text()
+    assert 'boyname_songs_total 25\n' in text
+    assert 'boyname_songs_per_second 1.2500\n' in text
+    assert 'boyname_queue_depth 80\n' in text
+    assert 'boyname_eta_seconds{counter="songs"} 60.0\n' in text
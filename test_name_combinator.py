@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Tests for the full-name combinator
+"""
+
+from chaldean_numerology import calculate_chaldean_sum
+from name_combinator import build_name_pool, count_full_names, find_full_names
+
+
+def test_full_name_combinations_match_nested_loop():
+    firsts = {"Chaarvik": 0.8, "Cara": 0.6, "Fan": 1.0, "Guha": 0.7, "Velan": 0.9}
+    middles = {"Siva": 1.0, "Skanda": 0.8, "Kumar": 0.6, "Arul": 0.7}
+    first_pool = build_name_pool(firsts, firsts.values())
+    middle_pool = build_name_pool(middles, middles.values())
+
+    targets = [14, 41] + list(range(40, 60, 3))
+    expected = sorted(
+        (firsts[f] * middles[m], f"{f} {m} Shekar") for f in firsts for m in middles
+        if calculate_chaldean_sum(f + m + "Shekar") in targets
+    )
+    results = find_full_names(first_pool, middle_pool, "Shekar", targets)
+    assert len(expected) > 5
+    assert sorted((r['confidence'], r['full_name']) for r in results) == expected
+    assert [r['confidence'] for r in results] == sorted((r['confidence'] for r in results), reverse=True)
+    assert count_full_names(first_pool, middle_pool, "Shekar", targets) == len(expected)
+    assert [r['full_name'] for r in find_full_names(first_pool, target_values=[14])] == ["Fan"]
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Thiruppugazh name matcher
+"""
+
+import re
+
+import pytest
+
+from name_matcher import PATTERN_SETS, NameMatcher, get_name_matcher
+
+TEXT = ("Oh Saravanabhava, six-faced Shanmukha, son of Shiva! We chant Sami and "
+        "Subramaniam at your Charanam; such grace, the Chandran-like Saravaṇa, Shakti_vel and Sarvanan2.")
+
+
+@pytest.mark.parametrize('pattern_set', sorted(PATTERN_SETS))
+def test_scan_finds_what_every_pattern_finds_separately(pattern_set):
+    expected = sorted({(m.start(), m.end()) for _, pattern in PATTERN_SETS[pattern_set]
+                       for m in re.finditer(pattern, TEXT, re.IGNORECASE)})
+    found = [(m.start, m.end) for m in get_name_matcher().scan(TEXT, pattern_set)]
+    assert found == expected
+
+
+def test_scan_reports_the_families_that_fired():
+    matches = {m.text: m.families for m in get_name_matcher().scan(TEXT, 'web')}
+    assert matches['Shanmukha'] == ('sha_prefix', 'shanmukha')
+    assert matches['Charanam'] == ('cha_prefix',)
+    assert 'Shiva' not in matches
+    assert get_name_matcher().families('csv')[:3] == ['saravana', 'shakti', 'shanmukha']
+
+
+def test_matcher_rejects_patterns_that_do_not_match_whole_words():
+    with pytest.raises(ValueError):
+        NameMatcher({'bad': [('sa', r'[Ss]a')]})
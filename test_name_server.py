@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the name server's JSON-lines and HTTP front ends
+"""
+
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from chaldean_index import ChaldeanIndex
+from chaldean_numerology import calculate_chaldean_sum
+from name_server import NameService, make_http_server, serve_stdio
+from name_tweaker import iter_target_tweaks
+
+TARGETS = [14, 41]
+
+
+def test_name_server_stdio_and_http():
+    index = ChaldeanIndex()
+    index.add_many(["Fan", "Guha", "Velan", "Kumaran"], 'test')
+    service = NameService(index, workers=1)
+
+    requests_in = io.StringIO("\n".join([
+        json.dumps({"id": 1, "op": "analyze", "name": "fan"}),
+        json.dumps({"id": 2, "op": "tweak", "name": "Alexander", "max_changes": 3, "limit": 2}),
+        json.dumps({"id": 3, "op": "search", "targets": [14, 41], "source": "test"}),
+        "not json",
+        json.dumps({"id": 4, "op": "explode"}),
+    ]) + "\n")
+    responses_out = io.StringIO()
+    serve_stdio(service, requests_in, responses_out)
+    responses = [json.loads(line) for line in responses_out.getvalue().splitlines()]
+
+    assert responses[0]['result']['total_sum'] == 14
+    assert responses[0]['result']['known_sources'] == ['test']
+    assert [t['tweaked'] for t in responses[1]['result']['tweaks']] == [
+        t['tweaked'] for t in iter_target_tweaks("Alexander", TARGETS, 3, limit=2)]
+    assert [n['name'] for n in responses[2]['result']['names']] == [
+        name for name in ["Fan", "Guha", "Velan", "Kumaran"] if calculate_chaldean_sum(name) in TARGETS]
+    assert [r.get('error') for r in responses[3:]] == ['bad_json', 'unknown_op']
+
+    server = make_http_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/search"
+        body = json.dumps({"nearest": 20, "limit": 1}).encode()
+        request = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request) as response:
+            result = json.loads(response.read())['result']
+        assert result['names'][0]['name'] == index.nearest(20, 1)[0].name
+
+        # A form-encoded POST (what a cross-site page can send) is refused
+        with pytest.raises(urllib.error.HTTPError) as refused:
+            urllib.request.urlopen(urllib.request.Request(url, data=body))
+        assert refused.value.code == 415
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_combine_pools_are_limited_to_the_pool_directory(tmp_path):
+    (tmp_path / "first.txt").write_text("Guha\nVelan\nFan\n")
+    (tmp_path / "second.txt").write_text("Kumaran\n")
+    (tmp_path / "third.txt").write_text("Saravana\n")
+    index = ChaldeanIndex()
+    index.add_many(["Fan"], 'test')
+    service = NameService(index, workers=1, pool_dir=str(tmp_path), pool_cache_size=2)
+
+    for pool in ("first.txt", "second.txt", "third.txt", "second.txt"):
+        assert 'result' in service.handle({"op": "combine", "first": pool, "surname": "Shekar"})
+    assert list(service._pools) == ["third.txt", "second.txt"]
+
+    for pool in ("/etc/passwd", "../first.txt", str(tmp_path / "first.txt"), "missing.csv", "first.py"):
+        response = service.handle({"op": "combine", "first": pool})
+        assert response['error'] == 'ValueError', pool
+    assert len(service._pools) == 2
+
+
+def test_combine_reads_json_pools(tmp_path):
+    names = ["Guha", "Velan", "Kumaran", "Saravana", "Senthil"]
+    (tmp_path / "organized.json").write_text(json.dumps({
+        "tamil_names": [{"name": n, "meaning": "Murugan"} for n in names[:3]],
+        "sanskrit_names": [{"name": n, "source": "Skanda Purana"} for n in names[3:]] + [{"meaning": "no name"}],
+    }))
+    (tmp_path / "plain.txt").write_text("\n".join(names) + "\n")
+    service = NameService(ChaldeanIndex(), workers=1, pool_dir=str(tmp_path))
+
+    request = {"op": "combine", "middle": "plain.txt", "limit": 100}
+    from_json = service.handle(dict(request, first="organized.json"))['result']['combinations']
+    from_text = service.handle(dict(request, first="plain.txt"))['result']['combinations']
+    assert from_json and from_json == from_text
+    assert len(service._get_pool("organized.json")) == len(names)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-bounded name spool
+"""
+
+import csv
+
+from name_spool import SKANDA_FIELDNAMES, NameSpool
+
+
+def make_row(i):
+    row = dict.fromkeys(SKANDA_FIELDNAMES, '')
+    row.update({'Name/Word': f"Skanda{i}", 'Part#': f"Part {i % 3}", 'Context/Line#': 'x' * 200})
+    return row
+
+
+def test_spool_flushes_at_ceiling_and_streams_rows_back(tmp_path):
+    spool = NameSpool(str(tmp_path / "spool.csv"), max_buffer_bytes=4096)
+    for i in range(100):
+        spool.append(make_row(i))
+
+    assert len(spool) == 100 and spool
+    assert spool.flushes > 1 and spool.peak_buffer_bytes < 4096 + 2048
+    assert [row['Name/Word'] for row in spool] == [f"Skanda{i}" for i in range(100)]
+
+    spool.export_csv(str(tmp_path / "names.csv"))
+    with open(tmp_path / "names.csv", newline='', encoding='utf-8') as f:
+        assert len(list(csv.DictReader(f))) == 100
+    spool.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the name tweak search
+"""
+
+import itertools
+
+import name_tweaker
+from chaldean_numerology import calculate_chaldean_sum
+from name_tweaker import SUBSTITUTION_DELTAS, find_target_tweaks, get_position_options, iter_target_tweaks
+from subramanya_tweaker import enforce_cha_prefix, find_cha_target_tweaks
+from tweak_cache import TweakCache, cached_find_cha_target_tweaks, cached_find_target_tweaks
+
+TARGETS = [14, 41]
+
+
+def brute_force_tweaks(name, target_values, max_changes):
+    """Try every substitution plan and keep the cheapest plan per spelling."""
+    position_options = [get_position_options(letter) for letter in name.upper()]
+    best = {}
+    for plan in itertools.product(*(range(len(options)) for options in position_options)):
+        num_changes = sum(1 for option_index in plan if option_index)
+        if num_changes > max_changes:
+            continue
+        tweaked = ''.join(options[i][0] for options, i in zip(position_options, plan))
+        if calculate_chaldean_sum(tweaked) in target_values:
+            best[tweaked] = min(best.get(tweaked, num_changes), num_changes)
+    return best
+
+
+def test_substitution_deltas_match_rescoring():
+    for letter, deltas in SUBSTITUTION_DELTAS.items():
+        for substitute, delta in deltas:
+            assert calculate_chaldean_sum(substitute) - calculate_chaldean_sum(letter) == delta
+    assert ('PH', 5) in SUBSTITUTION_DELTAS['F']
+    assert ('KS', 0) in SUBSTITUTION_DELTAS['X']
+
+
+def test_find_target_tweaks_matches_brute_force():
+    for name in ["Mike", "David", "Fan", "Al ex", "Chaarvik"]:
+        for max_changes in range(4):
+            found = {tweak['tweaked']: tweak['num_changes']
+                     for tweak in find_target_tweaks(name, TARGETS, max_changes)}
+            assert found == brute_force_tweaks(name, TARGETS, max_changes), (name, max_changes)
+
+
+def test_find_target_tweaks_honours_large_max_changes():
+    tweaks = find_target_tweaks("Alexander", TARGETS, max_changes=4)
+    assert max(tweak['num_changes'] for tweak in tweaks) == 4
+    assert [tweak['num_changes'] for tweak in tweaks] == sorted(tweak['num_changes'] for tweak in tweaks)
+    for tweak in tweaks:
+        assert calculate_chaldean_sum(tweak['tweaked']) == tweak['chaldean_sum']
+        assert tweak['chaldean_sum'] in TARGETS
+
+
+def test_zero_changes_only_keeps_target_names():
+    assert [tweak['tweaked'] for tweak in find_target_tweaks("Fan", TARGETS, 0)] == ["FAN"]
+    assert find_target_tweaks("Mike", TARGETS, 0) == []
+
+
+def test_iter_target_tweaks_streams_cheapest_first():
+    streamed = list(iter_target_tweaks("Alexander", TARGETS, max_changes=4))
+    costs = [tweak['num_changes'] for tweak in streamed]
+    assert costs == sorted(costs)
+    assert sorted(tweak['tweaked'] for tweak in streamed) == sorted(
+        tweak['tweaked'] for tweak in find_target_tweaks("Alexander", TARGETS, 4))
+
+
+def test_iter_target_tweaks_limit_stops_early():
+    limited = list(iter_target_tweaks("Alexander", TARGETS, max_changes=4, limit=3))
+    assert len(limited) == 3
+    assert all(tweak['num_changes'] == 2 for tweak in limited)
+    assert list(iter_target_tweaks("Alexander", TARGETS, max_changes=4, limit=0)) == []
+
+
+def test_cha_search_matches_unconstrained_suffix_search():
+    prefix_sum = calculate_chaldean_sum("CHA")
+    suffix_targets = [target - prefix_sum for target in TARGETS]
+    for name in ["Chaarvik", "Chandrashila", "Charanam", "Kumaran"]:
+        suffix = enforce_cha_prefix(name)[3:]
+        for max_changes in range(5):
+            found = {tweak['tweaked']: tweak['num_changes']
+                     for tweak in find_cha_target_tweaks(name, TARGETS, max_changes)}
+            expected = {'CHA' + tweaked: num_changes
+                        for tweaked, num_changes in brute_force_tweaks(suffix, suffix_targets, max_changes).items()}
+            assert found == expected, (name, max_changes)
+
+
+def test_tweak_cache_round_trip_and_invalidation(tmp_path, monkeypatch):
+    cache = TweakCache(str(tmp_path / "cache.sqlite3"))
+    fresh = cached_find_target_tweaks("Alexander", TARGETS, 3, cache=cache)
+    assert fresh == find_target_tweaks("Alexander", TARGETS, 3)
+
+    # A second cache on the same file is served from SQLite
+    reopened = TweakCache(str(tmp_path / "cache.sqlite3"))
+    assert cached_find_target_tweaks("alexander", TARGETS, 3, cache=reopened)[0]['original'] == "alexander"
+    assert cached_find_cha_target_tweaks("Charanam", TARGETS, 2, cache=reopened) == \
+        find_cha_target_tweaks("Charanam", TARGETS, 2)
+
+    # Changing the substitution tables changes the key once the cache is refreshed
+    key = cache.make_key('tweak', "ALEXANDER", TARGETS, 3)
+    monkeypatch.setitem(name_tweaker.VOWEL_SUBSTITUTIONS, 'A', ['A', 'E'])
+    assert cache.make_key('tweak', "ALEXANDER", TARGETS, 3) == key
+    cache.refresh()
+    assert cache.make_key('tweak', "ALEXANDER", TARGETS, 3) != key
+    assert cached_find_target_tweaks("Alexander", TARGETS, 3, cache=cache) == \
+        find_target_tweaks("Alexander", TARGETS, 3)
+    monkeypatch.undo()
+    name_tweaker.refresh_substitution_deltas()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the page cache against a local stand-in for kaumaram.com
+"""
+
+import pytest
+import requests
+
+from name_matcher import NameMatcher
+from page_cache import CachedSession, PageCache, PageCacheMiss
+from thiruppugazh_extractor_with_csv import ThiruppugazhExtractorWithCSV
+
+# One page for every song, so pages of different songs share a blob
+SONG_PAGE = """<html><head><title>Thiruppugazh</title></head><body>
+<p>Oh Lord Saravanabava, the six-faced divine one, we worship your holy feet.</p>
+</body></html>"""
+
+
+@pytest.fixture
+def site(song_site):
+    return song_site(page=SONG_PAGE)
+
+
+def test_cached_pages_cost_no_round_trips(tmp_path, site):
+    cache = PageCache(str(tmp_path / 'pages.sqlite3'))
+    with CachedSession(cache, offline=False, max_age=None) as session:
+        first = session.get(f"{site.url}nnt0006_u.html#english", timeout=5)
+        again = session.get(f"{site.url}nnt0006_u.html", timeout=5)
+        other = session.get(f"{site.url}nnt0007_u.html", timeout=5)
+
+    assert not first.from_cache and again.from_cache and not other.from_cache
+    assert again.content == first.content and again.headers['ETag'] == first.headers['ETag']
+    assert site.requests == 2
+    # Two URLs with the same body share one compressed blob
+    stats = cache.stats()
+    assert stats['pages'] == 2 and stats['blobs'] == 1
+    assert stats['stored_bytes'] < stats['raw_bytes']
+
+
+def test_stale_pages_are_revalidated_conditionally(tmp_path, site):
+    cache = PageCache(str(tmp_path / 'pages.sqlite3'))
+    with CachedSession(cache, offline=False, max_age=0) as session:
+        session.get(f"{site.url}nnt0006_u.html", timeout=5)
+        response = session.get(f"{site.url}nnt0006_u.html", timeout=5)
+
+    assert response.status_code == 200 and response.from_cache
+    assert b'Saravanabava' in response.content
+    assert session.revalidated == 1
+    _, if_none_match, if_modified_since = site.request_log[-1]
+    assert if_none_match and if_modified_since == 'Sat, 01 Jun 2024 00:00:00 GMT'
+
+
+def test_offline_mode_serves_only_from_cache(tmp_path, site):
+    cache = PageCache(str(tmp_path / 'pages.sqlite3'))
+    with CachedSession(cache, offline=False, max_age=None) as session:
+        session.get(f"{site.url}nnt0006_u.html", timeout=5)
+
+    with CachedSession(cache, offline=True) as session:
+        streamed = session.get(f"{site.url}nnt0006_u.html", stream=True)
+        assert streamed.from_cache
+        assert b''.join(streamed.iter_content(chunk_size=16)) == streamed.content
+        with pytest.raises(requests.RequestException):
+            session.get(f"{site.url}nnt0008_u.html")
+    assert issubclass(PageCacheMiss, requests.ConnectionError)
+    assert site.requests == 1
+
+
+def test_reextraction_with_new_patterns_uses_cache(tmp_path, site):
+    cache = PageCache(str(tmp_path / 'pages.sqlite3'))
+    extractor = ThiruppugazhExtractorWithCSV()
+    extractor.base_url = site.url
+    extractor.session = CachedSession(cache, offline=False, max_age=None)
+    assert [n.name for n in extractor.extract_from_song(6)] == ['Saravanabava']
+
+    extractor.session = CachedSession(cache, offline=True)
+    extractor.matcher = NameMatcher({'csv': [('saravana', r'\b[Ss]aravana\w*\b'), ('worship', r'\b[Ww]orship\b')]})
+    names = extractor.extract_from_song(6)
+    assert {n.name for n in names} == {'Saravanabava', 'Worship'}
+    assert site.requests == 1
+
+
+def test_is_cached_does_not_load_the_body(tmp_path, monkeypatch):
+    cache = PageCache(str(tmp_path / 'pages.sqlite3'))
+    cache.put("http://songs.test/thiru/nnt0006_u.html", SONG_PAGE.encode())
+    body_reads = []
+    get = cache.get
+    monkeypatch.setattr(cache, 'get', lambda url: body_reads.append(url) or get(url))
+
+    with CachedSession(cache, offline=False, max_age=None) as session:
+        assert session.is_cached("http://songs.test/thiru/nnt0006_u.html#english")
+        assert not session.is_cached("http://songs.test/thiru/nnt0007_u.html")
+        assert body_reads == []
+        assert session.get("http://songs.test/thiru/nnt0006_u.html").from_cache
+    assert len(body_reads) == 1
+    assert not CachedSession(cache, offline=False, max_age=0).is_cached("http://songs.test/thiru/nnt0006_u.html")
+    cache.close()
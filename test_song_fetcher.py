@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent song fetcher against a local stand-in for kaumaram.com
+"""
+
+from song_fetcher import SongFetcher
+from thiruppugazh_web_extractor import ThiruppugazhWebExtractor
+
+def make_fetcher(**options):
+    return SongFetcher(max_workers=6, per_host_concurrency=3, per_host_rate=1000, jitter=0, backoff=0.01, **options)
+
+
+def test_fetch_ordered_keeps_input_order_within_host_limits(song_site):
+    site = song_site(missing={7}, fail_first={9})
+    with make_fetcher() as fetcher:
+        songs = [(n, f"{site.url}nnt{n:04d}_u.html") for n in range(1, 31)]
+        results = list(fetcher.fetch_ordered(songs))
+
+    assert [r.key for r in results] == list(range(1, 31))
+    assert all(r.ok for r in results if r.key != 7)
+    assert results[6].status_code == 404 and results[6].attempts == 1 and not results[6].ok
+    assert results[8].attempts == 2 and fetcher.retries == 1
+    assert b'song 12.' in results[11].content
+    assert site.requests == 31
+    assert 1 < site.max_in_flight <= 3
+
+
+def test_fetch_gives_up_after_max_retries(song_site):
+    site = song_site(fail_first={1})
+    with make_fetcher(max_retries=0) as fetcher:
+        result = fetcher.fetch(f"{site.url}nnt0001_u.html", key=1)
+    assert not result.ok and result.error == "HTTP 503" and result.attempts == 1
+
+
+def test_web_extractor_crawls_local_site_concurrently(tmp_path, monkeypatch, song_site):
+    monkeypatch.chdir(tmp_path)
+    site = song_site(missing={8})
+    extractor = ThiruppugazhWebExtractor(base_url=site.url)
+    parse = extractor.extract_names_from_page
+
+    def parse_or_choke(song_number, content):
+        if song_number == 11:
+            raise ValueError("malformed page")
+        return parse(song_number, content)
+
+    monkeypatch.setattr(extractor, 'extract_names_from_page', parse_or_choke)
+    with make_fetcher() as fetcher:
+        names = extractor.extract_all_thiruppugazh(6, 15, fetcher=fetcher)
+
+    assert extractor.processed_songs == 10
+    assert extractor.failed_songs == [8, 11]
+    assert [n.song_number for n in names] == [n for n in range(6, 16) if n not in (8, 11)]
+    assert {n.name for n in names} == {'Saravana'}
+    journal = (tmp_path / 'thiruppugazh_web_journal.jsonl').read_text().splitlines()
+    assert sum('"type": "done"' in line for line in journal) == 10
+    assert any('"song": 11' in line and 'ValueError: malformed page' in line for line in journal)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the append-only song checkpoint journal
+"""
+
+import json
+
+from complete_thiruppugazh_systematic_extractor import CompleteThiruppugazhSystematicExtractor
+from page_cache import CachedSession
+from song_fetcher import SongFetcher
+from song_journal import SongJournal, replay_journal
+
+def test_replay_keeps_only_completed_songs(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    with SongJournal(path, sync_every=2) as journal:
+        journal.record_song(6, [{'name': 'Saravana'}, {'name': 'Shanmukha'}])
+        journal.record_song(7, [], error='HTTP 404')
+        journal.record_song(8, [{'name': 'Senthil'}])
+
+    # A crash mid-song leaves name records without a done marker and a torn line
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'type': 'name', 'song': 9, 'data': {'name': 'Sakthi'}}) + '\n')
+        f.write('{"type": "na')
+
+    state = replay_journal(path)
+    assert sorted(state.songs) == [6, 7, 8]
+    assert [r['name'] for r in state.records] == ['Saravana', 'Shanmukha', 'Senthil']
+    assert state.failed == [(7, 'HTTP 404')]
+
+    with SongJournal(path) as journal:
+        assert journal.done[8] == [{'name': 'Senthil'}]
+        journal.record_song(9, [{'name': 'Sakthi'}])
+    lines = open(path, encoding='utf-8').read().splitlines()
+    assert all(json.loads(line) for line in lines)
+    assert sorted(replay_journal(path).songs) == [6, 7, 8, 9]
+
+
+def test_compaction_keeps_last_entry_per_song(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    with SongJournal(path) as journal:
+        journal.record_song(7, [], error='HTTP 503')
+        journal.record_song(6, [{'name': 'Saravana'}])
+        journal.record_song(7, [{'name': 'Shanmukha'}])
+        assert journal.state.superseded == 1
+        state = journal.compact()
+        journal.record_song(8, [])
+
+    assert state.failed == []
+    songs = [json.loads(line)['song'] for line in open(path, encoding='utf-8')
+             if json.loads(line)['type'] == 'done']
+    assert songs == [6, 7, 8]
+    assert [r['name'] for r in replay_journal(path).records] == ['Saravana', 'Shanmukha']
+
+
+def test_complete_extractor_resumes_from_journal(tmp_path, monkeypatch, fill_cache):
+    monkeypatch.chdir(tmp_path)
+    base_url = "http://songs.test/thiru/"
+    cache = fill_cache(range(6, 12))
+
+    first = CompleteThiruppugazhSystematicExtractor(base_url)
+    with SongFetcher(jitter=0, session=CachedSession(cache, offline=True)) as fetcher:
+        names = first.extract_complete_systematic(6, 13, save_interval=2, fetcher=fetcher)
+    assert names and [f[0] for f in first.failed_extractions] == [12, 13]
+
+    # Songs 12-13 are now available; songs 6-11 must come from the journal
+    fill_cache((12, 13), cache=cache)
+    fill_cache(range(6, 12), page='<html>changed</html>', cache=cache)
+
+    second = CompleteThiruppugazhSystematicExtractor(base_url)
+    with SongFetcher(jitter=0, session=CachedSession(cache, offline=True)) as fetcher:
+        resumed = second.extract_complete_systematic(6, 13, save_interval=2, fetcher=fetcher)
+        assert fetcher.requests == 0  # cache hits only, and only for songs 12-13
+
+    assert second.failed_extractions == [] and second.processed_songs == 8
+    assert [n.name for n in resumed[:len(names)]] == [n.name for n in names]
+    assert sorted({n.song_number for n in resumed}) == list(range(6, 14))
+    state = replay_journal(second.journal_path)
+    assert sorted(state.songs) == list(range(6, 14)) and state.failed == []
+
+    # A fresh run archives the finished journal and fetches every song again
+    third = CompleteThiruppugazhSystematicExtractor(base_url)
+    with SongFetcher(jitter=0, session=CachedSession(cache, offline=True)) as fetcher:
+        third.extract_complete_systematic(6, 13, save_interval=2, fetcher=fetcher, resume=False)
+    assert third.processed_songs == 8
+    assert [f[0] for f in third.failed_extractions] == []
+    archived = [p.name for p in tmp_path.glob(third.journal_path + '.*')]
+    assert len(archived) == 1
+    assert sorted(replay_journal(str(tmp_path / archived[0])).songs) == list(range(6, 14))
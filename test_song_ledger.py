@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the song ledger, the retry scheduler and the per-host circuit breaker
+"""
+
+import pytest
+
+from song_fetcher import CircuitBreaker, FetchResult, SongFetcher
+from song_ledger import EMPTY, HTTP_ERROR, OK, PARSE_ERROR, PENDING, RetryScheduler, SongLedger
+from song_pipeline import SongPipeline, builtin_variants
+
+
+def test_ledger_records_states_and_attempts(tmp_path):
+    with SongLedger(str(tmp_path / 'ledger.sqlite3')) as ledger:
+        ledger.add_songs(range(1, 6))
+        ledger.record(2, HTTP_ERROR, 'HTTP 503', 503)
+        ledger.record(2, OK, names=3)
+        ledger.record(3, EMPTY)
+        ledger.record(4, PARSE_ERROR, 'ValueError: bad page')
+        ledger.add_songs([2, 6])  # known songs keep their state
+
+        status = ledger.get(2)
+        assert (status.state, status.attempts, status.last_error, status.names) == (OK, 2, None, 3)
+        assert ledger.get(1).attempts == 0 and ledger.get(99) is None
+        assert ledger.songs_not_ok() == [1, 3, 4, 5, 6]
+        assert ledger.songs_not_ok(start=4, end=5) == [4, 5]
+        assert ledger.counts() == {PENDING: 3, OK: 1, EMPTY: 1, HTTP_ERROR: 0, PARSE_ERROR: 1}
+        with pytest.raises(ValueError):
+            ledger.record(1, 'done')
+
+    # The states survive a reopen
+    with SongLedger(str(tmp_path / 'ledger.sqlite3')) as ledger:
+        assert ledger.songs([PARSE_ERROR]) == [4]
+
+
+def test_circuit_breaker_opens_and_probes():
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=2, cooldown=10, clock=lambda: now[0])
+    breaker.record(False)
+    assert breaker.state == 'closed'
+    breaker.record(False)
+    assert breaker.state == 'open' and breaker.opens == 1
+
+    now[0] = 10.0
+    breaker.acquire()  # cooldown over: this caller is the probe
+    assert breaker.state == 'half_open'
+    breaker.record(False)
+    assert breaker.state == 'open' and breaker.cooldown == 20
+
+    now[0] = 30.0
+    breaker.acquire()
+    breaker.record(True)
+    assert breaker.state == 'closed' and breaker.cooldown == 10 and breaker.failures == 0
+
+
+class FlakyFetcher:
+    """fetch_ordered() stand-in: each song fails with its listed status codes first."""
+
+    def __init__(self, failures):
+        self.failures = {key: list(codes) for key, codes in failures.items()}
+        self.session = None
+
+    def fetch_ordered(self, items):
+        for key, url in items:
+            codes = self.failures.get(key)
+            if codes:
+                code = codes.pop(0)
+                yield FetchResult(key=key, url=url, status_code=code, error=f"HTTP {code}")
+            else:
+                yield FetchResult(key=key, url=url, status_code=200, content=b'page')
+
+
+def test_retry_scheduler_backs_off_and_gives_up(tmp_path):
+    delays = []
+    with SongLedger(str(tmp_path / 'ledger.sqlite3')) as ledger:
+        scheduler = RetryScheduler(FlakyFetcher({2: [503], 3: [404], 4: [503, 503, 503, 503]}), ledger,
+                                   max_attempts=3, base_delay=4, sleep=delays.append)
+        results = {r.key: r for r in scheduler.fetch((n, f"song{n}") for n in range(1, 5))}
+
+        assert results[1].ok and results[2].ok
+        assert results[3].status_code == 404  # not retryable
+        assert results[4].error == "HTTP 503"  # gave up after max_attempts
+        assert scheduler.retried == 3
+        assert len(delays) == 2 and 2 <= delays[0] <= 4 and 4 <= delays[1] <= 8
+        assert ledger.get(4).attempts == 2 and ledger.get(4).http_status == 503
+
+
+def test_pipeline_records_ledger_and_reruns_only_failed_songs(tmp_path, song_site):
+    site = song_site(missing={4}, fail_first={2})
+    with SongLedger(str(tmp_path / 'ledger.sqlite3')) as ledger:
+        fetcher = SongFetcher(max_workers=4, per_host_rate=1000, jitter=0, max_retries=0)
+        pipeline = SongPipeline([builtin_variants()['csv']], fetcher, site.url, queue_size=2,
+                                ledger=ledger, retry_delay=0)
+        with fetcher, pipeline:
+            results = list(pipeline.run(1, 5))
+
+        assert [r.song_number for r in results] == [1, 3, 4, 5, 2]  # retried songs come last
+        assert site.requests == 6  # one request per attempt
+        assert ledger.get(2).state == OK and ledger.get(2).attempts == 2
+        assert ledger.get(4).state == HTTP_ERROR and ledger.get(4).http_status == 404
+        assert ledger.songs_not_ok(1, 5) == [4]
+
+        requests_before = site.requests
+        fetcher = SongFetcher(max_workers=4, per_host_rate=1000, jitter=0, max_retries=0)
+        pipeline = SongPipeline([builtin_variants()['csv']], fetcher, site.url, ledger=ledger)
+        with fetcher, pipeline:
+            rerun = list(pipeline.run(1, 5, songs=ledger.songs_not_ok(1, 5)))
+        assert [r.song_number for r in rerun] == [4]
+        assert site.requests == requests_before + 1
+        assert ledger.get(4).attempts == 2
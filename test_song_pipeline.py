@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the staged song pipeline, replayed offline from a pre-filled page cache
+"""
+
+import pytest
+
+from complete_thiruppugazh_systematic_extractor import CompleteThiruppugazhSystematicExtractor
+from enhanced_thiruppugazh_extractor import EnhancedThiruppugazhExtractor
+from final_retry_stubborn_songs import UltraConservativeRetry
+from page_cache import CachedSession
+from song_fetcher import SongFetcher
+from song_pipeline import LXML_AVAILABLE, SongPipeline, builtin_variants, resolve_parser
+from thiruppugazh_extractor_with_csv import ThiruppugazhExtractorWithCSV
+from thiruppugazh_web_extractor import ThiruppugazhWebExtractor
+
+BASE_URL = "http://songs.test/thiru/"
+
+# Page with names for every builtin variant to find
+SONG_PAGE = """<html><head><title>Thiruppugazh {number}</title></head><body>
+<p><a name="tamil"></a>தமிழ் பாடல் வரிகள்</p>
+<p><a name="english"></a>English translation and meaning</p>
+<p>Oh Lord Saravana, the six-faced Shanmukha, Son of Shiva and commander of the divine army,
+we worship your holy feet in song {number}.</p>
+<div>Sacred Chandra shines on the peacock of the Sakthi-wielding Senthil at the temple.</div>
+</body></html>"""
+
+
+def offline_pipeline(cache, variants, **options):
+    fetcher = SongFetcher(max_workers=4, jitter=0, session=CachedSession(cache, offline=True))
+    return fetcher, SongPipeline(variants, fetcher, BASE_URL, queue_size=2, **options)
+
+
+def summary(names):
+    return [(n.name, n.context, n.meaning if hasattr(n, 'meaning') else n.english_meaning,
+             n.category, n.confidence, n.pattern_family) for n in names]
+
+
+def test_variants_match_their_extractors(fill_cache):
+    cache = fill_cache([12], page=SONG_PAGE)
+    variants = builtin_variants()
+    fetcher, pipeline = offline_pipeline(cache, list(variants.values()))
+    with fetcher, pipeline:
+        [result] = list(pipeline.run(12, 12))
+
+    content = SONG_PAGE.format(number=12).encode()
+    web = ThiruppugazhWebExtractor(base_url=BASE_URL)
+    complete = CompleteThiruppugazhSystematicExtractor(base_url=BASE_URL)
+    fetched = {}
+    for key, extractor in (('csv', ThiruppugazhExtractorWithCSV()), ('enhanced', EnhancedThiruppugazhExtractor()),
+                           ('stubborn', UltraConservativeRetry())):
+        extractor.base_url = BASE_URL
+        extractor.session = CachedSession(cache, offline=True)
+        fetched[key] = extractor
+
+    expected = {
+        'web': [(n.name, n.context_line, n.meaning_context, 'divine_name', 1.0, n.pattern_family)
+                for n in web.extract_names_from_page(12, content)],
+        'csv': summary(fetched['csv'].extract_from_song(12)),
+        'enhanced': summary(fetched['enhanced'].extract_from_single_song_enhanced(12)),
+        'complete': summary(complete.extract_names_from_page(12, content)),
+        'stubborn': summary(fetched['stubborn'].ultra_conservative_extract(12)),
+    }
+    assert result.error is None and result.title == 'Thiruppugazh 12'
+    for variant, names in expected.items():
+        assert names, variant
+        assert summary(result.names[variant]) == names, variant
+
+
+def test_pipeline_keeps_song_order_and_reports_misses(fill_cache):
+    cache = fill_cache([n for n in range(1, 41) if n != 17], page=SONG_PAGE)
+    variants = builtin_variants()
+    fetcher, pipeline = offline_pipeline(cache, [variants['csv'], variants['complete']])
+    with fetcher, pipeline:
+        results = list(pipeline.run(1, 40))
+
+    assert [r.song_number for r in results] == list(range(1, 41))
+    assert results[16].error and results[16].names == {}
+    for result in results:
+        if result.song_number != 17:
+            assert set(result.names) == {'csv', 'complete'}
+            assert {n.song_number for n in result.names['csv']} == {result.song_number}
+
+
+def test_consumer_can_stop_early(fill_cache):
+    cache = fill_cache(range(1, 101), page=SONG_PAGE)
+    fetcher, pipeline = offline_pipeline(cache, [builtin_variants()['csv']])
+    with fetcher, pipeline:
+        for result in pipeline.run(1, 100):
+            if result.song_number == 3:
+                break
+    assert result.song_number == 3
+
+
+def test_process_pool_parsing_matches_threaded_parsing(fill_cache):
+    cache = fill_cache([n for n in range(1, 13) if n != 5], page=SONG_PAGE)
+    variants = list(builtin_variants().values())
+    runs = []
+    for workers in (0, 2):
+        fetcher, pipeline = offline_pipeline(cache, variants, parse_workers=workers)
+        with fetcher, pipeline:
+            runs.append([(r.song_number, r.error is None, {v: summary(n) for v, n in r.names.items()})
+                         for r in pipeline.run(1, 12)])
+    assert runs[0] == runs[1]
+    assert [song for song, ok, _ in runs[1] if not ok] == [5]
+
+
+def test_resolve_parser():
+    assert resolve_parser('html.parser') == 'html.parser'
+    assert resolve_parser('auto') == ('lxml' if LXML_AVAILABLE else 'html.parser')
+    with pytest.raises(ValueError):
+        resolve_parser('html5')
+    if not LXML_AVAILABLE:
+        with pytest.raises(ValueError, match='pip install lxml'):
+            resolve_parser('lxml')
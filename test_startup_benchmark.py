@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Tests for the entry points' lazy imports
+"""
+
+from startup_benchmark import LAZY_MODULES, STARTUP_BUDGETS_MS, measure_import
+
+
+def test_entry_points_do_not_import_optional_subsystems():
+    for module in STARTUP_BUDGETS_MS:
+        _, imported = measure_import(module)
+        assert module in imported
+        assert not imported & set(LAZY_MODULES), module
+
+
+def test_master_tool_defers_the_name_database():
+    _, imported = measure_import('murugan_name_master')
+    assert not imported & {'subramanya_tweaker', 'comprehensive_subramanya_database'}
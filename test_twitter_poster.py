@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Tests for Twitter posting against a local stand-in for the API
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import post_outbox
+from batch_optimizer import run_batch
+from post_outbox import PostOutbox
+from twitter_poster import TokenBucket, TwitterPostQueue, TwitterPoster
+
+
+class FakeTwitterAPI:
+    """Local HTTP server that answers like the tweets endpoint."""
+
+    def __init__(self, rate_limited_first=0, fail_first=0):
+        self.rate_limited_first = rate_limited_first
+        self.fail_first = fail_first
+        self.tweets = []
+        self.requests = 0
+        self.client_ports = set()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self, status, body, headers=()):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                for key, value in headers:
+                    self.send_header(key, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                api.client_ports.add(self.client_address[1])
+                self._reply(200, {'data': {'id': '1', 'username': 'stand_in'}})
+
+            def do_POST(self):
+                api.requests += 1
+                api.client_ports.add(self.client_address[1])
+                payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                if api.rate_limited_first > 0:
+                    api.rate_limited_first -= 1
+                    self._reply(429, {'title': 'Too Many Requests'}, [
+                        ('Retry-After', '0'),
+                        ('x-rate-limit-remaining', '0'),
+                        ('x-rate-limit-reset', str(int(time.time()))),
+                    ])
+                elif api.fail_first > 0:
+                    api.fail_first -= 1
+                    self._reply(503, {'title': 'Service Unavailable'})
+                else:
+                    api.tweets.append(payload['text'])
+                    self._reply(201, {'data': {'id': str(len(api.tweets)), 'text': payload['text']}},
+                                [('x-rate-limit-remaining', '99')])
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/2/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_poster(api, sleeps):
+    return TwitterPoster(bearer_token='test-token', base_url=api.url, backoff=0.01,
+                         rate_limiter=TokenBucket(rate=1000, capacity=10), sleep=sleeps.append)
+
+
+def test_poster_retries_rate_limits_on_one_pooled_connection():
+    api = FakeTwitterAPI(rate_limited_first=2)
+    sleeps = []
+    poster = make_poster(api, sleeps)
+    try:
+        assert poster.test_connection()['success']
+        result = poster.create_tweet("Chaarvik -> Chaarvika")
+        assert result['data']['text'] == "Chaarvik -> Chaarvika"
+        assert api.requests == 3
+        assert poster.retries == 2 and len(sleeps) == 2
+        assert len(api.client_ports) == 1
+    finally:
+        poster.close()
+        api.close()
+
+
+def test_poster_gives_up_after_max_retries():
+    api = FakeTwitterAPI(rate_limited_first=10)
+    poster = make_poster(api, [])
+    poster.max_retries = 2
+    try:
+        result = poster.create_tweet("never delivered")
+        assert result['error'] and result['status_code'] == 429
+        assert api.requests == 3
+    finally:
+        poster.close()
+        api.close()
+
+
+def test_poster_does_not_resend_a_tweet_that_may_have_been_posted():
+    api = FakeTwitterAPI(fail_first=1)
+    poster = make_poster(api, [])
+    try:
+        result = poster.create_tweet("maybe delivered")
+        assert result['error'] and result['status_code'] == 503
+        assert api.requests == 1 and poster.retries == 0
+    finally:
+        poster.close()
+        api.close()
+
+    # Nothing listens on a closed server's port: connecting fails before anything is sent
+    sleeps = []
+    poster = make_poster(api, sleeps)
+    poster.max_retries = 2
+    try:
+        result = poster.create_tweet("never sent")
+        assert result['error'] and result['status_code'] is None
+        assert poster.retries == 2 and len(sleeps) == 2
+    finally:
+        poster.close()
+
+
+def test_post_queue_delivers_in_background():
+    api = FakeTwitterAPI(rate_limited_first=2)
+    poster = make_poster(api, [])
+    try:
+        with TwitterPostQueue(poster) as post_queue:
+            futures = [post_queue.submit_name_optimization(
+                {'original': f"Name{i}", 'tweaked': f"Name{i}a", 'chaldean_sum': 14, 'num_changes': 1})
+                for i in range(5)]
+            post_queue.flush()
+            assert all('data' in future.result(timeout=5) for future in futures)
+        assert post_queue.sent == 5 and post_queue.failed == 0
+        assert [text.split('\n')[2] for text in api.tweets] == [f"Original: Name{i}" for i in range(5)]
+    finally:
+        api.close()
+
+
+def test_token_bucket_waits_for_refill_and_reset():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0],
+                         sleep=lambda seconds: now.__setitem__(0, now[0] + seconds))
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    bucket.update_from_headers({'x-rate-limit-remaining': '0', 'x-rate-limit-reset': str(time.time() + 30)})
+    assert 29 < bucket.acquire() <= 30
+
+
+def test_outbox_enqueue_is_idempotent_and_replays_after_crash(tmp_path):
+    path = str(tmp_path / "outbox.sqlite3")
+    tweak = {'original': "Mike", 'tweaked': "Maike", 'chaldean_sum': 14, 'num_changes': 1}
+    outbox = PostOutbox(path)
+    assert outbox.enqueue(tweak)
+    assert not outbox.enqueue(dict(tweak, num_changes=2))
+    assert outbox.enqueue_many([tweak, dict(tweak, tweaked="Myke")]) == 1
+    assert len(outbox.claim(1)) == 1
+    outbox.close()
+
+    # The claimed entry was never marked sent, so reopening replays it once its lease expires
+    reopened = PostOutbox(path)
+    assert reopened.replayed == 0
+    reopened.close()
+    reopened = PostOutbox(path, lease_timeout=0)
+    assert reopened.replayed == 1
+    assert reopened.counts() == {'pending': 2, 'sending': 0, 'sent': 0, 'failed': 0}
+    reopened.close()
+
+
+def test_outbox_leaves_entries_leased_by_a_live_drain_alone(tmp_path):
+    path = str(tmp_path / "outbox.sqlite3")
+    api = FakeTwitterAPI()
+    poster = make_poster(api, [])
+    tweaks = [{'original': f"Name{i}", 'tweaked': f"Name{i}a", 'chaldean_sum': 14, 'num_changes': 1}
+              for i in range(3)]
+    draining = PostOutbox(path)
+    try:
+        draining.enqueue_many(tweaks)
+        claimed = draining.claim(2)
+
+        # A single post opening the outbox meanwhile neither replays nor posts the drain's entries
+        single = PostOutbox(path)
+        assert single.replayed == 0
+        leased = next(t for t in tweaks if t['original'] == claimed[0]['original'])
+        assert single.post(poster, leased)['duplicate']
+        assert single.drain(poster) == {'sent': 1, 'retried': 0, 'failed': 0}
+        single.close()
+
+        for entry in claimed:
+            assert draining.deliver(poster, entry) == 'sent'
+        assert len(api.tweets) == 3
+        assert draining.counts()['sent'] == 3
+    finally:
+        draining.close()
+        poster.close()
+        api.close()
+
+
+def test_outbox_drain_posts_each_result_once():
+    api = FakeTwitterAPI(fail_first=5)
+    poster = make_poster(api, [])
+    poster.max_retries = 0
+    outbox = PostOutbox(':memory:', max_attempts=3)
+    tweaks = [{'original': f"Name{i}", 'tweaked': f"Name{i}a", 'chaldean_sum': 14, 'num_changes': 1}
+              for i in range(4)]
+    try:
+        outbox.enqueue_many(tweaks)
+        summary = outbox.drain(poster, batch_size=2)
+        assert summary == {'sent': 4, 'retried': 5, 'failed': 0}
+        assert len(api.tweets) == 4
+
+        outbox.enqueue_many(tweaks)
+        assert outbox.drain(poster)['sent'] == 0
+        assert poster.post_name_optimization(tweaks[0], outbox=outbox)['duplicate']
+        assert len(api.tweets) == 4
+    finally:
+        outbox.close()
+        poster.close()
+        api.close()
+
+
+def test_batch_auto_post_is_restartable(tmp_path, monkeypatch):
+    api = FakeTwitterAPI()
+    monkeypatch.setenv('TWITTER_BEARER_TOKEN', 'test-token')
+    monkeypatch.setenv('TWITTER_API_BASE_URL', api.url)
+    monkeypatch.setattr(post_outbox, 'DEFAULT_OUTBOX_PATH', str(tmp_path / "outbox.sqlite3"))
+    names = tmp_path / "names.txt"
+    names.write_text("Alexander\nMike\nFan\n")
+    try:
+        first = run_batch(str(names), str(tmp_path / "out.jsonl"), max_changes=2, limit=1,
+                          workers=1, auto_post=True)
+        assert first['tweets']['sent'] == first['optimized'] == len(api.tweets) > 0
+
+        second = run_batch(str(names), str(tmp_path / "out.jsonl"), max_changes=2, limit=1,
+                           workers=1, auto_post=True)
+        assert second['tweets'] == first['tweets']
+        assert len(api.tweets) == first['optimized']
+    finally:
+        api.close()
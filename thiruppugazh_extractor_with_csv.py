@@ -6,17 +6,20 @@ This creates a CSV with the specific song number (X) from the URL pattern:
 https://kaumaram.com/thiru/nnt000X_u.html#english where X is 6 to 1340
 """
 
-import requests
 import re
 import time
 import json
 import csv
-from typing import List, Dict
+from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 from bs4 import BeautifulSoup
 import random
 from datetime import datetime
 
+from name_matcher import get_name_matcher
+from page_cache import CachedSession
+from song_journal import SongJournal
+
 @dataclass
 class ThiruppugazhNameCSV:
     """Name structure for CSV export with song number."""
@@ -27,38 +30,20 @@ class ThiruppugazhNameCSV:
     meaning: str
     category: str
     confidence: float
+    pattern_family: str = ''
 
 class ThiruppugazhExtractorWithCSV:
     """Extractor with proper CSV export including song numbers."""
     
     def __init__(self):
         self.base_url = "https://kaumaram.com/thiru/"
-        self.session = requests.Session()
+        self.session = CachedSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
-        # Key patterns for Sa/Cha/Sha names
-        self.patterns = [
-            r'\b[Ss]aravana[a-z]*\b',
-            r'\b[Ss]haravan[a-z]*\b', 
-            r'\b[Ss]aktivel[a-z]*\b',
-            r'\b[Ss]haktivel[a-z]*\b',
-            r'\b[Ss]hanmukh[a-z]*\b',
-            r'\b[Cc]hanmukh[a-z]*\b',
-            r'\b[Ss]iva[a-z]*\b',
-            r'\b[Ss]hiva[a-z]*\b',
-            r'\b[Ss]ami[a-z]*\b',
-            r'\b[Ss]wami[a-z]*\b',
-            r'\b[Cc]handra[a-z]*\b',
-            r'\b[Ss]handra[a-z]*\b',
-            r'\b[Ss]ubramany[a-z]*\b',
-            r'\b[Ss]ubrahmany[a-z]*\b',
-            r'\b[Ss]aran[a-z]*\b',
-            r'\b[Cc]haran[a-z]*\b',
-            r'\b[Ss]hambhu[a-z]*\b',
-            r'\b[Cc]haitany[a-z]*\b'
-        ]
+        # Key patterns for Sa/Cha/Sha names ('csv' set of the shared matcher)
+        self.matcher = get_name_matcher()
         
         self.divine_indicators = [
             'lord', 'god', 'murugan', 'divine', 'deity', 'worship', 'prayer',
@@ -66,13 +51,16 @@ class ThiruppugazhExtractorWithCSV:
         ]
         
         self.extracted_names = []
+        self.failed_songs = {}  # song number -> error of the last failed attempt
     
     def extract_from_song(self, song_number: int) -> List[ThiruppugazhNameCSV]:
         """Extract names from single song with song number tracking."""
         url = f"{self.base_url}nnt{song_number:04d}_u.html"
         
         try:
-            time.sleep(random.uniform(0.5, 1.0))
+            # Pages already in the page cache need no politeness delay
+            if not self.session.is_cached(url):
+                time.sleep(random.uniform(0.5, 1.0))
             
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
@@ -84,36 +72,35 @@ class ThiruppugazhExtractorWithCSV:
             english_content = self._extract_english_text(page_text)
             
             names_found = []
-            for pattern in self.patterns:
-                matches = re.finditer(pattern, english_content, re.IGNORECASE)
+            for match in self.matcher.scan(english_content, 'csv'):
+                name = match.text
+                if len(name) < 4:
+                    continue
                 
-                for match in matches:
-                    name = match.group().strip()
-                    if len(name) < 4:
-                        continue
-                    
-                    # Get context
-                    start = max(0, match.start() - 100)
-                    end = min(len(english_content), match.end() + 100)
-                    context = english_content[start:end]
-                    
-                    # Validate divine context
-                    confidence = self._calculate_confidence(name, context)
-                    if confidence >= 0.3:
-                        names_found.append(ThiruppugazhNameCSV(
-                            name=name.title(),
-                            song_number=song_number,  # This is the X from the URL
-                            song_url=url,
-                            context=context.replace('\n', ' ').strip()[:200],
-                            meaning=self._extract_meaning(name, context),
-                            category=self._categorize_name(name, context),
-                            confidence=confidence
-                        ))
+                # Get context
+                start = max(0, match.start - 100)
+                end = min(len(english_content), match.end + 100)
+                context = english_content[start:end]
+                
+                # Validate divine context
+                confidence = self._calculate_confidence(name, context)
+                if confidence >= 0.3:
+                    names_found.append(ThiruppugazhNameCSV(
+                        name=name.title(),
+                        song_number=song_number,  # This is the X from the URL
+                        song_url=url,
+                        context=context.replace('\n', ' ').strip()[:200],
+                        meaning=self._extract_meaning(name, context),
+                        category=self._categorize_name(name, context),
+                        confidence=confidence,
+                        pattern_family='/'.join(match.families)
+                    ))
             
             return self._deduplicate_names(names_found)
             
         except Exception as e:
             print(f"   ❌ Error processing song {song_number}: {e}")
+            self.failed_songs[song_number] = str(e)
             return []
     
     def _extract_english_text(self, page_text: str) -> str:
@@ -203,16 +190,32 @@ class ThiruppugazhExtractorWithCSV:
                 seen[key] = name_obj
         return list(seen.values())
     
-    def extract_batch(self, start_song: int, end_song: int) -> List[ThiruppugazhNameCSV]:
-        """Extract from batch of songs."""
+    def extract_batch(self, start_song: int, end_song: int,
+                      journal: Optional[SongJournal] = None) -> List[ThiruppugazhNameCSV]:
+        """
+        Extract from batch of songs.
+        
+        Args:
+            start_song: First song number
+            end_song: Last song number
+            journal: Checkpoint journal; songs it already holds are restored
+                instead of fetched, and each new song is appended to it
+        """
         print(f"🎵 EXTRACTING BATCH: Songs {start_song} to {end_song}")
         print("=" * 60)
         
         all_names = []
         for song_num in range(start_song, end_song + 1):
+            if journal is not None and song_num in journal.done and song_num not in journal.state.errors:
+                all_names.extend(ThiruppugazhNameCSV(**record) for record in journal.done[song_num])
+                continue
+            
             print(f"   📿 Song {song_num:4d}: ", end='')
+            self.failed_songs.pop(song_num, None)
             names = self.extract_from_song(song_num)
             all_names.extend(names)
+            if journal is not None:
+                journal.record_song(song_num, [asdict(n) for n in names], self.failed_songs.get(song_num))
             print(f"{len(names)} names found")
         
         self.extracted_names = all_names
@@ -7,6 +7,8 @@ URL pattern: https://kaumaram.com/thiru/nnt000<number>_u.html#english
 Numbers: 6 to 1340 (1334 pages total)
 
 Extract ALL names starting with Sa/Cha/Sha from English translations.
+Songs are fetched concurrently by song_fetcher.SongFetcher (per-host
+concurrency and rate limits, ordered results).
 """
 
 import requests
@@ -18,6 +20,13 @@ from dataclasses import dataclass, asdict
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import random
+import argparse
+
+from instrumentation import INSTRUMENTATION as instr, add_profile_argument, profiling
+from run_metrics import add_metrics_arguments, metrics_reporting
+from name_matcher import get_name_matcher
+from song_fetcher import SongFetcher, add_fetcher_arguments
+from song_journal import SongJournal
 
 @dataclass
 class ThiruppugazhName:
@@ -29,39 +38,22 @@ class ThiruppugazhName:
     meaning_context: str
     script_type: str  # 'tamil' or 'english'
     verified: bool = True
+    pattern_family: str = ''
 
 class ThiruppugazhWebExtractor:
     """Extract names from all 1,340 Thiruppugazh songs."""
     
-    def __init__(self):
-        self.base_url = "https://kaumaram.com/thiru/"
+    def __init__(self, base_url: str = "https://kaumaram.com/thiru/"):
+        self.base_url = base_url
         self.extracted_names = []
         self.processed_songs = 0
         self.failed_songs = []
         
-        # Patterns for Sa/Cha/Sha names in English translations
-        self.name_patterns = [
-            r'\b[Ss][aA][a-zA-Z]*(?:an|ar|am|al|ai|ay|av|ah|ak|ag|aj|ad|ap|ab|at|as|a)\b',  # Sa- names
-            r'\b[Cc][hH][aA][a-zA-Z]*(?:an|ar|am|al|ai|ay|av|ah|ak|ag|aj|ad|ap|ab|at|as|a)\b',  # Cha- names  
-            r'\b[Ss][hH][aA][a-zA-Z]*(?:an|ar|am|al|ai|ay|av|ah|ak|ag|aj|ad|ap|ab|at|as|a)\b',  # Sha- names
-            # Additional Tamil transliteration patterns
-            r'\b[Ss]aran[a-z]*\b',  # Saran variations
-            r'\b[Cc]aran[a-z]*\b',  # Caran variations
-            r'\b[Ss]arvana[a-z]*\b',  # Sarvana variations
-            r'\b[Cc]harav[a-z]*\b',  # Charavan variations
-            r'\b[Ss]hanmukh[a-z]*\b',  # Shanmukha variations
-            r'\b[Cc]hanmukh[a-z]*\b',  # Chanmukha variations
-            r'\b[Ss]haktiv[a-z]*\b',  # Shaktivel variations
-            r'\b[Cc]haktiv[a-z]*\b',  # Chaktivel variations
-            r'\b[Ss]ami\b',  # Sami
-            r'\b[Cc]hami\b',  # Chami
-            r'\b[Ss]ambh[a-z]*\b',  # Sambhu variations
-            r'\b[Cc]handr[a-z]*\b',  # Chandra variations
-            r'\b[Ss]handr[a-z]*\b',  # Shandra variations
-            r'\b[Ss]ubramany[a-z]*\b',  # Subrahmanya variations
-            r'\b[Cc]haitany[a-z]*\b',  # Chaitanya variations
-            r'\b[Ss]aitany[a-z]*\b',  # Saitanya variations
-        ]
+        # Each finished song is appended to the journal; see song_journal.py
+        self.journal_path = "thiruppugazh_web_journal.jsonl"
+        
+        # Sa/Cha/Sha name patterns ('web' set of the shared matcher)
+        self.matcher = get_name_matcher()
         
         # Known divine names and epithets to validate against
         self.divine_indicators = [
@@ -88,66 +80,91 @@ class ThiruppugazhWebExtractor:
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                 }
                 
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find English translation section
-                english_section = soup.find('a', {'name': 'english'})
-                if not english_section:
-                    print(f"   ⚠️  No English section found in song {song_number}")
-                    return []
-                
-                # Get text content after the English anchor
-                english_content = ""
-                current = english_section.parent
-                while current:
-                    if current.name in ['p', 'div', 'span']:
-                        english_content += current.get_text() + " "
-                    current = current.find_next_sibling()
-                    if current and 'tamil' in str(current).lower():
-                        break
-                
-                # Extract names using patterns
-                extracted = []
-                for pattern in self.name_patterns:
-                    matches = re.finditer(pattern, english_content, re.IGNORECASE)
-                    for match in matches:
-                        potential_name = match.group().strip()
-                        context_start = max(0, match.start() - 50)
-                        context_end = min(len(english_content), match.end() + 50)
-                        context = english_content[context_start:context_end].strip()
-                        
-                        # Validate if this appears to be a divine name
-                        if self._is_divine_name(potential_name, context):
-                            extracted.append(ThiruppugazhName(
-                                name=potential_name,
-                                song_number=song_number,
-                                song_url=url,
-                                context_line=context,
-                                meaning_context=self._extract_meaning_context(context),
-                                script_type='english',
-                                verified=True
-                            ))
+                with instr.span('fetch'):
+                    response = requests.get(url, headers=headers, timeout=10)
+                    response.raise_for_status()
+                instr.count('pages')
                 
-                print(f"   📿 Song {song_number}: {len(extracted)} names extracted")
-                return extracted
+                return self.extract_names_from_page(song_number, response.content)
                 
             except requests.RequestException as e:
                 print(f"   ❌ Attempt {attempt + 1} failed for song {song_number}: {e}")
                 if attempt < max_retries - 1:
+                    instr.count('retries')
                     time.sleep(2)
                 else:
+                    instr.count('errors')
                     self.failed_songs.append(song_number)
                     return []
             
             except Exception as e:
+                instr.count('errors')
                 print(f"   ❌ Error processing song {song_number}: {e}")
                 return []
         
         return []
     
+    def extract_names_from_page(self, song_number: int, content: bytes) -> List[ThiruppugazhName]:
+        """
+        Extract names from the HTML of a fetched song page.
+        
+        Args:
+            song_number: Song number
+            content: Page HTML
+            
+        Returns:
+            List[ThiruppugazhName]: Names found in the English translation
+        """
+        url = self.get_song_url(song_number)
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        english_content = self._extract_english_section(soup)
+        if english_content is None:
+            print(f"   ⚠️  No English section found in song {song_number}")
+            return []
+        
+        # Extract names with one scan over the text
+        extracted = []
+        for match in self.matcher.scan(english_content, 'web'):
+            potential_name = match.text
+            context_start = max(0, match.start - 50)
+            context_end = min(len(english_content), match.end + 50)
+            context = english_content[context_start:context_end].strip()
+            
+            # Validate if this appears to be a divine name
+            if self._is_divine_name(potential_name, context):
+                extracted.append(ThiruppugazhName(
+                    name=potential_name,
+                    song_number=song_number,
+                    song_url=url,
+                    context_line=context,
+                    meaning_context=self._extract_meaning_context(context),
+                    script_type='english',
+                    verified=True,
+                    pattern_family='/'.join(match.families)
+                ))
+        
+        instr.count('names', len(extracted))
+        print(f"   📿 Song {song_number}: {len(extracted)} names extracted")
+        return extracted
+    
+    def _extract_english_section(self, soup: BeautifulSoup):
+        """Text after the page's 'english' anchor, or None when there is no anchor."""
+        english_section = soup.find('a', {'name': 'english'})
+        if not english_section:
+            return None
+        
+        # Get text content after the English anchor
+        english_content = ""
+        current = english_section.parent
+        while current:
+            if current.name in ['p', 'div', 'span']:
+                english_content += current.get_text() + " "
+            current = current.find_next_sibling()
+            if current and 'tamil' in str(current).lower():
+                break
+        return english_content
+    
     def _is_divine_name(self, name: str, context: str) -> bool:
         """Check if extracted name appears to be a divine name."""
         name_lower = name.lower()
@@ -219,17 +236,22 @@ class ThiruppugazhWebExtractor:
         
         all_extracted = []
         
-        for song_num in range(start_song, end_song + 1):
-            if song_num % batch_size == 0:
-                print(f"\n📊 Progress: Processing song {song_num}/{end_song} ({((song_num-start_song)/(end_song-start_song)*100):.1f}%)")
-                print(f"   Names extracted so far: {len(all_extracted)}")
+        with SongJournal(self.journal_path, sync_every=batch_size) as journal:
+            for song_num in range(start_song, end_song + 1):
+                if song_num % batch_size == 0:
+                    print(f"\n📊 Progress: Processing song {song_num}/{end_song} ({((song_num-start_song)/(end_song-start_song)*100):.1f}%)")
+                    print(f"   Names extracted so far: {len(all_extracted)}")
                 
-                # Save intermediate results
-                self._save_intermediate_results(all_extracted, f"thiruppugazh_batch_{start_song}_{song_num}.json")
+                failed_before = len(self.failed_songs)
+                extracted = self.extract_from_single_song(song_num)
+                journal.record_song(song_num, [asdict(n) for n in extracted],
+                                    "fetch failed" if len(self.failed_songs) > failed_before else None)
+                all_extracted.extend(extracted)
+                self.processed_songs += 1
+                instr.count('songs')
             
-            extracted = self.extract_from_single_song(song_num)
-            all_extracted.extend(extracted)
-            self.processed_songs += 1
+            # Songs journaled by earlier batches were superseded; keep one entry each
+            journal.compact()
         
         print(f"\n✅ BATCH COMPLETE:")
         print(f"   Songs processed: {end_song - start_song + 1}")
@@ -238,55 +260,100 @@ class ThiruppugazhWebExtractor:
         
         return all_extracted
     
-    def extract_all_thiruppugazh(self, start_from: int = 6, end_at: int = 1340) -> List[ThiruppugazhName]:
-        """Extract from all Thiruppugazh songs."""
+    def extract_all_thiruppugazh(self, start_from: int = 6, end_at: int = 1340,
+                                 fetcher: SongFetcher = None, resume: bool = True) -> List[ThiruppugazhName]:
+        """
+        Extract from all Thiruppugazh songs.
+        
+        Songs are fetched concurrently but handled in song order. Each finished
+        song is appended to the journal (fsynced every 100 songs), and songs
+        already journaled by an earlier run are not fetched again.
+        
+        Args:
+            start_from: First song number
+            end_at: Last song number
+            fetcher: SongFetcher to use (default: one with the polite default limits)
+            resume: False archives the previous journal and fetches every song again
+            
+        Returns:
+            List[ThiruppugazhName]: All extracted names
+        """
         print(f"🕉️ COMPLETE THIRUPPUGAZH EXTRACTION: Songs {start_from} to {end_at}")
         print("=" * 70)
         
-        # Process in batches to manage memory and network load
         batch_size = 100
         all_names = []
-        
-        for batch_start in range(start_from, end_at + 1, batch_size):
-            batch_end = min(batch_start + batch_size - 1, end_at)
-            
-            print(f"\n🎵 Processing batch: {batch_start} to {batch_end}")
-            batch_names = self.extract_systematic_batch(batch_start, batch_end, 20)
-            all_names.extend(batch_names)
-            
-            # Save after each batch
-            self._save_intermediate_results(all_names, f"thiruppugazh_progress_{batch_end}.json")
-            
-            print(f"   Batch results: {len(batch_names)} names")
-            print(f"   Total so far: {len(all_names)} names")
+        batch_names = 0
+        
+        journal = SongJournal(self.journal_path, sync_every=batch_size, resume=resume)
+        if journal.archived:
+            print(f"🗃️  Starting fresh; previous journal archived to {journal.archived}")
+        song_range = range(start_from, end_at + 1)
+        resumed = {n for n in song_range if n in journal.done and n not in journal.state.errors}
+        if resumed:
+            print(f"🔄 Resuming: {len(resumed)} songs already in {self.journal_path} (--fresh starts over)")
+        remaining = [n for n in song_range if n not in resumed]
+        instr.set_target('songs', instr.counters['songs'] + len(remaining))
+        
+        own_fetcher = fetcher is None
+        fetcher = fetcher or SongFetcher()
+        songs = ((song_num, self.get_song_url(song_num)) for song_num in remaining)
+        
+        try:
+            with instr.span('fetch'):
+                results = fetcher.fetch_ordered(songs)
+                for result in results:
+                    song_num = result.key
+                    instr.set_gauge('queue_depth', end_at - song_num + 1)
+                    error = result.error
+                    names = []
+                    if result.ok:
+                        instr.count('pages')
+                        try:
+                            with instr.span('parse'):
+                                names = self.extract_names_from_page(song_num, result.content)
+                        except Exception as e:
+                            # A malformed page fails its song, not the whole crawl
+                            error = f"{type(e).__name__}: {e}"
+                            instr.count('errors')
+                            print(f"   ❌ Error processing song {song_num}: {error}")
+                            self.failed_songs.append(song_num)
+                    else:
+                        instr.count('errors')
+                        print(f"   ❌ Song {song_num} failed after {result.attempts} attempt(s): {result.error}")
+                        self.failed_songs.append(song_num)
+                    
+                    journal.record_song(song_num, [asdict(n) for n in names], error)
+                    all_names.extend(names)
+                    batch_names += len(names)
+                    self.processed_songs += 1
+                    instr.count('songs')
+                    
+                    # Report after each batch of songs
+                    if (song_num - start_from + 1) % batch_size == 0 or song_num == end_at:
+                        print(f"   Batch results: {batch_names} names")
+                        print(f"   Total so far: {len(all_names)} names")
+                        batch_names = 0
             
-            # Longer pause between batches
-            time.sleep(3)
-        
+            journal.compact()
+        finally:
+            journal.close()
+            if own_fetcher:
+                fetcher.close()
+        
+        # Names of this run and of any resumed songs, in song order
+        all_names = [ThiruppugazhName(**record) for n in song_range for record in journal.done.get(n, [])]
         self.extracted_names = all_names
+        instr.set_gauge('queue_depth', 0)
         
         print(f"\n🏆 COMPLETE THIRUPPUGAZH EXTRACTION FINISHED:")
         print(f"   Total songs processed: {self.processed_songs}")
         print(f"   Total names extracted: {len(all_names)}")
         print(f"   Failed songs: {len(self.failed_songs)}")
+        print(f"   Requests: {fetcher.requests} ({fetcher.retries} retries)")
         
         return all_names
     
-    def _save_intermediate_results(self, names: List[ThiruppugazhName], filename: str):
-        """Save intermediate results."""
-        data = {
-            'metadata': {
-                'extraction_date': '2025-01-29',
-                'songs_processed': len(set(n.song_number for n in names)),
-                'total_names': len(names),
-                'source': 'kaumaram.com Thiruppugazh complete extraction'
-            },
-            'names': [asdict(name) for name in names]
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    
     def deduplicate_names(self) -> List[ThiruppugazhName]:
         """Remove duplicate names while preserving song references."""
         seen_names = {}
@@ -376,13 +443,31 @@ class ThiruppugazhWebExtractor:
 
 def main():
     """Main extraction function."""
-    extractor = ThiruppugazhWebExtractor()
+    parser = argparse.ArgumentParser(description="Extract Sa/Cha/Sha names from all Thiruppugazh songs")
+    add_profile_argument(parser, 'thiruppugazh_web_extraction')
+    add_metrics_arguments(parser)
+    add_fetcher_arguments(parser)
+    parser.add_argument('--fresh', action='store_true',
+                        help='Archive the journal of a previous run and fetch every song again')
+    args = parser.parse_args()
+    
+    fetcher = SongFetcher(max_workers=args.workers, per_host_concurrency=args.per_host, per_host_rate=args.rate)
+    with profiling(args.profile), metrics_reporting(args.metrics, args.metrics_format, args.metrics_interval), fetcher:
+        run_extraction(fetcher, args.base_url, args.fresh)
+    
+    print()
+    print(instr.format_report("THIRUPPUGAZH WEB EXTRACTION STAGE BREAKDOWN"))
+
+def run_extraction(fetcher: SongFetcher = None, base_url: str = "https://kaumaram.com/thiru/",
+                   fresh: bool = False):
+    """Interactive extraction run with final exports."""
+    extractor = ThiruppugazhWebExtractor(base_url)
     
     print("🕉️ COMPLETE THIRUPPUGAZH WEB EXTRACTION SYSTEM")
     print("=" * 60)
     print("This will extract from ALL 1,340 Thiruppugazh songs")
     print("URL pattern: https://kaumaram.com/thiru/nnt000X_u.html#english")
-    print("Processing time: ~2-3 hours for complete extraction")
+    print("Processing time: ~5-10 minutes for complete extraction")
     
     # Option to do a small test first
     test_mode = input("\nDo you want to test with a small batch first? (y/n): ").strip().lower()
@@ -408,7 +493,7 @@ def main():
     
     # Full extraction
     print("\n🚀 STARTING COMPLETE EXTRACTION...")
-    all_names = extractor.extract_all_thiruppugazh()
+    all_names = extractor.extract_all_thiruppugazh(fetcher=fetcher, resume=not fresh)
     
     # Save results
     print(f"\n💾 SAVING RESULTS...")
@@ -0,0 +1,278 @@
+"""
+Tweak Result Cache
+
+Two-level cache for tweak searches: an in-process LRU in front of an
+on-disk SQLite store. Entries are keyed by the normalised name, the target
+set, max_changes and a hash of the substitution tables, so editing
+VOWEL_SUBSTITUTIONS or CONSONANT_SUBSTITUTIONS invalidates them. The hash is
+taken when the cache is created; call refresh() after editing the tables at
+runtime.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from name_tweaker import iter_target_tweaks, refresh_substitution_deltas
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'TWEAK_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tweak_cache.sqlite3')
+)
+
+
+class TweakCache:
+    """
+    In-process LRU backed by a SQLite table of JSON-encoded tweak lists.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent level (None or '' for memory only)
+            maxsize: Number of entries kept in the in-process LRU
+        """
+        self.path = path or None
+        self.maxsize = maxsize
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pruned_hash = None
+        self.tables_hash = refresh_substitution_deltas()
+
+    def refresh(self) -> str:
+        """
+        Pick up substitution tables edited since the cache was created.
+
+        Rebuilds name_tweaker.SUBSTITUTION_DELTAS if needed; later keys use the
+        new tables hash, so entries computed with the old tables are not served.
+
+        Returns:
+            str: Hash of the current substitution tables
+        """
+        self.tables_hash = refresh_substitution_deltas()
+        return self.tables_hash
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store on first use."""
+        if self.path is None:
+            return None
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS tweak_results (
+                    kind TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    targets TEXT NOT NULL,
+                    max_changes INTEGER NOT NULL,
+                    tables_hash TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (kind, name, targets, max_changes, tables_hash)
+                )
+            """)
+            self._connection.commit()
+        return self._connection
+
+    def make_key(self, kind: str, name: str, target_values, max_changes: int) -> tuple:
+        """
+        Build the cache key for a search.
+
+        Args:
+            kind: Search family ('tweak' or 'cha')
+            name: Normalised name
+            target_values: Target Chaldean sums
+            max_changes: Maximum number of letter changes
+
+        Returns:
+            tuple: (kind, name, targets, max_changes, tables_hash)
+        """
+        targets = ','.join(str(t) for t in sorted(set(target_values)))
+        return (kind, name, targets, int(max_changes), self.tables_hash)
+
+    def _prune_stale(self, connection: sqlite3.Connection, tables_hash: str) -> None:
+        """Drop persisted entries computed with other substitution tables."""
+        if self._pruned_hash != tables_hash:
+            connection.execute('DELETE FROM tweak_results WHERE tables_hash != ?', (tables_hash,))
+            connection.commit()
+            self._pruned_hash = tables_hash
+
+    def get(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a cached tweak list.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            list: Fresh copy of the cached tweaks, or None on a miss
+        """
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+            else:
+                connection = self._connect()
+                if connection is None:
+                    return None
+                row = connection.execute(
+                    'SELECT result FROM tweak_results WHERE kind = ? AND name = ? AND targets = ? '
+                    'AND max_changes = ? AND tables_hash = ?', key
+                ).fetchone()
+                if row is None:
+                    return None
+                payload = row[0]
+                self._remember(key, payload)
+        return json.loads(payload)
+
+    def put(self, key: tuple, tweaks: List[Dict[str, Any]]) -> None:
+        """
+        Store a complete tweak list in both levels.
+
+        Args:
+            key: Key from make_key
+            tweaks: Tweak results to cache
+        """
+        payload = json.dumps(tweaks, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, payload)
+            connection = self._connect()
+            if connection is not None:
+                self._prune_stale(connection, key[-1])
+                connection.execute(
+                    'INSERT OR REPLACE INTO tweak_results VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    key + (payload, time.time())
+                )
+                connection.commit()
+
+    def _remember(self, key: tuple, payload: str) -> None:
+        """Insert into the LRU, evicting the least recently used entry."""
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Empty both cache levels."""
+        with self._lock:
+            self._memory.clear()
+            connection = self._connect()
+            if connection is not None:
+                connection.execute('DELETE FROM tweak_results')
+                connection.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_default_cache = None
+
+
+def get_default_cache() -> TweakCache:
+    """
+    Get the process-wide cache (created on first use).
+
+    Returns:
+        TweakCache: Cache stored at DEFAULT_CACHE_PATH
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TweakCache(DEFAULT_CACHE_PATH)
+    return _default_cache
+
+
+def cached_iter_target_tweaks(name: str, target_values=[14, 41], max_changes: int = 2,
+                              limit: Optional[int] = None,
+                              cache: Optional[TweakCache] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Cached version of name_tweaker.iter_target_tweaks.
+
+    A hit replays the stored tweaks in their original cheapest-first order.
+    A miss streams from the search and stores the list once it ran to completion.
+
+    Args:
+        name: Original name
+        target_values: Target Chaldean sums
+        max_changes: Maximum number of letter changes
+        limit: Stop after this many tweaks (None for all)
+        cache: Cache to use (default: get_default_cache())
+
+    Yields:
+        dict: Tweak results in the find_target_tweaks format
+    """
+    cache = cache or get_default_cache()
+    key = cache.make_key('tweak', name.upper(), target_values, max_changes)
+
+    cached = cache.get(key)
+    if cached is not None:
+        for tweak in cached[:limit]:
+            tweak['original'] = name
+            yield tweak
+        return
+
+    found = []
+    for tweak in iter_target_tweaks(name, target_values, max_changes, limit):
+        found.append(tweak)
+        yield tweak
+
+    if limit is None or len(found) < limit:
+        cache.put(key, found)
+
+
+def cached_find_target_tweaks(name: str, target_values=[14, 41], max_changes: int = 2,
+                              cache: Optional[TweakCache] = None) -> List[Dict[str, Any]]:
+    """
+    Cached version of name_tweaker.find_target_tweaks.
+
+    Args:
+        name: Original name
+        target_values: Target Chaldean sums
+        max_changes: Maximum number of letter changes
+        cache: Cache to use (default: get_default_cache())
+
+    Returns:
+        list: List of successful tweaks, fewest changes first
+    """
+    tweaks = list(cached_iter_target_tweaks(name, target_values, max_changes, cache=cache))
+    tweaks.sort(key=lambda x: (x['num_changes'], x['tweaked']))
+    return tweaks
+
+
+def cached_find_cha_target_tweaks(base_name: str, target_values=[14, 41], max_changes: int = 3,
+                                  cache: Optional[TweakCache] = None) -> List[Dict[str, Any]]:
+    """
+    Cached version of subramanya_tweaker.find_cha_target_tweaks.
+
+    Args:
+        base_name: Base name (will be enforced to start with 'Cha')
+        target_values: Target Chaldean sums
+        max_changes: Maximum number of changes after 'Cha' prefix
+        cache: Cache to use (default: get_default_cache())
+
+    Returns:
+        list: List of successful tweaks with analysis
+    """
+    from subramanya_tweaker import enforce_cha_prefix, find_cha_target_tweaks
+
+    cache = cache or get_default_cache()
+    key = cache.make_key('cha', enforce_cha_prefix(base_name), target_values, max_changes)
+
+    tweaks = cache.get(key)
+    if tweaks is None:
+        tweaks = find_cha_target_tweaks(base_name, target_values, max_changes)
+        cache.put(key, tweaks)
+    else:
+        for tweak in tweaks:
+            tweak['original'] = base_name
+    return tweaks
@@ -8,7 +8,154 @@ Requires Twitter API v2 credentials.
 import requests
 import json
 import os
-from typing import Optional, Dict, Any
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Callable
+
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+# Status codes worth retrying: rate limited or a transient server error
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Requests that are safe to send again after a timeout or a 5xx
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+
+def is_connect_error(error: requests.exceptions.RequestException) -> bool:
+    """
+    Whether a request failed before it reached the server.
+
+    Args:
+        error: Exception raised by requests
+
+    Returns:
+        bool: True for connect timeouts and refused/unresolvable connections,
+            False when the request may have been sent (read timeouts, resets)
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    # urllib3 wraps the underlying error in MaxRetryError.reason
+    reason = getattr(error.args[0], 'reason', error.args[0])
+    return isinstance(reason, ConnectTimeoutError)  # includes NewConnectionError
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that also follows the API's rate-limit headers.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`. When a
+    response reports no remaining requests (x-rate-limit-remaining: 0) or a
+    Retry-After, the bucket is paused until the reported reset time.
+    """
+    
+    def __init__(self, rate: float = 1.0, capacity: int = 5,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available.
+        
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                if now >= self._paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = max(self._paused_until - now, (1 - self.tokens) / self.rate)
+            self.sleep(delay)
+            waited += delay
+    
+    def pause_until(self, wall_time: float) -> None:
+        """
+        Hold every request until a wall-clock time (e.g. a rate-limit reset).
+        
+        Args:
+            wall_time: Unix timestamp to resume at
+        """
+        with self._lock:
+            resume_at = self.clock() + max(0.0, wall_time - time.time())
+            self._paused_until = max(self._paused_until, resume_at)
+    
+    def update_from_headers(self, headers) -> None:
+        """
+        Apply x-rate-limit-remaining/x-rate-limit-reset and Retry-After headers.
+        
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            self.pause_until(time.time() + parse_retry_after(retry_after))
+        
+        remaining = headers.get('x-rate-limit-remaining')
+        reset = headers.get('x-rate-limit-reset')
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+        with self._lock:
+            self.tokens = min(self.tokens, remaining)
+        if remaining <= 0 and reset:
+            try:
+                self.pause_until(float(reset))
+            except ValueError:
+                pass
+
+
+def parse_retry_after(value: str) -> float:
+    """
+    Parse a Retry-After header (seconds or an HTTP date).
+    
+    Args:
+        value: Header value
+        
+    Returns:
+        float: Seconds to wait (0 when unparseable)
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
 
 
 class TwitterPoster:
@@ -20,7 +167,13 @@ class TwitterPoster:
                  api_key: Optional[str] = None,
                  api_secret: Optional[str] = None,
                  access_token: Optional[str] = None,
-                 access_token_secret: Optional[str] = None):
+                 access_token_secret: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 timeout: float = 10.0,
+                 max_retries: int = 4,
+                 backoff: float = 1.0,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 sleep: Callable[[float], None] = time.sleep):
         """
         Initialize Twitter poster with API credentials.
         
@@ -30,6 +183,13 @@ class TwitterPoster:
             api_secret: Twitter API Secret
             access_token: Twitter Access Token
             access_token_secret: Twitter Access Token Secret
+            base_url: API root (default: TWITTER_API_BASE_URL or the public v2 API)
+            timeout: Seconds before a request is abandoned
+            max_retries: Retries for 429/5xx responses and connection errors (POST: only
+                429 and errors raised before the request was sent)
+            backoff: Base delay for jittered exponential backoff (seconds)
+            rate_limiter: Token bucket shared by all requests (default: 1/s, burst 5)
+            sleep: Sleep function used between retries (injectable for tests)
         """
         self.bearer_token = bearer_token or os.getenv('TWITTER_BEARER_TOKEN')
         self.api_key = api_key or os.getenv('TWITTER_API_KEY')
@@ -37,7 +197,82 @@ class TwitterPoster:
         self.access_token = access_token or os.getenv('TWITTER_ACCESS_TOKEN')
         self.access_token_secret = access_token_secret or os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
         
-        self.base_url = "https://api.twitter.com/2/"
+        self.base_url = base_url or os.getenv('TWITTER_API_BASE_URL') or "https://api.twitter.com/2/"
+        if not self.base_url.endswith('/'):
+            self.base_url += '/'
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.rate_limiter = rate_limiter or TokenBucket(sleep=sleep)
+        self.sleep = sleep
+        self.retries = 0
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Pooled keep-alive session, created on first use."""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+            return self._session
+    
+    def close(self) -> None:
+        """Close the pooled session."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+    
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Full-jitter exponential backoff, never shorter than the server's Retry-After."""
+        delay = random.uniform(0, self.backoff * (2 ** attempt))
+        if response is not None and response.headers.get('Retry-After'):
+            delay = max(delay, parse_retry_after(response.headers['Retry-After']))
+        return delay
+    
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Send a rate-limited request, retrying 429/5xx and connection errors.
+        
+        Non-idempotent requests (POST /tweets) are retried only on 429 and on
+        connect errors: after a read timeout or a 5xx the tweet may already
+        exist, and sending it again would post it twice.
+        
+        Args:
+            method: HTTP method
+            path: Path relative to base_url
+            **kwargs: Passed to requests.Session.request
+            
+        Returns:
+            requests.Response: Final response (raise_for_status not yet applied)
+        """
+        url = f"{self.base_url}{path}"
+        kwargs.setdefault('timeout', self.timeout)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_status_codes = RETRY_STATUS_CODES if idempotent else {429}
+        
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.max_retries or not (idempotent or is_connect_error(e)):
+                    raise
+                response = None
+            else:
+                self.rate_limiter.update_from_headers(response.headers)
+                if response.status_code not in retry_status_codes or attempt == self.max_retries:
+                    return response
+            
+            self.retries += 1
+            self.sleep(self._retry_delay(attempt, response))
+        
+        return response
         
     def _get_auth_headers(self) -> Dict[str, str]:
         """
@@ -64,7 +299,6 @@ class TwitterPoster:
         Returns:
             dict: Twitter API response
         """
-        url = f"{self.base_url}tweets"
         headers = self._get_auth_headers()
         
         payload = {
@@ -72,7 +306,7 @@ class TwitterPoster:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = self._request('POST', 'tweets', headers=headers, json=payload)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -82,7 +316,8 @@ class TwitterPoster:
                 "status_code": getattr(e.response, 'status_code', None)
             }
     
-    def format_name_tweet(self, tweak_result: Dict[str, Any]) -> str:
+    @staticmethod
+    def format_name_tweet(tweak_result: Dict[str, Any]) -> str:
         """
         Format a name tweak result into a tweet.
         
@@ -115,16 +350,21 @@ class TwitterPoster:
         
         return tweet_text
     
-    def post_name_optimization(self, tweak_result: Dict[str, Any]) -> Dict[str, Any]:
+    def post_name_optimization(self, tweak_result: Dict[str, Any], outbox=None) -> Dict[str, Any]:
         """
         Post a name optimization result to Twitter.
         
         Args:
             tweak_result: Result from name_tweaker.find_target_tweaks
+            outbox: PostOutbox recording the post, so the same result is
+                never posted twice (optional)
             
         Returns:
             dict: Twitter API response
         """
+        if outbox is not None:
+            return outbox.post(self, tweak_result)
+        
         tweet_text = self.format_name_tweet(tweak_result)
         return self.create_tweet(tweet_text)
     
@@ -135,11 +375,10 @@ class TwitterPoster:
         Returns:
             dict: Connection test result
         """
-        url = f"{self.base_url}users/me"
         headers = self._get_auth_headers()
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self._request('GET', 'users/me', headers=headers)
             response.raise_for_status()
             return {
                 "success": True,
@@ -154,6 +393,108 @@ class TwitterPoster:
             }
 
 
+class TwitterPostQueue:
+    """
+    Background delivery for tweets.
+    
+    Posts are queued and sent by a worker thread through a shared
+    TwitterPoster, so callers never wait on the network. Every submission
+    returns a Future resolving to the Twitter API response dict.
+    """
+    
+    def __init__(self, poster: Optional[TwitterPoster] = None, workers: int = 1):
+        """
+        Initialize the queue and start its worker threads.
+        
+        Args:
+            poster: Poster used for delivery (default: credentials from the environment)
+            workers: Delivery threads (they share the poster's rate limiter)
+        """
+        self.poster = poster or TwitterPoster()
+        self._queue = queue.Queue()
+        self._closed = False
+        self.sent = 0
+        self.failed = 0
+        self._counter_lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+    
+    @property
+    def pending(self) -> int:
+        """Number of posts waiting for delivery."""
+        return self._queue.qsize()
+    
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            future, text = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = self.poster.create_tweet(text)
+                except Exception as e:
+                    result = {"error": True, "message": f"Failed to post tweet: {str(e)}", "status_code": None}
+                with self._counter_lock:
+                    if 'error' in result:
+                        self.failed += 1
+                    else:
+                        self.sent += 1
+                future.set_result(result)
+            self._queue.task_done()
+    
+    def submit(self, text: str) -> Future:
+        """
+        Queue a tweet.
+        
+        Args:
+            text: Tweet content
+            
+        Returns:
+            Future: Resolves to the create_tweet response
+        """
+        if self._closed:
+            raise RuntimeError("TwitterPostQueue is closed")
+        future = Future()
+        self._queue.put((future, text))
+        return future
+    
+    def submit_name_optimization(self, tweak_result: Dict[str, Any]) -> Future:
+        """
+        Queue a name optimization tweet (see TwitterPoster.format_name_tweet).
+        
+        Args:
+            tweak_result: Result from name_tweaker.find_target_tweaks
+            
+        Returns:
+            Future: Resolves to the create_tweet response
+        """
+        return self.submit(self.poster.format_name_tweet(tweak_result))
+    
+    def flush(self) -> None:
+        """Block until every queued tweet has been delivered (or failed)."""
+        self._queue.join()
+    
+    def close(self) -> None:
+        """Deliver what is queued, stop the workers and close the session."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self.poster.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 def create_sample_env_file():
     """
     Create a sample .env file with Twitter API key placeholders.